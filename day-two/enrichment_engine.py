@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Enrichment Diff Engine
+======================
+Columnar build of the Day Two enrichment updates.
+
+The enrichment notebooks compare each migrated BBF record with its ES source
+and fill the BBF fields that are still empty. This module does that as column
+operations: ES and BBF records are loaded into DataFrames, joined on
+BBF_New_Id__c = Id, and each ENRICHMENT_MAPPING field gets an "already set",
+"to enrich" and "no source" mask plus a column-wise picklist translation
+(mapping_reader.PicklistTable: each distinct value is translated once). Only
+the cells that are actually enriched are turned back into update dicts.
+
+The result matches the per-record loop the notebooks used before: the same
+updates, update_details, field_stats and unmapped_values.
+
+With field_metadata (field_coercion.describe_fields()) every value is also
+coerced to its BBF field type column-wise; values the API would reject
+(too long, not a number / date / boolean) are left out of the updates and
+listed in coercion_errors.
+
+Usage:
+    from enrichment_engine import build_enrichment_updates
+
+    build = build_enrichment_updates(es_records, bbf_records, ENRICHMENT_MAPPING, mapping)
+    build.print_summary()
+
+    updates = build.updates
+    update_details = build.update_details
+    field_stats = build.field_stats
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+from field_coercion import compile_coercers
+from mapping_reader import picklist_table
+
+# Geolocation compound fields: BBF field -> (BBF lat, BBF lng, ES lat, ES lng)
+LOCATION_GEOLOCATION = {
+    'Loc__c': ('Loc__Latitude__s', 'Loc__Longitude__s',
+               'Geocode_Lat_Long__Latitude__s', 'Geocode_Lat_Long__Longitude__s'),
+}
+
+# Scalar values that are falsy in the notebooks' `if value:` checks
+FALSY_SCALARS = ['', 0]
+
+
+class EnrichmentBuild:
+    """Updates and statistics produced by build_enrichment_updates()."""
+
+    def __init__(self, updates: List[Dict], update_details: List[Dict],
+                 field_stats: Dict[str, Dict[str, int]],
+                 unmapped_values: Dict[str, set], records_analyzed: int,
+                 coercion_errors: Dict[str, List[Dict]] = None):
+        self.updates = updates
+        self.update_details = update_details
+        self.field_stats = field_stats
+        self.unmapped_values = unmapped_values
+        self.records_analyzed = records_analyzed
+        self.coercion_errors = coercion_errors or {}
+
+    def print_summary(self, field_width: int = 35, show_unmapped: bool = False):
+        """Print the enrichment analysis table (and unmapped picklist values)."""
+        print(f"\n📊 Enrichment Analysis:")
+        print(f"   Total BBF records analyzed: {self.records_analyzed}")
+        print(f"   Records needing updates: {len(self.updates)}")
+        print(f"\n   Field Statistics (from mapping Excel):")
+        print(f"   {'Field':<{field_width}} | {'Enriched':>10} | {'Already Set':>12} | {'No Source':>10}")
+        print(f"   {'-' * (field_width + 40)}")
+        for field, stats in self.field_stats.items():
+            print(f"   {field:<{field_width}} | {stats['enriched']:>10} | "
+                  f"{stats['already_set']:>12} | {stats['no_source']:>10}")
+
+        if self.coercion_errors:
+            print(f"\n❌ Values rejected by type coercion (not sent):")
+            for field, errors in self.coercion_errors.items():
+                print(f"   {field}: {len(errors)} - {errors[0]['error']}")
+
+        if show_unmapped and self.unmapped_values:
+            print(f"\n⚠️  Unmapped picklist values (need review):")
+            for field, values in self.unmapped_values.items():
+                print(f"   {field}: {list(values)[:5]}{'...' if len(values) > 5 else ''}")
+
+
+# =============================================================================
+# COLUMN HELPERS
+# =============================================================================
+
+def _frame(records: List[Dict], columns: List[str]) -> pd.DataFrame:
+    """Records as an object-dtype frame restricted to columns (missing -> NaN)."""
+    if not records:
+        return pd.DataFrame(columns=columns, dtype=object)
+    return pd.DataFrame(records, columns=columns, dtype=object)
+
+
+def _truthy(values: pd.Series) -> pd.Series:
+    """Vectorized Python truthiness (None, NaN, '', 0 and False are empty)."""
+    try:
+        return values.notna() & ~values.isin(FALSY_SCALARS)
+    except TypeError:
+        # Unhashable values (compound fields) - fall back to bool() per cell
+        return values.notna() & values.map(bool)
+
+
+def _none_if_nan(value: Any) -> Any:
+    """Missing cells come back from the frame as NaN; the loop saw None."""
+    return None if isinstance(value, float) and value != value else value
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def build_enrichment_updates(es_records: List[Dict], bbf_records: List[Dict],
+                             enrichment_mapping: Dict[str, str], mapping: Dict,
+                             multipicklist: bool = False,
+                             truncate_datetimes: bool = False,
+                             geolocation: Dict[str, Tuple[str, str, str, str]] = None,
+                             field_metadata: Dict[str, Dict] = None) -> EnrichmentBuild:
+    """
+    Build the enrichment updates for BBF records that have empty mapped fields.
+
+    Args:
+        es_records: ES records (must include BBF_New_Id__c and the mapped ES fields)
+        bbf_records: BBF records (must include Id and the mapped BBF fields)
+        enrichment_mapping: Dict[BBF_field, ES_field] of fields to enrich
+        mapping: Result from load_mapping() (picklist translations)
+        multipicklist: Translate ';'-separated values part by part
+        truncate_datetimes: Keep only the date part of datetimes written to BBF
+            fields whose name contains 'Date' (fields without field_metadata)
+        geolocation: Compound geolocation fields, e.g. LOCATION_GEOLOCATION
+        field_metadata: BBF describe metadata per field (field_coercion.describe_fields);
+            values are coerced to the field types, rejected ones go to coercion_errors
+
+    Returns:
+        EnrichmentBuild with updates, update_details, field_stats, unmapped_values,
+        coercion_errors
+    """
+    geolocation = geolocation or {}
+    picklist_mappings = mapping.get('picklist_mappings', {})
+    coercers = compile_coercers(field_metadata) if field_metadata else {}
+
+    es_columns = ['BBF_New_Id__c', 'Id']
+    bbf_columns = ['Id']
+    for bbf_field, es_field in enrichment_mapping.items():
+        if bbf_field in geolocation:
+            bbf_lat, bbf_lng, es_lat, es_lng = geolocation[bbf_field]
+            bbf_columns += [bbf_lat, bbf_lng]
+            es_columns += [es_lat, es_lng]
+        else:
+            bbf_columns.append(bbf_field)
+            es_columns.append(es_field)
+    es_columns = list(dict.fromkeys(es_columns))
+    bbf_columns = list(dict.fromkeys(bbf_columns))
+
+    # Join: BBF records with a matching ES record, in BBF order (last ES record wins)
+    es_df = _frame(es_records, es_columns).drop_duplicates('BBF_New_Id__c', keep='last')
+    es_df = es_df.set_index('BBF_New_Id__c')
+    bbf_df = _frame(bbf_records, bbf_columns)
+    bbf_df = bbf_df[bbf_df['Id'].isin(es_df.index)]
+    source_rows = bbf_df.index.tolist()
+    bbf_df = bbf_df.reset_index(drop=True)
+    es_df = es_df.reindex(bbf_df['Id']).reset_index(drop=True)
+
+    field_stats = {field: {'enriched': 0, 'already_set': 0, 'no_source': 0}
+                   for field in enrichment_mapping}
+    for field in enrichment_mapping:
+        if field in coercers:
+            field_stats[field]['invalid'] = 0  # Values rejected by coercion (not in enriched)
+    unmapped_values = {}
+    coercion_errors = {}
+    enriched_cells = []  # One frame per field: pos, order, field, old, new, shown, source
+
+    for order, (bbf_field, es_field) in enumerate(enrichment_mapping.items()):
+        if bbf_field in geolocation:
+            bbf_lat, bbf_lng, es_lat, es_lng = geolocation[bbf_field]
+            already_set = _truthy(bbf_df[bbf_lat]) & _truthy(bbf_df[bbf_lng])
+            has_source = _truthy(es_df[es_lat]) & _truthy(es_df[es_lng])
+        else:
+            already_set = _truthy(bbf_df[bbf_field])
+            has_source = _truthy(es_df[es_field])
+        to_enrich = ~already_set & has_source
+
+        stats = field_stats[bbf_field]
+        stats['already_set'] = int(already_set.sum())
+        stats['enriched'] = int(to_enrich.sum())
+        stats['no_source'] = len(bbf_df) - stats['already_set'] - stats['enriched']
+        if not stats['enriched']:
+            continue
+
+        rows = to_enrich[to_enrich].index
+        if bbf_field in geolocation:
+            old_lat, old_lng = bbf_df.loc[rows, bbf_lat], bbf_df.loc[rows, bbf_lng]
+            new_lat, new_lng = es_df.loc[rows, es_lat], es_df.loc[rows, es_lng]
+            cells = pd.DataFrame({
+                'pos': rows,
+                'order': order,
+                'field': bbf_field,
+                'old': [f"({_none_if_nan(a)}, {_none_if_nan(b)})" for a, b in zip(old_lat, old_lng)],
+                'new': [{'latitude': a, 'longitude': b} for a, b in zip(new_lat, new_lng)],
+                'shown': [f"({a}, {b})" for a, b in zip(new_lat, new_lng)],
+                'source': es_field,
+            })
+        else:
+            source = es_df.loc[rows, es_field]
+            transformed = picklist_table(mapping, bbf_field).translate_column(source, multipicklist)
+            coercer = coercers.get(bbf_field)
+            if truncate_datetimes and 'Date' in bbf_field and coercer is None:
+                transformed = transformed.str.split('T', n=1).str[0]
+            if bbf_field in picklist_mappings:
+                unmapped = source.astype(str)[transformed == source.astype(str)]
+                if len(unmapped):
+                    unmapped_values[bbf_field] = set(unmapped)
+            if coercer is not None:
+                transformed, errors = coercer(transformed)
+                rejected = errors.notna()
+                if rejected.any():
+                    coercion_errors[bbf_field] = [
+                        {'bbf_id': bbf_id, 'value': value, 'error': error}
+                        for bbf_id, value, error in zip(bbf_df.loc[rows[rejected.values], 'Id'],
+                                                        source[rejected], errors[rejected])
+                    ]
+                    stats['enriched'] -= len(coercion_errors[bbf_field])
+                    stats['invalid'] = len(coercion_errors[bbf_field])
+                    if not stats['enriched']:
+                        continue
+                    rows = rows[~rejected.values]
+                    source, transformed = source[~rejected], transformed[~rejected]
+            cells = pd.DataFrame({
+                'pos': rows,
+                'order': order,
+                'field': bbf_field,
+                'old': bbf_df.loc[rows, bbf_field].values,
+                'new': transformed.values,
+                'shown': transformed.values,
+                'source': source.values,
+            })
+        enriched_cells.append(cells)
+
+    # Single pass over the enriched cells, grouped by record in BBF order
+    updates = []
+    update_details = []
+    if enriched_cells:
+        cells = pd.concat(enriched_cells, ignore_index=True)
+        cells = cells.sort_values(['pos', 'order'], kind='mergesort')
+        ids = bbf_df['Id'].tolist()
+        es_ids = es_df['Id'].tolist()
+
+        current = None
+        for pos, field, old, new, shown, source in cells[
+                ['pos', 'field', 'old', 'new', 'shown', 'source']].itertuples(index=False, name=None):
+            if pos != current:
+                current = pos
+                update_rec = {'Id': ids[pos]}
+                name = bbf_records[source_rows[pos]].get('Name', 'N/A')
+                rec_details = {'bbf_id': ids[pos], 'es_id': _none_if_nan(es_ids[pos]), 'name': name, 'fields': []}
+                updates.append(update_rec)
+                update_details.append(rec_details)
+            update_rec[field] = new
+            rec_details['fields'].append({'field': field, 'old': _none_if_nan(old), 'new': shown, 'source': source})
+
+    return EnrichmentBuild(updates, update_details, field_stats, unmapped_values, len(bbf_records),
+                           coercion_errors)
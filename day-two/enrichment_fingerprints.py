@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Enrichment Fingerprints
+=======================
+Incremental re-runs of the Day Two enrichment notebooks.
+
+Each migrated record gets a fingerprint: a hash of its ES source values, the
+part of the mapping that applies to it (the enriched fields and the picklist
+translations of its own values) and the transformer version (the source of
+enrichment_engine.py, field_coercion.py and mapping_reader.py). After a live run the fingerprints
+of the records that were enriched or needed nothing are appended to the run
+journal (journal/<key>_enrichment/). The next run only rebuilds and pushes the
+records whose fingerprint changed: an unchanged re-run processes nothing, and
+a picklist fix re-processes only the records carrying that value.
+
+Records whose update failed are not fingerprinted and are retried. Changes made
+directly in BBF are not detected; set INCREMENTAL = False for a full refresh.
+
+Usage:
+    from enrichment_fingerprints import EnrichmentFingerprints
+
+    fingerprints = EnrichmentFingerprints("ban", ENRICHMENT_MAPPING, mapping, run_id=timestamp)
+    es_records = fingerprints.changed(es_records)
+    ...
+    fingerprints.record_run(es_records, bbf_records, updates, update_results)
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List
+
+from migration_engine.journal import RunJournal
+
+FINGERPRINT_EVENT = 'fingerprint'
+
+# Modules whose code decides the enrichment values
+TRANSFORMER_SOURCES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'enrichment_engine.py'),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'field_coercion.py'),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mapping_reader.py'),
+]
+
+
+def _digest(payload) -> str:
+    """Stable short hash of a JSON-serialisable payload."""
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:24]
+
+
+def transformer_version(paths: List[str] = None) -> str:
+    """Hash of the source files that transform ES values into BBF values."""
+    sha = hashlib.sha256()
+    for path in paths or TRANSFORMER_SOURCES:
+        with open(path, 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()[:24]
+
+
+def record_fingerprint(es_rec: Dict, enrichment_mapping: Dict[str, str],
+                       picklist_mappings: Dict[str, Dict[str, str]], version: str) -> str:
+    """
+    Fingerprint of one ES record.
+
+    Args:
+        es_rec: ES record as queried (the 'attributes' key is ignored)
+        enrichment_mapping: Dict[BBF_field, ES_field] being enriched
+        picklist_mappings: mapping['picklist_mappings']
+        version: transformer_version()
+    """
+    values = {k: v for k, v in es_rec.items() if k != 'attributes'}
+    applied = {}
+    for bbf_field, es_field in enrichment_mapping.items():
+        picklist_map = picklist_mappings.get(bbf_field) or {}
+        es_value = es_rec.get(es_field)
+        if picklist_map and es_value is not None:
+            # Translations of this record's value(s) only - multipicklist parts included
+            applied[bbf_field] = [es_field, [picklist_map.get(part.strip())
+                                             for part in str(es_value).split(';')]]
+        else:
+            applied[bbf_field] = [es_field, None]
+    return _digest([version, values, applied])
+
+
+class EnrichmentFingerprints:
+    """
+    Fingerprints for one enrichment notebook, stored in the run journal.
+
+    Args:
+        key: Enrichment key, e.g. 'ban' (journal directory <key>_enrichment)
+        enrichment_mapping: Dict[BBF_field, ES_field] being enriched
+        mapping: Result from load_mapping()
+        run_id: Run identifier (the notebook timestamp)
+        directory: Journal root directory (defaults to MIGRATION_JOURNAL_DIR)
+    """
+
+    def __init__(self, key: str, enrichment_mapping: Dict[str, str], mapping: Dict,
+                 run_id: str = None, directory: str = None):
+        self.key = key
+        self.journal = RunJournal(f"{key}_enrichment", run_id=run_id, directory=directory)
+        self.directory = directory
+        self.enrichment_mapping = enrichment_mapping
+        self.picklist_mappings = mapping.get('picklist_mappings', {})
+        self.version = transformer_version()
+        self._previous = None
+        self.unchanged_count = 0
+
+    def previous(self) -> Dict[str, str]:
+        """BBF Id -> fingerprint from earlier runs (latest run wins)."""
+        if self._previous is None:
+            self._previous = {}
+            for entry in RunJournal.read_all(self.journal.object_name, directory=self.directory):
+                if entry.get('event') == FINGERPRINT_EVENT:
+                    self._previous[entry['bbf_id']] = entry['fingerprint']
+        return self._previous
+
+    def fingerprint(self, es_rec: Dict) -> str:
+        return record_fingerprint(es_rec, self.enrichment_mapping, self.picklist_mappings, self.version)
+
+    def changed(self, es_records: List[Dict]) -> List[Dict]:
+        """ES records that are new or whose fingerprint differs from the last run."""
+        previous = self.previous()
+        changed = [r for r in es_records
+                   if previous.get(r.get('BBF_New_Id__c')) != self.fingerprint(r)]
+        self.unchanged_count = len(es_records) - len(changed)
+        return changed
+
+    def record_run(self, es_records: List[Dict], bbf_records: List[Dict],
+                   updates: List[Dict], update_results: List[Dict],
+                   rejected_ids: Iterable[str] = ()) -> int:
+        """
+        Journal the fingerprints of records that are now up to date in BBF.
+
+        A record is up to date when its BBF record was analyzed and either
+        needed no update or its update succeeded, and none of its values was
+        rejected by type coercion (rejected_ids, EnrichmentBuild.coercion_errors).
+
+        Returns:
+            Number of fingerprints recorded
+        """
+        analyzed = {r['Id'] for r in bbf_records}
+        pushed = {u['Id'] for u in updates}
+        succeeded = {r.get('id') for r in update_results if r.get('success')}
+        rejected = set(rejected_ids)
+
+        rows = []
+        for es_rec in es_records:
+            bbf_id = es_rec.get('BBF_New_Id__c')
+            if (bbf_id not in analyzed or bbf_id in rejected
+                    or (bbf_id in pushed and bbf_id not in succeeded)):
+                continue
+            rows.append({'bbf_id': bbf_id, 'es_id': es_rec.get('Id'),
+                         'fingerprint': self.fingerprint(es_rec)})
+        self.journal.record_many(FINGERPRINT_EVENT, rows)
+        return len(rows)
@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+"""
+Enrichment Runner
+=================
+Runs the Day Two enrichment for one, several or all objects in one process.
+
+The seven enrichment notebooks share the same steps - query migrated ES
+records, query the BBF records, build the updates, apply them, write the Excel
+report - and differ only in a few settings (Day 1 field list, extra query
+fields, update style). Those settings live in ENRICHMENT_OBJECTS, keyed like
+mapping_reader.MAPPING_FILES; everything else is derived from the mapping
+Excel. Objects run concurrently on one ES and one BBF connection, and every
+API call goes through a shared RateLimiter.
+
+Usage:
+    python enrichment_runner.py all                       # dry run, all 7 objects
+    python enrichment_runner.py ban contact --limit 100
+    python enrichment_runner.py all --live --workers 4 --rate 5
+
+Configuration:
+    Set environment variables (not needed against the fake org server):
+        ES_SF_USERNAME / ES_SF_PASSWORD / ES_SF_SECURITY_TOKEN
+        BBF_SF_USERNAME / BBF_SF_PASSWORD / BBF_SF_SECURITY_TOKEN
+        ES_SF_DOMAIN / BBF_SF_DOMAIN  (default 'test')
+
+    from enrichment_runner import run_enrichments
+    results = run_enrichments(['ban', 'contact'], es_sf, bbf_sf, dry_run=True)
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List
+
+# Shared migration runtime (repo root)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mapping_reader import MAPPING_FILES, load_mapping, get_enrichment_fields
+from enrichment_engine import build_enrichment_updates, LOCATION_GEOLOCATION
+from enrichment_fingerprints import EnrichmentFingerprints
+from field_coercion import describe_fields
+from migration_engine.ledger import RunLedger
+from migration_engine.report import ReportWriter, update_detail_rows
+
+# Credentials are read from the environment, per org prefix (ES_ / BBF_):
+#   <ORG>_SF_USERNAME, <ORG>_SF_PASSWORD, <ORG>_SF_SECURITY_TOKEN, <ORG>_SF_DOMAIN
+CREDENTIAL_ENV = ('USERNAME', 'PASSWORD', 'SECURITY_TOKEN')
+DEFAULT_DOMAIN = 'test'
+
+# BBF Ids per "WHERE Id IN (...)" query
+BBF_QUERY_CHUNK_SIZE = 200
+
+DEFAULT_WORKERS = 4
+DEFAULT_CALLS_PER_SECOND = 10.0
+
+
+class EnrichmentObject:
+    """
+    Per-object settings that are not in the mapping Excel.
+
+    Args:
+        key: MAPPING_FILES key
+        label: Display name ('Service Charge')
+        es_object: ES sObject queried
+        bbf_object: BBF sObject updated
+        day1_fields: BBF fields migrated on Day 1 (excluded from enrichment)
+        es_extra_fields: ES fields queried besides the mapped ones
+        build_options: Extra build_enrichment_updates() arguments
+        update_batch_size: Bulk update batch size (None: one bulk call)
+        rest_updates: Update one record at a time over REST instead of Bulk
+    """
+
+    def __init__(self, key: str, label: str, es_object: str, bbf_object: str,
+                 day1_fields: List[str], es_extra_fields: List[str] = None,
+                 build_options: Dict = None, update_batch_size: int = None,
+                 rest_updates: bool = False):
+        self.key = key
+        self.label = label
+        self.es_object = es_object
+        self.bbf_object = bbf_object
+        self.day1_fields = day1_fields
+        self.es_extra_fields = es_extra_fields if es_extra_fields is not None else ['Name']
+        self.build_options = build_options or {}
+        self.update_batch_size = update_batch_size
+        self.rest_updates = rest_updates
+
+
+ENRICHMENT_OBJECTS = {
+    'location': EnrichmentObject(
+        'location', 'Location', 'Address__c', 'Location__c',
+        ['Name', 'City__c', 'State__c', 'County__c', 'PostalCode__c',
+         'Street__c', 'Full_Address__c', 'CLLICode__c',
+         'businessUnit__c', 'OwnerId', 'ES_Legacy_ID__c', 'Name_Is_Set_Manually__c'],
+        build_options={'geolocation': LOCATION_GEOLOCATION},
+    ),
+    'account': EnrichmentObject(
+        'account', 'Account', 'Account', 'Account',
+        ['Name', 'BillingStreet', 'BillingCity', 'BillingState', 'BillingPostalCode',
+         'Phone', 'Website', 'Industry', 'Type', 'OwnerId', 'ES_Legacy_ID__c'],
+        update_batch_size=10,  # Small batches for Account due to CPQ triggers
+    ),
+    'contact': EnrichmentObject(
+        'contact', 'Contact', 'Contact', 'Contact',
+        ['FirstName', 'LastName', 'Email', 'Phone', 'Title',
+         'AccountId', 'OwnerId', 'ES_Legacy_ID__c'],
+        es_extra_fields=['Name', 'FirstName', 'LastName'],
+        build_options={'multipicklist': True},
+    ),
+    'ban': EnrichmentObject(
+        'ban', 'BAN', 'Billing_Invoice__c', 'BAN__c',
+        ['Name', 'Account__c', 'Billing_Street__c', 'Billing_City__c',
+         'OwnerId', 'ES_Legacy_ID__c'],
+    ),
+    'service': EnrichmentObject(
+        'service', 'Service', 'Order', 'Service__c',
+        ['Name', 'BAN__c', 'Account__c', 'A_Location__c', 'Z_Location__c',
+         'Status__c', 'OwnerId', 'ES_Legacy_ID__c'],
+        es_extra_fields=['Name', 'OrderNumber'],
+        rest_updates=True,  # Individual updates due to @future method limits
+    ),
+    'service_charge': EnrichmentObject(
+        'service_charge', 'Service Charge', 'OrderItem', 'Service_Charge__c',
+        ['Name', 'Service__c', 'mrc__c', 'nrc__c', 'ES_Legacy_ID__c'],
+        es_extra_fields=[],
+    ),
+    'offnet': EnrichmentObject(
+        'offnet', 'Off Net', 'Off_Net__c', 'Off_Net__c',
+        ['Name', 'Service__c', 'ES_Legacy_ID__c'],
+    ),
+}
+
+
+class RateLimiter:
+    """
+    Spaces API calls from all threads to at most calls_per_second.
+
+    Args:
+        calls_per_second: Allowed call rate (0 or None: unlimited)
+    """
+
+    def __init__(self, calls_per_second: float = DEFAULT_CALLS_PER_SECOND):
+        self.interval = 1.0 / calls_per_second if calls_per_second else 0.0
+        self.calls = 0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call slot."""
+        with self._lock:
+            self.calls += 1
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """fn(*args, **kwargs) in the next call slot."""
+        self.wait()
+        return fn(*args, **kwargs)
+
+
+class EnrichmentResult:
+    """Outcome of one object's enrichment run."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.es_records = 0
+        self.unchanged = 0
+        self.records_analyzed = 0
+        self.updates = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.unmapped_fields = 0
+        self.rejected_values = 0
+        self.output_file = None
+        self.error = None
+        self.seconds = 0.0
+
+
+_print_lock = threading.Lock()
+
+
+def _log(key: str, message: str):
+    """Print one line prefixed with the object key (threads interleave lines, not characters)."""
+    with _print_lock:
+        print(f"[{key}] {message}")
+
+
+# =============================================================================
+# QUERY / APPLY
+# =============================================================================
+
+def es_query_fields(enrichment_mapping: Dict[str, str], obj: EnrichmentObject) -> List[str]:
+    """ES fields to query: mapped fields (geolocation as lat/lng) plus Id / BBF_New_Id__c."""
+    fields = []
+    geolocation = obj.build_options.get('geolocation', {})
+    for bbf_field, es_field in enrichment_mapping.items():
+        if bbf_field in geolocation:
+            fields.extend(geolocation[bbf_field][2:])
+        else:
+            fields.append(es_field)
+    fields.extend(['Id', 'BBF_New_Id__c'] + obj.es_extra_fields)
+    return list(dict.fromkeys(fields))
+
+
+def bbf_query_fields(enrichment_mapping: Dict[str, str], obj: EnrichmentObject) -> List[str]:
+    """BBF fields to query: mapped fields (geolocation as lat/lng) plus Id, ES_Legacy_ID__c, Name."""
+    fields = []
+    geolocation = obj.build_options.get('geolocation', {})
+    for bbf_field in enrichment_mapping:
+        if bbf_field in geolocation:
+            fields.extend(geolocation[bbf_field][:2])
+        else:
+            fields.append(bbf_field)
+    fields.extend(['Id', 'ES_Legacy_ID__c', 'Name'])
+    return list(dict.fromkeys(fields))
+
+
+def query_bbf_records(obj: EnrichmentObject, bbf_sf, es_records: List[Dict], fields: List[str],
+                      limiter: RateLimiter, chunk_size: int = BBF_QUERY_CHUNK_SIZE) -> List[Dict]:
+    """BBF records linked from es_records (BBF_New_Id__c), queried chunk_size Ids at a time."""
+    bbf_ids = list({r['BBF_New_Id__c']: r for r in es_records})
+    fields_str = ', '.join(fields)
+    records = []
+    for i in range(0, len(bbf_ids), chunk_size):
+        ids_str = "','".join(bbf_ids[i:i + chunk_size])
+        query = f"SELECT {fields_str} FROM {obj.bbf_object} WHERE Id IN ('{ids_str}')"
+        records.extend(limiter.call(bbf_sf.query_all, query)['records'])
+    return records
+
+
+def apply_updates(obj: EnrichmentObject, updates: List[Dict], bbf_sf,
+                   limiter: RateLimiter) -> List[Dict]:
+    """Push updates the way the object's notebook does; returns per-record results."""
+    if obj.rest_updates:
+        sobject = getattr(bbf_sf, obj.bbf_object)
+        results = []
+        for update in updates:
+            try:
+                limiter.call(sobject.update, update['Id'], {k: v for k, v in update.items() if k != 'Id'})
+                results.append({'success': True, 'id': update['Id']})
+            except Exception as e:
+                results.append({'success': False, 'id': update['Id'], 'errors': str(e)})
+        return results
+
+    bulk = getattr(bbf_sf.bulk, obj.bbf_object)
+    batch_size = obj.update_batch_size or len(updates)
+    results = []
+    for i in range(0, len(updates), batch_size):
+        batch = updates[i:i + batch_size]
+        try:
+            results.extend(limiter.call(bulk.update, batch))
+        except Exception as e:
+            _log(obj.key, f"❌ Error in update batch {i // batch_size + 1}: {e}")
+    return results
+
+
+def _write_report(obj: EnrichmentObject, path: str, mapping_file: str, dry_run: bool,
+                  enrichment_mapping: Dict[str, str], build) -> str:
+    """Excel report with the same sheets as the notebooks."""
+    report = ReportWriter(path)
+
+    summary_rows = [
+        [],
+        ["Mapping File:", mapping_file],
+        ["Run Type:", "DRY RUN" if dry_run else "LIVE UPDATE"],
+        ["Timestamp:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+        ["Records Analyzed:", build.records_analyzed],
+        ["Records Updated:", len(build.updates)],
+        [],
+        ["Field (from mapping)", "Enriched", "Already Set", "No Source"],
+    ]
+    for field, stats in build.field_stats.items():
+        summary_rows.append([field, stats['enriched'], stats['already_set'], stats['no_source']])
+    if build.unmapped_values:
+        summary_rows.append([])
+        summary_rows.append(["Unmapped Picklist Values (need review):"])
+        for field, values in build.unmapped_values.items():
+            summary_rows.append([field, ", ".join(list(values)[:10])])
+    if build.coercion_errors:
+        summary_rows.append([])
+        summary_rows.append(["Rejected Values (not sent):"])
+        for field, errors in build.coercion_errors.items():
+            summary_rows.append([field, len(errors), errors[0]['error']])
+    report.add_summary("Summary", f"{obj.label} Enrichment Summary", summary_rows)
+
+    headers = [f"BBF {obj.label} ID", "Name", "Field", "Old Value", "New Value", "ES Source"]
+    report.add_table("Update Details", headers, update_detail_rows(build.update_details), max_width=50)
+
+    report.add_table(
+        "Mapping Reference",
+        ["BBF Field", "ES Field"],
+        enrichment_mapping.items(),
+        heading="Field Mappings Used (from Excel)",
+    )
+    return report.save()
+
+
+# =============================================================================
+# RUN
+# =============================================================================
+
+def run_enrichment(key: str, es_sf, bbf_sf, limiter: RateLimiter = None,
+                   dry_run: bool = True, limit: int = None, incremental: bool = True,
+                   output_dir: str = '.', timestamp: str = None) -> EnrichmentResult:
+    """
+    Enrich one object: query, build, apply, report (the notebook steps).
+
+    Args:
+        key: ENRICHMENT_OBJECTS / MAPPING_FILES key
+        es_sf: ES Salesforce connection (shared between threads)
+        bbf_sf: BBF Salesforce connection (shared between threads)
+        limiter: Shared RateLimiter for all API calls
+        dry_run: Build and report only, no BBF updates
+        limit: ES record LIMIT (None for all records)
+        incremental: Skip records whose fingerprint is unchanged since the last live run
+        output_dir: Directory for the Excel report
+        timestamp: Run timestamp (report name and journal run id)
+
+    Returns:
+        EnrichmentResult
+    """
+    obj = ENRICHMENT_OBJECTS[key]
+    limiter = limiter or RateLimiter(None)
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    result = EnrichmentResult(key)
+    started = time.monotonic()
+
+    mapping_file = MAPPING_FILES[key]
+    mapping = load_mapping(mapping_file)
+    enrichment_mapping = get_enrichment_fields(mapping, obj.day1_fields)
+    _log(key, f"{len(enrichment_mapping)} enrichment fields from {mapping_file}")
+
+    # ES records migrated on Day 1
+    es_query = f"SELECT {', '.join(es_query_fields(enrichment_mapping, obj))} FROM {obj.es_object} WHERE BBF_New_Id__c != null"
+    if limit:
+        es_query += f" ORDER BY Id LIMIT {limit}"  # Same records every limited run
+    es_records = limiter.call(es_sf.query_all, es_query)['records']
+    result.es_records = len(es_records)
+
+    fingerprints = EnrichmentFingerprints(key, enrichment_mapping, mapping, run_id=timestamp)
+    if incremental:
+        es_records = fingerprints.changed(es_records)
+        result.unchanged = fingerprints.unchanged_count
+    _log(key, f"{result.es_records} migrated {obj.es_object} records, {len(es_records)} to process")
+
+    # Current BBF values
+    bbf_records = query_bbf_records(obj, bbf_sf, es_records,
+                                    bbf_query_fields(enrichment_mapping, obj), limiter)
+
+    # BBF field types, lengths and required flags (cached describe)
+    field_metadata = limiter.call(describe_fields, bbf_sf, obj.bbf_object)
+
+    build = build_enrichment_updates(es_records, bbf_records, enrichment_mapping, mapping,
+                                     field_metadata=field_metadata, **obj.build_options)
+    result.records_analyzed = build.records_analyzed
+    result.updates = len(build.updates)
+    result.unmapped_fields = len(build.unmapped_values)
+    result.rejected_values = sum(len(errors) for errors in build.coercion_errors.values())
+    if result.rejected_values:
+        _log(key, f"⚠️  {result.rejected_values} values rejected by type coercion (see the Summary sheet)")
+
+    if dry_run or not build.updates:
+        update_results = [{'success': True, 'id': u['Id']} for u in build.updates]
+    else:
+        _log(key, f"Updating {len(build.updates)} {obj.bbf_object} records...")
+        update_results = apply_updates(obj, build.updates, bbf_sf, limiter)
+    result.succeeded = sum(1 for r in update_results if r['success'])
+    result.failed = len(build.updates) - result.succeeded
+
+    if not dry_run:
+        rejected_ids = [e['bbf_id'] for errors in build.coercion_errors.values() for e in errors]
+        fingerprints.record_run(es_records, bbf_records, build.updates, update_results, rejected_ids)
+        ledger = RunLedger(f"{key}_enrichment", run_id=timestamp, batch_size=obj.update_batch_size)
+        ledger.record_updates(build.update_details, update_results=update_results)
+
+    output_file = os.path.join(output_dir, f"{key}_enrichment_{timestamp}.xlsx")
+    result.output_file = _write_report(obj, output_file, mapping_file, dry_run, enrichment_mapping, build)
+    result.seconds = time.monotonic() - started
+    _log(key, f"✅ {result.updates} updates ({result.failed} failed) in {result.seconds:.1f}s -> {output_file}")
+    return result
+
+
+def run_enrichments(keys: List[str], es_sf, bbf_sf, workers: int = DEFAULT_WORKERS,
+                    calls_per_second: float = DEFAULT_CALLS_PER_SECOND,
+                    **kwargs) -> List[EnrichmentResult]:
+    """
+    Run several objects concurrently on shared connections and one rate limit.
+
+    An object that raises is reported in its result's error; the others carry on.
+
+    Args:
+        keys: Object keys (or ['all'])
+        es_sf: ES Salesforce connection
+        bbf_sf: BBF Salesforce connection
+        workers: Objects processed at the same time
+        calls_per_second: Shared API call rate across all objects
+        **kwargs: run_enrichment() options (dry_run, limit, incremental, output_dir)
+
+    Returns:
+        One EnrichmentResult per key, in ENRICHMENT_OBJECTS order
+    """
+    if 'all' in keys:
+        keys = list(ENRICHMENT_OBJECTS)
+    unknown = [k for k in keys if k not in ENRICHMENT_OBJECTS]
+    if unknown:
+        raise ValueError(f"Unknown enrichment object(s): {', '.join(unknown)} "
+                         f"(choose from {', '.join(ENRICHMENT_OBJECTS)} or 'all')")
+    keys = [k for k in ENRICHMENT_OBJECTS if k in keys]
+
+    limiter = RateLimiter(calls_per_second)
+    kwargs.setdefault('timestamp', datetime.now().strftime("%Y%m%d_%H%M%S"))
+
+    def run_one(key: str) -> EnrichmentResult:
+        try:
+            return run_enrichment(key, es_sf, bbf_sf, limiter=limiter, **kwargs)
+        except Exception as e:
+            _log(key, f"❌ {type(e).__name__}: {e}")
+            result = EnrichmentResult(key)
+            result.error = f"{type(e).__name__}: {e}"
+            return result
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(run_one, keys))
+    print(f"\n📡 API calls: {limiter.calls}")
+    return results
+
+
+def print_combined_summary(results: List[EnrichmentResult], dry_run: bool = True):
+    """One table for all objects, plus totals and errors."""
+    print("\n" + "=" * 100)
+    print(f"DAY TWO ENRICHMENT SUMMARY{' (DRY RUN)' if dry_run else ''}")
+    print("=" * 100)
+    print(f"{'Object':<16} | {'ES':>7} | {'Unchanged':>9} | {'Analyzed':>8} | {'Updates':>7} | "
+          f"{'Failed':>6} | {'Time':>7} | Output")
+    print("-" * 100)
+    for r in results:
+        if r.error:
+            print(f"{r.key:<16} | ❌ {r.error}")
+            continue
+        print(f"{r.key:<16} | {r.es_records:>7} | {r.unchanged:>9} | {r.records_analyzed:>8} | "
+              f"{r.updates:>7} | {r.failed:>6} | {r.seconds:>6.1f}s | {os.path.basename(r.output_file)}")
+    print("-" * 100)
+    ok = [r for r in results if not r.error]
+    print(f"{'TOTAL':<16} | {sum(r.es_records for r in ok):>7} | {sum(r.unchanged for r in ok):>9} | "
+          f"{sum(r.records_analyzed for r in ok):>8} | {sum(r.updates for r in ok):>7} | "
+          f"{sum(r.failed for r in ok):>6} |")
+
+    unmapped = [r.key for r in ok if r.unmapped_fields]
+    if unmapped:
+        print(f"\n⚠️  Unmapped picklist values in: {', '.join(unmapped)} (see the Summary sheets)")
+    rejected = [f"{r.key} ({r.rejected_values})" for r in ok if r.rejected_values]
+    if rejected:
+        print(f"\n❌ Values rejected by type coercion in: {', '.join(rejected)} (see the Summary sheets)")
+    if dry_run:
+        print("\n⚠️  This was a DRY RUN - no changes were made (use --live to apply updates)")
+
+
+def org_credentials(org: str, required: bool = True) -> Dict[str, str]:
+    """
+    Salesforce login arguments of one org from <ORG>_SF_* environment variables.
+
+    Args:
+        org: Org prefix ('ES' or 'BBF')
+        required: Exit with setup instructions when a variable is missing
+
+    Returns:
+        Dict of username / password / security_token / domain
+    """
+    prefix = f"{org}_SF_"
+    missing = [prefix + name for name in CREDENTIAL_ENV if not os.environ.get(prefix + name)]
+    if missing and required:
+        print(f"\nERROR: {org} credentials not configured ({', '.join(missing)}).")
+        print("Set environment variables:")
+        print(f"  export {prefix}USERNAME='your.email@company.com'")
+        print(f"  export {prefix}PASSWORD='yourpassword'")
+        print(f"  export {prefix}SECURITY_TOKEN='yoursecuritytoken'")
+        print(f"  export {prefix}DOMAIN='{DEFAULT_DOMAIN}'")
+        sys.exit(1)
+    return {
+        'username': os.environ.get(prefix + 'USERNAME', ''),
+        'password': os.environ.get(prefix + 'PASSWORD', ''),
+        'security_token': os.environ.get(prefix + 'SECURITY_TOKEN', ''),
+        'domain': os.environ.get(prefix + 'DOMAIN') or DEFAULT_DOMAIN,
+    }
+
+
+def connect():
+    """ES and BBF connections (the fake org server when SF_FAKE_ORG_URL is set)."""
+    from simple_salesforce import Salesforce
+    from migration_engine.fake_org.client import FAKE_ORG_URL_ENV, fake_session_from_env
+
+    # The fake org server accepts any login, so credentials are optional there
+    required = not os.environ.get(FAKE_ORG_URL_ENV)
+    es_sf = Salesforce(**org_credentials('ES', required), session=fake_session_from_env("es"))
+    bbf_sf = Salesforce(**org_credentials('BBF', required), session=fake_session_from_env("bbf"))
+    return es_sf, bbf_sf
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run Day Two enrichment for one or more objects')
+    parser.add_argument('objects', nargs='+', choices=list(ENRICHMENT_OBJECTS) + ['all'],
+                        help="Object keys, or 'all'")
+    parser.add_argument('--live', action='store_true', help='Apply updates (default: dry run)')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='ES record LIMIT per object (implies --full-refresh)')
+    parser.add_argument('--full-refresh', action='store_true',
+                        help='Ignore fingerprints from earlier runs')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Objects run concurrently (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--rate', type=float, default=DEFAULT_CALLS_PER_SECOND,
+                        help=f'Shared API calls per second, 0 = unlimited (default: {DEFAULT_CALLS_PER_SECOND})')
+    parser.add_argument('--output-dir', default='.', help='Directory for the Excel reports')
+    args = parser.parse_args()
+
+    try:
+        es_sf, bbf_sf = connect()
+    except ImportError as e:
+        print(f"Error: {e}")
+        print("Install with: pip install simple-salesforce pandas openpyxl")
+        sys.exit(1)
+    print("✅ Connected to ES and BBF")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    results = run_enrichments(
+        args.objects, es_sf, bbf_sf,
+        workers=args.workers,
+        calls_per_second=args.rate,
+        dry_run=not args.live,
+        limit=args.limit,
+        # A limited run re-reads the same first records, which an incremental run would skip
+        incremental=not (args.full_refresh or args.limit),
+        output_dir=args.output_dir,
+    )
+    print_combined_summary(results, dry_run=not args.live)
+    if any(r.error or r.failed for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Field Coercion
+==============
+Typed coercion of enrichment values from BBF describe metadata.
+
+Picklist translation leaves every enrichment value a string, and the only
+type handling used to be a name heuristic ('Date' in the field name -> cut
+the time off). A FieldCoercer is compiled per BBF field from its describe
+metadata (type, length, scale, precision, nillable) and converts a whole
+column at once:
+
+    date                         'YYYY-MM-DD' (time part dropped)
+    datetime                     ISO 8601 string
+    double / currency / percent  float rounded half-up to scale, as the org rounds
+                                 ('$', ',' and '%' removed)
+    int / long                   int (values with a fraction are rejected, not rounded)
+    boolean                      True / False (true/false, yes/no, y/n, 1/0)
+    string types                 str, checked against length
+
+Values that cannot be sent (too long, not a number, not a whole number for
+an int field, not a date, empty in a required field) get an error message shaped like the API's (STRING_TOO_LONG,
+INVALID_TYPE_ON_FIELD_IN_RECORD, ...) so they are caught before the update
+round trip. Other types (reference, id, address, location ...) pass through.
+
+Describe metadata is cached per sObject as JSON in mappings/.cache/ (or
+BBF_DESCRIBE_CACHE_DIR) for DESCRIBE_MAX_AGE_HOURS.
+
+Usage:
+    from field_coercion import describe_fields, compile_coercers
+
+    field_metadata = describe_fields(bbf_sf, 'Service__c')
+    build = build_enrichment_updates(es_records, bbf_records, ENRICHMENT_MAPPING, mapping,
+                                     field_metadata=field_metadata)
+    build.coercion_errors   # {BBF field: [{'bbf_id', 'value', 'error'}]}
+
+    coercers = compile_coercers(field_metadata)
+    values, errors = coercers['PON__c'](df['PON__c'])
+"""
+
+import json
+import os
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Tuple
+
+import pandas as pd
+
+DESCRIBE_CACHE_ENV = 'BBF_DESCRIBE_CACHE_DIR'
+DESCRIBE_CACHE_DIR = os.environ.get(
+    DESCRIBE_CACHE_ENV, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mappings', '.cache'))
+
+# Cached describe metadata older than this is fetched again
+DESCRIBE_MAX_AGE_HOURS = 24
+
+# Describe keys kept in the cache
+DESCRIBE_KEYS = ('name', 'label', 'type', 'length', 'scale', 'precision', 'nillable')
+
+STRING_TYPES = ('string', 'textarea', 'picklist', 'multipicklist', 'combobox',
+                'email', 'phone', 'url', 'encryptedstring')
+NUMBER_TYPES = ('double', 'currency', 'percent')
+INTEGER_TYPES = ('int', 'long')
+
+TRUE_STRINGS = ('true', 'yes', 'y', '1', 't')
+FALSE_STRINGS = ('false', 'no', 'n', '0', 'f')
+
+
+# =============================================================================
+# DESCRIBE CACHE
+# =============================================================================
+
+def describe_cache_path(sobject: str, cache_dir: str = None) -> str:
+    return os.path.join(cache_dir or DESCRIBE_CACHE_DIR, f"describe_{sobject}.json")
+
+
+def describe_fields(sf, sobject: str, cache_dir: str = None, refresh: bool = False,
+                    max_age_hours: float = DESCRIBE_MAX_AGE_HOURS) -> Dict[str, Dict]:
+    """
+    Field describe metadata of an sObject, from the cache when it is fresh.
+
+    Args:
+        sf: Salesforce connection (simple_salesforce)
+        sobject: sObject API name, e.g. 'Service__c'
+        cache_dir: Cache directory (defaults to DESCRIBE_CACHE_DIR)
+        refresh: Ignore the cache and describe again
+        max_age_hours: Cache lifetime
+
+    Returns:
+        Dict[field name, {'type', 'length', 'scale', 'precision', 'nillable', ...}]
+    """
+    path = describe_cache_path(sobject, cache_dir)
+    if not refresh and os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if time.time() - cached['fetched_at'] < max_age_hours * 3600:
+                return cached['fields']
+        except (OSError, ValueError, KeyError):
+            pass  # Unreadable cache - describe again
+
+    describe = getattr(sf, sobject).describe()
+    fields = {field['name']: {key: field.get(key) for key in DESCRIBE_KEYS}
+              for field in describe['fields']}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'sobject': sobject, 'fetched_at': time.time(), 'fields': fields}, f, indent=1)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not cache describe of {sobject}: {e}")
+    return fields
+
+
+# =============================================================================
+# COERCERS
+# =============================================================================
+
+def _text(values: pd.Series) -> pd.Series:
+    """str() of every value as an object Series; missing values stay missing."""
+    return values.astype(str).where(values.notna()).astype(object)
+
+
+def _flag(mask) -> pd.Series:
+    return mask.fillna(False).astype(bool)
+
+
+class FieldCoercer:
+    """
+    Column converter for one BBF field, compiled from its describe metadata.
+
+    Calling it with a Series returns (coerced values, errors): errors holds
+    an API-style message for every value that cannot be sent, None otherwise.
+    """
+
+    def __init__(self, name: str, metadata: Dict):
+        self.name = name
+        self.type = metadata.get('type') or 'string'
+        self.length = metadata.get('length') or 0
+        self.scale = metadata.get('scale') or 0
+        self.precision = metadata.get('precision') or 0
+        self.nillable = metadata.get('nillable') is not False
+
+        if self.type == 'date':
+            self._convert = self._date
+        elif self.type == 'datetime':
+            self._convert = self._datetime
+        elif self.type in NUMBER_TYPES or self.type in INTEGER_TYPES:
+            self._convert = self._number
+        elif self.type == 'boolean':
+            self._convert = self._boolean
+        elif self.type in STRING_TYPES:
+            self._convert = self._string
+        else:
+            self._convert = None  # Passed through
+
+    def __repr__(self):
+        return f"FieldCoercer({self.name!r}, {self.type!r})"
+
+    def __call__(self, values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        errors = pd.Series([None] * len(values), index=values.index, dtype=object)
+        if self._convert is None:
+            return values, errors
+
+        text = _text(values)
+        coerced = self._convert(text, errors)
+        if not self.nillable:
+            empty = text.isna() | _flag(text.str.strip() == '')
+            errors[empty & errors.isna()] = f"REQUIRED_FIELD_MISSING: Required fields are missing: [{self.name}]"
+        return coerced.where(errors.isna(), values).astype(object), errors
+
+    def _reject(self, errors: pd.Series, invalid: pd.Series, text: pd.Series, code: str, problem: str):
+        """Set an API-style message on the invalid rows that have none yet."""
+        invalid = invalid & errors.isna()
+        if invalid.any():
+            errors[invalid] = [f"{code}: {self.name}: {problem}: {value[:40]}" for value in text[invalid]]
+
+    def _date(self, text: pd.Series, errors: pd.Series) -> pd.Series:
+        stripped = text.str.strip()
+        day = stripped.str.slice(0, 10)
+        valid = (_flag(stripped.str.match(r'\d{4}-\d{2}-\d{2}(?:$|[T ])'))
+                 & pd.to_datetime(day, format='%Y-%m-%d', errors='coerce').notna())
+        self._reject(errors, text.notna() & ~valid, text, 'INVALID_TYPE_ON_FIELD_IN_RECORD', 'not a valid date')
+        return day
+
+    def _datetime(self, text: pd.Series, errors: pd.Series) -> pd.Series:
+        stripped = text.str.strip()
+        valid = (_flag(stripped.str.match(r'\d{4}-\d{2}-\d{2}'))
+                 & pd.to_datetime(stripped, errors='coerce', utc=True, format='ISO8601').notna())
+        self._reject(errors, text.notna() & ~valid, text, 'INVALID_TYPE_ON_FIELD_IN_RECORD', 'not a valid datetime')
+        # str(datetime) separates date and time with a space; the API wants 'T'
+        return stripped.str.replace(r'^(\d{4}-\d{2}-\d{2}) ', r'\1T', regex=True)
+
+    def _number(self, text: pd.Series, errors: pd.Series) -> pd.Series:
+        cleaned = text.str.strip().str.replace(r'^\$|,|%$', '', regex=True)
+        numbers = pd.to_numeric(cleaned, errors='coerce')
+        numbers = numbers.where(numbers.abs() != float('inf'))  # 'inf' / 'Infinity' are not numbers
+        self._reject(errors, text.notna() & numbers.isna(), text, 'INVALID_TYPE_ON_FIELD_IN_RECORD', 'not a number')
+        if self.precision:
+            too_large = _flag(numbers.abs() >= 10 ** (self.precision - self.scale))
+            self._reject(errors, too_large, text, 'NUMBER_OUTSIDE_VALID_RANGE',
+                         f"more than {self.precision - self.scale} integer digits")
+
+        # Exact decimal of each distinct valid value (binary floats would round 0.125 down)
+        decimals = {value: Decimal(value) for value in cleaned[numbers.notna()].unique()}
+        if self.type in INTEGER_TYPES:
+            fraction = cleaned.map(lambda value: value in decimals and decimals[value] % 1 != 0)
+            self._reject(errors, _flag(fraction), text, 'INVALID_TYPE_ON_FIELD_IN_RECORD', 'not a whole number')
+            converted = {value: int(number) for value, number in decimals.items() if number % 1 == 0}
+        else:
+            # Half-up like the org (Series.round() rounds half to even: 2.5 -> 2.0)
+            quantum = Decimal(1).scaleb(-self.scale)
+            converted = {value: float(number.quantize(quantum, rounding=ROUND_HALF_UP))
+                         for value, number in decimals.items()}
+        # Python ints / floats (JSON serializable); rejected rows keep their input value
+        return pd.Series([converted.get(value) for value in cleaned], index=text.index, dtype=object)
+
+    def _boolean(self, text: pd.Series, errors: pd.Series) -> pd.Series:
+        lowered = text.str.strip().str.lower()
+        booleans = lowered.map({**dict.fromkeys(TRUE_STRINGS, True), **dict.fromkeys(FALSE_STRINGS, False)})
+        self._reject(errors, text.notna() & booleans.isna(), text, 'INVALID_TYPE_ON_FIELD_IN_RECORD', 'not a boolean')
+        return booleans
+
+    def _string(self, text: pd.Series, errors: pd.Series) -> pd.Series:
+        if self.length:
+            self._reject(errors, _flag(text.str.len() > self.length), text, 'STRING_TOO_LONG',
+                         f"data value too large (max length={self.length})")
+        return text
+
+
+def compile_coercers(field_metadata: Dict[str, Dict]) -> Dict[str, FieldCoercer]:
+    """FieldCoercer per field of describe_fields() metadata."""
+    return {name: FieldCoercer(name, metadata) for name, metadata in field_metadata.items()}
@@ -18,23 +18,68 @@ Usage:
 
     # Get fields that need enrichment (have ES source and confidence >= Medium)
     enrichable = mapping['enrichable_fields']
+
+    # Compiled picklist translation (scalar, or a whole column at once)
+    table = picklist_table(mapping, 'Contact_Type__c')
+    table.translate('Decision Maker; Billing', multipicklist=True)
+    table.translate_column(es_df['Contact_Type__c'], multipicklist=True)
+
+Compiled cache:
+    Parsing a workbook through openpyxl takes seconds. The parsed result is
+    pickled to mappings/.cache/<workbook>.pkl and reused until the workbook
+    changes (same size and mtime, or same content hash after a touch / git
+    checkout) or mapping_reader.py itself changes. MAPPING_CACHE=0 or
+    load_mapping(..., use_cache=False) always parses the Excel file.
+
+Workbook loader:
+    read_workbook() / read_workbooks() parse the mapping sheets of each
+    workbook once per session (again only after the file changes), several
+    workbooks in parallel in a process pool. load_all_mappings() and the
+    tools in tools/ (generate_transformers, recommend_picklist_values,
+    generate_summary_md) all read their sheets through it.
+
+    from mapping_reader import read_workbooks
+    workbooks = read_workbooks(paths)   # {path: {'Field_Mapping': df, 'Picklist_Mapping': df}}
 """
 
+import hashlib
+import pickle
+import re
+import numpy as np
 import pandas as pd
 import os
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional, Tuple
 
 # Default mapping directory
 MAPPING_DIR = os.path.join(os.path.dirname(__file__), 'mappings')
 
+# Compiled mapping cache: <mapping_dir>/.cache/<workbook>.pkl
+MAPPING_CACHE_ENV = 'MAPPING_CACHE'
+CACHE_DIRNAME = '.cache'
+
+# Sheets read from a mapping workbook
+MAPPING_SHEETS = ('Field_Mapping', 'Picklist_Mapping')
+
+# Processes used by read_workbooks() (defaults to one per workbook, at most one per core)
+MAPPING_WORKERS_ENV = 'MAPPING_WORKERS'
+
+# Standard fields: PascalCase or single words, no special characters except underscores
+_STANDARD_FIELD_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
 
-def load_mapping(filename: str, mapping_dir: str = None) -> Dict[str, Any]:
+# is_valid_api_name() as one regex over stripped text (standard field, or no spaces and __c)
+API_NAME_PATTERN = r'[A-Za-z][A-Za-z0-9_]*|[^ ]*__c'
+
+
+def load_mapping(filename: str, mapping_dir: str = None, use_cache: bool = None) -> Dict[str, Any]:
     """
     Load a field mapping Excel file and return structured data.
 
     Args:
         filename: Name of the mapping Excel file (e.g., 'ES_Address__c_to_BBF_Location__c_mapping.xlsx')
         mapping_dir: Optional directory path (defaults to day-two/mappings/)
+        use_cache: Use the compiled cache (defaults to on unless MAPPING_CACHE=0)
 
     Returns:
         Dictionary with:
@@ -51,6 +96,29 @@ def load_mapping(filename: str, mapping_dir: str = None) -> Dict[str, Any]:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Mapping file not found: {filepath}")
 
+    if use_cache is None:
+        use_cache = _cache_enabled()
+    if not use_cache:
+        return _parse_mapping(filename, filepath)[0]
+
+    cached = _read_cache(filepath)
+    if cached is not None:
+        cached['filename'] = filename
+        cached['filepath'] = filepath
+        return cached
+
+    # Key taken before parsing: a workbook saved meanwhile is not cached as the new version
+    key = _workbook_key(filepath, _content_hash(filepath))
+    result, complete = _parse_mapping(filename, filepath)
+    if complete:
+        # A sheet that failed to parse is not cached: the next load retries it
+        _write_cache(filepath, result, key)
+    return result
+
+
+def _parse_mapping(filename: str, filepath: str):
+    """Parse both sheets of a mapping workbook; returns (result, all sheets parsed)."""
+    complete = True
     result = {
         'filename': filename,
         'filepath': filepath,
@@ -63,71 +131,322 @@ def load_mapping(filename: str, mapping_dir: str = None) -> Dict[str, Any]:
 
     # Read Field_Mapping sheet
     try:
-        df_fields = pd.read_excel(filepath, sheet_name='Field_Mapping')
+        df_fields = read_sheet(filepath, 'Field_Mapping')
         result['all_fields'] = df_fields
 
-        # Build field mapping dictionary
-        for _, row in df_fields.iterrows():
-            bbf_field = row.get('BBF_Field_API_Name') or row.get('BBF Field API Name')
-            # Prefer ES_Final_Field (manual override) over ES_Field_API_Name (AI-matched)
-            # But only if ES_Final_Field contains a valid API name (not a label or note)
-            es_final = row.get('ES_Final_Field')
-            es_api = row.get('ES_Field_API_Name') or row.get('ES Field API Name')
-            es_final_str = str(es_final).strip() if pd.notna(es_final) else ''
-            es_field = es_final_str if is_valid_api_name(es_final_str) else es_api
-            confidence = row.get('Match_Confidence') or row.get('Confidence') or ''
-
-            if pd.notna(bbf_field) and pd.notna(es_field) and str(es_field).strip():
-                result['field_mappings'][bbf_field] = es_field
-
-                # Get field label for deprecated check
-                bbf_label = row.get('BBF_Field_Label') or row.get('BBF Field Label') or ''
-
-                # Track enrichable fields (have source and reasonable confidence)
-                # Skip deprecated fields (label contains "(dep)")
-                # Skip fields marked Include_in_Migration = 'No'
-                conf_str = str(confidence).lower()
-                is_deprecated = '(dep)' in str(bbf_label).lower()
-
-                # Check Include_in_Migration column (default to Yes if missing)
-                include_in_migration = str(row.get('Include_in_Migration', 'Yes')).strip().lower()
-                should_include = include_in_migration in ['yes', 'y', '']
-
-                if conf_str in ['high', 'medium', 'exact', 'semantic'] and not is_deprecated and should_include:
-                    result['enrichable_fields'].append({
-                        'bbf_field': bbf_field,
-                        'es_field': es_field,
-                        'confidence': confidence,
-                        'transformer_needed': row.get('Transformer_Needed', 'N') == 'Y',
-                        'bbf_label': bbf_label
-                    })
+        # Build field mapping dictionary (column-wise; aliases resolved once per sheet)
+        bbf_field = _first_truthy(df_fields, 'BBF_Field_API_Name', 'BBF Field API Name')
+        # Prefer ES_Final_Field (manual override) over ES_Field_API_Name (AI-matched)
+        # But only if ES_Final_Field contains a valid API name (not a label or note)
+        es_final = _text(_first_truthy(df_fields, 'ES_Final_Field')).str.strip()
+        es_api = _first_truthy(df_fields, 'ES_Field_API_Name', 'ES Field API Name')
+        es_field = es_final.astype(object).where(_mask(es_final.str.fullmatch(API_NAME_PATTERN)), es_api)
+        confidence = _first_truthy(df_fields, 'Match_Confidence', 'Confidence', default='')
+
+        mapped = bbf_field.notna() & es_field.notna() & _mask(_text(es_field).str.strip() != '')
+        result['field_mappings'] = dict(zip(bbf_field[mapped].tolist(), es_field[mapped].tolist()))
+
+        # Get field label for deprecated check
+        bbf_label = _first_truthy(df_fields, 'BBF_Field_Label', 'BBF Field Label', default='')
+
+        # Track enrichable fields (have source and reasonable confidence)
+        # Skip deprecated fields (label contains "(dep)")
+        # Skip fields marked Include_in_Migration = 'No'
+        confident = _text(confidence).str.lower().isin(['high', 'medium', 'exact', 'semantic'])
+        is_deprecated = _deprecated_mask(bbf_label)
+
+        # Check Include_in_Migration column (default to Yes if missing)
+        if 'Include_in_Migration' in df_fields.columns:
+            should_include = _text(df_fields['Include_in_Migration']).str.strip().str.lower().isin(['yes', 'y', ''])
+        else:
+            should_include = pd.Series(True, index=df_fields.index)
+
+        if 'Transformer_Needed' in df_fields.columns:
+            transformer_needed = _mask(df_fields['Transformer_Needed'] == 'Y')
+        else:
+            transformer_needed = pd.Series(False, index=df_fields.index)
+
+        enrichable = mapped & confident & ~is_deprecated & should_include
+        columns = [bbf_field, es_field, confidence, transformer_needed, bbf_label]
+        result['enrichable_fields'] = [
+            {
+                'bbf_field': bbf,
+                'es_field': es,
+                'confidence': conf,
+                'transformer_needed': needed,
+                'bbf_label': label
+            }
+            for bbf, es, conf, needed, label in zip(*(c[enrichable].tolist() for c in columns))
+        ]
     except Exception as e:
+        complete = False
         print(f"Warning: Could not read Field_Mapping sheet: {e}")
 
     # Read Picklist_Mapping sheet
     try:
-        df_picklists = pd.read_excel(filepath, sheet_name='Picklist_Mapping')
+        df_picklists = read_sheet(filepath, 'Picklist_Mapping')
         result['all_picklists'] = df_picklists
 
         # Build picklist mapping dictionary
-        for _, row in df_picklists.iterrows():
-            bbf_field = row.get('BBF_Field') or row.get('BBF Field')
-            es_value = row.get('ES_Picklist_Value') or row.get('ES Value') or row.get('ES_Value')
-            bbf_value = row.get('BBF_Final_Value') or row.get('Suggested_Mapping') or row.get('BBF Value')
-
-            if pd.notna(bbf_field) and pd.notna(es_value):
-                if bbf_field not in result['picklist_mappings']:
-                    result['picklist_mappings'][bbf_field] = {}
-
-                # Only add if we have a definite BBF value (not a list of options)
-                if pd.notna(bbf_value) and '|' not in str(bbf_value):
-                    result['picklist_mappings'][bbf_field][str(es_value)] = str(bbf_value).strip()
+        bbf_field = _first_truthy(df_picklists, 'BBF_Field', 'BBF Field')
+        es_value = _first_truthy(df_picklists, 'ES_Picklist_Value', 'ES Value', 'ES_Value')
+        bbf_value = _first_truthy(df_picklists, 'BBF_Final_Value', 'Suggested_Mapping', 'BBF Value')
+        bbf_text = _text(bbf_value)
+
+        keyed = bbf_field.notna() & es_value.notna()
+        translations = pd.DataFrame({
+            'bbf_field': bbf_field[keyed],
+            'es_value': _text(es_value[keyed]),
+            'bbf_value': bbf_text[keyed].str.strip(),
+            # Only add if we have a definite BBF value (not a list of options)
+            'definite': (bbf_value.notna() & ~_mask(bbf_text.str.contains('|', regex=False)))[keyed],
+        })
+
+        # Every field with a keyed row gets a dict (possibly empty), in sheet order
+        picklist_mappings = {field: {} for field in translations['bbf_field'].tolist()}
+        definite = translations[translations['definite']]
+        es_values, bbf_values = definite['es_value'].tolist(), definite['bbf_value'].tolist()
+        for field, positions in definite.groupby('bbf_field', sort=False).indices.items():
+            picklist_mappings[field] = {es_values[i]: bbf_values[i] for i in positions}
+        result['picklist_mappings'] = picklist_mappings
     except Exception as e:
+        complete = False
         print(f"Warning: Could not read Picklist_Mapping sheet: {e}")
 
+    return result, complete
+
+
+# =============================================================================
+# COLUMN HELPERS
+# =============================================================================
+
+def _first_truthy(df: pd.DataFrame, *columns: str, default: Any = None) -> pd.Series:
+    """
+    Column-wise `row.get(a) or row.get(b) ... [or default]`.
+
+    Missing columns read as None; the result is an object Series.
+    """
+    values = None
+    for column in columns:
+        if column in df.columns:
+            operand = df[column].astype(object)
+        else:
+            operand = pd.Series([None] * len(df), index=df.index, dtype=object)
+        values = operand if values is None else values.where(values.astype(bool), operand)
+    if default is not None:
+        values = values.where(values.astype(bool), default)
+    return values
+
+
+def _text(values: pd.Series) -> pd.Series:
+    """str() of every value; missing values stay missing."""
+    return values.astype(object).astype(str).where(values.notna())
+
+
+def _mask(values: pd.Series) -> pd.Series:
+    """Boolean mask from a string-method result (missing -> False)."""
+    return values.fillna(False).astype(bool)
+
+
+def _deprecated_mask(labels: pd.Series) -> pd.Series:
+    """is_deprecated_field() for a column of labels."""
+    return _mask(_text(labels).str.lower().str.contains('(dep)', regex=False))
+
+
+# =============================================================================
+# WORKBOOK LOADER (shared by load_all_mappings and the mapping tools)
+# =============================================================================
+
+# abspath -> ((size, mtime_ns), {sheet name: DataFrame})
+_workbooks: Dict[str, Tuple[Tuple[int, int], Dict[str, pd.DataFrame]]] = {}
+
+
+def _file_version(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _read_workbook_file(path: str) -> Dict[str, pd.DataFrame]:
+    """Parse the MAPPING_SHEETS present in one workbook (runs in the worker processes)."""
+    with pd.ExcelFile(path) as workbook:
+        return {name: workbook.parse(name) for name in MAPPING_SHEETS if name in workbook.sheet_names}
+
+
+def _try_read_workbook_file(path: str) -> Optional[Dict[str, pd.DataFrame]]:
+    # A broken workbook must not fail the others; read_workbook() of it raises the error
+    try:
+        return _read_workbook_file(path)
+    except Exception:
+        return None
+
+
+def _parsed_workbooks(paths: List[str], workers: int = None) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """The session's parsed sheets per workbook, parsing new / changed ones in parallel (failed ones omitted)."""
+    versions = {path: _file_version(path) for path in paths}
+    stale = []
+    for path in dict.fromkeys(paths):
+        cached = _workbooks.get(os.path.abspath(path))
+        if cached is None or cached[0] != versions[path]:
+            stale.append(path)
+
+    if workers is None:
+        workers = int(os.environ.get(MAPPING_WORKERS_ENV) or min(len(stale), os.cpu_count() or 1))
+    parsed = None
+    if workers > 1 and len(stale) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(_try_read_workbook_file, stale))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: Parallel workbook parsing unavailable ({e}); parsing serially")
+    if parsed is None:
+        parsed = [_try_read_workbook_file(path) for path in stale]
+
+    for path, sheets in zip(stale, parsed):
+        if sheets is None:
+            _workbooks.pop(os.path.abspath(path), None)
+        else:
+            _workbooks[os.path.abspath(path)] = (versions[path], sheets)
+    return {path: _workbooks[os.path.abspath(path)][1] for path in paths if os.path.abspath(path) in _workbooks}
+
+
+def read_workbooks(paths: List[str], workers: int = None) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """
+    Mapping sheets of several workbooks, parsed in parallel.
+
+    Each workbook is parsed once per session; it is parsed again only when
+    its size or mtime changes. Workbooks not parsed yet are spread over a
+    process pool.
+
+    Args:
+        paths: Workbook paths
+        workers: Worker processes (defaults to MAPPING_WORKERS or one per
+                 workbook, at most one per core); 1 parses in this process
+
+    Returns:
+        Dict[path, Dict[sheet name, DataFrame]] with copies the caller may
+        modify (only the MAPPING_SHEETS present in the workbook). Workbooks
+        that could not be parsed are left out; read_workbook() raises their error.
+    """
+    workbooks = _parsed_workbooks(paths, workers)
+    # Callers add columns / set cells; the session copy stays as parsed
+    return {path: {name: df.copy() for name, df in sheets.items()} for path, sheets in workbooks.items()}
+
+
+def read_workbook(path: str) -> Dict[str, pd.DataFrame]:
+    """Mapping sheets of one workbook (see read_workbooks); raises if it cannot be parsed."""
+    workbooks = read_workbooks([path], workers=1)
+    if path not in workbooks:
+        _read_workbook_file(path)  # Raises the parse error
+    return workbooks[path]
+
+
+def read_sheet(path: str, sheet_name: str) -> pd.DataFrame:
+    """One mapping sheet (a copy); ValueError if the workbook has no such sheet."""
+    sheets = _parsed_workbooks([path], workers=1).get(path)
+    if sheets is None:
+        sheets = _read_workbook_file(path)  # Raises the parse error
+    if sheet_name not in sheets:
+        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+    return sheets[sheet_name].copy()
+
+
+# =============================================================================
+# COMPILED MAPPING CACHE
+# =============================================================================
+
+_reader_version_hash = None
+
+
+def _reader_version() -> str:
+    """Hash of this module's source: a parser change invalidates every cache."""
+    global _reader_version_hash
+    if _reader_version_hash is None:
+        with open(os.path.abspath(__file__), 'rb') as f:
+            _reader_version_hash = hashlib.sha256(f.read()).hexdigest()[:24]
+    return _reader_version_hash
+
+
+def _content_hash(filepath: str) -> str:
+    sha = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def mapping_cache_path(filepath: str) -> str:
+    """Cache file of a mapping workbook: <workbook dir>/.cache/<workbook>.pkl"""
+    directory, name = os.path.split(os.path.abspath(filepath))
+    return os.path.join(directory, CACHE_DIRNAME, name + '.pkl')
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get(MAPPING_CACHE_ENV, '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def _workbook_key(filepath: str, content_hash: str = None) -> Dict[str, Any]:
+    stat = os.stat(filepath)
+    return {
+        'version': _reader_version(),
+        'path': os.path.abspath(filepath),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': content_hash,
+    }
+
+
+def _read_cache(filepath: str) -> Optional[Dict[str, Any]]:
+    """Cached result for the workbook as it is now, or None (missing / stale / unreadable)."""
+    cache_path = mapping_cache_path(filepath)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        stored, result = cached['key'], cached['result']
+    except Exception:
+        return None
+
+    key = _workbook_key(filepath)
+    if stored['version'] != key['version'] or stored['path'] != key['path'] or stored['size'] != key['size']:
+        return None
+    if stored['mtime_ns'] == key['mtime_ns']:
+        return result
+
+    # Touched (copy, git checkout) - still valid if the bytes are the same
+    key['sha256'] = _content_hash(filepath)
+    if stored['sha256'] != key['sha256']:
+        return None
+    _write_cache(filepath, result, key)
     return result
 
 
+def _write_cache(filepath: str, result: Dict[str, Any], key: Dict[str, Any]):
+    """Pickle result next to the workbook (written atomically; failures only warn)."""
+    cache_path = mapping_cache_path(filepath)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'key': key, 'result': result}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write mapping cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def clear_mapping_cache(mapping_dir: str = None) -> int:
+    """Delete the compiled caches in mapping_dir; returns the number removed."""
+    cache_dir = os.path.join(mapping_dir or MAPPING_DIR, CACHE_DIRNAME)
+    if not os.path.isdir(cache_dir):
+        return 0
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if name.endswith('.pkl'):
+            os.remove(os.path.join(cache_dir, name))
+            removed += 1
+    return removed
+
+
 def is_valid_api_name(field_name: str) -> bool:
     """
     Check if a string looks like a valid Salesforce API field name.
@@ -165,11 +484,7 @@ def is_valid_api_name(field_name: str) -> bool:
 
     # Standard fields are typically PascalCase or single words
     # They don't have special characters except underscores
-    import re
-    if re.match(r'^[A-Za-z][A-Za-z0-9_]*$', field_name):
-        return True
-
-    return False
+    return bool(_STANDARD_FIELD_RE.match(field_name))
 
 
 def is_deprecated_field(field_label: str) -> bool:
@@ -228,7 +543,8 @@ def get_enrichment_fields(mapping: Dict, exclude_day1_fields: List[str] = None,
     return enrichment_fields
 
 
-def translate_picklist(mapping: Dict, bbf_field: str, es_value: Any) -> Optional[str]:
+def translate_picklist(mapping: Dict, bbf_field: str, es_value: Any,
+                       multipicklist: bool = False) -> Optional[str]:
     """
     Translate an ES picklist value to BBF using the mapping.
 
@@ -236,17 +552,116 @@ def translate_picklist(mapping: Dict, bbf_field: str, es_value: Any) -> Optional
         mapping: Result from load_mapping()
         bbf_field: The BBF field name
         es_value: The ES value to translate
+        multipicklist: Translate ';'-separated values part by part
 
     Returns:
         Translated BBF value, or original value if no translation found
     """
-    if es_value is None:
-        return None
+    return picklist_table(mapping, bbf_field).translate(es_value, multipicklist)
+
+
+# =============================================================================
+# PICKLIST TRANSLATION TABLES
+# =============================================================================
+
+class _Unmapped:
+    """Type of UNMAPPED."""
+
+    def __repr__(self):
+        return 'UNMAPPED'
+
+    def __bool__(self):
+        return False
+
+    def __reduce__(self):
+        return 'UNMAPPED'
+
+
+# PicklistTable.lookup() result for a value without a translation
+UNMAPPED = _Unmapped()
+
+
+class PicklistTable:
+    """
+    Compiled picklist translations of one BBF field.
+
+    Keys are normalized once (str, stripped; an exact key wins over a padded
+    duplicate), so a lookup is one dict get on the stripped value. With
+    multipicklist=True a value containing ';' is translated part by part and
+    joined with ';' again. Unmapped values translate to themselves (stripped).
+
+    Args:
+        picklist_map: Dict[ES_value, BBF_value] (mapping['picklist_mappings'][field])
+    """
+
+    def __init__(self, picklist_map: Dict[str, str] = None):
+        self.translations: Dict[str, str] = {}
+        for es_value, bbf_value in (picklist_map or {}).items():
+            key = str(es_value).strip()
+            if key not in self.translations or key == es_value:
+                self.translations[key] = bbf_value
+
+    def __len__(self) -> int:
+        return len(self.translations)
+
+    def lookup(self, es_value: Any) -> Any:
+        """BBF value of one ES value, or UNMAPPED."""
+        if es_value is None:
+            return UNMAPPED
+        return self.translations.get(str(es_value).strip(), UNMAPPED)
+
+    def translate(self, es_value: Any, multipicklist: bool = False) -> Optional[str]:
+        """translate_picklist() of one value: BBF value, or the stripped ES value."""
+        if es_value is None:
+            return None
+        text = str(es_value)
+        if multipicklist and ';' in text:
+            parts = [part.strip() for part in text.split(';')]
+            return ';'.join([self.translations.get(part, part) for part in parts])
+        text = text.strip()
+        return self.translations.get(text, text)
+
+    def translate_column(self, values: pd.Series, multipicklist: bool = False) -> pd.Series:
+        """
+        translate() of a whole column.
+
+        Each distinct value is translated once and the result broadcast back
+        to its rows; missing values (None / NaN) stay missing. Mixed-type
+        columns are translated cell by cell (factorize would merge True with 1).
+        """
+        if pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+            uniques = values.to_numpy(dtype=object)
+            codes = np.where(values.isna().to_numpy(), -1, np.arange(len(values)))
+        else:
+            # Factorize the raw values: astype(str) would turn None / NaN into 'None' / 'nan'
+            codes, uniques = pd.factorize(values)
+        translated = [self.translate(value, multipicklist) for value in uniques]
+        # Code -1 (missing) takes the trailing NaN
+        return pd.Series(np.array(translated + [np.nan], dtype=object).take(codes), index=values.index)
+
+
+_EMPTY_TABLE = PicklistTable()
+
+
+def picklist_tables(mapping: Dict) -> Dict[str, PicklistTable]:
+    """
+    PicklistTable per BBF field of a mapping.
+
+    Compiled on first use and kept in mapping['picklist_tables'] (delete that
+    key after editing mapping['picklist_mappings']).
+    """
+    tables = mapping.get('picklist_tables')
+    if tables is None:
+        tables = mapping['picklist_tables'] = {
+            field: PicklistTable(picklist_map)
+            for field, picklist_map in mapping.get('picklist_mappings', {}).items()
+        }
+    return tables
 
-    picklist_map = mapping.get('picklist_mappings', {}).get(bbf_field, {})
-    es_str = str(es_value).strip()
 
-    return picklist_map.get(es_str, es_str)
+def picklist_table(mapping: Dict, bbf_field: str) -> PicklistTable:
+    """PicklistTable of one BBF field (an empty table if it has no translations)."""
+    return picklist_tables(mapping).get(bbf_field, _EMPTY_TABLE)
 
 
 def get_deprecated_fields(mapping: Dict) -> List[Dict]:
@@ -259,20 +674,19 @@ def get_deprecated_fields(mapping: Dict) -> List[Dict]:
     Returns:
         List of deprecated field info dicts
     """
-    deprecated = []
     df_fields = mapping.get('all_fields')
     if df_fields is None:
-        return deprecated
-
-    for _, row in df_fields.iterrows():
-        bbf_label = row.get('BBF_Field_Label') or row.get('BBF Field Label') or ''
-        if is_deprecated_field(bbf_label):
-            deprecated.append({
-                'bbf_field': row.get('BBF_Field_API_Name') or row.get('BBF Field API Name'),
-                'bbf_label': bbf_label,
-                'es_field': row.get('ES_Field_API_Name') or row.get('ES Field API Name')
-            })
-    return deprecated
+        return []
+
+    bbf_label = _first_truthy(df_fields, 'BBF_Field_Label', 'BBF Field Label', default='')
+    deprecated = _deprecated_mask(bbf_label)
+    bbf_field = _first_truthy(df_fields, 'BBF_Field_API_Name', 'BBF Field API Name')
+    es_field = _first_truthy(df_fields, 'ES_Field_API_Name', 'ES Field API Name')
+    return [
+        {'bbf_field': bbf, 'bbf_label': label, 'es_field': es}
+        for bbf, label, es in zip(bbf_field[deprecated].tolist(), bbf_label[deprecated].tolist(),
+                                  es_field[deprecated].tolist())
+    ]
 
 
 def print_mapping_summary(mapping: Dict, show_deprecated: bool = True):
@@ -321,8 +735,14 @@ MAPPING_FILES = {
 }
 
 
-def load_all_mappings() -> Dict[str, Dict]:
-    """Load all mapping files."""
+def load_all_mappings(workers: int = None) -> Dict[str, Dict]:
+    """Load all mapping files (workbooks without a valid compiled cache are parsed in parallel)."""
+    paths = [os.path.join(MAPPING_DIR, filename) for filename in MAPPING_FILES.values()]
+    stale = [path for path in paths
+             if os.path.exists(path) and (not _cache_enabled() or _read_cache(path) is None)]
+    if stale:
+        _parsed_workbooks(stale, workers=workers)
+
     mappings = {}
     for key, filename in MAPPING_FILES.items():
         try:
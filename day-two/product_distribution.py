@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Product Distribution
+====================
+Product_Name__c / Product_Family__c / bandwidth counts of the BBF-eligible
+ES OrderItems, for the product mapping tools.
+
+The tools used to pull up to 5,000 / 10,000 raw OrderItems with query_all
+and count them in Counters, so their reports only covered a capped sample.
+Here the counting is pushed down to the org:
+
+    aggregate   One SOQL GROUP BY query per count set: (name, family)
+                combinations, from which the per-name and per-family counts
+                and the total are summed; and (family, Description) for
+                bandwidths, each distinct Description extracted once. The
+                whole population, in a few small queries.
+    stream      The records are streamed (Bulk API result chunks, REST pages
+                when Bulk is unavailable) and counted on the fly, nothing is
+                kept. Used automatically for a count set whose GROUP BY
+                query the org rejects (e.g. a formula or long text field
+                is not groupable, or more than 2,000 groups).
+    sample      The old capped raw pull (LIMIT n), for quick looks.
+
+Usage:
+    from product_distribution import product_distribution
+
+    dist = product_distribution(es_sf, bandwidth_extractor=extract_bandwidths)
+    dist.total, dist.products.most_common(30), dist.families, dist.combos
+    dist.bandwidths, dist.family_bandwidths['Dark Fiber (DFBR)']
+"""
+
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# BBF-eligible OrderItems (active Orders outside the PA market decom)
+ORDERITEM_SCOPE = (
+    "Order.Status IN ('Activated', 'Suspended (Late Payment)', 'Disconnect in Progress') "
+    "AND (Order.Project_Group__c = null OR (NOT Order.Project_Group__c LIKE '%PA MARKET DECOM%'))"
+)
+
+DISTRIBUTION_MODES = ('aggregate', 'stream', 'sample')
+DEFAULT_SAMPLE_LIMIT = 5000
+
+NULL_LABEL = '(null)'
+
+# (value, unit) per text, for a column of texts (e.g. extract_bandwidths)
+BandwidthExtractor = Callable[[List[Optional[str]]], List[Tuple[Optional[int], Optional[str]]]]
+
+
+class ProductDistribution:
+    """OrderItem counts by Product_Name__c, Product_Family__c and bandwidth."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.total = 0
+        self.products = Counter()     # Product_Name__c (None -> '(null)')
+        self.families = Counter()     # Product_Family__c (None -> '(null)')
+        self.combos = Counter()       # (Product_Name__c, Product_Family__c)
+        self.bandwidths = Counter()   # '100 Mbps' -> OrderItems with that bandwidth
+        self.family_bandwidths: Dict[str, Counter] = {}
+        self.sources = {}             # Count set -> how it was counted
+
+    def add_product(self, name: Optional[str], family: Optional[str], count: int = 1):
+        name, family = name or NULL_LABEL, family or NULL_LABEL
+        self.total += count
+        self.products[name] += count
+        self.families[family] += count
+        self.combos[(name, family)] += count
+
+    def add_bandwidth(self, family: Optional[str], value: Optional[int], unit: Optional[str],
+                      count: int = 1):
+        if not value:
+            return
+        bandwidth = f"{value} {unit}"
+        family = family or NULL_LABEL
+        self.bandwidths[bandwidth] += count
+        self.family_bandwidths.setdefault(family, Counter())[bandwidth] += count
+
+    @property
+    def bandwidth_total(self) -> int:
+        return sum(self.bandwidths.values())
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+def aggregate_counts(sf, fields: List[str], where: str = ORDERITEM_SCOPE,
+                     sobject: str = 'OrderItem') -> Counter:
+    """
+    Record count per combination of field values, counted by the org.
+
+    Runs SELECT <fields>, COUNT(Id) n FROM <sobject> WHERE ... GROUP BY <fields>.
+
+    Returns:
+        Counter[tuple of values (None for null)]
+    """
+    field_list = ', '.join(fields)
+    soql = f"SELECT {field_list}, COUNT(Id) n FROM {sobject} WHERE {where} GROUP BY {field_list}"
+    counts = Counter()
+    for row in sf.query_all(soql)['records']:
+        counts[tuple(row.get(field) for field in fields)] += row['n']
+    return counts
+
+
+def stream_records(sf, soql: str, sobject: str = 'OrderItem', use_bulk: bool = True) -> Iterator[Dict]:
+    """
+    Records of a query, one at a time, without holding the result set.
+
+    Bulk API result chunks when available; REST pages (query_all_iter)
+    when the Bulk query cannot be started.
+    """
+    if use_bulk:
+        streamed = 0
+        try:
+            for chunk in getattr(sf.bulk, sobject).query(soql, lazy_operation=True):
+                for record in chunk:
+                    streamed += 1
+                    yield record
+            return
+        except Exception as e:
+            if streamed:
+                raise  # Part of the result was already counted
+            print(f"Warning: Bulk query failed ({e}), streaming REST pages instead")
+    yield from sf.query_all_iter(soql)
+
+
+def _stream_products(sf, dist: ProductDistribution, where: str, limit: int = None,
+                     bandwidth_extractor: BandwidthExtractor = None):
+    """Count products (and bandwidths) over the records themselves."""
+    fields = ['Product_Name__c', 'Product_Family__c']
+    if bandwidth_extractor:
+        fields.append('Description')
+    soql = f"SELECT {', '.join(fields)} FROM OrderItem WHERE {where}"
+    if limit:
+        records = sf.query_all(f"{soql} LIMIT {limit}")['records']
+    else:
+        records = stream_records(sf, soql)
+
+    batch = []
+    for r in records:
+        dist.add_product(r.get('Product_Name__c'), r.get('Product_Family__c'))
+        if bandwidth_extractor:
+            batch.append((r.get('Product_Family__c'), r.get('Description') or ''))
+            if len(batch) >= 10000:
+                _count_bandwidths(dist, batch, bandwidth_extractor)
+                batch = []
+    if batch:
+        _count_bandwidths(dist, batch, bandwidth_extractor)
+
+
+def _count_bandwidths(dist: ProductDistribution, rows: List[Tuple], bandwidth_extractor: BandwidthExtractor,
+                      counts: List[int] = None):
+    """Add (family, description) rows, optionally weighted by counts."""
+    extracted = bandwidth_extractor([description for _family, description in rows])
+    for i, ((family, _description), (value, unit)) in enumerate(zip(rows, extracted)):
+        dist.add_bandwidth(family, value, unit, counts[i] if counts else 1)
+
+
+def product_distribution(sf, where: str = ORDERITEM_SCOPE, mode: str = 'aggregate',
+                         bandwidth_extractor: BandwidthExtractor = None,
+                         sample_limit: int = DEFAULT_SAMPLE_LIMIT) -> ProductDistribution:
+    """
+    OrderItem product distribution.
+
+    Args:
+        sf: ES Salesforce connection (simple_salesforce)
+        where: OrderItem filter (defaults to the BBF-eligible scope)
+        mode: 'aggregate', 'stream' or 'sample' (see the module docstring)
+        bandwidth_extractor: Column bandwidth extractor, e.g.
+            transformers.service_charge_product_transformer.extract_bandwidths;
+            bandwidths are not counted without one
+        sample_limit: LIMIT of the 'sample' mode
+
+    Returns:
+        ProductDistribution
+    """
+    if mode not in DISTRIBUTION_MODES:
+        raise ValueError(f"Unknown distribution mode {mode!r} (use one of {', '.join(DISTRIBUTION_MODES)})")
+    dist = ProductDistribution(mode)
+
+    if mode == 'sample':
+        _stream_products(sf, dist, where, limit=sample_limit, bandwidth_extractor=bandwidth_extractor)
+        dist.sources = {'products': f'sample (LIMIT {sample_limit})', 'bandwidths': f'sample (LIMIT {sample_limit})'}
+        return dist
+
+    if mode == 'aggregate':
+        try:
+            combos = aggregate_counts(sf, ['Product_Name__c', 'Product_Family__c'], where)
+        except Exception as e:
+            print(f"Warning: GROUP BY on Product_Name__c / Product_Family__c failed ({e}), streaming records")
+        else:
+            for (name, family), count in combos.items():
+                dist.add_product(name, family, count)
+            dist.sources['products'] = 'GROUP BY'
+
+        if bandwidth_extractor and 'products' in dist.sources:
+            try:
+                descriptions = aggregate_counts(sf, ['Product_Family__c', 'Description'], where)
+            except Exception as e:
+                print(f"Warning: GROUP BY on Description failed ({e}), streaming records for bandwidths")
+            else:
+                rows = [(family, description or '') for family, description in descriptions]
+                _count_bandwidths(dist, rows, bandwidth_extractor, counts=list(descriptions.values()))
+                dist.sources['bandwidths'] = 'GROUP BY'
+
+    if 'products' not in dist.sources:
+        _stream_products(sf, dist, where, bandwidth_extractor=bandwidth_extractor)
+        dist.sources = {'products': 'stream', 'bandwidths': 'stream'}
+    elif bandwidth_extractor and 'bandwidths' not in dist.sources:
+        counted = ProductDistribution(mode)  # Products are already counted
+        _stream_products(sf, counted, where, bandwidth_extractor=bandwidth_extractor)
+        dist.bandwidths, dist.family_bandwidths = counted.bandwidths, counted.family_bandwidths
+        dist.sources['bandwidths'] = 'stream'
+    return dist
@@ -6,15 +6,26 @@ Creates an Excel file with:
 1. ES Product_Family__c → BBF Service_Type_Charge__c mapping (with AI suggestions)
 2. ES Product_Name__c → BBF Product_Simple__c mapping (with AI suggestions)
 3. Bandwidth extraction patterns from Description field
+
+Counts cover every BBF-eligible OrderItem: they are pushed down to the org as
+SOQL GROUP BY queries (--mode stream counts streamed records, --mode sample
+is the old LIMIT pull; see day-two/product_distribution.py).
 """
 
-from collections import Counter
+import argparse
 from simple_salesforce import Salesforce
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from datetime import datetime
-import re
+from pathlib import Path
+import sys
+
+# Single-pass bandwidth extractor (day-two/transformers/bandwidth.py) and
+# OrderItem counting (day-two/product_distribution.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from product_distribution import DISTRIBUTION_MODES, product_distribution
+from transformers.bandwidth import BandwidthExtractor
 
 # Color codes
 COLOR_HEADER = 'FF366092'
@@ -185,30 +196,20 @@ BANDWIDTH_PATTERNS = [
     (r'0*(\d+)Mbps', 'Mbps'),  # Handle leading zeros like "0100Mbps"
 ]
 
+# All patterns compiled into one regex (first matching pattern wins, no value limits)
+BANDWIDTH_EXTRACTOR = BandwidthExtractor(BANDWIDTH_PATTERNS)
+
 def extract_bandwidth(description):
     """Extract bandwidth from description field."""
-    if not description:
-        return None, None
-
-    for pattern, unit in BANDWIDTH_PATTERNS:
-        match = re.search(pattern, description, re.IGNORECASE)
-        if match:
-            value = int(match.group(1))
-            return value, unit
-    return None, None
-
-def bandwidth_to_product_simple(value, unit):
-    """Convert bandwidth to BBF Product_Simple__c value."""
-    if value is None:
-        return None
-
-    if unit == 'Gbps':
-        return f"{value} Gbps"
-    elif unit == 'Mbps':
-        return f"{value} Mbps"
-    return None
+    return BANDWIDTH_EXTRACTOR.extract(description)
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate the product mapping template Excel')
+    parser.add_argument('--mode', choices=DISTRIBUTION_MODES, default='aggregate',
+                        help='aggregate: SOQL GROUP BY (default), stream: count all records, sample: LIMIT pull')
+    parser.add_argument('--limit', type=int, default=10000, help='Records of the sample mode (default: 10000)')
+    args = parser.parse_args()
+
     print("=" * 80)
     print("GENERATING PRODUCT MAPPING TEMPLATE")
     print("=" * 80)
@@ -233,43 +234,17 @@ def main():
     )
     print(f"✅ Connected to BBF: {bbf_sf.sf_instance}")
 
-    # Query ES OrderItems
-    print("\n📊 Querying ES OrderItem data...")
-    query = '''
-    SELECT Id, Product_Name__c, Product_Family__c, Description
-    FROM OrderItem
-    WHERE Order.Status IN ('Activated', 'Suspended (Late Payment)', 'Disconnect in Progress')
-    AND (Order.Project_Group__c = null OR (NOT Order.Project_Group__c LIKE '%PA MARKET DECOM%'))
-    LIMIT 10000
-    '''
-    result = es_sf.query_all(query)
-    records = result['records']
-    print(f"✅ Retrieved {len(records)} OrderItem records")
-
-    # Aggregate data
-    family_counter = Counter()
-    product_counter = Counter()
-    bandwidth_counter = Counter()
-    family_bandwidth = {}  # Track bandwidths per family
-
-    for r in records:
-        family = r.get('Product_Family__c') or '(null)'
-        product = r.get('Product_Name__c') or '(null)'
-        desc = r.get('Description') or ''
-
-        family_counter[family] += 1
-        product_counter[product] += 1
-
-        # Extract bandwidth
-        bw_value, bw_unit = extract_bandwidth(desc)
-        if bw_value:
-            bw_str = bandwidth_to_product_simple(bw_value, bw_unit)
-            bandwidth_counter[bw_str] += 1
-
-            # Track bandwidths per family
-            if family not in family_bandwidth:
-                family_bandwidth[family] = Counter()
-            family_bandwidth[family][bw_str] += 1
+    # Count ES OrderItems (bandwidths: each distinct Description scanned once)
+    print(f"\n📊 Counting ES OrderItem data ({args.mode} mode)...")
+    dist = product_distribution(es_sf, mode=args.mode, sample_limit=args.limit,
+                                bandwidth_extractor=BANDWIDTH_EXTRACTOR.extract_many)
+    total_records = dist.total
+    print(f"✅ Counted {total_records} OrderItem records "
+          f"(products: {dist.sources['products']}, bandwidths: {dist.sources['bandwidths']})")
+
+    family_counter = dist.families
+    product_counter = dist.products
+    bandwidth_counter = dist.bandwidths
 
     # Get BBF picklist values
     print("\n📋 Getting BBF picklist values...")
@@ -321,7 +296,7 @@ def main():
 
     row = 2
     for family, count in family_counter.most_common():
-        pct = count / len(records) * 100
+        pct = count / total_records * 100
 
         # Get AI suggestion
         suggestion = FAMILY_TO_SERVICE_TYPE.get(family, ('', 'Low', 'No mapping defined - needs business input'))
@@ -381,7 +356,7 @@ def main():
 
     row = 2
     for bw, count in bandwidth_counter.most_common():
-        pct = count / len(records) * 100
+        pct = count / total_records * 100
 
         # Check if exact match exists in BBF
         if bw in bbf_products:
@@ -405,10 +380,10 @@ def main():
         row += 1
 
     # Add row for records without bandwidth
-    no_bw_count = len(records) - sum(bandwidth_counter.values())
+    no_bw_count = total_records - sum(bandwidth_counter.values())
     ws2.cell(row=row, column=1, value='(No Bandwidth Detected)').border = thin_border
     ws2.cell(row=row, column=2, value=no_bw_count).border = thin_border
-    ws2.cell(row=row, column=3, value=f"{no_bw_count/len(records)*100:.1f}%").border = thin_border
+    ws2.cell(row=row, column=3, value=f"{no_bw_count/total_records*100:.1f}%").border = thin_border
     ws2.cell(row=row, column=4, value='').border = thin_border
     ws2.cell(row=row, column=5, value='Needs Default Value').border = thin_border
     ws2.cell(row=row, column=6, value='').border = thin_border
@@ -450,7 +425,7 @@ def main():
     unmapped_count = 0
 
     for product_name, count in product_counter.most_common():
-        pct = count / len(records) * 100
+        pct = count / total_records * 100
 
         # Get AI suggestion from mapping
         if product_name in PRODUCT_NAME_TO_PRODUCT_SIMPLE:
@@ -535,8 +510,8 @@ def main():
     ws6.insert_rows(1)  # Move to first position
     wb.move_sheet(ws6, offset=-5)
 
-    mapped_pct = mapped_count / len(records) * 100 if len(records) > 0 else 0
-    unmapped_pct = unmapped_count / len(records) * 100 if len(records) > 0 else 0
+    mapped_pct = mapped_count / total_records * 100 if total_records > 0 else 0
+    unmapped_pct = unmapped_count / total_records * 100 if total_records > 0 else 0
 
     instructions = [
         ('ES → BBF Service_Charge__c Product Mapping Template', Font(bold=True, size=16)),
@@ -569,7 +544,7 @@ def main():
         ('  Red = Low confidence or No mapping (business decision required)', None),
         ('', None),
         ('STATISTICS:', Font(bold=True, size=12)),
-        (f'  Total ES OrderItems analyzed: {len(records):,}', None),
+        (f'  Total ES OrderItems analyzed: {total_records:,}', None),
         ('', None),
         ('  Product_Name__c Mapping Coverage:', Font(bold=True)),
         (f'    Unique Product_Name__c values: {len(product_counter)}', None),
@@ -581,8 +556,8 @@ def main():
         ('', None),
         ('  Bandwidth Extraction (SECONDARY):', Font(bold=True)),
         (f'    Unique bandwidths extracted: {len(bandwidth_counter)}', None),
-        (f'    Records with bandwidth: {sum(bandwidth_counter.values()):,} ({sum(bandwidth_counter.values())/len(records)*100:.1f}%)', None),
-        (f'    Records without bandwidth: {no_bw_count:,} ({no_bw_count/len(records)*100:.1f}%)', None),
+        (f'    Records with bandwidth: {sum(bandwidth_counter.values()):,} ({sum(bandwidth_counter.values())/total_records*100:.1f}%)', None),
+        (f'    Records without bandwidth: {no_bw_count:,} ({no_bw_count/total_records*100:.1f}%)', None),
         ('', None),
         ('REFERENCE SHEETS:', Font(bold=True, size=12)),
         ('  • "BBF_ServiceType_Values" - All valid BBF Service_Type_Charge__c picklist values', None),
@@ -603,7 +578,7 @@ def main():
 
     print(f"\n✅ Mapping template created: {output_file}")
     print(f"\n📊 Summary:")
-    print(f"   Total records analyzed: {len(records):,}")
+    print(f"   Total records analyzed: {total_records:,}")
     print(f"\n   Product_Name__c → Product_Simple__c:")
     print(f"      Unique Product_Name values: {len(product_counter)}")
     print(f"      Records with AI mapping: {mapped_count:,} ({mapped_pct:.1f}%)")
@@ -612,7 +587,7 @@ def main():
     print(f"      Product_Family values: {len(family_counter)}")
     print(f"\n   Bandwidth extraction (secondary):")
     print(f"      Bandwidth patterns found: {len(bandwidth_counter)}")
-    print(f"      Records with bandwidth: {sum(bandwidth_counter.values()):,} ({sum(bandwidth_counter.values())/len(records)*100:.1f}%)")
+    print(f"      Records with bandwidth: {sum(bandwidth_counter.values()):,} ({sum(bandwidth_counter.values())/total_records*100:.1f}%)")
 
     return output_file
 
@@ -9,60 +9,57 @@ Usage:
     python generate_summary_md.py --excel mapping.xlsx --output summary.md
     python generate_summary_md.py --excel mapping.xlsx  # prints to stdout
     python generate_summary_md.py --all  # generates summaries for all mapping files
+
+Workbooks are read through mapping_reader.read_workbooks(): --all parses them
+in parallel, once per session.
 """
 
 import argparse
+import importlib.util
 import sys
 from pathlib import Path
 from datetime import datetime
 
-try:
-    import openpyxl
-except ImportError:
-    print("Error: openpyxl is required. Install with: pip install openpyxl")
+# mapping_reader reads the workbooks with pandas (openpyxl engine)
+if any(importlib.util.find_spec(name) is None for name in ('openpyxl', 'pandas')):
+    print("Error: openpyxl and pandas are required. Install with: pip install openpyxl pandas")
     sys.exit(1)
 
+# Shared workbook loader (day-two/mapping_reader.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from mapping_reader import read_workbook, read_workbooks
+
+
+def sheet_rows(df):
+    """Rows of a sheet as dicts (empty cells -> None)."""
+    if df is None:
+        return []
+    values = df.astype(object).where(df.notna(), None)
+    first_column = df.columns[0] if len(df.columns) else None
+    return [row for row in values.to_dict('records')
+            if row[first_column] is not None]  # Skip empty rows
 
-def read_excel_mapping(excel_path):
+
+def read_excel_mapping(excel_path, sheets=None):
     """
     Read field mapping and picklist mapping from Excel file.
 
+    Args:
+        excel_path: Mapping workbook
+        sheets: The workbook's sheets from read_workbooks() (read here if None)
+
     Returns:
         dict with 'field_mappings' and 'picklist_mappings' lists
     """
-    wb = openpyxl.load_workbook(excel_path, data_only=True)
+    if sheets is None:
+        sheets = read_workbook(excel_path)
 
-    result = {
-        'field_mappings': [],
-        'picklist_mappings': [],
+    return {
+        'field_mappings': sheet_rows(sheets.get('Field_Mapping')),
+        'picklist_mappings': sheet_rows(sheets.get('Picklist_Mapping')),
         'source_file': str(excel_path)
     }
 
-    # Read Field_Mapping sheet
-    if 'Field_Mapping' in wb.sheetnames:
-        ws = wb['Field_Mapping']
-        headers = [cell.value for cell in ws[1]]
-
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if row[0] is None:  # Skip empty rows
-                continue
-            mapping = dict(zip(headers, row))
-            result['field_mappings'].append(mapping)
-
-    # Read Picklist_Mapping sheet
-    if 'Picklist_Mapping' in wb.sheetnames:
-        ws = wb['Picklist_Mapping']
-        headers = [cell.value for cell in ws[1]]
-
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if row[0] is None:  # Skip empty rows
-                continue
-            mapping = dict(zip(headers, row))
-            result['picklist_mappings'].append(mapping)
-
-    wb.close()
-    return result
-
 
 def calculate_statistics(data):
     """Calculate summary statistics from mapping data."""
@@ -326,12 +323,16 @@ def process_all_mappings(mappings_dir=None):
     summaries_dir = mappings_dir / 'summaries'
     summaries_dir.mkdir(exist_ok=True)
 
-    for excel_path in sorted(excel_files):
+    # Parse every workbook once, in parallel
+    excel_files = sorted(excel_files)
+    workbooks = read_workbooks(excel_files)
+
+    for excel_path in excel_files:
         output_name = excel_path.stem + '_summary.md'
         output_path = summaries_dir / output_name
 
         try:
-            data = read_excel_mapping(excel_path)
+            data = read_excel_mapping(excel_path, workbooks.get(excel_path))
             stats = calculate_statistics(data)
             markdown = generate_markdown(data, stats)
             output_path.write_text(markdown, encoding='utf-8')
@@ -14,6 +14,25 @@ Usage:
 
     # Dry run - show what would be generated without writing files
     python generate_transformers.py --mapping path/to/mapping.xlsx --dry-run
+
+    # Also emit the fused per-object kernel (transform_record_fused / transform_records)
+    python generate_transformers.py --all --fused
+
+    # Add / refresh fused kernels in the existing modules without the Excel files
+    python generate_transformers.py --fuse-existing
+
+    # Also emit the DataFrame kernel (apply_transformers_frame), or add it to existing modules
+    python generate_transformers.py --all --frame
+    python generate_transformers.py --frame-existing
+
+    # Pure transformers are memoized (transformers/memo.py); add that to existing modules
+    python generate_transformers.py --memoize-existing
+
+    # apply_transformers() takes a profiler (or TRANSFORMER_PROFILE=1); refresh existing modules
+    python generate_transformers.py --profile-existing
+
+Workbooks are read through mapping_reader.read_workbooks(): --all parses them
+in parallel, once per session.
 """
 
 import argparse
@@ -36,6 +55,10 @@ except ImportError:
 MAPPINGS_DIR = Path(__file__).parent.parent / "mappings"
 TRANSFORMERS_DIR = Path(__file__).parent.parent / "transformers"
 
+# Shared workbook loader (day-two/mapping_reader.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from mapping_reader import read_workbook, read_workbooks
+
 
 def safe_str(value) -> str:
     """Safely convert value to string, handling NaN/None/float."""
@@ -98,13 +121,93 @@ def get_type_hint(sf_type: str) -> str:
         return "Any"
 
 
-def generate_transformation_logic(es_type: str, bbf_type: str, es_field: str, bbf_field: str, notes: str) -> str:
-    """Generate the transformation logic based on type conversion needs."""
+def classify_transformation(es_type: str, bbf_type: str) -> str:
+    """
+    Kind of conversion a field needs, from its ES and BBF types.
+
+    Returns:
+        'date', 'to_number', 'to_string', 'picklist', 'multipicklist',
+        'boolean' or 'passthrough' (checked in that order)
+    """
     es_lower = safe_str(es_type).lower()
     bbf_lower = safe_str(bbf_type).lower()
 
-    # DateTime to Date
     if 'datetime' in es_lower and 'date' in bbf_lower and 'datetime' not in bbf_lower:
+        return 'date'
+    if ('string' in es_lower or 'text' in es_lower) and ('number' in bbf_lower or 'double' in bbf_lower or 'currency' in bbf_lower):
+        return 'to_number'
+    if ('number' in es_lower or 'double' in es_lower or 'currency' in es_lower) and ('string' in bbf_lower or 'text' in bbf_lower):
+        return 'to_string'
+    if 'picklist' in es_lower and 'picklist' in bbf_lower:
+        return 'picklist'
+    if 'multipicklist' in es_lower and 'multipicklist' in bbf_lower:
+        return 'multipicklist'
+    if 'boolean' in bbf_lower or 'checkbox' in bbf_lower:
+        return 'boolean'
+    return 'passthrough'
+
+
+# Generated conversions that are pure functions of the ES value and worth caching
+# (passthrough and str() cost less than a cache lookup)
+MEMOIZED_KINDS = ('picklist', 'multipicklist', 'date', 'to_number', 'boolean')
+MEMO_DECORATOR = '@memoize_value'
+MEMO_IMPORT = 'from .memo import memoize_value'
+
+
+PROFILING_IMPORT = 'from .profiling import active_profiler'
+
+# apply_transformers()' profiler annotation (imported for type checkers only)
+TYPING_IMPORT = 'from typing import TYPE_CHECKING, Any, Optional'
+PROFILER_TYPE_IMPORT = 'if TYPE_CHECKING:\n    from .profiling import TransformerProfiler\n'
+
+# apply_transformers() of every generated module (profiling: transformers/profiling.py)
+APPLY_TRANSFORMERS_FUNC = '''
+
+def apply_transformers(es_record: dict, profiler: 'TransformerProfiler' = None) -> dict:
+    """
+    Apply all transformers to an ES record.
+
+    Args:
+        es_record: Dictionary of ES field values (field API name -> value)
+        profiler: Optional transformers.profiling.TransformerProfiler timing each
+            transformer; defaults to the TRANSFORMER_PROFILE one (off when unset)
+
+    Returns:
+        Dictionary of transformed BBF field values (BBF field API name -> value)
+    """
+    profiler = profiler or active_profiler()
+    if profiler is not None:
+        return profiler.apply(__name__, TRANSFORMERS, FIELD_MAPPING, es_record)
+
+    bbf_record = {}
+
+    for bbf_field, transformer in TRANSFORMERS.items():
+        es_field = FIELD_MAPPING.get(bbf_field)
+        if es_field and es_field in es_record:
+            try:
+                bbf_record[bbf_field] = transformer(es_record[es_field], es_record)
+            except Exception as e:
+                # Log error but continue with other fields
+                print(f"Warning: Transform failed for {bbf_field}: {e}")
+                bbf_record[bbf_field] = None
+
+    return bbf_record
+'''
+
+_APPLY_TRANSFORMERS_RE = re.compile(r'\n\ndef apply_transformers\(es_record: dict.*?\n    return bbf_record\n', re.DOTALL)
+
+
+def picklist_map_name(bbf_field: str) -> str:
+    """Name of the module-level picklist dict for a BBF field (INVTYPE_MAP)."""
+    return bbf_field.upper().replace('__C', '').replace('__c', '') + '_MAP'
+
+
+def generate_transformation_logic(es_type: str, bbf_type: str, es_field: str, bbf_field: str, notes: str) -> str:
+    """Generate the transformation logic based on type conversion needs."""
+    kind = classify_transformation(es_type, bbf_type)
+
+    # DateTime to Date
+    if kind == 'date':
         return """    # Convert datetime to date
     if isinstance(es_value, datetime):
         return es_value.date()
@@ -119,7 +222,7 @@ def generate_transformation_logic(es_type: str, bbf_type: str, es_field: str, bb
     return None"""
 
     # String to Number
-    if ('string' in es_lower or 'text' in es_lower) and ('number' in bbf_lower or 'double' in bbf_lower or 'currency' in bbf_lower):
+    if kind == 'to_number':
         return """    # Convert string to number
     if isinstance(es_value, (int, float)):
         return float(es_value)
@@ -133,24 +236,22 @@ def generate_transformation_logic(es_type: str, bbf_type: str, es_field: str, bb
     return 0.0"""
 
     # Number to String
-    if ('number' in es_lower or 'double' in es_lower or 'currency' in es_lower) and ('string' in bbf_lower or 'text' in bbf_lower):
+    if kind == 'to_string':
         return """    # Convert number to string
     if es_value is None:
         return ''
     return str(es_value)"""
 
     # Picklist to Picklist (value mapping)
-    if 'picklist' in es_lower and 'picklist' in bbf_lower:
-        field_upper = bbf_field.upper().replace('__C', '').replace('__c', '')
+    if kind == 'picklist':
         return f"""    # Map picklist values using lookup dictionary
     if es_value is None:
         return None
     es_str = str(es_value).strip()
-    return {field_upper}_MAP.get(es_str, es_str)  # Return original if no mapping"""
+    return {picklist_map_name(bbf_field)}.get(es_str, es_str)  # Return original if no mapping"""
 
     # Multipicklist to Multipicklist
-    if 'multipicklist' in es_lower and 'multipicklist' in bbf_lower:
-        field_upper = bbf_field.upper().replace('__C', '').replace('__c', '')
+    if kind == 'multipicklist':
         return f"""    # Map multipicklist values using lookup dictionary
     if es_value is None:
         return None
@@ -159,11 +260,11 @@ def generate_transformation_logic(es_type: str, bbf_type: str, es_field: str, bb
         return None
     # Split by semicolon, map each value, rejoin
     values = [v.strip() for v in es_str.split(';')]
-    mapped = [{field_upper}_MAP.get(v, v) for v in values if v]
+    mapped = [{picklist_map_name(bbf_field)}.get(v, v) for v in values if v]
     return ';'.join(mapped) if mapped else None"""
 
     # Boolean conversion
-    if 'boolean' in bbf_lower or 'checkbox' in bbf_lower:
+    if kind == 'boolean':
         return """    # Convert to boolean
     if es_value is None:
         return False
@@ -186,9 +287,10 @@ def generate_transformer_function(
     es_field: str,
     es_label: str,
     es_type: str,
-    notes: str
+    notes: str,
+    memoize: bool = True
 ) -> str:
-    """Generate a single transformer function."""
+    """Generate a single transformer function (memoized when its conversion is pure)."""
     is_required = safe_str(bbf_required).lower() == 'yes'
     default_value = get_default_value(bbf_type, is_required)
     return_type = get_type_hint(bbf_type)
@@ -220,8 +322,10 @@ def generate_transformer_function(
         Transformed value suitable for BBF {bbf_field}
     """'''
 
+    decorator = MEMO_DECORATOR + "\n" if memoize and classify_transformation(es_type, bbf_type) in MEMOIZED_KINDS else ""
+
     function_code = f'''
-def transform_{func_name}(es_value: Any, context: dict = None) -> Optional[{return_type}]:
+{decorator}def transform_{func_name}(es_value: Any, context: dict = None) -> Optional[{return_type}]:
 {docstring}
     # Handle null/empty input
     if es_value is None or (isinstance(es_value, str) and not es_value.strip()):
@@ -279,9 +383,12 @@ def generate_transformer_module(
     es_object: str,
     bbf_object: str,
     field_df: pd.DataFrame,
-    picklist_df: pd.DataFrame
+    picklist_df: pd.DataFrame,
+    fused: bool = False,
+    frame: bool = False,
+    memoize: bool = True
 ) -> str:
-    """Generate the complete transformer module."""
+    """Generate the complete transformer module (plus the fused / frame kernels if requested)."""
 
     # Filter to fields needing transformation
     needs_transform = field_df[field_df['Transformer_Needed'] == 'Y']
@@ -326,9 +433,10 @@ Usage:
 """
 
 import re
-from typing import Any, Optional
+{typing_import}
 from datetime import datetime, date
 
+{package_imports}
 '''.format(
         es_object=es_object,
         bbf_object=bbf_object,
@@ -336,16 +444,21 @@ from datetime import datetime, date
         excel_filename=excel_path.name,
         module_name=bbf_object.lower().replace('__c', ''),
         example_field=needs_transform.iloc[0]['BBF_Field_API_Name'] if not needs_transform.empty else 'field',
-        example_es_field=needs_transform.iloc[0]['ES_Field_API_Name'] if not needs_transform.empty else 'field'
+        example_es_field=needs_transform.iloc[0]['ES_Field_API_Name'] if not needs_transform.empty else 'field',
+        typing_import=TYPING_IMPORT,
+        package_imports="\n".join(([MEMO_IMPORT] if memoize else []) + [PROFILING_IMPORT])
+                        + "\n\n" + PROFILER_TYPE_IMPORT
     )
 
     # Generate picklist maps
     picklist_maps = generate_picklist_maps(picklist_df)
+    defined_maps = set(re.findall(r'^(\w+_MAP) = \{', picklist_maps, re.MULTILINE))
 
     # Generate transformer functions
     transformer_functions = []
     transformer_registry = []
     field_mapping = []
+    fused_specs = []
 
     for _, row in needs_transform.iterrows():
         bbf_field = row['BBF_Field_API_Name']
@@ -365,7 +478,8 @@ from datetime import datetime, date
             es_field=es_field if es_field and not pd.isna(es_field) else '',
             es_label=row.get('ES_Field_Label', ''),
             es_type=row.get('ES_Data_Type', ''),
-            notes=row.get('Notes', '')
+            notes=row.get('Notes', ''),
+            memoize=memoize
         )
         transformer_functions.append(func_code)
         transformer_registry.append(f"    '{bbf_field}': transform_{func_name}")
@@ -373,6 +487,15 @@ from datetime import datetime, date
         if es_field and not pd.isna(es_field):
             field_mapping.append(f"    '{bbf_field}': '{es_field}'")
 
+        fused_specs.append(fused_field_spec(
+            bbf_field=bbf_field,
+            es_field=es_field if es_field and not pd.isna(es_field) else '',
+            es_type=row.get('ES_Data_Type', ''),
+            bbf_type=row.get('BBF_Data_Type', ''),
+            bbf_required=row.get('BBF_Is_Required', 'No'),
+            defined_maps=defined_maps,
+        ))
+
     # Generate TRANSFORMERS registry
     transformers_dict = "TRANSFORMERS = {\n" + ",\n".join(transformer_registry) + "\n}\n"
 
@@ -380,47 +503,567 @@ from datetime import datetime, date
     field_mapping_dict = "FIELD_MAPPING = {\n" + ",\n".join(field_mapping) + "\n}\n"
 
     # Generate apply_transformers function
-    apply_func = '''
+    apply_func = APPLY_TRANSFORMERS_FUNC
 
-def apply_transformers(es_record: dict) -> dict:
+    # Combine all parts
+    module_code = imports
+    if picklist_maps:
+        module_code += "\n# Picklist value mappings\n" + picklist_maps + "\n"
+    module_code += "\n".join(transformer_functions)
+    module_code += "\n\n# Transformer registry\n" + transformers_dict
+    module_code += "\n# Field mapping (BBF -> ES)\n" + field_mapping_dict
+    module_code += apply_func
+    if fused:
+        module_code += "\n\n" + generate_fused_kernel(fused_specs, es_object, bbf_object)
+    if frame:
+        module_code += "\n\n" + generate_frame_kernel(fused_specs, es_object, bbf_object)
+
+    return module_code
+
+
+# =============================================================================
+# FUSED KERNELS (--fused / --fuse-existing)
+# =============================================================================
+# apply_transformers() walks TRANSFORMERS, looks up FIELD_MAPPING, tests
+# membership and calls one function per field inside a try/except. A fused
+# kernel is the same work compiled into one straight-line function per object:
+# direct field reads, null guards and picklist lookups inlined, and a batch
+# entry point. Records it cannot handle fall back to apply_transformers().
+
+FUSED_BEGIN = '# --- BEGIN FUSED KERNEL (generated by generate_transformers.py --fused) ---'
+FUSED_END = '# --- END FUSED KERNEL ---'
+
+# Inline conversion per kind; {out} is the target, {map} the picklist dict
+_FUSED_CONVERSIONS = {
+    'date': [
+        "if isinstance(v, datetime):",
+        "    {out} = v.date()",
+        "elif isinstance(v, date):",
+        "    {out} = v",
+        "elif isinstance(v, str):",
+        "    try:",
+        "        {out} = datetime.fromisoformat(v.replace('Z', '+00:00')).date()",
+        "    except (ValueError, AttributeError):",
+        "        {out} = None",
+        "else:",
+        "    {out} = None",
+    ],
+    'to_number': [
+        "if isinstance(v, (int, float)):",
+        "    {out} = float(v)",
+        "elif isinstance(v, str):",
+        "    cleaned = _FUSED_NUMBER_JUNK.sub('', v)",
+        "    try:",
+        "        {out} = float(cleaned) if cleaned else 0.0",
+        "    except ValueError:",
+        "        {out} = 0.0",
+        "else:",
+        "    {out} = 0.0",
+    ],
+    'to_string': [
+        "{out} = str(v)",
+    ],
+    'picklist': [
+        "s = str(v).strip()",
+        "{out} = {map}.get(s, s)",
+    ],
+    'multipicklist': [
+        "s = str(v).strip()",
+        "mapped = [{map}.get(p, p) for p in [x.strip() for x in s.split(';')] if p] if s else None",
+        "{out} = ';'.join(mapped) if mapped else None",
+    ],
+    'boolean': [
+        "if isinstance(v, bool):",
+        "    {out} = v",
+        "elif isinstance(v, str):",
+        "    {out} = v.lower() in ('true', 'yes', '1', 'y')",
+        "else:",
+        "    {out} = bool(v)",
+    ],
+    'passthrough': [
+        "{out} = v",
+    ],
+    'missing_map': [
+        "{out} = None  # {map} is not defined in this module",
+    ],
+}
+
+
+def fused_field_spec(bbf_field: str, es_field: str, es_type: str, bbf_type: str,
+                     bbf_required: str, defined_maps: set) -> Dict[str, str]:
     """
-    Apply all transformers to an ES record.
+    What the fused kernel needs to know about one transformed field.
+
+    defined_maps holds the picklist dict names the module defines. A picklist
+    transformer whose map was never generated (no Picklist_Mapping rows) fails
+    in apply_transformers(), which stores None; the kernel does the same.
+    """
+    is_required = safe_str(bbf_required).lower() == 'yes'
+    kind = classify_transformation(es_type, bbf_type)
+    if kind in ('picklist', 'multipicklist') and picklist_map_name(bbf_field) not in defined_maps:
+        kind = 'missing_map'
+    return {
+        'bbf_field': bbf_field,
+        'es_field': es_field,
+        'function': 'transform_' + re.sub(r'[^a-z0-9_]', '_', bbf_field.lower().replace('__c', '').replace('__', '_')),
+        'kind': kind,
+        'default': get_default_value(bbf_type, is_required),
+    }
+
+
+def generate_fused_kernel(specs: List[Dict[str, str]], es_object: str, bbf_object: str) -> str:
+    """
+    Generate transform_record_fused() / transform_records() for one object.
 
     Args:
-        es_record: Dictionary of ES field values (field API name -> value)
+        specs: fused_field_spec() per field, in TRANSFORMERS order
+        es_object: ES object name (docstring)
+        bbf_object: BBF object name (docstring)
 
     Returns:
-        Dictionary of transformed BBF field values (BBF field API name -> value)
+        Module code between FUSED_BEGIN and FUSED_END markers
     """
-    bbf_record = {}
+    body = []
+    for spec in specs:
+        es_field = spec['es_field']
+        if not es_field:
+            continue  # apply_transformers() skips fields without an ES source
+        out = f"bbf_record[{spec['bbf_field']!r}]"
+        body.append(f"# {spec['bbf_field']} <- {es_field} ({spec['kind']})")
+        body.append(f"if {es_field!r} in es_record:")
+        if spec['kind'] == 'custom':
+            # Hand-edited transformer: call it as apply_transformers() does
+            body.append(f"    {out} = TRANSFORMERS[{spec['bbf_field']!r}](es_record[{es_field!r}], es_record)")
+            continue
+        body.append(f"    v = es_record[{es_field!r}]")
+        body.append(f"    if v is None or (isinstance(v, str) and not v.strip()):")
+        body.append(f"        {out} = {spec['default']}")
+        body.append(f"    else:")
+        for line in _FUSED_CONVERSIONS[spec['kind']]:
+            body.append("        " + line.format(out=out, map=picklist_map_name(spec['bbf_field'])))
+    indent = "\n" + " " * 12
+    body = indent.join(body) if body else "pass"
 
-    for bbf_field, transformer in TRANSFORMERS.items():
-        es_field = FIELD_MAPPING.get(bbf_field)
-        if es_field and es_field in es_record:
-            try:
-                bbf_record[bbf_field] = transformer(es_record[es_field], es_record)
-            except Exception as e:
-                # Log error but continue with other fields
-                print(f"Warning: Transform failed for {bbf_field}: {e}")
-                bbf_record[bbf_field] = None
+    return f'''{FUSED_BEGIN}
 
-    return bbf_record
+_FUSED_NUMBER_JUNK = re.compile(r'[\\$,\\s]')
+
+
+def transform_records(es_records: list) -> list:
+    """
+    Fused apply_transformers() for a batch of ES {es_object} -> BBF {bbf_object} records.
+
+    Same result as [apply_transformers(r) for r in es_records], with every
+    transformer inlined into one straight-line loop body: no registry walk
+    and no function call per field. A record that raises is redone with
+    apply_transformers(), which handles the failing field on its own.
+    """
+    if active_profiler() is not None:
+        # Profiled runs need the per-field timings of apply_transformers()
+        return [apply_transformers(es_record) for es_record in es_records]
+    results = []
+    append = results.append
+    for es_record in es_records:
+        bbf_record = {{}}
+        try:
+            {body}
+        except Exception:
+            bbf_record = apply_transformers(es_record)
+        append(bbf_record)
+    return results
+
+
+def transform_record_fused(es_record: dict) -> dict:
+    """Fused apply_transformers() for a single ES record."""
+    return transform_records([es_record])[0]
+
+{FUSED_END}
 '''
 
-    # Combine all parts
-    module_code = imports
-    if picklist_maps:
-        module_code += "\n# Picklist value mappings\n" + picklist_maps + "\n"
-    module_code += "\n".join(transformer_functions)
-    module_code += "\n\n# Transformer registry\n" + transformers_dict
-    module_code += "\n# Field mapping (BBF -> ES)\n" + field_mapping_dict
-    module_code += apply_func
 
+def splice_kernel(module_code: str, kernel_code: str, begin: str, end: str) -> str:
+    """Replace the module's section between the begin / end markers, or append one."""
+    if begin in module_code and end in module_code:
+        start = module_code.index(begin)
+        stop = module_code.index(end) + len(end)
+        return module_code[:start] + kernel_code.rstrip('\n') + module_code[stop:]
+    return module_code.rstrip('\n') + '\n\n\n' + kernel_code
+
+
+# =============================================================================
+# FRAME KERNELS (--frame / --frame-existing)
+# =============================================================================
+# apply_transformers_frame(df) transforms a DataFrame of ES records column by
+# column. Each column is factorized first, so a conversion runs once per
+# distinct value and is broadcast back with take(): picklist maps become
+# Series.map lookups, ISO dates are sliced and validated with pd.to_datetime,
+# numbers go through pd.to_numeric. Values a column operation cannot
+# reproduce exactly go through the transformer function itself, as do
+# hand-edited ('custom') transformers, row by row with the record as context.
+
+FRAME_BEGIN = '# --- BEGIN FRAME KERNEL (generated by generate_transformers.py --frame) ---'
+FRAME_END = '# --- END FRAME KERNEL ---'
+
+# _frame_column() conversion arguments per kind (None keeps the value as-is)
+_FRAME_CONVERSIONS = {
+    'date': "_frame_date, {field!r}",
+    'to_number': "_frame_number, {field!r}",
+    'to_string': "_frame_string",
+    'picklist': "_frame_picklist, {map}",
+    'multipicklist': "_frame_multipicklist, {map}",
+    'boolean': "_frame_boolean, {field!r}",
+    'passthrough': "None",
+    'missing_map': "_frame_none",
+}
+
+# Emitted once per module, ahead of apply_transformers_frame()
+_FRAME_HELPERS = r'''
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # Only apply_transformers_frame() needs pandas
+    np = pd = None
+
+_FRAME_ISO_DATE = r'^\d{4}-\d{2}-\d{2}(?:[T ]|$)'
+_FRAME_TRUE = ['true', 'yes', '1', 'y']
+
+
+def _frame_column(values, default, convert, *args):
+    """
+    One output column: default for blank cells, convert(filled, *args) for the rest.
+
+    Columns holding a single type are factorized, so blank checks and
+    conversions see each distinct value once. Mixed-type columns are not
+    (factorize would merge True with 1), every cell is converted on its own.
+    """
+    if pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+        codes, distinct = np.arange(len(values)), values.astype(object).reset_index(drop=True)
+    else:
+        codes, uniques = pd.factorize(values)
+        distinct = pd.Series(uniques)
+    try:
+        blank = distinct.isna() | distinct.str.strip().eq('')
+    except AttributeError:  # No string values
+        blank = distinct.isna()
+    converted = pd.Series([default] * len(distinct), index=distinct.index, dtype=object)
+    filled = distinct[~blank]
+    if len(filled):
+        converted[~blank] = filled if convert is None else convert(filled, *args)
+    # Code -1 (None / NaN) picks the default appended at the end
+    return pd.Series(np.append(converted.to_numpy(), default).take(codes), dtype=object)
+
+
+def _frame_rowwise(bbf_field, values):
+    """Run the field's transformer per value, with apply_transformers() error handling."""
+    transformer = TRANSFORMERS[bbf_field]
+    result = []
+    for value in values:
+        try:
+            result.append(transformer(value))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=values.index, dtype=object)
+
+
+def _frame_custom(bbf_field, es_field, frame):
+    """Hand-edited transformer: called for every row with the record as context."""
+    transformer = TRANSFORMERS[bbf_field]
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    result = []
+    for record in records:
+        try:
+            result.append(transformer(record[es_field], record))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=frame.index, dtype=object)
+
+
+def _frame_strings(values):
+    """Mask of the values that are str."""
+    try:
+        return values.str.len().notna()
+    except AttributeError:  # No string values
+        return pd.Series(False, index=values.index)
+
+
+def _frame_none(values):
+    return None
+
+
+def _frame_string(values):
+    return values.astype(str).astype(object)
+
+
+def _frame_picklist(values, picklist_map):
+    text = values.astype(str).str.strip()
+    mapped = text.map(picklist_map)
+    return mapped.where(mapped.notna(), text)
+
+
+def _frame_multipicklist(values, picklist_map):
+    parts = values.astype(str).str.strip().str.split(';').explode().str.strip()
+    parts = parts[parts.ne('')]
+    mapped = parts.map(picklist_map)
+    mapped = mapped.where(mapped.notna(), parts)
+    joined = mapped.groupby(level=0).agg(';'.join).reindex(values.index).astype(object)
+    joined[joined.isna()] = None
+    return joined
+
+
+def _frame_date(values, bbf_field):
+    """ISO date / datetime strings -> date; other values via the transformer."""
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    iso = _frame_strings(values)
+    if iso.any():
+        iso[iso] = values[iso].str.match(_FRAME_ISO_DATE)
+    text = values[iso].astype(str)
+    if len(text):
+        valid = pd.to_datetime(text.str.replace('Z', '+00:00', regex=False), format='ISO8601',
+                               errors='coerce', utc=True).notna()
+        text = text[valid]
+        result[text.index] = pd.to_datetime(text.str.slice(0, 10), format='%Y-%m-%d').dt.date
+    rest = values.index.difference(text.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_number(values, bbf_field):
+    """Numeric values and '$1,234.50' strings -> float; other values via the transformer."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float).astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    number = pd.Series(dtype=float)
+    if strings.any():
+        cleaned = values[strings].str.replace(r'[\$,\s]', '', regex=True)
+        number = pd.to_numeric(cleaned, errors='coerce')
+        number[cleaned.eq('')] = 0.0
+        number = number[number.notna()]
+        result[number.index] = number.astype(float)
+    rest = values.index.difference(number.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_boolean(values, bbf_field):
+    """'true' / 'yes' / '1' / 'y' strings and bool values -> bool; other values via the transformer."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    if strings.any():
+        result[strings] = values[strings].str.lower().isin(_FRAME_TRUE)
+    if (~strings).any():
+        result[~strings] = _frame_rowwise(bbf_field, values[~strings])
+    return result
+'''
+
+
+def generate_frame_kernel(specs: List[Dict[str, str]], es_object: str, bbf_object: str) -> str:
+    """
+    Generate apply_transformers_frame() for one object.
+
+    Args:
+        specs: fused_field_spec() per field, in TRANSFORMERS order
+        es_object: ES object name (docstring)
+        bbf_object: BBF object name (docstring)
+
+    Returns:
+        Module code between FRAME_BEGIN and FRAME_END markers
+    """
+    body = []
+    for spec in specs:
+        es_field = spec['es_field']
+        if not es_field:
+            continue  # apply_transformers() skips fields without an ES source
+        column = f"columns[{spec['bbf_field']!r}]"
+        body.append(f"# {spec['bbf_field']} <- {es_field} ({spec['kind']})")
+        body.append(f"if {es_field!r} in frame.columns:")
+        if spec['kind'] == 'custom':
+            body.append(f"    {column} = _frame_custom({spec['bbf_field']!r}, {es_field!r}, frame)")
+            continue
+        if spec['kind'] == 'missing_map':
+            body.append(f"    # {picklist_map_name(spec['bbf_field'])} is not defined in this module")
+        conversion = _FRAME_CONVERSIONS[spec['kind']].format(
+            field=spec['bbf_field'], map=picklist_map_name(spec['bbf_field']))
+        body.append(f"    {column} = _frame_column(frame[{es_field!r}], {spec['default']}, {conversion})")
+    indent = "\n" + " " * 4
+    body = indent.join(body) if body else "pass"
+
+    return f"""{FRAME_BEGIN}
+{_FRAME_HELPERS}
+
+def apply_transformers_frame(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    \"\"\"
+    Column-wise apply_transformers() for a DataFrame of ES {es_object} records.
+
+    Returns one object column per BBF {bbf_object} field whose ES column is in df,
+    in TRANSFORMERS order, on df's index. Each row matches
+    apply_transformers() on the same record, with missing cells (NaN) read
+    as None. Conversions run once per distinct value of a column.
+    \"\"\"
+    if pd is None:
+        raise ImportError("apply_transformers_frame() requires pandas")
+    frame = df.reset_index(drop=True)
+    columns = {{}}
+    {body}
+    result = pd.DataFrame(columns, index=frame.index)
+    result.index = df.index
+    return result
+
+{FRAME_END}
+"""
+
+
+_DOC_FIELD_RE = re.compile(r'Transform ES (.*?) to BBF (\S+)\.')
+_DOC_VALUE_RE = r'^\s*{}:\s*(.*)$'
+
+
+def specs_from_module(module_path: Path) -> Tuple[str, str, List[Dict[str, str]]]:
+    """
+    Rebuild the field specs of an already generated transformer module.
+
+    The generated functions' docstrings carry the ES / BBF types and the BBF
+    required flag, so kernels can be added without the mapping Excel. A
+    function whose body is no longer the generated conversion (edited by
+    hand) gets kind 'custom' and is called as-is by the kernels.
+
+    Returns:
+        (es_object, bbf_object, specs)
+    """
+    import importlib.util
+    import inspect
+
+    # Loaded as part of the transformers package (modules import .memo)
+    package_root = str(module_path.parent.parent)
+    if package_root not in sys.path:
+        sys.path.insert(0, package_root)
+    spec = importlib.util.spec_from_file_location(f"{module_path.parent.name}.{module_path.stem}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    header = re.search(r'ES (\S+) to BBF (\S+) migration', module.__doc__ or '')
+    es_object, bbf_object = header.groups() if header else ('Unknown', 'Unknown')
+
+    specs = []
+    for bbf_field, func in module.TRANSFORMERS.items():
+        doc = func.__doc__ or ''
+
+        def doc_value(label: str) -> str:
+            match = re.search(_DOC_VALUE_RE.format(re.escape(label)), doc, re.MULTILINE)
+            return match.group(1).strip() if match else ''
+
+        es_type, bbf_type = doc_value('ES Type'), doc_value('BBF Type')
+        field_spec = fused_field_spec(
+            bbf_field=bbf_field,
+            es_field=module.FIELD_MAPPING.get(bbf_field, ''),
+            es_type=es_type,
+            bbf_type=bbf_type,
+            bbf_required=doc_value('BBF Required'),
+            defined_maps={name for name in vars(module) if name.endswith('_MAP')},
+        )
+        generated_logic = generate_transformation_logic(es_type, bbf_type, field_spec['es_field'], bbf_field, '')
+        if generated_logic not in inspect.getsource(func).replace('\r\n', '\n'):
+            field_spec['kind'] = 'custom'
+        field_spec['function'] = func.__name__
+        specs.append(field_spec)
+    return es_object, bbf_object, specs
+
+
+def add_package_import(module_code: str, import_line: str) -> str:
+    """Add a `from .x import y` line to a generated module's imports (idempotent)."""
+    if import_line in module_code:
+        return module_code
+    package_imports = re.findall(r'^from \.\w+ import .*\n', module_code, flags=re.MULTILINE)
+    if package_imports:
+        last = package_imports[-1]
+        return module_code.replace(last, last + import_line + '\n', 1)
+    return module_code.replace('from datetime import datetime, date\n',
+                               f'from datetime import datetime, date\n\n{import_line}\n', 1)
+
+
+def add_profiler_type_import(module_code: str) -> str:
+    """Add the TYPE_CHECKING import of TransformerProfiler after the package imports (idempotent)."""
+    if PROFILER_TYPE_IMPORT in module_code:
+        return module_code
+    module_code = module_code.replace('from typing import Any, Optional\n', TYPING_IMPORT + '\n', 1)
+    last = re.findall(r'^from \.\w+ import .*\n', module_code, flags=re.MULTILINE)[-1]
+    return module_code.replace(last, last + '\n' + PROFILER_TYPE_IMPORT, 1)
+
+
+def memoize_module_code(module_code: str, specs: List[Dict[str, str]]) -> str:
+    """Decorate the module's pure transformers with memoize_value (idempotent)."""
+    memoized = [spec['function'] for spec in specs if spec['kind'] in MEMOIZED_KINDS]
+    for function in memoized:
+        module_code = re.sub(rf'^(?<!{MEMO_DECORATOR}\n)(def {function}\()',
+                             rf'{MEMO_DECORATOR}\n\1', module_code, flags=re.MULTILINE)
+    if memoized:
+        module_code = add_package_import(module_code, MEMO_IMPORT)
     return module_code
 
 
-def process_mapping_file(excel_path: Path, output_path: Optional[Path] = None, dry_run: bool = False) -> dict:
-    """Process a single mapping Excel file and generate transformer module."""
+def profile_module_code(module_code: str) -> str:
+    """Replace the module's apply_transformers() with the profiling-aware one."""
+    module_code, replaced = _APPLY_TRANSFORMERS_RE.subn(lambda m: APPLY_TRANSFORMERS_FUNC, module_code, count=1)
+    if not replaced:
+        raise ValueError("apply_transformers() not found")
+    return add_profiler_type_import(add_package_import(module_code, PROFILING_IMPORT))
+
+
+def update_existing_module(module_path: Path, fused: bool = False, frame: bool = False,
+                           memoize: bool = False, profile: bool = False, dry_run: bool = False) -> dict:
+    """Add (or refresh) the kernels, memoization and profiling hook of a generated module in place."""
+    print(f"\nUpdating: {module_path.name}")
+    es_object, bbf_object, specs = specs_from_module(module_path)
+
+    with open(module_path, encoding='utf-8', newline='') as f:
+        original = f.read()
+    newline = '\r\n' if '\r\n' in original else '\n'
+    module_code = original.replace('\r\n', '\n')
+    if memoize:
+        module_code = memoize_module_code(module_code, specs)
+    if profile:
+        module_code = profile_module_code(module_code)
+    if fused:
+        module_code = splice_kernel(module_code, generate_fused_kernel(specs, es_object, bbf_object),
+                                    FUSED_BEGIN, FUSED_END)
+    if frame:
+        module_code = splice_kernel(module_code, generate_frame_kernel(specs, es_object, bbf_object),
+                                    FRAME_BEGIN, FRAME_END)
+    compile(module_code, str(module_path), 'exec')
+
+    kinds = {}
+    for s in specs:
+        kinds[s['kind']] = kinds.get(s['kind'], 0) + 1
+    print(f"  Fields: {len(specs)} ({', '.join(f'{k}: {n}' for k, n in sorted(kinds.items()))})")
+
+    if dry_run:
+        print(f"  [DRY RUN] Would update: {module_path}")
+    else:
+        with open(module_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(module_code.replace('\n', newline))
+        print(f"  Written to: {module_path}")
+    return {'module': str(module_path), 'fields': len(specs)}
+
+
+def generated_modules() -> List[Path]:
+    """Transformer modules produced by this generator (they have a TRANSFORMERS registry)."""
+    return [path for path in sorted(TRANSFORMERS_DIR.glob('*_transformers.py'))
+            if 'TRANSFORMERS = {' in path.read_text(encoding='utf-8')]
+
+
+def process_mapping_file(excel_path: Path, output_path: Optional[Path] = None, dry_run: bool = False,
+                         fused: bool = False, frame: bool = False, memoize: bool = True,
+                         sheets: Optional[Dict[str, pd.DataFrame]] = None) -> dict:
+    """
+    Process a single mapping Excel file and generate transformer module.
+
+    sheets: The workbook's sheets from read_workbooks() (read here if None)
+    """
     print(f"\nProcessing: {excel_path.name}")
 
     # Extract object names
@@ -430,18 +1073,21 @@ def process_mapping_file(excel_path: Path, output_path: Optional[Path] = None, d
 
     # Read Excel sheets
     try:
-        field_df = pd.read_excel(excel_path, sheet_name='Field_Mapping')
+        if sheets is None:
+            sheets = read_workbook(excel_path)
+        if 'Field_Mapping' not in sheets:
+            raise ValueError("Worksheet named 'Field_Mapping' not found")
+        field_df = sheets['Field_Mapping']
         print(f"  Field mappings: {len(field_df)}")
     except Exception as e:
         print(f"  Error reading Field_Mapping sheet: {e}")
         return {'error': str(e)}
 
-    try:
-        picklist_df = pd.read_excel(excel_path, sheet_name='Picklist_Mapping')
+    picklist_df = sheets.get('Picklist_Mapping')
+    if picklist_df is not None:
         print(f"  Picklist mappings: {len(picklist_df)}")
-    except Exception:
+    else:
         print("  No Picklist_Mapping sheet found")
-        picklist_df = None
 
     # Count transformers needed
     needs_transform = field_df[field_df['Transformer_Needed'] == 'Y']
@@ -463,7 +1109,10 @@ def process_mapping_file(excel_path: Path, output_path: Optional[Path] = None, d
         es_object=es_object,
         bbf_object=bbf_object,
         field_df=field_df,
-        picklist_df=picklist_df
+        picklist_df=picklist_df,
+        fused=fused,
+        frame=frame,
+        memoize=memoize
     )
 
     # Determine output path
@@ -504,16 +1153,21 @@ def process_mapping_file(excel_path: Path, output_path: Optional[Path] = None, d
     }
 
 
-def process_all_mappings(dry_run: bool = False) -> List[dict]:
+def process_all_mappings(dry_run: bool = False, fused: bool = False, frame: bool = False,
+                         memoize: bool = True) -> List[dict]:
     """Process all mapping Excel files in the mappings directory."""
     results = []
 
     # Find all mapping Excel files
-    mapping_files = list(MAPPINGS_DIR.glob('ES_*_to_BBF_*_mapping.xlsx'))
+    mapping_files = sorted(MAPPINGS_DIR.glob('ES_*_to_BBF_*_mapping.xlsx'))
     print(f"Found {len(mapping_files)} mapping files")
 
-    for excel_path in sorted(mapping_files):
-        result = process_mapping_file(excel_path, dry_run=dry_run)
+    # Parse every workbook once, in parallel
+    workbooks = read_workbooks(mapping_files)
+
+    for excel_path in mapping_files:
+        result = process_mapping_file(excel_path, dry_run=dry_run, fused=fused, frame=frame, memoize=memoize,
+                                      sheets=workbooks.get(excel_path))
         results.append(result)
 
     return results
@@ -543,14 +1197,59 @@ def main():
         action='store_true',
         help='Show what would be generated without writing files'
     )
+    parser.add_argument(
+        '--fused',
+        action='store_true',
+        help='Also generate a fused per-object kernel (transform_record_fused / transform_records)'
+    )
+    parser.add_argument(
+        '--fuse-existing',
+        action='store_true',
+        help='Add or refresh the fused kernel of the modules already in day-two/transformers/ (no Excel needed)'
+    )
+    parser.add_argument(
+        '--frame',
+        action='store_true',
+        help='Also generate the DataFrame kernel (apply_transformers_frame)'
+    )
+    parser.add_argument(
+        '--frame-existing',
+        action='store_true',
+        help='Add or refresh the DataFrame kernel of the modules already in day-two/transformers/ (no Excel needed)'
+    )
+    parser.add_argument(
+        '--no-memoize',
+        action='store_true',
+        help='Do not memoize the pure (picklist / date / number / boolean) transformers'
+    )
+    parser.add_argument(
+        '--memoize-existing',
+        action='store_true',
+        help='Memoize the pure transformers of the modules already in day-two/transformers/ (no Excel needed)'
+    )
+    parser.add_argument(
+        '--profile-existing',
+        action='store_true',
+        help='Refresh apply_transformers() of the existing modules with the profiling hook (no Excel needed)'
+    )
 
     args = parser.parse_args()
 
-    if args.all:
+    if args.fuse_existing or args.frame_existing or args.memoize_existing or args.profile_existing:
+        print("=" * 60)
+        print("UPDATING KERNELS OF EXISTING TRANSFORMER MODULES")
+        print("=" * 60)
+        for module_path in generated_modules():
+            update_existing_module(module_path, fused=args.fuse_existing, frame=args.frame_existing,
+                                   memoize=args.memoize_existing, profile=args.profile_existing,
+                                   dry_run=args.dry_run)
+
+    elif args.all:
         print("=" * 60)
         print("GENERATING TRANSFORMERS FOR ALL MAPPING FILES")
         print("=" * 60)
-        results = process_all_mappings(dry_run=args.dry_run)
+        results = process_all_mappings(dry_run=args.dry_run, fused=args.fused, frame=args.frame,
+                                       memoize=not args.no_memoize)
 
         # Summary
         print("\n" + "=" * 60)
@@ -569,7 +1268,8 @@ def main():
             print(f"Error: Mapping file not found: {args.mapping}")
             sys.exit(1)
 
-        result = process_mapping_file(args.mapping, args.output, dry_run=args.dry_run)
+        result = process_mapping_file(args.mapping, args.output, dry_run=args.dry_run,
+                                      fused=args.fused, frame=args.frame, memoize=not args.no_memoize)
 
         if 'error' in result:
             print(f"Error: {result['error']}")
@@ -583,6 +1283,11 @@ def main():
         print("  python generate_transformers.py --all")
         print("  python generate_transformers.py --mapping day-two/mappings/ES_Account_to_BBF_Account_mapping.xlsx")
         print("  python generate_transformers.py --all --dry-run")
+        print("  python generate_transformers.py --all --fused")
+        print("  python generate_transformers.py --fuse-existing")
+        print("  python generate_transformers.py --frame-existing")
+        print("  python generate_transformers.py --memoize-existing")
+        print("  python generate_transformers.py --profile-existing")
 
 
 if __name__ == '__main__':
@@ -1,8 +1,32 @@
 #!/usr/bin/env python3
-"""Query ES OrderItem Product distribution for mapping to BBF Product_Simple__c"""
+"""Query ES OrderItem Product distribution for mapping to BBF Product_Simple__c
+
+Counts are pushed down to the org as SOQL GROUP BY queries and cover every
+BBF-eligible OrderItem (see day-two/product_distribution.py).
+
+Usage:
+    python day-two/tools/query_product_distribution.py                  # GROUP BY counts
+    python day-two/tools/query_product_distribution.py --mode stream    # count streamed records
+    python day-two/tools/query_product_distribution.py --mode sample --limit 5000
+"""
+
+import argparse
+import sys
+from pathlib import Path
 
 from simple_salesforce import Salesforce
 
+# Shared OrderItem counting (day-two/product_distribution.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from product_distribution import DEFAULT_SAMPLE_LIMIT, DISTRIBUTION_MODES, product_distribution
+
+parser = argparse.ArgumentParser(description='ES OrderItem Product distribution')
+parser.add_argument('--mode', choices=DISTRIBUTION_MODES, default='aggregate',
+                    help='aggregate: SOQL GROUP BY (default), stream: count all records, sample: LIMIT pull')
+parser.add_argument('--limit', type=int, default=DEFAULT_SAMPLE_LIMIT,
+                    help=f'Records of the sample mode (default: {DEFAULT_SAMPLE_LIMIT})')
+args = parser.parse_args()
+
 # Connect to ES UAT
 sf = Salesforce(
     username='sfdcapi@everstream.net.uat',
@@ -14,33 +38,14 @@ sf = Salesforce(
 print("Connected to ES UAT")
 print()
 
-from collections import Counter
-
-# Query OrderItems for BBF-eligible Orders
-query = '''
-SELECT Id, Product_Name__c, Product_Family__c, Description
-FROM OrderItem
-WHERE Order.Status IN ('Activated', 'Suspended (Late Payment)', 'Disconnect in Progress')
-AND (Order.Project_Group__c = null OR (NOT Order.Project_Group__c LIKE '%PA MARKET DECOM%'))
-LIMIT 5000
-'''
-
-print("Querying ES OrderItem Product distribution (up to 5000 records)...")
-result = sf.query_all(query)
-records = result['records']
-print(f"Retrieved {len(records)} OrderItem records")
-
-# Aggregate by Product_Name__c
-product_counter = Counter()
-family_counter = Counter()
-combo_counter = Counter()
-
-for r in records:
-    name = r.get('Product_Name__c') or '(null)'
-    family = r.get('Product_Family__c') or '(null)'
-    product_counter[name] += 1
-    family_counter[family] += 1
-    combo_counter[(name, family)] += 1
+# Count OrderItems for BBF-eligible Orders
+print(f"Querying ES OrderItem Product distribution ({args.mode} mode)...")
+dist = product_distribution(sf, mode=args.mode, sample_limit=args.limit)
+print(f"Counted {dist.total} OrderItem records ({dist.sources['products']})")
+
+product_counter = dist.products
+family_counter = dist.families
+combo_counter = dist.combos
 
 print()
 print("=" * 90)
@@ -49,7 +54,7 @@ print("=" * 90)
 print(f"{'Product_Name__c':60} | Count | %")
 print("-" * 90)
 for name, cnt in product_counter.most_common(30):
-    pct = cnt / len(records) * 100
+    pct = cnt / dist.total * 100
     print(f"{name:60} | {cnt:5} | {pct:.1f}%")
 
 print()
@@ -59,14 +64,14 @@ print("=" * 90)
 print(f"{'Product_Family__c':40} | Count | %")
 print("-" * 90)
 for family, cnt in family_counter.most_common():
-    pct = cnt / len(records) * 100
+    pct = cnt / dist.total * 100
     print(f"{family:40} | {cnt:5} | {pct:.1f}%")
 
 print()
 print("-" * 90)
 print(f"Total unique Product_Name__c: {len(product_counter)}")
 print(f"Total unique Product_Family__c: {len(family_counter)}")
-print(f"Total OrderItems analyzed: {len(records)}")
+print(f"Total OrderItems analyzed: {dist.total}")
 
 # Now check BBF Product_Simple__c picklist values
 print()
@@ -36,6 +36,10 @@ except ImportError:
 # Mapping directory
 MAPPINGS_DIR = Path(__file__).parent.parent / "mappings"
 
+# Shared workbook loader (day-two/mapping_reader.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from mapping_reader import read_workbook, read_workbooks
+
 
 # ============================================================================
 # SEMANTIC MATCHING KNOWLEDGE BASE
@@ -469,13 +473,22 @@ def update_excel_file(excel_path: Path, picklist_df: pd.DataFrame, dry_run: bool
         return False
 
 
-def process_mapping_file(excel_path: Path, dry_run: bool = False) -> dict:
-    """Process a single mapping Excel file."""
+def process_mapping_file(excel_path: Path, dry_run: bool = False,
+                         sheets: Optional[Dict[str, pd.DataFrame]] = None) -> dict:
+    """
+    Process a single mapping Excel file.
+
+    sheets: The workbook's sheets from read_workbooks() (read here if None)
+    """
     print(f"\nProcessing: {excel_path.name}")
 
     # Read Picklist_Mapping sheet
     try:
-        picklist_df = pd.read_excel(excel_path, sheet_name='Picklist_Mapping')
+        if sheets is None:
+            sheets = read_workbook(excel_path)
+        if 'Picklist_Mapping' not in sheets:
+            raise ValueError("Worksheet named 'Picklist_Mapping' not found")
+        picklist_df = sheets['Picklist_Mapping']
         print(f"  Total picklist rows: {len(picklist_df)}")
     except Exception as e:
         print(f"  No Picklist_Mapping sheet or error: {e}")
@@ -520,11 +533,14 @@ def process_all_mappings(dry_run: bool = False) -> List[dict]:
     results = []
 
     # Find all mapping Excel files
-    mapping_files = list(MAPPINGS_DIR.glob('ES_*_to_BBF_*_mapping.xlsx'))
+    mapping_files = sorted(MAPPINGS_DIR.glob('ES_*_to_BBF_*_mapping.xlsx'))
     print(f"Found {len(mapping_files)} mapping files")
 
-    for excel_path in sorted(mapping_files):
-        result = process_mapping_file(excel_path, dry_run=dry_run)
+    # Parse every workbook once, in parallel
+    workbooks = read_workbooks(mapping_files)
+
+    for excel_path in mapping_files:
+        result = process_mapping_file(excel_path, dry_run=dry_run, sheets=workbooks.get(excel_path))
         results.append(result)
 
     return results
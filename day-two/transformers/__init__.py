@@ -14,6 +14,32 @@ Usage:
     # Apply single transformer
     bbf_value = TRANSFORMERS['Payment_Terms__c'](es_record['Payment_Terms__c'])
 
+    # Fused kernel for batches (same result as apply_transformers per record)
+    from transformers.account_transformers import transform_records
+    bbf_records = transform_records(es_records)
+
+    # Column-wise transform of a DataFrame of ES records (pandas required)
+    from transformers.account_transformers import apply_transformers_frame
+    bbf_df = apply_transformers_frame(es_df)
+
+    # Bandwidth of a column of Descriptions (one regex scan per distinct value)
+    from transformers.service_charge_product_transformer import extract_bandwidths
+    bandwidths = extract_bandwidths(es_df['Description'])
+
+    # Service type of every Product_Family__c with the rule that decided it
+    from transformers.service_charge_product_transformer import classify_product_families
+    classifications = classify_product_families(es_df['Product_Family__c'])
+
+    # Hit rates of the memoized (pure) transformers
+    from transformers.memo import print_memo_stats
+    print_memo_stats()
+
+    # Per-field timings and failures (or run with TRANSFORMER_PROFILE=1)
+    from transformers.profiling import TransformerProfiler
+    profiler = TransformerProfiler()
+    bbf_record = apply_transformers(es_record, profiler=profiler)
+    profiler.print_report()
+
 Generated by: transformation-generator agent
 """
 
@@ -17,9 +17,14 @@ Usage:
 """
 
 import re
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from datetime import datetime, date
 
+from .profiling import active_profiler
+
+if TYPE_CHECKING:
+    from .profiling import TransformerProfiler
+
 
 # Picklist value mappings
 ACCOUNTSOURCE_MAP = {
@@ -300,16 +305,22 @@ FIELD_MAPPING = {
 }
 
 
-def apply_transformers(es_record: dict) -> dict:
+def apply_transformers(es_record: dict, profiler: 'TransformerProfiler' = None) -> dict:
     """
     Apply all transformers to an ES record.
 
     Args:
         es_record: Dictionary of ES field values (field API name -> value)
+        profiler: Optional transformers.profiling.TransformerProfiler timing each
+            transformer; defaults to the TRANSFORMER_PROFILE one (off when unset)
 
     Returns:
         Dictionary of transformed BBF field values (BBF field API name -> value)
     """
+    profiler = profiler or active_profiler()
+    if profiler is not None:
+        return profiler.apply(__name__, TRANSFORMERS, FIELD_MAPPING, es_record)
+
     bbf_record = {}
 
     for bbf_field, transformer in TRANSFORMERS.items():
@@ -323,3 +334,245 @@ def apply_transformers(es_record: dict) -> dict:
                 bbf_record[bbf_field] = None
 
     return bbf_record
+
+
+# --- BEGIN FUSED KERNEL (generated by generate_transformers.py --fused) ---
+
+_FUSED_NUMBER_JUNK = re.compile(r'[\$,\s]')
+
+
+def transform_records(es_records: list) -> list:
+    """
+    Fused apply_transformers() for a batch of ES Account -> BBF Account records.
+
+    Same result as [apply_transformers(r) for r in es_records], with every
+    transformer inlined into one straight-line loop body: no registry walk
+    and no function call per field. A record that raises is redone with
+    apply_transformers(), which handles the failing field on its own.
+    """
+    if active_profiler() is not None:
+        # Profiled runs need the per-field timings of apply_transformers()
+        return [apply_transformers(es_record) for es_record in es_records]
+    results = []
+    append = results.append
+    for es_record in es_records:
+        bbf_record = {}
+        try:
+            # proposalmanager__Primary_State__c <- Legally_Organized_Under__c (missing_map)
+            if 'Legally_Organized_Under__c' in es_record:
+                v = es_record['Legally_Organized_Under__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['proposalmanager__Primary_State__c'] = None
+                else:
+                    bbf_record['proposalmanager__Primary_State__c'] = None  # PROPOSALMANAGER__PRIMARY_STATE_MAP is not defined in this module
+            # proposalmanager__Tax_Exempt__c <- Sales_Tax_Exemption__c (passthrough)
+            if 'Sales_Tax_Exemption__c' in es_record:
+                v = es_record['Sales_Tax_Exemption__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['proposalmanager__Tax_Exempt__c'] = None
+                else:
+                    bbf_record['proposalmanager__Tax_Exempt__c'] = v
+            # Business_Unit__c <- OneCommunity_Entity__c (passthrough)
+            if 'OneCommunity_Entity__c' in es_record:
+                v = es_record['OneCommunity_Entity__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Business_Unit__c'] = None
+                else:
+                    bbf_record['Business_Unit__c'] = v
+            # Full_Company_Name__c <- Company_Legal_Name__c (passthrough)
+            if 'Company_Legal_Name__c' in es_record:
+                v = es_record['Company_Legal_Name__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Full_Company_Name__c'] = None
+                else:
+                    bbf_record['Full_Company_Name__c'] = v
+        except Exception:
+            bbf_record = apply_transformers(es_record)
+        append(bbf_record)
+    return results
+
+
+def transform_record_fused(es_record: dict) -> dict:
+    """Fused apply_transformers() for a single ES record."""
+    return transform_records([es_record])[0]
+
+# --- END FUSED KERNEL ---
+
+
+# --- BEGIN FRAME KERNEL (generated by generate_transformers.py --frame) ---
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # Only apply_transformers_frame() needs pandas
+    np = pd = None
+
+_FRAME_ISO_DATE = r'^\d{4}-\d{2}-\d{2}(?:[T ]|$)'
+_FRAME_TRUE = ['true', 'yes', '1', 'y']
+
+
+def _frame_column(values, default, convert, *args):
+    """
+    One output column: default for blank cells, convert(filled, *args) for the rest.
+
+    Columns holding a single type are factorized, so blank checks and
+    conversions see each distinct value once. Mixed-type columns are not
+    (factorize would merge True with 1), every cell is converted on its own.
+    """
+    if pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+        codes, distinct = np.arange(len(values)), values.astype(object).reset_index(drop=True)
+    else:
+        codes, uniques = pd.factorize(values)
+        distinct = pd.Series(uniques)
+    try:
+        blank = distinct.isna() | distinct.str.strip().eq('')
+    except AttributeError:  # No string values
+        blank = distinct.isna()
+    converted = pd.Series([default] * len(distinct), index=distinct.index, dtype=object)
+    filled = distinct[~blank]
+    if len(filled):
+        converted[~blank] = filled if convert is None else convert(filled, *args)
+    # Code -1 (None / NaN) picks the default appended at the end
+    return pd.Series(np.append(converted.to_numpy(), default).take(codes), dtype=object)
+
+
+def _frame_rowwise(bbf_field, values):
+    """Run the field's transformer per value, with apply_transformers() error handling."""
+    transformer = TRANSFORMERS[bbf_field]
+    result = []
+    for value in values:
+        try:
+            result.append(transformer(value))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=values.index, dtype=object)
+
+
+def _frame_custom(bbf_field, es_field, frame):
+    """Hand-edited transformer: called for every row with the record as context."""
+    transformer = TRANSFORMERS[bbf_field]
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    result = []
+    for record in records:
+        try:
+            result.append(transformer(record[es_field], record))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=frame.index, dtype=object)
+
+
+def _frame_strings(values):
+    """Mask of the values that are str."""
+    try:
+        return values.str.len().notna()
+    except AttributeError:  # No string values
+        return pd.Series(False, index=values.index)
+
+
+def _frame_none(values):
+    return None
+
+
+def _frame_string(values):
+    return values.astype(str).astype(object)
+
+
+def _frame_picklist(values, picklist_map):
+    text = values.astype(str).str.strip()
+    mapped = text.map(picklist_map)
+    return mapped.where(mapped.notna(), text)
+
+
+def _frame_multipicklist(values, picklist_map):
+    parts = values.astype(str).str.strip().str.split(';').explode().str.strip()
+    parts = parts[parts.ne('')]
+    mapped = parts.map(picklist_map)
+    mapped = mapped.where(mapped.notna(), parts)
+    joined = mapped.groupby(level=0).agg(';'.join).reindex(values.index).astype(object)
+    joined[joined.isna()] = None
+    return joined
+
+
+def _frame_date(values, bbf_field):
+    """ISO date / datetime strings -> date; other values via the transformer."""
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    iso = _frame_strings(values)
+    if iso.any():
+        iso[iso] = values[iso].str.match(_FRAME_ISO_DATE)
+    text = values[iso].astype(str)
+    if len(text):
+        valid = pd.to_datetime(text.str.replace('Z', '+00:00', regex=False), format='ISO8601',
+                               errors='coerce', utc=True).notna()
+        text = text[valid]
+        result[text.index] = pd.to_datetime(text.str.slice(0, 10), format='%Y-%m-%d').dt.date
+    rest = values.index.difference(text.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_number(values, bbf_field):
+    """Numeric values and '$1,234.50' strings -> float; other values via the transformer."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float).astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    number = pd.Series(dtype=float)
+    if strings.any():
+        cleaned = values[strings].str.replace(r'[\$,\s]', '', regex=True)
+        number = pd.to_numeric(cleaned, errors='coerce')
+        number[cleaned.eq('')] = 0.0
+        number = number[number.notna()]
+        result[number.index] = number.astype(float)
+    rest = values.index.difference(number.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_boolean(values, bbf_field):
+    """'true' / 'yes' / '1' / 'y' strings and bool values -> bool; other values via the transformer."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    if strings.any():
+        result[strings] = values[strings].str.lower().isin(_FRAME_TRUE)
+    if (~strings).any():
+        result[~strings] = _frame_rowwise(bbf_field, values[~strings])
+    return result
+
+
+def apply_transformers_frame(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Column-wise apply_transformers() for a DataFrame of ES Account records.
+
+    Returns one object column per BBF Account field whose ES column is in df,
+    in TRANSFORMERS order, on df's index. Each row matches
+    apply_transformers() on the same record, with missing cells (NaN) read
+    as None. Conversions run once per distinct value of a column.
+    """
+    if pd is None:
+        raise ImportError("apply_transformers_frame() requires pandas")
+    frame = df.reset_index(drop=True)
+    columns = {}
+    # proposalmanager__Primary_State__c <- Legally_Organized_Under__c (missing_map)
+    if 'Legally_Organized_Under__c' in frame.columns:
+        # PROPOSALMANAGER__PRIMARY_STATE_MAP is not defined in this module
+        columns['proposalmanager__Primary_State__c'] = _frame_column(frame['Legally_Organized_Under__c'], None, _frame_none)
+    # proposalmanager__Tax_Exempt__c <- Sales_Tax_Exemption__c (passthrough)
+    if 'Sales_Tax_Exemption__c' in frame.columns:
+        columns['proposalmanager__Tax_Exempt__c'] = _frame_column(frame['Sales_Tax_Exemption__c'], None, None)
+    # Business_Unit__c <- OneCommunity_Entity__c (passthrough)
+    if 'OneCommunity_Entity__c' in frame.columns:
+        columns['Business_Unit__c'] = _frame_column(frame['OneCommunity_Entity__c'], None, None)
+    # Full_Company_Name__c <- Company_Legal_Name__c (passthrough)
+    if 'Company_Legal_Name__c' in frame.columns:
+        columns['Full_Company_Name__c'] = _frame_column(frame['Company_Legal_Name__c'], None, None)
+    result = pd.DataFrame(columns, index=frame.index)
+    result.index = df.index
+    return result
+
+# --- END FRAME KERNEL ---
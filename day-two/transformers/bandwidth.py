@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Bandwidth Extraction
+====================
+Single-pass bandwidth extraction from free-text Description / Product_Name__c
+values.
+
+Bandwidth rules are an ordered list of (regex, unit) patterns that start at
+a run of digits and capture it, e.g. (r'(\\d+)\\s*Gbps', 'Gbps'). The old
+extractors called re.search once per pattern until one matched (up to 10
+case-insensitive searches per description). A BandwidthExtractor compiles
+the whole list into one regex: at the start of every digit run each pattern
+is tried in a lookahead that always succeeds ('(?=pattern|)') and captures
+into its own named group (p0, p1, ... in priority order). One scan
+therefore yields the leftmost match of every pattern, which is exactly what
+re.search returned, and the winner is picked the same way as before: the
+first pattern (list order) whose leftmost match is within the unit limit.
+The scan stops as soon as the first pattern has won.
+
+A plain alternation would not do: it returns the leftmost match of any
+pattern, while the rules give pattern order precedence over position
+('10M 1Gbps' is 1 Gbps, not 10 Mbps).
+
+Usage:
+    from transformers.bandwidth import BandwidthExtractor
+
+    extractor = BandwidthExtractor([(r'(\\d+)\\s*Gbps', 'Gbps'), (r'(\\d+)M\\b', 'Mbps')],
+                                   limits={'Gbps': 1000})
+    extractor.extract('0100Mbps Ethernet')          # (100, 'Mbps')
+    extractor.extract_many(df['Description'])       # each distinct value scanned once
+    extractor.verify(GOLDEN_CASES)                  # [] when every case matches
+
+BandwidthSteps keeps the picklist bandwidths ('1 Gbps', '100 Mbps', ...)
+sorted per unit and snaps an extracted bandwidth to the nearest one with a
+binary search (bisect for one value, numpy.searchsorted for a column)
+instead of rebuilding and scanning the value list on every call.
+
+    steps = BandwidthSteps(BANDWIDTH_TO_PRODUCT)
+    steps.snap(120, 'Mbps')                         # 100
+    steps.snap_many([120, 3000], 'Mbps')            # array([100, 900])
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Only BandwidthSteps.snap_many() needs numpy
+    np = None
+
+Bandwidth = Tuple[Optional[int], Optional[str]]
+
+NO_BANDWIDTH: Bandwidth = (None, None)
+
+# First capturing group of a pattern (the digit run)
+_CAPTURE_GROUP_RE = re.compile(r'(?<!\\)\((?!\?)')
+
+
+class BandwidthExtractor:
+    """
+    Ordered bandwidth patterns compiled into one regex.
+
+    Args:
+        patterns: [(regex, unit)] in priority order; each regex starts at a
+            digit run and captures it in its first group
+        limits: {unit: largest accepted value}; a larger leftmost match of a
+            pattern falls through to the next pattern
+        flags: re flags for every pattern
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, str]], limits: Dict[str, int] = None,
+                 flags: int = re.IGNORECASE):
+        self.patterns = list(patterns)
+        self.limits = dict(limits or {})
+        self.flags = flags
+
+        lookaheads = []
+        for i, (pattern, _unit) in enumerate(self.patterns):
+            named, found = _CAPTURE_GROUP_RE.subn(f'(?P<p{i}>', pattern, count=1)
+            if not found:
+                raise ValueError(f"Bandwidth pattern has no capture group: {pattern}")
+            lookaheads.append(f'(?={named}|)')
+        self.regex = re.compile(r'(?<!\d)(?=\d)' + ''.join(lookaheads), flags)
+
+        # (position in match.groups(), unit, limit) per pattern, in priority order
+        self._rules = [(self.regex.groupindex[f'p{i}'] - 1, unit, self.limits.get(unit))
+                       for i, (_pattern, unit) in enumerate(self.patterns)]
+
+    def __repr__(self):
+        return f"BandwidthExtractor({len(self.patterns)} patterns, limits={self.limits})"
+
+    def extract(self, text: Optional[str]) -> Bandwidth:
+        """
+        Bandwidth in a text.
+
+        Returns:
+            (value, unit), e.g. (100, 'Mbps'), or (None, None) if not found
+        """
+        if not text:
+            return NO_BANDWIDTH
+
+        rules = self._rules
+        judged = [False] * len(rules)  # Leftmost match of the pattern already seen
+        best = len(rules)
+        result = NO_BANDWIDTH
+        for match in self.regex.finditer(text):
+            groups = match.groups()
+            for i in range(best):
+                if judged[i]:
+                    continue
+                index, unit, limit = rules[i]
+                digits = groups[index]
+                if digits is None:
+                    continue
+                judged[i] = True
+                value = int(digits)
+                if limit is None or value <= limit:
+                    best, result = i, (value, unit)
+                    break
+            if best == 0:
+                break
+        return result
+
+    def extract_many(self, texts: Iterable[Optional[str]]) -> List[Bandwidth]:
+        """extract() for a column of texts; each distinct text is scanned once."""
+        results = {}
+        extracted = []
+        for text in texts:
+            try:
+                bandwidth = results[text]
+            except KeyError:
+                bandwidth = results[text] = self.extract(text)
+            extracted.append(bandwidth)
+        return extracted
+
+    def search_reference(self, text: Optional[str]) -> Bandwidth:
+        """The pattern-by-pattern re.search loop extract() replaces (used by verify())."""
+        if not text:
+            return NO_BANDWIDTH
+        for pattern, unit in self.patterns:
+            match = re.search(pattern, text, self.flags)
+            if match:
+                value = int(match.group(1))
+                limit = self.limits.get(unit)
+                if limit is not None and value > limit:
+                    continue
+                return value, unit
+        return NO_BANDWIDTH
+
+    def verify(self, cases: Sequence[Tuple[Optional[str], Bandwidth]]) -> List[str]:
+        """
+        Check extract() and extract_many() against golden cases and the reference loop.
+
+        Args:
+            cases: [(text, expected (value, unit))]
+
+        Returns:
+            One message per mismatch (empty when everything agrees)
+        """
+        problems = []
+        batch = self.extract_many(text for text, _expected in cases)
+        for (text, expected), batched in zip(cases, batch):
+            expected = tuple(expected)
+            got = self.extract(text)
+            reference = self.search_reference(text)
+            if not got == batched == reference == expected:
+                problems.append(f"{text!r}: expected {expected}, extract {got}, "
+                                f"extract_many {batched}, re.search loop {reference}")
+        return problems
+
+
+class BandwidthSteps:
+    """
+    Picklist bandwidths per unit, for snapping to the nearest one.
+
+    Args:
+        bandwidths: Bandwidth picklist values such as '10 Gbps' (e.g. the
+            keys of BANDWIDTH_TO_PRODUCT); a value belongs to a unit when
+            its text contains the unit
+        units: Units to index
+
+    A value halfway between two steps snaps to the one listed first in
+    bandwidths, as min(values, key=distance) did.
+    """
+
+    def __init__(self, bandwidths: Iterable[str], units: Sequence[str] = ('Gbps', 'Mbps')):
+        bandwidths = list(bandwidths)
+        self._values: Dict[str, List[int]] = {}  # Unit -> ascending step values
+        self._ranks: Dict[str, List[int]] = {}   # Unit -> listing order of each step (ties)
+        self._arrays = {}                        # Unit -> (values, ranks) as NumPy arrays
+        for unit in units:
+            ranks = {}
+            for bandwidth in bandwidths:
+                if unit in bandwidth:
+                    ranks.setdefault(int(bandwidth.split()[0]), len(ranks))
+            if not ranks:
+                continue
+            values = sorted(ranks)
+            self._values[unit] = values
+            self._ranks[unit] = [ranks[value] for value in values]
+            if np is not None:
+                self._arrays[unit] = (np.array(values, dtype=np.int64),
+                                      np.array(self._ranks[unit], dtype=np.int64))
+
+    def __repr__(self):
+        return f"BandwidthSteps({ {unit: len(values) for unit, values in self._values.items()} })"
+
+    def values(self, unit: str) -> List[int]:
+        """Steps of a unit, ascending."""
+        return list(self._values.get(unit, []))
+
+    def snap(self, value: int, unit: str) -> Optional[int]:
+        """Nearest step of the unit (None when the unit has no steps)."""
+        values = self._values.get(unit)
+        if not values:
+            return None
+        i = bisect_left(values, value)
+        if i == 0:
+            return values[0]
+        if i == len(values):
+            return values[-1]
+        lower, upper = values[i - 1], values[i]
+        if value - lower != upper - value:
+            return lower if value - lower < upper - value else upper
+        ranks = self._ranks[unit]
+        return lower if ranks[i - 1] < ranks[i] else upper
+
+    def snap_many(self, values, unit: str):
+        """
+        snap() for a column of values of one unit (numpy required).
+
+        Returns:
+            NumPy int64 array of the nearest steps, or None when the unit has no steps
+        """
+        if np is None:
+            raise ImportError("BandwidthSteps.snap_many() needs numpy (pip install numpy)")
+        if unit not in self._arrays:
+            return None
+        steps, ranks = self._arrays[unit]
+        values = np.asarray(values, dtype=np.int64)
+        upper = np.minimum(np.searchsorted(steps, values, side='left'), len(steps) - 1)
+        lower = np.maximum(upper - 1, 0)
+        to_lower = np.abs(values - steps[lower])
+        to_upper = np.abs(steps[upper] - values)
+        pick_lower = (to_lower < to_upper) | ((to_lower == to_upper) & (ranks[lower] < ranks[upper]))
+        return np.where(pick_lower, steps[lower], steps[upper])
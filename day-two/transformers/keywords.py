@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Keyword Classification
+======================
+Single-pass keyword rules for free-text picklist values (e.g. ES
+Product_Family__c -> BBF Service_Type_Charge__c).
+
+A classifier looks a value up in an exact mapping first. Failing that, it
+applies ordered keyword rules ('DARK FIBER' or 'DFBR' -> 'DF', then
+'INTERNET' or 'DIA' -> 'DIA', ...), where the first rule with a keyword
+anywhere in the upper-cased value wins. Values nothing matches get the
+default. Instead of one substring test per keyword (up to ~15 scans of the
+value), all keywords are compiled into one regex: a plain alternation in
+priority order, so re's literal-prefix scan skips everything that cannot
+start a keyword. Each search reports the highest-priority keyword starting
+at the next candidate position. The scan resumes one character later, so
+overlapping keywords are all seen ('VOICE' / 'VOIC'). The best keyword
+found wins, which is the rule and keyword the if-chain picked.
+
+Every result names the winning rule and carries its confidence, so a
+reclassification report can show why a value landed where it did.
+
+Usage:
+    from transformers.keywords import KeywordClassifier, KeywordRule
+
+    classifier = KeywordClassifier(
+        [KeywordRule('dark_fiber', ('DARK FIBER', 'DFBR'), 'DF', 'Medium')],
+        exact=FAMILY_TO_SERVICE_TYPE, default='EPL')
+    classifier.classify('Dark Fiber Lease')     # Classification('DF', 'dark_fiber', 'DARK FIBER', 'Medium')
+    classifier.classify_many(df['Product_Family__c'])
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+EXACT_RULE = 'exact'
+DEFAULT_RULE = 'default'
+
+
+class KeywordRule(NamedTuple):
+    """Keywords (upper case) that classify a value as label."""
+    name: str
+    keywords: Tuple[str, ...]
+    label: str
+    confidence: str = 'Medium'
+
+
+class Classification(NamedTuple):
+    """Result of KeywordClassifier.classify()."""
+    label: str
+    rule: str                 # KeywordRule.name, EXACT_RULE or DEFAULT_RULE
+    keyword: Optional[str]    # Matched keyword (keyword rules only)
+    confidence: str
+
+
+class KeywordClassifier:
+    """
+    Exact mapping, then keyword rules in priority order, then a default.
+
+    Args:
+        rules: KeywordRule list, highest priority first
+        exact: Value -> label for exact matches (checked before the rules;
+            kept by reference: edits apply to later classify() calls, but not
+            to results a caller has memoized)
+        default: Label when nothing matches (also for empty values)
+        exact_confidence: Confidence of exact matches
+        default_confidence: Confidence of the default
+    """
+
+    def __init__(self, rules: Sequence[KeywordRule], exact: Dict[str, str] = None,
+                 default: str = None, exact_confidence: str = 'High',
+                 default_confidence: str = 'Low'):
+        self.rules = list(rules)
+        self.exact = exact if exact is not None else {}
+        self.default = Classification(default, DEFAULT_RULE, None, default_confidence)
+        self.exact_confidence = exact_confidence
+
+        # (rule, keyword) in priority order; keyword -> its first (best) priority
+        self._keywords: List[Tuple[KeywordRule, str]] = [
+            (rule, keyword) for rule in self.rules for keyword in rule.keywords]
+        self._priority: Dict[str, int] = {}
+        for priority, (_rule, keyword) in enumerate(self._keywords):
+            self._priority.setdefault(keyword, priority)
+        self._results = [Classification(rule.label, rule.name, keyword, rule.confidence)
+                         for rule, keyword in self._keywords]
+        # No capture groups: they would disable re's literal-prefix scan
+        self.regex = re.compile('|'.join(re.escape(keyword) for _rule, keyword in self._keywords)) \
+            if self._keywords else None
+
+    def __repr__(self):
+        return f"KeywordClassifier({len(self.rules)} rules, {len(self._keywords)} keywords)"
+
+    def classify(self, value: Optional[str]) -> Classification:
+        """Label, winning rule, matched keyword and confidence of one value."""
+        if not value:
+            return self.default
+
+        if value in self.exact:
+            return Classification(self.exact[value], EXACT_RULE, None, self.exact_confidence)
+
+        best = self.match(value.upper())
+        return self.default if best is None else self._results[best]
+
+    def match(self, text: str) -> Optional[int]:
+        """Priority index of the best keyword in an (upper-cased) text, None if none occurs."""
+        if self.regex is None:
+            return None
+        search = self.regex.search
+        priority = self._priority
+        best = None
+        found = search(text)
+        while found is not None:
+            index = priority[found.group()]
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+            found = search(text, found.start() + 1)
+        return best
+
+    def classify_many(self, values: Iterable[Optional[str]]) -> List[Classification]:
+        """classify() for a column of values; each distinct value is classified once."""
+        results = {}
+        classified = []
+        for value in values:
+            try:
+                classification = results[value]
+            except KeyError:
+                classification = results[value] = self.classify(value)
+            classified.append(classification)
+        return classified
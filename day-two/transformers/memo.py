@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Transformer Memoization
+=======================
+Value-level caches for pure transformer functions.
+
+Picklist-style transformers see the same handful of distinct ES values over
+and over across Order / OrderItem records. A memoized transformer computes
+each distinct value once; repeats cost one cache lookup. Caches are bounded
+(functools.lru_cache, least recently used values are dropped first) and
+typed, so True and 1 or 1 and 1.0 are cached separately.
+
+Only pure functions may be memoized: the result must depend on the arguments
+alone and must be immutable. generate_transformers.py applies memoize_value
+to the generated picklist, date, number and boolean transformers.
+
+Usage:
+    from transformers.memo import memoize, memoize_value, print_memo_stats
+
+    @memoize_value
+    def transform_change_type(es_value, context=None): ...
+
+    @memoize
+    def transform_service_type_charge(product_family): ...
+
+    print_memo_stats()
+"""
+
+from functools import lru_cache, wraps
+from typing import Callable, Dict
+
+# Distinct values kept per transformer
+MEMO_MAXSIZE = 4096
+
+# Every memoized function, for memo_stats() / clear_memo_caches()
+_MEMOIZED = []
+
+
+def _register(wrapper: Callable, cached: Callable) -> Callable:
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    _MEMOIZED.append(wrapper)
+    return wrapper
+
+
+def memoize_value(func: Callable = None, maxsize: int = MEMO_MAXSIZE) -> Callable:
+    """
+    Memoize a generated transformer `func(es_value, context=None)` on es_value.
+
+    The context record is not part of the key: generated transformers do not
+    read it. Unhashable values are passed straight to func.
+    """
+    if func is None:
+        return lambda f: memoize_value(f, maxsize=maxsize)
+
+    cached = lru_cache(maxsize=maxsize, typed=True)(func)
+
+    @wraps(func)
+    def wrapper(es_value, context=None):
+        try:
+            return cached(es_value)
+        except TypeError:  # Unhashable value (a TypeError from func is simply raised again)
+            return func(es_value, context)
+
+    return _register(wrapper, cached)
+
+
+def memoize(func: Callable = None, maxsize: int = MEMO_MAXSIZE) -> Callable:
+    """Memoize a pure function on all of its arguments (all must be hashable)."""
+    if func is None:
+        return lambda f: memoize(f, maxsize=maxsize)
+
+    cached = lru_cache(maxsize=maxsize, typed=True)(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return cached(*args, **kwargs)
+
+    return _register(wrapper, cached)
+
+
+def memo_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Cache statistics per memoized function.
+
+    Returns:
+        Dict['module.function', {'hits', 'misses', 'size', 'maxsize', 'hit_rate'}]
+        for the functions that have been called
+    """
+    stats = {}
+    for wrapper in _MEMOIZED:
+        info = wrapper.cache_info()
+        calls = info.hits + info.misses
+        if not calls:
+            continue
+        name = f"{wrapper.__module__.rsplit('.', 1)[-1]}.{wrapper.__name__}"
+        stats[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+            'hit_rate': info.hits / calls,
+        }
+    return stats
+
+
+def print_memo_stats():
+    """Print the hit rate of every memoized function that has been called."""
+    stats = memo_stats()
+    print(f"\n🧠 Transformer Memo Caches:")
+    if not stats:
+        print(f"   (no memoized transformer called)")
+        return
+    width = max(len(name) for name in stats)
+    print(f"   {'Transformer':<{width}} | {'Calls':>10} | {'Hit Rate':>8} | {'Cached':>13}")
+    print(f"   {'-' * (width + 41)}")
+    for name, s in sorted(stats.items()):
+        cached = f"{s['size']:,}/{s['maxsize']:,}"
+        print(f"   {name:<{width}} | {s['hits'] + s['misses']:>10,} | {s['hit_rate']:>8.1%} | {cached:>13}")
+
+
+def clear_memo_caches():
+    """Empty every cache and reset its statistics."""
+    for wrapper in _MEMOIZED:
+        wrapper.cache_clear()
@@ -17,9 +17,15 @@ Usage:
 """
 
 import re
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from datetime import datetime, date
 
+from .memo import memoize_value
+from .profiling import active_profiler
+
+if TYPE_CHECKING:
+    from .profiling import TransformerProfiler
+
 
 # Picklist value mappings
 TERM_MAP = {
@@ -141,6 +147,7 @@ def transform_aloc_cogs_provider(es_value: Any, context: dict = None) -> Optiona
     return es_value
 
 
+@memoize_value
 def transform_term(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES Term__c to BBF Term__c.
@@ -202,6 +209,7 @@ def transform_zloc_cogs_provider(es_value: Any, context: dict = None) -> Optiona
     return es_value
 
 
+@memoize_value
 def transform_product(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES Bandwidth__c to BBF Product__c.
@@ -234,6 +242,7 @@ def transform_product(es_value: Any, context: dict = None) -> Optional[str]:
     return PRODUCT_MAP.get(es_str, es_str)  # Return original if no mapping
 
 
+@memoize_value
 def transform_service_type(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES Off_Net_Type__c to BBF Service_Type__c.
@@ -324,6 +333,7 @@ def transform_demarc_location(es_value: Any, context: dict = None) -> Optional[s
     return es_value
 
 
+@memoize_value
 def transform_off_net_service_status(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES LEC_Order_Status__c to BBF Off_Net_Service_Status__c.
@@ -505,16 +515,22 @@ FIELD_MAPPING = {
 }
 
 
-def apply_transformers(es_record: dict) -> dict:
+def apply_transformers(es_record: dict, profiler: 'TransformerProfiler' = None) -> dict:
     """
     Apply all transformers to an ES record.
 
     Args:
         es_record: Dictionary of ES field values (field API name -> value)
+        profiler: Optional transformers.profiling.TransformerProfiler timing each
+            transformer; defaults to the TRANSFORMER_PROFILE one (off when unset)
 
     Returns:
         Dictionary of transformed BBF field values (BBF field API name -> value)
     """
+    profiler = profiler or active_profiler()
+    if profiler is not None:
+        return profiler.apply(__name__, TRANSFORMERS, FIELD_MAPPING, es_record)
+
     bbf_record = {}
 
     for bbf_field, transformer in TRANSFORMERS.items():
@@ -528,3 +544,328 @@ def apply_transformers(es_record: dict) -> dict:
                 bbf_record[bbf_field] = None
 
     return bbf_record
+
+
+# --- BEGIN FUSED KERNEL (generated by generate_transformers.py --fused) ---
+
+_FUSED_NUMBER_JUNK = re.compile(r'[\$,\s]')
+
+
+def transform_records(es_records: list) -> list:
+    """
+    Fused apply_transformers() for a batch of ES Off_Net__c -> BBF Off_Net__c records.
+
+    Same result as [apply_transformers(r) for r in es_records], with every
+    transformer inlined into one straight-line loop body: no registry walk
+    and no function call per field. A record that raises is redone with
+    apply_transformers(), which handles the failing field on its own.
+    """
+    if active_profiler() is not None:
+        # Profiled runs need the per-field timings of apply_transformers()
+        return [apply_transformers(es_record) for es_record in es_records]
+    results = []
+    append = results.append
+    for es_record in es_records:
+        bbf_record = {}
+        try:
+            # Aloc_COGS_Provider__c <- Off_Net_Vendor__c (passthrough)
+            if 'Off_Net_Vendor__c' in es_record:
+                v = es_record['Off_Net_Vendor__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Aloc_COGS_Provider__c'] = None
+                else:
+                    bbf_record['Aloc_COGS_Provider__c'] = v
+            # Term__c <- Term__c (picklist)
+            if 'Term__c' in es_record:
+                v = es_record['Term__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Term__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Term__c'] = TERM_MAP.get(s, s)
+            # Zloc_COGS_Provider__c <- Vendor_Name__c (passthrough)
+            if 'Vendor_Name__c' in es_record:
+                v = es_record['Vendor_Name__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Zloc_COGS_Provider__c'] = None
+                else:
+                    bbf_record['Zloc_COGS_Provider__c'] = v
+            # Product__c <- Bandwidth__c (picklist)
+            if 'Bandwidth__c' in es_record:
+                v = es_record['Bandwidth__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Product__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Product__c'] = PRODUCT_MAP.get(s, s)
+            # Service_Type__c <- Off_Net_Type__c (picklist)
+            if 'Off_Net_Type__c' in es_record:
+                v = es_record['Off_Net_Type__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Service_Type__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Service_Type__c'] = SERVICE_TYPE_MAP.get(s, s)
+            # BBF_Circuit_ID__c <- Internal_Circuit_Id__c (passthrough)
+            if 'Internal_Circuit_Id__c' in es_record:
+                v = es_record['Internal_Circuit_Id__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['BBF_Circuit_ID__c'] = None
+                else:
+                    bbf_record['BBF_Circuit_ID__c'] = v
+            # Demarc_Location__c <- Demarc_Loaction__c (passthrough)
+            if 'Demarc_Loaction__c' in es_record:
+                v = es_record['Demarc_Loaction__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Demarc_Location__c'] = None
+                else:
+                    bbf_record['Demarc_Location__c'] = v
+            # Off_Net_Service_Status__c <- LEC_Order_Status__c (picklist)
+            if 'LEC_Order_Status__c' in es_record:
+                v = es_record['LEC_Order_Status__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Off_Net_Service_Status__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Off_Net_Service_Status__c'] = OFF_NET_SERVICE_STATUS_MAP.get(s, s)
+            # Stripped_Circuit_ID__c <- Stripped_Circuit_ID2__c (passthrough)
+            if 'Stripped_Circuit_ID2__c' in es_record:
+                v = es_record['Stripped_Circuit_ID2__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Stripped_Circuit_ID__c'] = None
+                else:
+                    bbf_record['Stripped_Circuit_ID__c'] = v
+            # Vendor_BAN__c <- Vendor_Ban__c (passthrough)
+            if 'Vendor_Ban__c' in es_record:
+                v = es_record['Vendor_Ban__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Vendor_BAN__c'] = None
+                else:
+                    bbf_record['Vendor_BAN__c'] = v
+            # Vendor_NNI__c <- Vendor_NNI__c (passthrough)
+            if 'Vendor_NNI__c' in es_record:
+                v = es_record['Vendor_NNI__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Vendor_NNI__c'] = None
+                else:
+                    bbf_record['Vendor_NNI__c'] = v
+            # Vendor_PON__c <- VendorPON__c (passthrough)
+            if 'VendorPON__c' in es_record:
+                v = es_record['VendorPON__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Vendor_PON__c'] = None
+                else:
+                    bbf_record['Vendor_PON__c'] = v
+        except Exception:
+            bbf_record = apply_transformers(es_record)
+        append(bbf_record)
+    return results
+
+
+def transform_record_fused(es_record: dict) -> dict:
+    """Fused apply_transformers() for a single ES record."""
+    return transform_records([es_record])[0]
+
+# --- END FUSED KERNEL ---
+
+
+# --- BEGIN FRAME KERNEL (generated by generate_transformers.py --frame) ---
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # Only apply_transformers_frame() needs pandas
+    np = pd = None
+
+_FRAME_ISO_DATE = r'^\d{4}-\d{2}-\d{2}(?:[T ]|$)'
+_FRAME_TRUE = ['true', 'yes', '1', 'y']
+
+
+def _frame_column(values, default, convert, *args):
+    """
+    One output column: default for blank cells, convert(filled, *args) for the rest.
+
+    Columns holding a single type are factorized, so blank checks and
+    conversions see each distinct value once. Mixed-type columns are not
+    (factorize would merge True with 1), every cell is converted on its own.
+    """
+    if pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+        codes, distinct = np.arange(len(values)), values.astype(object).reset_index(drop=True)
+    else:
+        codes, uniques = pd.factorize(values)
+        distinct = pd.Series(uniques)
+    try:
+        blank = distinct.isna() | distinct.str.strip().eq('')
+    except AttributeError:  # No string values
+        blank = distinct.isna()
+    converted = pd.Series([default] * len(distinct), index=distinct.index, dtype=object)
+    filled = distinct[~blank]
+    if len(filled):
+        converted[~blank] = filled if convert is None else convert(filled, *args)
+    # Code -1 (None / NaN) picks the default appended at the end
+    return pd.Series(np.append(converted.to_numpy(), default).take(codes), dtype=object)
+
+
+def _frame_rowwise(bbf_field, values):
+    """Run the field's transformer per value, with apply_transformers() error handling."""
+    transformer = TRANSFORMERS[bbf_field]
+    result = []
+    for value in values:
+        try:
+            result.append(transformer(value))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=values.index, dtype=object)
+
+
+def _frame_custom(bbf_field, es_field, frame):
+    """Hand-edited transformer: called for every row with the record as context."""
+    transformer = TRANSFORMERS[bbf_field]
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    result = []
+    for record in records:
+        try:
+            result.append(transformer(record[es_field], record))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=frame.index, dtype=object)
+
+
+def _frame_strings(values):
+    """Mask of the values that are str."""
+    try:
+        return values.str.len().notna()
+    except AttributeError:  # No string values
+        return pd.Series(False, index=values.index)
+
+
+def _frame_none(values):
+    return None
+
+
+def _frame_string(values):
+    return values.astype(str).astype(object)
+
+
+def _frame_picklist(values, picklist_map):
+    text = values.astype(str).str.strip()
+    mapped = text.map(picklist_map)
+    return mapped.where(mapped.notna(), text)
+
+
+def _frame_multipicklist(values, picklist_map):
+    parts = values.astype(str).str.strip().str.split(';').explode().str.strip()
+    parts = parts[parts.ne('')]
+    mapped = parts.map(picklist_map)
+    mapped = mapped.where(mapped.notna(), parts)
+    joined = mapped.groupby(level=0).agg(';'.join).reindex(values.index).astype(object)
+    joined[joined.isna()] = None
+    return joined
+
+
+def _frame_date(values, bbf_field):
+    """ISO date / datetime strings -> date; other values via the transformer."""
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    iso = _frame_strings(values)
+    if iso.any():
+        iso[iso] = values[iso].str.match(_FRAME_ISO_DATE)
+    text = values[iso].astype(str)
+    if len(text):
+        valid = pd.to_datetime(text.str.replace('Z', '+00:00', regex=False), format='ISO8601',
+                               errors='coerce', utc=True).notna()
+        text = text[valid]
+        result[text.index] = pd.to_datetime(text.str.slice(0, 10), format='%Y-%m-%d').dt.date
+    rest = values.index.difference(text.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_number(values, bbf_field):
+    """Numeric values and '$1,234.50' strings -> float; other values via the transformer."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float).astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    number = pd.Series(dtype=float)
+    if strings.any():
+        cleaned = values[strings].str.replace(r'[\$,\s]', '', regex=True)
+        number = pd.to_numeric(cleaned, errors='coerce')
+        number[cleaned.eq('')] = 0.0
+        number = number[number.notna()]
+        result[number.index] = number.astype(float)
+    rest = values.index.difference(number.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_boolean(values, bbf_field):
+    """'true' / 'yes' / '1' / 'y' strings and bool values -> bool; other values via the transformer."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    if strings.any():
+        result[strings] = values[strings].str.lower().isin(_FRAME_TRUE)
+    if (~strings).any():
+        result[~strings] = _frame_rowwise(bbf_field, values[~strings])
+    return result
+
+
+def apply_transformers_frame(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Column-wise apply_transformers() for a DataFrame of ES Off_Net__c records.
+
+    Returns one object column per BBF Off_Net__c field whose ES column is in df,
+    in TRANSFORMERS order, on df's index. Each row matches
+    apply_transformers() on the same record, with missing cells (NaN) read
+    as None. Conversions run once per distinct value of a column.
+    """
+    if pd is None:
+        raise ImportError("apply_transformers_frame() requires pandas")
+    frame = df.reset_index(drop=True)
+    columns = {}
+    # Aloc_COGS_Provider__c <- Off_Net_Vendor__c (passthrough)
+    if 'Off_Net_Vendor__c' in frame.columns:
+        columns['Aloc_COGS_Provider__c'] = _frame_column(frame['Off_Net_Vendor__c'], None, None)
+    # Term__c <- Term__c (picklist)
+    if 'Term__c' in frame.columns:
+        columns['Term__c'] = _frame_column(frame['Term__c'], None, _frame_picklist, TERM_MAP)
+    # Zloc_COGS_Provider__c <- Vendor_Name__c (passthrough)
+    if 'Vendor_Name__c' in frame.columns:
+        columns['Zloc_COGS_Provider__c'] = _frame_column(frame['Vendor_Name__c'], None, None)
+    # Product__c <- Bandwidth__c (picklist)
+    if 'Bandwidth__c' in frame.columns:
+        columns['Product__c'] = _frame_column(frame['Bandwidth__c'], None, _frame_picklist, PRODUCT_MAP)
+    # Service_Type__c <- Off_Net_Type__c (picklist)
+    if 'Off_Net_Type__c' in frame.columns:
+        columns['Service_Type__c'] = _frame_column(frame['Off_Net_Type__c'], None, _frame_picklist, SERVICE_TYPE_MAP)
+    # BBF_Circuit_ID__c <- Internal_Circuit_Id__c (passthrough)
+    if 'Internal_Circuit_Id__c' in frame.columns:
+        columns['BBF_Circuit_ID__c'] = _frame_column(frame['Internal_Circuit_Id__c'], None, None)
+    # Demarc_Location__c <- Demarc_Loaction__c (passthrough)
+    if 'Demarc_Loaction__c' in frame.columns:
+        columns['Demarc_Location__c'] = _frame_column(frame['Demarc_Loaction__c'], None, None)
+    # Off_Net_Service_Status__c <- LEC_Order_Status__c (picklist)
+    if 'LEC_Order_Status__c' in frame.columns:
+        columns['Off_Net_Service_Status__c'] = _frame_column(frame['LEC_Order_Status__c'], None, _frame_picklist, OFF_NET_SERVICE_STATUS_MAP)
+    # Stripped_Circuit_ID__c <- Stripped_Circuit_ID2__c (passthrough)
+    if 'Stripped_Circuit_ID2__c' in frame.columns:
+        columns['Stripped_Circuit_ID__c'] = _frame_column(frame['Stripped_Circuit_ID2__c'], None, None)
+    # Vendor_BAN__c <- Vendor_Ban__c (passthrough)
+    if 'Vendor_Ban__c' in frame.columns:
+        columns['Vendor_BAN__c'] = _frame_column(frame['Vendor_Ban__c'], None, None)
+    # Vendor_NNI__c <- Vendor_NNI__c (passthrough)
+    if 'Vendor_NNI__c' in frame.columns:
+        columns['Vendor_NNI__c'] = _frame_column(frame['Vendor_NNI__c'], None, None)
+    # Vendor_PON__c <- VendorPON__c (passthrough)
+    if 'VendorPON__c' in frame.columns:
+        columns['Vendor_PON__c'] = _frame_column(frame['VendorPON__c'], None, None)
+    result = pd.DataFrame(columns, index=frame.index)
+    result.index = df.index
+    return result
+
+# --- END FRAME KERNEL ---
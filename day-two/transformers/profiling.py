@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Transformer Profiling
+=====================
+Per-field timing and error telemetry for apply_transformers().
+
+apply_transformers() prints "Warning: Transform failed" and stores None when a
+transformer raises; nothing else is recorded. With a profiler attached every
+transformer call is timed and failures are aggregated per field:
+
+    calls, total / mean / p99 / max latency
+    exceptions by type
+    the first SAMPLE_LIMIT failing values (with the error message)
+
+p99 comes from a fixed-size random sample of each field's latencies
+(LATENCY_SAMPLE_SIZE), so memory stays flat over 100k-record runs.
+
+Switching it on:
+    TRANSFORMER_PROFILE=1 python ...           profile every apply_transformers()
+                                               call, print the report at exit
+    TRANSFORMER_PROFILE=profile.json python ...  ... and write it as JSON
+    apply_transformers(es_record, profiler=p)  profile into an explicit profiler
+
+Usage:
+    from transformers.profiling import TransformerProfiler
+
+    profiler = TransformerProfiler()
+    bbf_records = [apply_transformers(r, profiler=profiler) for r in es_records]
+    profiler.print_report()
+    profiler.write_json("transform_profile.json")
+"""
+
+import atexit
+import json
+import os
+import random
+from array import array
+from time import perf_counter_ns
+from typing import Callable, Dict, Optional
+
+PROFILE_ENV = 'TRANSFORMER_PROFILE'
+
+# Failing values kept per field
+SAMPLE_LIMIT = 5
+
+# Latencies kept per field for the p99 estimate (reservoir sample)
+LATENCY_SAMPLE_SIZE = 10000
+
+
+class FieldProfile:
+    """Counters for one transformer (one BBF field of one object)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.errors = {}  # exception type name -> count
+        self.samples = []  # first SAMPLE_LIMIT failures: {'value', 'error'}
+        self._latencies = array('q')
+        self._random = random.Random(name)
+
+    def record(self, elapsed_ns: int):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        if len(self._latencies) < LATENCY_SAMPLE_SIZE:
+            self._latencies.append(elapsed_ns)
+        else:
+            slot = self._random.randrange(self.calls)
+            if slot < LATENCY_SAMPLE_SIZE:
+                self._latencies[slot] = elapsed_ns
+
+    def record_error(self, elapsed_ns: int, value, error: Exception):
+        self.record(elapsed_ns)
+        error_type = type(error).__name__
+        self.errors[error_type] = self.errors.get(error_type, 0) + 1
+        if len(self.samples) < SAMPLE_LIMIT:
+            self.samples.append({'value': repr(value)[:200], 'error': f"{error_type}: {error}"})
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def percentile_ns(self, percent: float) -> int:
+        if not self._latencies:
+            return 0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def summary(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'total_ms': self.total_ns / 1e6,
+            'mean_us': self.total_ns / self.calls / 1e3 if self.calls else 0.0,
+            'p99_us': self.percentile_ns(99) / 1e3,
+            'max_us': self.max_ns / 1e3,
+            'errors': dict(self.errors),
+            'error_samples': list(self.samples),
+        }
+
+
+class TransformerProfiler:
+    """Collects FieldProfile counters for every transformer it runs."""
+
+    def __init__(self):
+        self.fields: Dict[str, FieldProfile] = {}
+
+    def field(self, name: str) -> FieldProfile:
+        profile = self.fields.get(name)
+        if profile is None:
+            profile = self.fields[name] = FieldProfile(name)
+        return profile
+
+    def apply(self, module_name: str, transformers: Dict[str, Callable],
+              field_mapping: Dict[str, str], es_record: dict) -> dict:
+        """
+        apply_transformers() with every transformer call timed.
+
+        Same result and the same warning for a failing transformer; fields are
+        profiled as '<object>.<BBF field>', e.g. 'service.Active_Date__c'.
+        """
+        prefix = module_name.rsplit('.', 1)[-1].replace('_transformers', '') + '.'
+        bbf_record = {}
+
+        for bbf_field, transformer in transformers.items():
+            es_field = field_mapping.get(bbf_field)
+            if es_field and es_field in es_record:
+                value = es_record[es_field]
+                start = perf_counter_ns()
+                try:
+                    bbf_record[bbf_field] = transformer(value, es_record)
+                except Exception as e:
+                    self.field(prefix + bbf_field).record_error(perf_counter_ns() - start, value, e)
+                    # Log error but continue with other fields
+                    print(f"Warning: Transform failed for {bbf_field}: {e}")
+                    bbf_record[bbf_field] = None
+                else:
+                    self.field(prefix + bbf_field).record(perf_counter_ns() - start)
+
+        return bbf_record
+
+    def report(self) -> Dict[str, Dict]:
+        """Field -> summary(), hottest (largest total time) first."""
+        ordered = sorted(self.fields.values(), key=lambda p: p.total_ns, reverse=True)
+        return {p.name: p.summary() for p in ordered}
+
+    def print_report(self, top: Optional[int] = None):
+        """Print the per-field table and the failure samples."""
+        report = self.report()
+        print(f"\n⏱️  Transformer Profile:")
+        if not report:
+            print(f"   (no transformer calls profiled)")
+            return
+        names = list(report)[:top] if top else list(report)
+        width = max(len(name) for name in names)
+        print(f"   {'Field':<{width}} | {'Calls':>9} | {'Total ms':>9} | {'Mean us':>8} | "
+              f"{'p99 us':>8} | {'Max us':>9} | {'Errors':>7}")
+        print(f"   {'-' * (width + 70)}")
+        for name in names:
+            s = report[name]
+            print(f"   {name:<{width}} | {s['calls']:>9,} | {s['total_ms']:>9.1f} | {s['mean_us']:>8.2f} | "
+                  f"{s['p99_us']:>8.2f} | {s['max_us']:>9.1f} | {sum(s['errors'].values()):>7,}")
+
+        failing = [name for name in report if report[name]['errors']]
+        if failing:
+            print(f"\n❌ Failing transformers:")
+            for name in failing:
+                s = report[name]
+                by_type = ', '.join(f"{t}: {n:,}" for t, n in sorted(s['errors'].items()))
+                print(f"   {name} ({by_type})")
+                for sample in s['error_samples']:
+                    print(f"      {sample['value']} -> {sample['error']}")
+
+    def write_json(self, path: str):
+        """Write report() to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        print(f"💾 Transformer profile saved: {path}")
+
+
+# =============================================================================
+# ACTIVE PROFILER (TRANSFORMER_PROFILE / enable_profiling)
+# =============================================================================
+
+_active: Optional[TransformerProfiler] = None
+
+
+def active_profiler() -> Optional[TransformerProfiler]:
+    """Profiler apply_transformers() uses when none is passed (None = off)."""
+    return _active
+
+
+def enable_profiling(report_path: str = None) -> TransformerProfiler:
+    """
+    Profile every apply_transformers() call from now on.
+
+    The report is printed when the interpreter exits (and written to
+    report_path as JSON if given).
+    """
+    global _active
+    if _active is None:
+        _active = TransformerProfiler()
+
+        def _report_at_exit(profiler=_active):
+            profiler.print_report()
+            if report_path:
+                profiler.write_json(report_path)
+
+        atexit.register(_report_at_exit)
+    return _active
+
+
+def disable_profiling() -> Optional[TransformerProfiler]:
+    """Stop profiling; returns the profiler that was active."""
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+# TRANSFORMER_PROFILE=1/true/yes profiles; any other value is also the JSON report path
+_env_value = os.environ.get(PROFILE_ENV, '').strip()
+if _env_value and _env_value.lower() not in ('0', 'false', 'no', 'off'):
+    enable_profiling(None if _env_value.lower() in ('1', 'true', 'yes', 'on') else _env_value)
@@ -16,10 +16,32 @@ Usage:
     # Transform a single record
     service_type = transform_service_type_charge(es_orderitem['Product_Family__c'])
     product_simple = transform_product_simple(es_orderitem['Description'], es_orderitem['Product_Family__c'])
+
+    # Transform all OrderItems at once
+    products = transform_service_charge_products_records(es_orderitems)
+
+Both transformers are pure and memoized (transformers.memo): each distinct
+Product_Family__c / Description / Product_Name__c combination is computed once.
+Change FAMILY_TO_SERVICE_TYPE at runtime with update_family_service_types(),
+which also drops the memoized results of the old mapping.
+
+BANDWIDTH_PATTERNS are compiled into one single-pass extractor
+(transformers.bandwidth); BANDWIDTH_GOLDEN_CASES pin its results, checked by
+verify_bandwidth_extraction(). Product families outside FAMILY_TO_SERVICE_TYPE
+go through FAMILY_KEYWORD_RULES (transformers.keywords);
+classify_product_family() also reports the winning rule and its confidence.
 """
 
-import re
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .bandwidth import BandwidthExtractor, BandwidthSteps
+    from .keywords import Classification, KeywordClassifier, KeywordRule
+    from .memo import memoize
+except ImportError:  # Run as a script from transformers/
+    from bandwidth import BandwidthExtractor, BandwidthSteps
+    from keywords import Classification, KeywordClassifier, KeywordRule
+    from memo import memoize
 
 # =============================================================================
 # PRODUCT_FAMILY → SERVICE_TYPE_CHARGE MAPPING
@@ -73,6 +95,23 @@ FAMILY_TO_SERVICE_TYPE = {
 # Default value when no mapping found
 DEFAULT_SERVICE_TYPE = 'EPL'
 
+# Partial matching for families not in FAMILY_TO_SERVICE_TYPE: the first rule
+# with a keyword anywhere in the upper-cased family wins
+FAMILY_KEYWORD_RULES = [
+    KeywordRule('dark_fiber', ('DARK FIBER', 'DFBR'), 'DF'),
+    KeywordRule('internet', ('INTERNET', 'DIA'), 'DIA'),
+    KeywordRule('voice', ('VOICE', 'VOIC'), 'VOICE'),
+    KeywordRule('colocation', ('COLO',), 'COLO'),
+    KeywordRule('ethernet', ('ETHERNET', 'EPL', 'EVPL'), 'EPL'),
+    KeywordRule('point_to_point', ('POINT-TO-POINT', 'PTPS'), 'EPL'),
+    KeywordRule('point_to_multipoint', ('POINT-TO-MULTI', 'PMPS'), 'ELAN'),
+    KeywordRule('wavelength', ('WAVE', 'DWDM'), 'Wavelength'),
+]
+
+# Exact mapping (High), keyword rules (Medium), default (Low) in one scan per family
+FAMILY_CLASSIFIER = KeywordClassifier(FAMILY_KEYWORD_RULES, exact=FAMILY_TO_SERVICE_TYPE,
+                                      default=DEFAULT_SERVICE_TYPE)
+
 
 # =============================================================================
 # BANDWIDTH EXTRACTION PATTERNS
@@ -98,6 +137,61 @@ BANDWIDTH_PATTERNS = [
     (r'(\d+)M\b', 'Mbps'),
 ]
 
+# Unrealistic values: a larger match falls through to the next pattern
+BANDWIDTH_LIMITS = {'Gbps': 1000, 'Mbps': 10000}
+
+BANDWIDTH_EXTRACTOR = BandwidthExtractor(BANDWIDTH_PATTERNS, limits=BANDWIDTH_LIMITS)
+
+# Description -> expected (value, unit); results of the original re.search loop
+BANDWIDTH_GOLDEN_CASES = [
+    (None, (None, None)),
+    ('', (None, None)),
+    ('Unknown', (None, None)),
+    ('2 Strands Dark Fiber', (None, None)),
+    ('0100Mbps Ethernet Transport', (100, 'Mbps')),
+    ('01Gbps Internet', (1, 'Gbps')),
+    ('50Mbps Ethernet', (50, 'Mbps')),
+    ('1 Gbps', (1, 'Gbps')),
+    ('10 Gbps DIA', (10, 'Gbps')),
+    ('1gbps', (1, 'Gbps')),
+    ('100 MBPS', (100, 'Mbps')),
+    ('10M 1Gbps', (1, 'Gbps')),
+    ('5000 Gbps 10Gbps', (10, 'Gbps')),
+    ('5000 Gbps 10 Gbps', (None, None)),
+    ('10GBE Port', (10, 'Gbps')),
+    ('100 MB', (100, 'Mbps')),
+    ('20000Mbps', (None, None)),
+    ('1G', (1, 'Gbps')),
+    ('10 G', (None, None)),
+    ('500M DIA', (500, 'Mbps')),
+    ('EPL 1 Gbps / 100 Mbps', (1, 'Gbps')),
+    ('1500 GB storage 10G', (10, 'Gbps')),
+    ('100Mbps\n10 Gbps', (10, 'Gbps')),
+    ('Cat6 100M', (100, 'Mbps')),
+    ('2x10G', (10, 'Gbps')),
+    ('0000Gbps', (0, 'Gbps')),
+    ('1000 Gbps', (1000, 'Gbps')),
+    ('1001 Gbps', (None, None)),
+    ('10000 Mbps', (10000, 'Mbps')),
+    ('10001Mbps 5M', (5, 'Mbps')),
+    ('400G-ZR', (400, 'Gbps')),
+    ('100G/10G', (100, 'Gbps')),
+    ('3M', (3, 'Mbps')),
+    ('1.5 Gbps', (5, 'Gbps')),
+    ('Port 8 - 100Mbps', (100, 'Mbps')),
+    ('99999 MB 2 GB', (2, 'Gbps')),
+    ('EVPL 250M', (250, 'Mbps')),
+    ('Wave 100GE', (None, None)),
+    ('10Gig', (None, None)),
+    ('DIA 1000Mbps burstable to 10G', (1000, 'Mbps')),
+    ('IPv4 Blocks /29  (1 Gateway, 5 Usable)', (None, None)),
+    ('New Service Promotion: First 3 Months Free', (None, None)),
+    ('Ethernet 10M\t', (10, 'Mbps')),
+    ('2 Gbps 3 Mbps', (2, 'Gbps')),
+    ('7 mb', (7, 'Mbps')),
+    ('Rack 42U 20A', (None, None)),
+]
+
 # Mapping of extracted bandwidth to BBF Product_Simple__c values
 # These are the exact picklist values in BBF
 BANDWIDTH_TO_PRODUCT = {
@@ -145,6 +239,9 @@ BANDWIDTH_TO_PRODUCT = {
     '900 Mbps': '900 Mbps',
 }
 
+# BANDWIDTH_TO_PRODUCT bandwidths sorted per unit, for nearest-value snapping
+BANDWIDTH_STEPS = BandwidthSteps(BANDWIDTH_TO_PRODUCT)
+
 # =============================================================================
 # PRODUCT_NAME → PRODUCT_SIMPLE DIRECT MAPPING
 # =============================================================================
@@ -304,26 +401,26 @@ def extract_bandwidth_from_description(description: Optional[str]) -> Tuple[Opti
     Returns:
         Tuple of (value, unit) e.g., (100, 'Mbps') or (None, None) if not found
     """
-    if not description:
-        return None, None
-
-    for pattern, unit in BANDWIDTH_PATTERNS:
-        match = re.search(pattern, description, re.IGNORECASE)
-        if match:
-            try:
-                value = int(match.group(1))
-                # Filter out unrealistic values
-                if unit == 'Gbps' and value > 1000:
-                    continue
-                if unit == 'Mbps' and value > 10000:
-                    continue
-                return value, unit
-            except (ValueError, IndexError):
-                continue
-
-    return None, None
+    return BANDWIDTH_EXTRACTOR.extract(description)
+
 
+def extract_bandwidths(descriptions: Iterable[Optional[str]]) -> List[Tuple[Optional[int], Optional[str]]]:
+    """extract_bandwidth_from_description() for a column; each distinct value is scanned once."""
+    return BANDWIDTH_EXTRACTOR.extract_many(descriptions)
+
+
+def verify_bandwidth_extraction() -> List[str]:
+    """
+    Check the compiled extractor against BANDWIDTH_GOLDEN_CASES and the
+    original pattern-by-pattern re.search loop.
 
+    Returns:
+        One message per mismatch (empty when everything agrees)
+    """
+    return BANDWIDTH_EXTRACTOR.verify(BANDWIDTH_GOLDEN_CASES)
+
+
+@memoize
 def transform_service_type_charge(product_family: Optional[str]) -> str:
     """
     Transform ES Product_Family__c to BBF Service_Type_Charge__c.
@@ -334,36 +431,43 @@ def transform_service_type_charge(product_family: Optional[str]) -> str:
     Returns:
         BBF Service_Type_Charge__c picklist value
     """
-    if not product_family:
-        return DEFAULT_SERVICE_TYPE
-
-    # Direct mapping lookup
-    if product_family in FAMILY_TO_SERVICE_TYPE:
-        return FAMILY_TO_SERVICE_TYPE[product_family]
-
-    # Try partial matching for variations
-    product_family_upper = product_family.upper()
-
-    if 'DARK FIBER' in product_family_upper or 'DFBR' in product_family_upper:
-        return 'DF'
-    if 'INTERNET' in product_family_upper or 'DIA' in product_family_upper:
-        return 'DIA'
-    if 'VOICE' in product_family_upper or 'VOIC' in product_family_upper:
-        return 'VOICE'
-    if 'COLO' in product_family_upper:
-        return 'COLO'
-    if 'ETHERNET' in product_family_upper or 'EPL' in product_family_upper or 'EVPL' in product_family_upper:
-        return 'EPL'
-    if 'POINT-TO-POINT' in product_family_upper or 'PTPS' in product_family_upper:
-        return 'EPL'
-    if 'POINT-TO-MULTI' in product_family_upper or 'PMPS' in product_family_upper:
-        return 'ELAN'
-    if 'WAVE' in product_family_upper or 'DWDM' in product_family_upper:
-        return 'Wavelength'
-
-    return DEFAULT_SERVICE_TYPE
+    return classify_product_family(product_family).label
 
 
+@memoize
+def classify_product_family(product_family: Optional[str]) -> Classification:
+    """
+    Service_Type_Charge__c of a Product_Family__c with the rule that decided it.
+
+    Returns:
+        Classification(label, rule, keyword, confidence): rule is 'exact'
+        (FAMILY_TO_SERVICE_TYPE, High), a FAMILY_KEYWORD_RULES name (Medium)
+        or 'default' (Low)
+    """
+    return FAMILY_CLASSIFIER.classify(product_family)
+
+
+def classify_product_families(product_families: Iterable[Optional[str]]) -> List[Classification]:
+    """classify_product_family() for a column; each distinct family is classified once."""
+    return FAMILY_CLASSIFIER.classify_many(product_families)
+
+
+def update_family_service_types(mapping: Dict[str, str]):
+    """
+    Add or change FAMILY_TO_SERVICE_TYPE entries.
+
+    The memoized transformers would keep returning the labels of the old
+    mapping, so their caches are cleared.
+
+    Args:
+        mapping: Product_Family__c -> Service_Type_Charge__c
+    """
+    FAMILY_TO_SERVICE_TYPE.update(mapping)
+    for transformer in (classify_product_family, transform_service_type_charge, transform_product_simple):
+        transformer.cache_clear()
+
+
+@memoize(maxsize=65536)  # Keyed on four fields: more distinct combinations
 def transform_product_simple(
     description: Optional[str],
     product_family: Optional[str] = None,
@@ -400,28 +504,62 @@ def transform_product_simple(
     if bw_value is None and product_name:
         bw_value, bw_unit = extract_bandwidth_from_description(product_name)
 
-    if bw_value is not None:
-        # Construct bandwidth string
-        bw_str = f"{bw_value} {bw_unit}"
-
-        # Check if exact match exists
-        if bw_str in BANDWIDTH_TO_PRODUCT:
-            return BANDWIDTH_TO_PRODUCT[bw_str]
-
-        # Try to find closest match
-        if bw_unit == 'Gbps':
-            # Find closest Gbps value
-            gbps_values = [int(k.split()[0]) for k in BANDWIDTH_TO_PRODUCT.keys() if 'Gbps' in k]
-            if gbps_values:
-                closest = min(gbps_values, key=lambda x: abs(x - bw_value))
-                return f"{closest} Gbps"
-        elif bw_unit == 'Mbps':
-            # Find closest Mbps value
-            mbps_values = [int(k.split()[0]) for k in BANDWIDTH_TO_PRODUCT.keys() if 'Mbps' in k]
-            if mbps_values:
-                closest = min(mbps_values, key=lambda x: abs(x - bw_value))
-                return f"{closest} Mbps"
+    product_simple = bandwidth_product(bw_value, bw_unit)
+    if product_simple is not None:
+        return product_simple
+    return _default_product_simple(product_family, service_type)
+
+
+def bandwidth_product(bw_value: Optional[int], bw_unit: Optional[str]) -> Optional[str]:
+    """
+    Product_Simple__c of an extracted bandwidth.
+
+    Returns:
+        The exact BANDWIDTH_TO_PRODUCT match, else the nearest bandwidth of the
+        same unit (binary search in BANDWIDTH_STEPS), else None
+    """
+    if bw_value is None:
+        return None
+
+    # Check if exact match exists
+    bw_str = f"{bw_value} {bw_unit}"
+    if bw_str in BANDWIDTH_TO_PRODUCT:
+        return BANDWIDTH_TO_PRODUCT[bw_str]
 
+    # Closest value of the same unit
+    closest = BANDWIDTH_STEPS.snap(bw_value, bw_unit)
+    return None if closest is None else f"{closest} {bw_unit}"
+
+
+def bandwidth_products(bandwidths: List[Tuple[Optional[int], Optional[str]]]) -> List[Optional[str]]:
+    """
+    bandwidth_product() for a column of (value, unit) pairs.
+
+    Values without an exact match are snapped per unit in one vectorized
+    searchsorted call (one bisect per value when numpy is not installed).
+    """
+    products = [None if value is None else BANDWIDTH_TO_PRODUCT.get(f"{value} {unit}")
+                for value, unit in bandwidths]
+    to_snap = {}  # Unit -> positions of values without an exact match
+    for i, (value, unit) in enumerate(bandwidths):
+        if value is not None and products[i] is None:
+            to_snap.setdefault(unit, []).append(i)
+
+    for unit, positions in to_snap.items():
+        values = [bandwidths[i][0] for i in positions]
+        try:
+            closest = BANDWIDTH_STEPS.snap_many(values, unit)
+        except ImportError:
+            closest = [BANDWIDTH_STEPS.snap(value, unit) for value in values]
+        if closest is None:
+            continue  # No steps for this unit
+        for i, step in zip(positions, closest):
+            products[i] = None if step is None else f"{int(step)} {unit}"
+    return products
+
+
+def _default_product_simple(product_family: Optional[str], service_type: Optional[str]) -> str:
+    """Priorities 4-5 of transform_product_simple() (no bandwidth product)."""
     # No bandwidth found - use service type default
     if service_type and service_type in SERVICE_TYPE_DEFAULT_PRODUCTS:
         return SERVICE_TYPE_DEFAULT_PRODUCTS[service_type]
@@ -435,6 +573,67 @@ def transform_product_simple(
     return DEFAULT_PRODUCT_SIMPLE
 
 
+def transform_product_simple_many(
+    descriptions: List[Optional[str]],
+    product_families: List[Optional[str]] = None,
+    service_types: List[Optional[str]] = None,
+    product_names: List[Optional[str]] = None
+) -> List[str]:
+    """
+    transform_product_simple() for whole columns.
+
+    Each distinct (description, family, service type, product name) row is
+    resolved once, the bandwidths of all distinct descriptions (then of the
+    product names still without one) are extracted in one batch and snapped
+    with bandwidth_products().
+
+    Returns:
+        Product_Simple__c value per row
+    """
+    n = len(descriptions)
+    rows = list(zip(descriptions, product_families or [None] * n,
+                    service_types or [None] * n, product_names or [None] * n))
+
+    products: Dict[tuple, str] = {}
+    to_extract = []
+    for row in dict.fromkeys(rows):
+        product_name = row[3]
+        if product_name and product_name in PRODUCT_NAME_TO_PRODUCT_SIMPLE:
+            products[row] = PRODUCT_NAME_TO_PRODUCT_SIMPLE[product_name]
+        else:
+            to_extract.append(row)
+
+    texts = list(dict.fromkeys(row[0] for row in to_extract))
+    bandwidths = dict(zip(texts, extract_bandwidths(texts)))
+    names = list(dict.fromkeys(row[3] for row in to_extract if row[3] and bandwidths[row[0]][0] is None))
+    name_bandwidths = dict(zip(names, extract_bandwidths(names)))
+
+    row_bandwidths = []
+    for description, _family, _service_type, product_name in to_extract:
+        bandwidth = bandwidths[description]
+        if bandwidth[0] is None and product_name:
+            bandwidth = name_bandwidths[product_name]
+        row_bandwidths.append(bandwidth)
+
+    for row, product_simple in zip(to_extract, bandwidth_products(row_bandwidths)):
+        if product_simple is None:
+            product_simple = _default_product_simple(row[1], row[2])
+        products[row] = product_simple
+
+    return [products[row] for row in rows]
+
+
+def transform_service_charge_products_records(es_orderitems: List[dict]) -> List[dict]:
+    """transform_service_charge_products() for a batch of ES OrderItem records."""
+    families = [r.get('Product_Family__c') for r in es_orderitems]
+    service_types = [c.label for c in classify_product_families(families)]
+    products = transform_product_simple_many(
+        [r.get('Description') for r in es_orderitems], families, service_types,
+        [r.get('Product_Name__c') for r in es_orderitems])
+    return [{'Service_Type_Charge__c': service_type, 'Product_Simple__c': product_simple}
+            for service_type, product_simple in zip(service_types, products)]
+
+
 def transform_service_charge_products(es_orderitem: dict) -> dict:
     """
     Transform ES OrderItem to BBF Service_Charge__c product fields.
@@ -495,3 +694,8 @@ if __name__ == '__main__':
         print(f"Output:")
         print(f"  Service_Type_Charge__c: {result['Service_Type_Charge__c']}")
         print(f"  Product_Simple__c: {result['Product_Simple__c']}")
+
+    problems = verify_bandwidth_extraction()
+    print(f"\nBandwidth golden cases: {len(BANDWIDTH_GOLDEN_CASES) - len(problems)}/{len(BANDWIDTH_GOLDEN_CASES)} OK")
+    for problem in problems:
+        print(f"  ❌ {problem}")
@@ -17,9 +17,15 @@ Usage:
 """
 
 import re
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from datetime import datetime, date
 
+from .memo import memoize_value
+from .profiling import active_profiler
+
+if TYPE_CHECKING:
+    from .profiling import TransformerProfiler
+
 
 # Picklist value mappings
 CHARGE_CLASS_MAP = {
@@ -153,6 +159,7 @@ def transform_pricebookentryid(es_value: Any, context: dict = None) -> Optional[
     return es_value
 
 
+@memoize_value
 def transform_charge_class(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES SBQQ__ChargeType__c to BBF Charge_Class__c.
@@ -185,6 +192,7 @@ def transform_charge_class(es_value: Any, context: dict = None) -> Optional[str]
     return CHARGE_CLASS_MAP.get(es_str, es_str)  # Return original if no mapping
 
 
+@memoize_value
 def transform_charge_active(es_value: Any, context: dict = None) -> Optional[bool]:
     """
     Transform ES SBQQ__Activated__c to BBF Charge_Active__c.
@@ -307,6 +315,7 @@ def transform_product(es_value: Any, context: dict = None) -> Optional[Any]:
     return es_value
 
 
+@memoize_value
 def transform_bill_schedule_type(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES SBQQ__BillingFrequency__c to BBF Bill_Schedule_Type__c.
@@ -426,6 +435,7 @@ def transform_nrc_net(es_value: Any, context: dict = None) -> Optional[float]:
     return es_value
 
 
+@memoize_value
 def transform_active(es_value: Any, context: dict = None) -> Optional[bool]:
     """
     Transform ES SBQQ__Activated__c to BBF Active__c.
@@ -653,16 +663,22 @@ FIELD_MAPPING = {
 }
 
 
-def apply_transformers(es_record: dict) -> dict:
+def apply_transformers(es_record: dict, profiler: 'TransformerProfiler' = None) -> dict:
     """
     Apply all transformers to an ES record.
 
     Args:
         es_record: Dictionary of ES field values (field API name -> value)
+        profiler: Optional transformers.profiling.TransformerProfiler timing each
+            transformer; defaults to the TRANSFORMER_PROFILE one (off when unset)
 
     Returns:
         Dictionary of transformed BBF field values (BBF field API name -> value)
     """
+    profiler = profiler or active_profiler()
+    if profiler is not None:
+        return profiler.apply(__name__, TRANSFORMERS, FIELD_MAPPING, es_record)
+
     bbf_record = {}
 
     for bbf_field, transformer in TRANSFORMERS.items():
@@ -676,3 +692,406 @@ def apply_transformers(es_record: dict) -> dict:
                 bbf_record[bbf_field] = None
 
     return bbf_record
+
+
+# --- BEGIN FUSED KERNEL (generated by generate_transformers.py --fused) ---
+
+_FUSED_NUMBER_JUNK = re.compile(r'[\$,\s]')
+
+
+def transform_records(es_records: list) -> list:
+    """
+    Fused apply_transformers() for a batch of ES OrderItem -> BBF Service_Charge__c records.
+
+    Same result as [apply_transformers(r) for r in es_records], with every
+    transformer inlined into one straight-line loop body: no registry walk
+    and no function call per field. A record that raises is redone with
+    apply_transformers(), which handles the failing field on its own.
+    """
+    if active_profiler() is not None:
+        # Profiled runs need the per-field timings of apply_transformers()
+        return [apply_transformers(es_record) for es_record in es_records]
+    results = []
+    append = results.append
+    for es_record in es_records:
+        bbf_record = {}
+        try:
+            # Description__c <- Description (passthrough)
+            if 'Description' in es_record:
+                v = es_record['Description']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Description__c'] = None
+                else:
+                    bbf_record['Description__c'] = v
+            # Sequence__c <- OrderItemNumber (passthrough)
+            if 'OrderItemNumber' in es_record:
+                v = es_record['OrderItemNumber']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Sequence__c'] = None
+                else:
+                    bbf_record['Sequence__c'] = v
+            # Amount__c <- Total_MRC_Amortized__c (passthrough)
+            if 'Total_MRC_Amortized__c' in es_record:
+                v = es_record['Total_MRC_Amortized__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Amount__c'] = None
+                else:
+                    bbf_record['Amount__c'] = v
+            # PricebookEntryId__c <- PricebookEntryId (passthrough)
+            if 'PricebookEntryId' in es_record:
+                v = es_record['PricebookEntryId']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['PricebookEntryId__c'] = None
+                else:
+                    bbf_record['PricebookEntryId__c'] = v
+            # Charge_Class__c <- SBQQ__ChargeType__c (picklist)
+            if 'SBQQ__ChargeType__c' in es_record:
+                v = es_record['SBQQ__ChargeType__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Charge_Class__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Charge_Class__c'] = CHARGE_CLASS_MAP.get(s, s)
+            # Charge_Active__c <- SBQQ__Activated__c (boolean)
+            if 'SBQQ__Activated__c' in es_record:
+                v = es_record['SBQQ__Activated__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Charge_Active__c'] = False
+                else:
+                    if isinstance(v, bool):
+                        bbf_record['Charge_Active__c'] = v
+                    elif isinstance(v, str):
+                        bbf_record['Charge_Active__c'] = v.lower() in ('true', 'yes', '1', 'y')
+                    else:
+                        bbf_record['Charge_Active__c'] = bool(v)
+            # Product_Category__c <- Product_Family__c (passthrough)
+            if 'Product_Family__c' in es_record:
+                v = es_record['Product_Family__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Product_Category__c'] = None
+                else:
+                    bbf_record['Product_Category__c'] = v
+            # Product_Name__c <- Product_Name__c (passthrough)
+            if 'Product_Name__c' in es_record:
+                v = es_record['Product_Name__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Product_Name__c'] = None
+                else:
+                    bbf_record['Product_Name__c'] = v
+            # Product__c <- Product2Id (passthrough)
+            if 'Product2Id' in es_record:
+                v = es_record['Product2Id']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Product__c'] = None
+                else:
+                    bbf_record['Product__c'] = v
+            # Bill_Schedule_Type__c <- SBQQ__BillingFrequency__c (picklist)
+            if 'SBQQ__BillingFrequency__c' in es_record:
+                v = es_record['SBQQ__BillingFrequency__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Bill_Schedule_Type__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Bill_Schedule_Type__c'] = BILL_SCHEDULE_TYPE_MAP.get(s, s)
+            # Service_Order_Line_Charge__c <- SBQQ__QuoteLine__c (passthrough)
+            if 'SBQQ__QuoteLine__c' in es_record:
+                v = es_record['SBQQ__QuoteLine__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Service_Order_Line_Charge__c'] = None
+                else:
+                    bbf_record['Service_Order_Line_Charge__c'] = v
+            # MRC_Net__c <- Total_MRC_Amortized__c (passthrough)
+            if 'Total_MRC_Amortized__c' in es_record:
+                v = es_record['Total_MRC_Amortized__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['MRC_Net__c'] = None
+                else:
+                    bbf_record['MRC_Net__c'] = v
+            # NRC_Net__c <- NRC_Non_Amortized__c (passthrough)
+            if 'NRC_Non_Amortized__c' in es_record:
+                v = es_record['NRC_Non_Amortized__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['NRC_Net__c'] = None
+                else:
+                    bbf_record['NRC_Net__c'] = v
+            # Active__c <- SBQQ__Activated__c (boolean)
+            if 'SBQQ__Activated__c' in es_record:
+                v = es_record['SBQQ__Activated__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Active__c'] = False
+                else:
+                    if isinstance(v, bool):
+                        bbf_record['Active__c'] = v
+                    elif isinstance(v, str):
+                        bbf_record['Active__c'] = v.lower() in ('true', 'yes', '1', 'y')
+                    else:
+                        bbf_record['Active__c'] = bool(v)
+            # Start_Date_Achieved_On__c <- ServiceDate (passthrough)
+            if 'ServiceDate' in es_record:
+                v = es_record['ServiceDate']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Start_Date_Achieved_On__c'] = None
+                else:
+                    bbf_record['Start_Date_Achieved_On__c'] = v
+            # End_Date_Achieved_On__c <- EndDate (passthrough)
+            if 'EndDate' in es_record:
+                v = es_record['EndDate']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['End_Date_Achieved_On__c'] = None
+                else:
+                    bbf_record['End_Date_Achieved_On__c'] = v
+            # Aloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+            if 'Last_Mile_Carrier__c' in es_record:
+                v = es_record['Last_Mile_Carrier__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Aloc_COGS_Provider__c'] = None
+                else:
+                    bbf_record['Aloc_COGS_Provider__c'] = v
+            # Zloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+            if 'Last_Mile_Carrier__c' in es_record:
+                v = es_record['Last_Mile_Carrier__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Zloc_COGS_Provider__c'] = None
+                else:
+                    bbf_record['Zloc_COGS_Provider__c'] = v
+            # Off_Net__c <- OFF_NET_IDs__c (passthrough)
+            if 'OFF_NET_IDs__c' in es_record:
+                v = es_record['OFF_NET_IDs__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Off_Net__c'] = None
+                else:
+                    bbf_record['Off_Net__c'] = v
+        except Exception:
+            bbf_record = apply_transformers(es_record)
+        append(bbf_record)
+    return results
+
+
+def transform_record_fused(es_record: dict) -> dict:
+    """Fused apply_transformers() for a single ES record."""
+    return transform_records([es_record])[0]
+
+# --- END FUSED KERNEL ---
+
+
+# --- BEGIN FRAME KERNEL (generated by generate_transformers.py --frame) ---
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # Only apply_transformers_frame() needs pandas
+    np = pd = None
+
+_FRAME_ISO_DATE = r'^\d{4}-\d{2}-\d{2}(?:[T ]|$)'
+_FRAME_TRUE = ['true', 'yes', '1', 'y']
+
+
+def _frame_column(values, default, convert, *args):
+    """
+    One output column: default for blank cells, convert(filled, *args) for the rest.
+
+    Columns holding a single type are factorized, so blank checks and
+    conversions see each distinct value once. Mixed-type columns are not
+    (factorize would merge True with 1), every cell is converted on its own.
+    """
+    if pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+        codes, distinct = np.arange(len(values)), values.astype(object).reset_index(drop=True)
+    else:
+        codes, uniques = pd.factorize(values)
+        distinct = pd.Series(uniques)
+    try:
+        blank = distinct.isna() | distinct.str.strip().eq('')
+    except AttributeError:  # No string values
+        blank = distinct.isna()
+    converted = pd.Series([default] * len(distinct), index=distinct.index, dtype=object)
+    filled = distinct[~blank]
+    if len(filled):
+        converted[~blank] = filled if convert is None else convert(filled, *args)
+    # Code -1 (None / NaN) picks the default appended at the end
+    return pd.Series(np.append(converted.to_numpy(), default).take(codes), dtype=object)
+
+
+def _frame_rowwise(bbf_field, values):
+    """Run the field's transformer per value, with apply_transformers() error handling."""
+    transformer = TRANSFORMERS[bbf_field]
+    result = []
+    for value in values:
+        try:
+            result.append(transformer(value))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=values.index, dtype=object)
+
+
+def _frame_custom(bbf_field, es_field, frame):
+    """Hand-edited transformer: called for every row with the record as context."""
+    transformer = TRANSFORMERS[bbf_field]
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    result = []
+    for record in records:
+        try:
+            result.append(transformer(record[es_field], record))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=frame.index, dtype=object)
+
+
+def _frame_strings(values):
+    """Mask of the values that are str."""
+    try:
+        return values.str.len().notna()
+    except AttributeError:  # No string values
+        return pd.Series(False, index=values.index)
+
+
+def _frame_none(values):
+    return None
+
+
+def _frame_string(values):
+    return values.astype(str).astype(object)
+
+
+def _frame_picklist(values, picklist_map):
+    text = values.astype(str).str.strip()
+    mapped = text.map(picklist_map)
+    return mapped.where(mapped.notna(), text)
+
+
+def _frame_multipicklist(values, picklist_map):
+    parts = values.astype(str).str.strip().str.split(';').explode().str.strip()
+    parts = parts[parts.ne('')]
+    mapped = parts.map(picklist_map)
+    mapped = mapped.where(mapped.notna(), parts)
+    joined = mapped.groupby(level=0).agg(';'.join).reindex(values.index).astype(object)
+    joined[joined.isna()] = None
+    return joined
+
+
+def _frame_date(values, bbf_field):
+    """ISO date / datetime strings -> date; other values via the transformer."""
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    iso = _frame_strings(values)
+    if iso.any():
+        iso[iso] = values[iso].str.match(_FRAME_ISO_DATE)
+    text = values[iso].astype(str)
+    if len(text):
+        valid = pd.to_datetime(text.str.replace('Z', '+00:00', regex=False), format='ISO8601',
+                               errors='coerce', utc=True).notna()
+        text = text[valid]
+        result[text.index] = pd.to_datetime(text.str.slice(0, 10), format='%Y-%m-%d').dt.date
+    rest = values.index.difference(text.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_number(values, bbf_field):
+    """Numeric values and '$1,234.50' strings -> float; other values via the transformer."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float).astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    number = pd.Series(dtype=float)
+    if strings.any():
+        cleaned = values[strings].str.replace(r'[\$,\s]', '', regex=True)
+        number = pd.to_numeric(cleaned, errors='coerce')
+        number[cleaned.eq('')] = 0.0
+        number = number[number.notna()]
+        result[number.index] = number.astype(float)
+    rest = values.index.difference(number.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_boolean(values, bbf_field):
+    """'true' / 'yes' / '1' / 'y' strings and bool values -> bool; other values via the transformer."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    if strings.any():
+        result[strings] = values[strings].str.lower().isin(_FRAME_TRUE)
+    if (~strings).any():
+        result[~strings] = _frame_rowwise(bbf_field, values[~strings])
+    return result
+
+
+def apply_transformers_frame(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Column-wise apply_transformers() for a DataFrame of ES OrderItem records.
+
+    Returns one object column per BBF Service_Charge__c field whose ES column is in df,
+    in TRANSFORMERS order, on df's index. Each row matches
+    apply_transformers() on the same record, with missing cells (NaN) read
+    as None. Conversions run once per distinct value of a column.
+    """
+    if pd is None:
+        raise ImportError("apply_transformers_frame() requires pandas")
+    frame = df.reset_index(drop=True)
+    columns = {}
+    # Description__c <- Description (passthrough)
+    if 'Description' in frame.columns:
+        columns['Description__c'] = _frame_column(frame['Description'], None, None)
+    # Sequence__c <- OrderItemNumber (passthrough)
+    if 'OrderItemNumber' in frame.columns:
+        columns['Sequence__c'] = _frame_column(frame['OrderItemNumber'], None, None)
+    # Amount__c <- Total_MRC_Amortized__c (passthrough)
+    if 'Total_MRC_Amortized__c' in frame.columns:
+        columns['Amount__c'] = _frame_column(frame['Total_MRC_Amortized__c'], None, None)
+    # PricebookEntryId__c <- PricebookEntryId (passthrough)
+    if 'PricebookEntryId' in frame.columns:
+        columns['PricebookEntryId__c'] = _frame_column(frame['PricebookEntryId'], None, None)
+    # Charge_Class__c <- SBQQ__ChargeType__c (picklist)
+    if 'SBQQ__ChargeType__c' in frame.columns:
+        columns['Charge_Class__c'] = _frame_column(frame['SBQQ__ChargeType__c'], None, _frame_picklist, CHARGE_CLASS_MAP)
+    # Charge_Active__c <- SBQQ__Activated__c (boolean)
+    if 'SBQQ__Activated__c' in frame.columns:
+        columns['Charge_Active__c'] = _frame_column(frame['SBQQ__Activated__c'], False, _frame_boolean, 'Charge_Active__c')
+    # Product_Category__c <- Product_Family__c (passthrough)
+    if 'Product_Family__c' in frame.columns:
+        columns['Product_Category__c'] = _frame_column(frame['Product_Family__c'], None, None)
+    # Product_Name__c <- Product_Name__c (passthrough)
+    if 'Product_Name__c' in frame.columns:
+        columns['Product_Name__c'] = _frame_column(frame['Product_Name__c'], None, None)
+    # Product__c <- Product2Id (passthrough)
+    if 'Product2Id' in frame.columns:
+        columns['Product__c'] = _frame_column(frame['Product2Id'], None, None)
+    # Bill_Schedule_Type__c <- SBQQ__BillingFrequency__c (picklist)
+    if 'SBQQ__BillingFrequency__c' in frame.columns:
+        columns['Bill_Schedule_Type__c'] = _frame_column(frame['SBQQ__BillingFrequency__c'], None, _frame_picklist, BILL_SCHEDULE_TYPE_MAP)
+    # Service_Order_Line_Charge__c <- SBQQ__QuoteLine__c (passthrough)
+    if 'SBQQ__QuoteLine__c' in frame.columns:
+        columns['Service_Order_Line_Charge__c'] = _frame_column(frame['SBQQ__QuoteLine__c'], None, None)
+    # MRC_Net__c <- Total_MRC_Amortized__c (passthrough)
+    if 'Total_MRC_Amortized__c' in frame.columns:
+        columns['MRC_Net__c'] = _frame_column(frame['Total_MRC_Amortized__c'], None, None)
+    # NRC_Net__c <- NRC_Non_Amortized__c (passthrough)
+    if 'NRC_Non_Amortized__c' in frame.columns:
+        columns['NRC_Net__c'] = _frame_column(frame['NRC_Non_Amortized__c'], None, None)
+    # Active__c <- SBQQ__Activated__c (boolean)
+    if 'SBQQ__Activated__c' in frame.columns:
+        columns['Active__c'] = _frame_column(frame['SBQQ__Activated__c'], False, _frame_boolean, 'Active__c')
+    # Start_Date_Achieved_On__c <- ServiceDate (passthrough)
+    if 'ServiceDate' in frame.columns:
+        columns['Start_Date_Achieved_On__c'] = _frame_column(frame['ServiceDate'], None, None)
+    # End_Date_Achieved_On__c <- EndDate (passthrough)
+    if 'EndDate' in frame.columns:
+        columns['End_Date_Achieved_On__c'] = _frame_column(frame['EndDate'], None, None)
+    # Aloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+    if 'Last_Mile_Carrier__c' in frame.columns:
+        columns['Aloc_COGS_Provider__c'] = _frame_column(frame['Last_Mile_Carrier__c'], None, None)
+    # Zloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+    if 'Last_Mile_Carrier__c' in frame.columns:
+        columns['Zloc_COGS_Provider__c'] = _frame_column(frame['Last_Mile_Carrier__c'], None, None)
+    # Off_Net__c <- OFF_NET_IDs__c (passthrough)
+    if 'OFF_NET_IDs__c' in frame.columns:
+        columns['Off_Net__c'] = _frame_column(frame['OFF_NET_IDs__c'], None, None)
+    result = pd.DataFrame(columns, index=frame.index)
+    result.index = df.index
+    return result
+
+# --- END FRAME KERNEL ---
@@ -17,9 +17,15 @@ Usage:
 """
 
 import re
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from datetime import datetime, date
 
+from .memo import memoize_value
+from .profiling import active_profiler
+
+if TYPE_CHECKING:
+    from .profiling import TransformerProfiler
+
 
 # Picklist value mappings
 CHANGE_TYPE_MAP = {
@@ -89,6 +95,7 @@ def transform_circuit_capacity(es_value: Any, context: dict = None) -> Optional[
     return str(es_value)
 
 
+@memoize_value
 def transform_active_date(es_value: Any, context: dict = None) -> Optional[date]:
     """
     Transform ES ActivatedDate to BBF Active_Date__c.
@@ -275,6 +282,7 @@ def transform_bandwidth(es_value: Any, context: dict = None) -> Optional[str]:
     return str(es_value)
 
 
+@memoize_value
 def transform_change_type(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES Order_Type_Data_Load__c to BBF Change_Type__c.
@@ -510,6 +518,7 @@ def transform_order_received_by(es_value: Any, context: dict = None) -> Optional
     return es_value
 
 
+@memoize_value
 def transform_order_received_date(es_value: Any, context: dict = None) -> Optional[date]:
     """
     Transform ES CreatedDate to BBF Order_Received_Date__c.
@@ -578,6 +587,7 @@ def transform_outside_plant_required(es_value: Any, context: dict = None) -> Opt
     return es_value
 
 
+@memoize_value
 def transform_opportunity_type(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES Service_Category_Multi__c to BBF Opportunity_Type__c.
@@ -813,6 +823,7 @@ def transform_zloc_cogs_provider(es_value: Any, context: dict = None) -> Optiona
     return es_value
 
 
+@memoize_value
 def transform_disconnect_reason_codes(es_value: Any, context: dict = None) -> Optional[str]:
     """
     Transform ES Service_End_Reasons__c to BBF Disconnect_Reason_Codes__c.
@@ -906,16 +917,22 @@ FIELD_MAPPING = {
 }
 
 
-def apply_transformers(es_record: dict) -> dict:
+def apply_transformers(es_record: dict, profiler: 'TransformerProfiler' = None) -> dict:
     """
     Apply all transformers to an ES record.
 
     Args:
         es_record: Dictionary of ES field values (field API name -> value)
+        profiler: Optional transformers.profiling.TransformerProfiler timing each
+            transformer; defaults to the TRANSFORMER_PROFILE one (off when unset)
 
     Returns:
         Dictionary of transformed BBF field values (BBF field API name -> value)
     """
+    profiler = profiler or active_profiler()
+    if profiler is not None:
+        return profiler.apply(__name__, TRANSFORMERS, FIELD_MAPPING, es_record)
+
     bbf_record = {}
 
     for bbf_field, transformer in TRANSFORMERS.items():
@@ -929,3 +946,487 @@ def apply_transformers(es_record: dict) -> dict:
                 bbf_record[bbf_field] = None
 
     return bbf_record
+
+
+# --- BEGIN FUSED KERNEL (generated by generate_transformers.py --fused) ---
+
+_FUSED_NUMBER_JUNK = re.compile(r'[\$,\s]')
+
+
+def transform_records(es_records: list) -> list:
+    """
+    Fused apply_transformers() for a batch of ES Order -> BBF Service__c records.
+
+    Same result as [apply_transformers(r) for r in es_records], with every
+    transformer inlined into one straight-line loop body: no registry walk
+    and no function call per field. A record that raises is redone with
+    apply_transformers(), which handles the failing field on its own.
+    """
+    if active_profiler() is not None:
+        # Profiled runs need the per-field timings of apply_transformers()
+        return [apply_transformers(es_record) for es_record in es_records]
+    results = []
+    append = results.append
+    for es_record in es_records:
+        bbf_record = {}
+        try:
+            # Circuit_Capacity__c <- Service_Provided__c (to_string)
+            if 'Service_Provided__c' in es_record:
+                v = es_record['Service_Provided__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Circuit_Capacity__c'] = None
+                else:
+                    bbf_record['Circuit_Capacity__c'] = str(v)
+            # Active_Date__c <- ActivatedDate (date)
+            if 'ActivatedDate' in es_record:
+                v = es_record['ActivatedDate']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Active_Date__c'] = None
+                else:
+                    if isinstance(v, datetime):
+                        bbf_record['Active_Date__c'] = v.date()
+                    elif isinstance(v, date):
+                        bbf_record['Active_Date__c'] = v
+                    elif isinstance(v, str):
+                        try:
+                            bbf_record['Active_Date__c'] = datetime.fromisoformat(v.replace('Z', '+00:00')).date()
+                        except (ValueError, AttributeError):
+                            bbf_record['Active_Date__c'] = None
+                    else:
+                        bbf_record['Active_Date__c'] = None
+            # A_Node__c <- Node__c (passthrough)
+            if 'Node__c' in es_record:
+                v = es_record['Node__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['A_Node__c'] = None
+                else:
+                    bbf_record['A_Node__c'] = v
+            # Z_Node__c <- Ring__c (passthrough)
+            if 'Ring__c' in es_record:
+                v = es_record['Ring__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Z_Node__c'] = None
+                else:
+                    bbf_record['Z_Node__c'] = v
+            # PON__c <- PON__c (passthrough)
+            if 'PON__c' in es_record:
+                v = es_record['PON__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['PON__c'] = None
+                else:
+                    bbf_record['PON__c'] = v
+            # Secondary_Circuit_Id__c <- Order_Link__c (passthrough)
+            if 'Order_Link__c' in es_record:
+                v = es_record['Order_Link__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Secondary_Circuit_Id__c'] = None
+                else:
+                    bbf_record['Secondary_Circuit_Id__c'] = v
+            # Bandwidth__c <- Service_Provided__c (to_string)
+            if 'Service_Provided__c' in es_record:
+                v = es_record['Service_Provided__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Bandwidth__c'] = None
+                else:
+                    bbf_record['Bandwidth__c'] = str(v)
+            # Change_Type__c <- Order_Type_Data_Load__c (picklist)
+            if 'Order_Type_Data_Load__c' in es_record:
+                v = es_record['Order_Type_Data_Load__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Change_Type__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Change_Type__c'] = CHANGE_TYPE_MAP.get(s, s)
+            # Carrier_Code__c <- Last_Mile_Carrier__c (passthrough)
+            if 'Last_Mile_Carrier__c' in es_record:
+                v = es_record['Last_Mile_Carrier__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Carrier_Code__c'] = None
+                else:
+                    bbf_record['Carrier_Code__c'] = v
+            # Service_Access_Build__c <- Build_Type_Address_Z__c (passthrough)
+            if 'Build_Type_Address_Z__c' in es_record:
+                v = es_record['Build_Type_Address_Z__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Service_Access_Build__c'] = None
+                else:
+                    bbf_record['Service_Access_Build__c'] = v
+            # Account_Manager__c <- Sales_Rep__c (passthrough)
+            if 'Sales_Rep__c' in es_record:
+                v = es_record['Sales_Rep__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Account_Manager__c'] = None
+                else:
+                    bbf_record['Account_Manager__c'] = v
+            # Disconnect_Reason__c <- End_Reason_Notes__c (passthrough)
+            if 'End_Reason_Notes__c' in es_record:
+                v = es_record['End_Reason_Notes__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Disconnect_Reason__c'] = None
+                else:
+                    bbf_record['Disconnect_Reason__c'] = v
+            # Engineer__c <- Service_Delivery_Manager__c (passthrough)
+            if 'Service_Delivery_Manager__c' in es_record:
+                v = es_record['Service_Delivery_Manager__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Engineer__c'] = None
+                else:
+                    bbf_record['Engineer__c'] = v
+            # OSP_Engineer__c <- OSP_Engineer__c (passthrough)
+            if 'OSP_Engineer__c' in es_record:
+                v = es_record['OSP_Engineer__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['OSP_Engineer__c'] = None
+                else:
+                    bbf_record['OSP_Engineer__c'] = v
+            # Order_Received_By__c <- CreatedById (passthrough)
+            if 'CreatedById' in es_record:
+                v = es_record['CreatedById']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Order_Received_By__c'] = None
+                else:
+                    bbf_record['Order_Received_By__c'] = v
+            # Order_Received_Date__c <- CreatedDate (date)
+            if 'CreatedDate' in es_record:
+                v = es_record['CreatedDate']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Order_Received_Date__c'] = None
+                else:
+                    if isinstance(v, datetime):
+                        bbf_record['Order_Received_Date__c'] = v.date()
+                    elif isinstance(v, date):
+                        bbf_record['Order_Received_Date__c'] = v
+                    elif isinstance(v, str):
+                        try:
+                            bbf_record['Order_Received_Date__c'] = datetime.fromisoformat(v.replace('Z', '+00:00')).date()
+                        except (ValueError, AttributeError):
+                            bbf_record['Order_Received_Date__c'] = None
+                    else:
+                        bbf_record['Order_Received_Date__c'] = None
+            # Outside_Plant_Required__c <- OSP_Needed__c (passthrough)
+            if 'OSP_Needed__c' in es_record:
+                v = es_record['OSP_Needed__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Outside_Plant_Required__c'] = None
+                else:
+                    bbf_record['Outside_Plant_Required__c'] = v
+            # Opportunity_Type__c <- Service_Category_Multi__c (picklist)
+            if 'Service_Category_Multi__c' in es_record:
+                v = es_record['Service_Category_Multi__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Opportunity_Type__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Opportunity_Type__c'] = OPPORTUNITY_TYPE_MAP.get(s, s)
+            # Provisioned_By__c <- Initially_Activated_By__c (passthrough)
+            if 'Initially_Activated_By__c' in es_record:
+                v = es_record['Initially_Activated_By__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Provisioned_By__c'] = None
+                else:
+                    bbf_record['Provisioned_By__c'] = v
+            # Replaced_By_Ckt_Code__c <- Service_Order_Details_Replacing__c (passthrough)
+            if 'Service_Order_Details_Replacing__c' in es_record:
+                v = es_record['Service_Order_Details_Replacing__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Replaced_By_Ckt_Code__c'] = None
+                else:
+                    bbf_record['Replaced_By_Ckt_Code__c'] = v
+            # Replacing_Ckt_Code__c <- Service_Order_Agreement_Replacing__c (passthrough)
+            if 'Service_Order_Agreement_Replacing__c' in es_record:
+                v = es_record['Service_Order_Agreement_Replacing__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Replacing_Ckt_Code__c'] = None
+                else:
+                    bbf_record['Replacing_Ckt_Code__c'] = v
+            # Sales_Engineer__c <- Sales_Rep__c (passthrough)
+            if 'Sales_Rep__c' in es_record:
+                v = es_record['Sales_Rep__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Sales_Engineer__c'] = None
+                else:
+                    bbf_record['Sales_Engineer__c'] = v
+            # Signal_Type__c <- Primary_Product_Family__c (passthrough)
+            if 'Primary_Product_Family__c' in es_record:
+                v = es_record['Primary_Product_Family__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Signal_Type__c'] = None
+                else:
+                    bbf_record['Signal_Type__c'] = v
+            # Aloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+            if 'Last_Mile_Carrier__c' in es_record:
+                v = es_record['Last_Mile_Carrier__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Aloc_COGS_Provider__c'] = None
+                else:
+                    bbf_record['Aloc_COGS_Provider__c'] = v
+            # Zloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+            if 'Last_Mile_Carrier__c' in es_record:
+                v = es_record['Last_Mile_Carrier__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Zloc_COGS_Provider__c'] = None
+                else:
+                    bbf_record['Zloc_COGS_Provider__c'] = v
+            # Disconnect_Reason_Codes__c <- Service_End_Reasons__c (picklist)
+            if 'Service_End_Reasons__c' in es_record:
+                v = es_record['Service_End_Reasons__c']
+                if v is None or (isinstance(v, str) and not v.strip()):
+                    bbf_record['Disconnect_Reason_Codes__c'] = None
+                else:
+                    s = str(v).strip()
+                    bbf_record['Disconnect_Reason_Codes__c'] = DISCONNECT_REASON_CODES_MAP.get(s, s)
+        except Exception:
+            bbf_record = apply_transformers(es_record)
+        append(bbf_record)
+    return results
+
+
+def transform_record_fused(es_record: dict) -> dict:
+    """Fused apply_transformers() for a single ES record."""
+    return transform_records([es_record])[0]
+
+# --- END FUSED KERNEL ---
+
+
+# --- BEGIN FRAME KERNEL (generated by generate_transformers.py --frame) ---
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # Only apply_transformers_frame() needs pandas
+    np = pd = None
+
+_FRAME_ISO_DATE = r'^\d{4}-\d{2}-\d{2}(?:[T ]|$)'
+_FRAME_TRUE = ['true', 'yes', '1', 'y']
+
+
+def _frame_column(values, default, convert, *args):
+    """
+    One output column: default for blank cells, convert(filled, *args) for the rest.
+
+    Columns holding a single type are factorized, so blank checks and
+    conversions see each distinct value once. Mixed-type columns are not
+    (factorize would merge True with 1), every cell is converted on its own.
+    """
+    if pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+        codes, distinct = np.arange(len(values)), values.astype(object).reset_index(drop=True)
+    else:
+        codes, uniques = pd.factorize(values)
+        distinct = pd.Series(uniques)
+    try:
+        blank = distinct.isna() | distinct.str.strip().eq('')
+    except AttributeError:  # No string values
+        blank = distinct.isna()
+    converted = pd.Series([default] * len(distinct), index=distinct.index, dtype=object)
+    filled = distinct[~blank]
+    if len(filled):
+        converted[~blank] = filled if convert is None else convert(filled, *args)
+    # Code -1 (None / NaN) picks the default appended at the end
+    return pd.Series(np.append(converted.to_numpy(), default).take(codes), dtype=object)
+
+
+def _frame_rowwise(bbf_field, values):
+    """Run the field's transformer per value, with apply_transformers() error handling."""
+    transformer = TRANSFORMERS[bbf_field]
+    result = []
+    for value in values:
+        try:
+            result.append(transformer(value))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=values.index, dtype=object)
+
+
+def _frame_custom(bbf_field, es_field, frame):
+    """Hand-edited transformer: called for every row with the record as context."""
+    transformer = TRANSFORMERS[bbf_field]
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    result = []
+    for record in records:
+        try:
+            result.append(transformer(record[es_field], record))
+        except Exception as e:
+            print(f"Warning: Transform failed for {bbf_field}: {e}")
+            result.append(None)
+    return pd.Series(result, index=frame.index, dtype=object)
+
+
+def _frame_strings(values):
+    """Mask of the values that are str."""
+    try:
+        return values.str.len().notna()
+    except AttributeError:  # No string values
+        return pd.Series(False, index=values.index)
+
+
+def _frame_none(values):
+    return None
+
+
+def _frame_string(values):
+    return values.astype(str).astype(object)
+
+
+def _frame_picklist(values, picklist_map):
+    text = values.astype(str).str.strip()
+    mapped = text.map(picklist_map)
+    return mapped.where(mapped.notna(), text)
+
+
+def _frame_multipicklist(values, picklist_map):
+    parts = values.astype(str).str.strip().str.split(';').explode().str.strip()
+    parts = parts[parts.ne('')]
+    mapped = parts.map(picklist_map)
+    mapped = mapped.where(mapped.notna(), parts)
+    joined = mapped.groupby(level=0).agg(';'.join).reindex(values.index).astype(object)
+    joined[joined.isna()] = None
+    return joined
+
+
+def _frame_date(values, bbf_field):
+    """ISO date / datetime strings -> date; other values via the transformer."""
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    iso = _frame_strings(values)
+    if iso.any():
+        iso[iso] = values[iso].str.match(_FRAME_ISO_DATE)
+    text = values[iso].astype(str)
+    if len(text):
+        valid = pd.to_datetime(text.str.replace('Z', '+00:00', regex=False), format='ISO8601',
+                               errors='coerce', utc=True).notna()
+        text = text[valid]
+        result[text.index] = pd.to_datetime(text.str.slice(0, 10), format='%Y-%m-%d').dt.date
+    rest = values.index.difference(text.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_number(values, bbf_field):
+    """Numeric values and '$1,234.50' strings -> float; other values via the transformer."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float).astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    number = pd.Series(dtype=float)
+    if strings.any():
+        cleaned = values[strings].str.replace(r'[\$,\s]', '', regex=True)
+        number = pd.to_numeric(cleaned, errors='coerce')
+        number[cleaned.eq('')] = 0.0
+        number = number[number.notna()]
+        result[number.index] = number.astype(float)
+    rest = values.index.difference(number.index)
+    if len(rest):
+        result[rest] = _frame_rowwise(bbf_field, values[rest])
+    return result
+
+
+def _frame_boolean(values, bbf_field):
+    """'true' / 'yes' / '1' / 'y' strings and bool values -> bool; other values via the transformer."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype(object)
+    result = pd.Series([None] * len(values), index=values.index, dtype=object)
+    strings = _frame_strings(values)
+    if strings.any():
+        result[strings] = values[strings].str.lower().isin(_FRAME_TRUE)
+    if (~strings).any():
+        result[~strings] = _frame_rowwise(bbf_field, values[~strings])
+    return result
+
+
+def apply_transformers_frame(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Column-wise apply_transformers() for a DataFrame of ES Order records.
+
+    Returns one object column per BBF Service__c field whose ES column is in df,
+    in TRANSFORMERS order, on df's index. Each row matches
+    apply_transformers() on the same record, with missing cells (NaN) read
+    as None. Conversions run once per distinct value of a column.
+    """
+    if pd is None:
+        raise ImportError("apply_transformers_frame() requires pandas")
+    frame = df.reset_index(drop=True)
+    columns = {}
+    # Circuit_Capacity__c <- Service_Provided__c (to_string)
+    if 'Service_Provided__c' in frame.columns:
+        columns['Circuit_Capacity__c'] = _frame_column(frame['Service_Provided__c'], None, _frame_string)
+    # Active_Date__c <- ActivatedDate (date)
+    if 'ActivatedDate' in frame.columns:
+        columns['Active_Date__c'] = _frame_column(frame['ActivatedDate'], None, _frame_date, 'Active_Date__c')
+    # A_Node__c <- Node__c (passthrough)
+    if 'Node__c' in frame.columns:
+        columns['A_Node__c'] = _frame_column(frame['Node__c'], None, None)
+    # Z_Node__c <- Ring__c (passthrough)
+    if 'Ring__c' in frame.columns:
+        columns['Z_Node__c'] = _frame_column(frame['Ring__c'], None, None)
+    # PON__c <- PON__c (passthrough)
+    if 'PON__c' in frame.columns:
+        columns['PON__c'] = _frame_column(frame['PON__c'], None, None)
+    # Secondary_Circuit_Id__c <- Order_Link__c (passthrough)
+    if 'Order_Link__c' in frame.columns:
+        columns['Secondary_Circuit_Id__c'] = _frame_column(frame['Order_Link__c'], None, None)
+    # Bandwidth__c <- Service_Provided__c (to_string)
+    if 'Service_Provided__c' in frame.columns:
+        columns['Bandwidth__c'] = _frame_column(frame['Service_Provided__c'], None, _frame_string)
+    # Change_Type__c <- Order_Type_Data_Load__c (picklist)
+    if 'Order_Type_Data_Load__c' in frame.columns:
+        columns['Change_Type__c'] = _frame_column(frame['Order_Type_Data_Load__c'], None, _frame_picklist, CHANGE_TYPE_MAP)
+    # Carrier_Code__c <- Last_Mile_Carrier__c (passthrough)
+    if 'Last_Mile_Carrier__c' in frame.columns:
+        columns['Carrier_Code__c'] = _frame_column(frame['Last_Mile_Carrier__c'], None, None)
+    # Service_Access_Build__c <- Build_Type_Address_Z__c (passthrough)
+    if 'Build_Type_Address_Z__c' in frame.columns:
+        columns['Service_Access_Build__c'] = _frame_column(frame['Build_Type_Address_Z__c'], None, None)
+    # Account_Manager__c <- Sales_Rep__c (passthrough)
+    if 'Sales_Rep__c' in frame.columns:
+        columns['Account_Manager__c'] = _frame_column(frame['Sales_Rep__c'], None, None)
+    # Disconnect_Reason__c <- End_Reason_Notes__c (passthrough)
+    if 'End_Reason_Notes__c' in frame.columns:
+        columns['Disconnect_Reason__c'] = _frame_column(frame['End_Reason_Notes__c'], None, None)
+    # Engineer__c <- Service_Delivery_Manager__c (passthrough)
+    if 'Service_Delivery_Manager__c' in frame.columns:
+        columns['Engineer__c'] = _frame_column(frame['Service_Delivery_Manager__c'], None, None)
+    # OSP_Engineer__c <- OSP_Engineer__c (passthrough)
+    if 'OSP_Engineer__c' in frame.columns:
+        columns['OSP_Engineer__c'] = _frame_column(frame['OSP_Engineer__c'], None, None)
+    # Order_Received_By__c <- CreatedById (passthrough)
+    if 'CreatedById' in frame.columns:
+        columns['Order_Received_By__c'] = _frame_column(frame['CreatedById'], None, None)
+    # Order_Received_Date__c <- CreatedDate (date)
+    if 'CreatedDate' in frame.columns:
+        columns['Order_Received_Date__c'] = _frame_column(frame['CreatedDate'], None, _frame_date, 'Order_Received_Date__c')
+    # Outside_Plant_Required__c <- OSP_Needed__c (passthrough)
+    if 'OSP_Needed__c' in frame.columns:
+        columns['Outside_Plant_Required__c'] = _frame_column(frame['OSP_Needed__c'], None, None)
+    # Opportunity_Type__c <- Service_Category_Multi__c (picklist)
+    if 'Service_Category_Multi__c' in frame.columns:
+        columns['Opportunity_Type__c'] = _frame_column(frame['Service_Category_Multi__c'], None, _frame_picklist, OPPORTUNITY_TYPE_MAP)
+    # Provisioned_By__c <- Initially_Activated_By__c (passthrough)
+    if 'Initially_Activated_By__c' in frame.columns:
+        columns['Provisioned_By__c'] = _frame_column(frame['Initially_Activated_By__c'], None, None)
+    # Replaced_By_Ckt_Code__c <- Service_Order_Details_Replacing__c (passthrough)
+    if 'Service_Order_Details_Replacing__c' in frame.columns:
+        columns['Replaced_By_Ckt_Code__c'] = _frame_column(frame['Service_Order_Details_Replacing__c'], None, None)
+    # Replacing_Ckt_Code__c <- Service_Order_Agreement_Replacing__c (passthrough)
+    if 'Service_Order_Agreement_Replacing__c' in frame.columns:
+        columns['Replacing_Ckt_Code__c'] = _frame_column(frame['Service_Order_Agreement_Replacing__c'], None, None)
+    # Sales_Engineer__c <- Sales_Rep__c (passthrough)
+    if 'Sales_Rep__c' in frame.columns:
+        columns['Sales_Engineer__c'] = _frame_column(frame['Sales_Rep__c'], None, None)
+    # Signal_Type__c <- Primary_Product_Family__c (passthrough)
+    if 'Primary_Product_Family__c' in frame.columns:
+        columns['Signal_Type__c'] = _frame_column(frame['Primary_Product_Family__c'], None, None)
+    # Aloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+    if 'Last_Mile_Carrier__c' in frame.columns:
+        columns['Aloc_COGS_Provider__c'] = _frame_column(frame['Last_Mile_Carrier__c'], None, None)
+    # Zloc_COGS_Provider__c <- Last_Mile_Carrier__c (passthrough)
+    if 'Last_Mile_Carrier__c' in frame.columns:
+        columns['Zloc_COGS_Provider__c'] = _frame_column(frame['Last_Mile_Carrier__c'], None, None)
+    # Disconnect_Reason_Codes__c <- Service_End_Reasons__c (picklist)
+    if 'Service_End_Reasons__c' in frame.columns:
+        columns['Disconnect_Reason_Codes__c'] = _frame_column(frame['Service_End_Reasons__c'], None, _frame_picklist, DISCONNECT_REASON_CODES_MAP)
+    result = pd.DataFrame(columns, index=frame.index)
+    result.index = df.index
+    return result
+
+# --- END FRAME KERNEL ---
@@ -23,8 +23,12 @@ Day 2 enrichment adds:
 
 from simple_salesforce import Salesforce
 from collections import Counter
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from migration_engine.fake_org.client import fake_session_from_env
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -63,6 +67,7 @@ es_sf = Salesforce(
     password=ES_PASSWORD,
     security_token=ES_TOKEN,
     domain=ES_DOMAIN,
+    session=fake_session_from_env("es"),
 )
 print(f"  Connected: {es_sf.sf_instance}")
 
@@ -72,6 +77,7 @@ bbf_sf = Salesforce(
     password=BBF_PASSWORD,
     security_token=BBF_TOKEN,
     domain=BBF_DOMAIN,
+    session=fake_session_from_env("bbf"),
 )
 print(f"  Connected: {bbf_sf.sf_instance}")
 
@@ -0,0 +1,28 @@
+"""
+Shared runtime for the ES to BBF Salesforce migration notebooks.
+
+The Day 1 notebooks in initial-day/ and the Day 2 tooling in day-two/ import
+these modules instead of copy-pasting the same load / write-back logic into
+every notebook cell.
+
+Usage (from a notebook in initial-day/ or day-two/):
+    import os, sys
+    sys.path.insert(0, os.path.abspath(".."))
+
+    from migration_engine.loader import upsert_by_legacy_id, split_upsert_results
+
+Modules:
+    benchmark: Stage-by-stage throughput benchmark on a synthetic fake org, with regression check
+    fake_org: In-memory fake Salesforce orgs (HTTP server) for local end-to-end runs
+    journal: Append-only JSON Lines run journal of per-record outcomes
+    ledger: Partitioned Parquet ledger of per-record outcomes, queries and lazy reports
+    loader: Bulk upsert keyed on ES_Legacy_ID__c (idempotent Day 1 loads)
+    lookups: Crosswalk-driven derived lookups resolved at transform time
+    pipeline: Overlapped extract -> transform -> load -> write-back with bounded queues
+    reconcile: Sorted-merge TRUE-UP of ES_Legacy_ID__c / BBF_New_Id__c links
+    report: Write-only (streaming) Excel report writer with named styles
+    retry: Classify bulk row failures and re-drive lock / transient ones
+    synth: Synthetic, reproducible ES datasets with profiled picklist distributions
+"""
+
+__all__ = ['benchmark', 'fake_org', 'journal', 'ledger', 'loader', 'lookups', 'pipeline', 'reconcile', 'report', 'retry', 'synth']
@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+"""
+Migration Throughput Benchmark
+==============================
+Times every migration stage against a synthetic ES org served by the fake org
+server, so chunk size / batch size / transform changes can be measured instead
+of guessed.
+
+The Day 1 chain (Location, Account, BAN, Service, Service Charge, Off-Net) is
+replayed with the notebooks' queries and the real simple_salesforce client:
+
+    extract      ES query_all (relationship paths to parent BBF_New_Id__c)
+    transform    generated day-two/transformers module (transform_records)
+                 plus the Day 1 fields and parent links
+    load         loader.upsert_by_legacy_id into the BBF org
+    write-back   Bulk update of ES BBF_New_Id__c
+    enrichment   enrichment_runner steps: query ES + BBF, describe,
+                 build_enrichment_updates, apply_updates
+
+ES fields the generated transformers read but the synthetic generator does
+not populate are declared on the fake ES org and read as null, unless
+--profile-dir supplies their picklist distributions.
+
+For each stage the report shows records/sec and API calls per 1k records.
+API calls are deterministic for a given dataset and batch sizes; records/sec
+depends on the machine, so compare runs on the same host (use --latency-ms to
+model network round trips). The chain is run --repeat times on fresh fake
+orgs and each stage's time is the median of those runs.
+
+Results are compared to a saved baseline; the run fails (exit code 1) when a
+stage's records/sec drops by more than --tolerance or its API calls per 1k
+grow by more than --api-tolerance. Stages faster than --min-seconds (here or
+in the baseline) are too short to time reliably and only get the API check.
+
+Usage:
+    # Record a baseline
+    python -m migration_engine.benchmark --orders 2000 --save-baseline
+
+    # Check a change against it
+    python -m migration_engine.benchmark --orders 2000 --load-batch-size 5000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from simple_salesforce import Salesforce
+
+from migration_engine.fake_org.client import fake_session
+from migration_engine.fake_org.server import HOST_SUFFIX, FakeOrgServer
+from migration_engine.fake_org.store import FaultConfig, FieldDef
+from migration_engine.loader import LEGACY_ID_FIELD, as_bool, upsert_by_legacy_id
+from migration_engine.lookups import get_path
+from migration_engine.synth import SCALES, build_fake_orgs, generate_es_dataset
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+
+# Day Two modules (enrichment engine, field coercion, generated transformers)
+sys.path.insert(0, os.path.join(REPO_ROOT, 'day-two'))
+
+from enrichment_engine import build_enrichment_updates
+from enrichment_runner import (ENRICHMENT_OBJECTS, RateLimiter, apply_updates,
+                               bbf_query_fields, es_query_fields, query_bbf_records)
+from field_coercion import describe_fields
+from transformers import (account_transformers, ban_transformers, location_transformers,
+                          off_net_transformers, service_charge_transformers,
+                          service_transformers)
+
+STAGES = ('extract', 'transform', 'load', 'write_back', 'enrichment')
+
+DEFAULT_LOAD_BATCH_SIZE = 10000
+DEFAULT_WRITE_BACK_BATCH_SIZE = 10000
+DEFAULT_ENRICH_CHUNK_SIZE = 200
+DEFAULT_TOLERANCE = 0.20
+DEFAULT_API_TOLERANCE = 0.05
+DEFAULT_REPEAT = 3
+DEFAULT_MIN_SECONDS = 0.1
+
+ACTIVE_STATUSES = "('Activated', 'Suspended (Late Payment)', 'Disconnect in Progress')"
+
+
+# =============================================================================
+# MIGRATION STEPS (queries follow the Day 1 notebooks)
+# =============================================================================
+
+class MigrationStep:
+    """
+    One Day 1 object in the benchmark chain.
+
+    The transform stage runs the object's generated transformer module
+    (transform_records) and adds the Day 1 fields; the enrichment stage runs
+    the enrichment_runner / enrichment_engine path for ENRICHMENT_OBJECTS[key].
+
+    Args:
+        key: Object key ('location', 'account', ...), as in ENRICHMENT_OBJECTS
+        es_object: ES sObject read
+        bbf_object: BBF sObject loaded
+        query: ES extract query (Day 1 fields and parent links)
+        transformers: Generated transformer module (day-two/transformers)
+        day1_fields: {BBF field: ES field path} copied as-is, parent links as
+            'Relationship__r.BBF_New_Id__c'
+        required: BBF field that must resolve, or the record is skipped
+        enrichment: {BBF field: ES field} filled by the enrichment stage
+    """
+
+    def __init__(self, key: str, es_object: str, bbf_object: str, query: str, transformers,
+                 day1_fields: Dict[str, str], required: Optional[str], enrichment: Dict[str, str]):
+        self.key = key
+        self.es_object = es_object
+        self.bbf_object = bbf_object
+        self.query = query
+        self.transformers = transformers
+        self.day1_fields = day1_fields
+        self.required = required
+        self.enrichment = enrichment
+
+    def transformer_fields(self) -> List[str]:
+        """ES fields the generated transformers read, in FIELD_MAPPING order."""
+        return list(dict.fromkeys(self.transformers.FIELD_MAPPING.values()))
+
+    def extract_query(self) -> str:
+        """Day 1 query with the transformer input fields added to the SELECT list."""
+        select, rest = self.query.split('FROM', 1)
+        selected = {f.strip() for f in select[len('SELECT'):].split(',')}
+        extra = [f for f in self.transformer_fields() if f not in selected]
+        if not extra:
+            return self.query
+        return f"{select.rstrip()}, {', '.join(extra)}\n           FROM{rest}"
+
+    def transform(self, es_records: List[Dict]) -> List[Dict]:
+        """ES records -> BBF payloads (generated transformers plus Day 1 fields)."""
+        payloads = []
+        for es, bbf in zip(es_records, self.transformers.transform_records(es_records)):
+            day1 = {field: get_path(es, path) for field, path in self.day1_fields.items()}
+            if self.required and not day1.get(self.required):
+                continue
+            # Date transformers return date objects; the Bulk API takes ISO strings
+            payload = {k: v.isoformat() if isinstance(v, date) else v
+                       for k, v in bbf.items() if v is not None}
+            payload.update((k, v) for k, v in day1.items() if v is not None)
+            payload[LEGACY_ID_FIELD] = es['Id']
+            payloads.append(payload)
+        return payloads
+
+
+MIGRATION_STEPS = [
+    MigrationStep(
+        'location', 'Address__c', 'Location__c',
+        """SELECT Id, Name, Address__c, City__c, State__c, County__c, Zip__c,
+               Complete_Address__c, CLLI__c, Building_Status__c, Building_Type__c
+           FROM Address__c
+           WHERE (BBF_New_Id__c = null OR BBF_New_Id__c = '')""",
+        location_transformers,
+        {'Name': 'Name', 'City__c': 'City__c', 'County__c': 'County__c',
+         'PostalCode__c': 'Zip__c', 'Street__c': 'Address__c',
+         'Full_Address__c': 'Complete_Address__c', 'CLLICode__c': 'CLLI__c'},
+        None,
+        {'Building_Type__c': 'Building_Type__c', 'Building_Status__c': 'Building_Status__c',
+         'Legacy_CLLI_Code__c': 'CLLI__c'},
+    ),
+    MigrationStep(
+        'account', 'Account', 'Account',
+        """SELECT Id, Name, Type, BillingStreet, BillingCity, BillingState,
+               BillingPostalCode, Phone, Website, Industry
+           FROM Account
+           WHERE (BBF_New_Id__c = null OR BBF_New_Id__c = '')""",
+        account_transformers,
+        {'Name': 'Name', 'Type': 'Type', 'BillingStreet': 'BillingStreet',
+         'BillingCity': 'BillingCity', 'BillingState': 'BillingState',
+         'BillingPostalCode': 'BillingPostalCode', 'Phone': 'Phone'},
+        None,
+        {'Industry': 'Industry', 'Website': 'Website'},
+    ),
+    MigrationStep(
+        'ban', 'Billing_Invoice__c', 'BAN__c',
+        """SELECT Id, Name, Account__c, Account__r.BBF_New_Id__c, Account_Name__c,
+               Billing_Address_1__c, Billing_City__c, Billing_State__c, Billing_ZIP__c,
+               Payment_Terms__c, Invoice_Delivery_Preference__c, Billing_E_mail__c
+           FROM Billing_Invoice__c
+           WHERE BBF_Ban__c = true
+             AND Account__r.BBF_New_Id__c != null
+             AND Account__r.BBF_New_Id__c != ''
+             AND (BBF_New_Id__c = null OR BBF_New_Id__c = '')""",
+        ban_transformers,
+        {'Account__c': 'Account__r.BBF_New_Id__c', 'Name': 'Name',
+         'Billing_Street__c': 'Billing_Address_1__c', 'Billing_City__c': 'Billing_City__c',
+         'Billing_PostalCode__c': 'Billing_ZIP__c',
+         'Billing_Company_Name__c': 'Account_Name__c', 'Payment_Terms__c': 'Payment_Terms__c'},
+        'Account__c',
+        {'Invoice_Delivery_Preference__c': 'Invoice_Delivery_Preference__c',
+         'Billing_Email__c': 'Billing_E_mail__c'},
+    ),
+    MigrationStep(
+        'service', 'Order', 'Service__c',
+        f"""SELECT Id, Billing_Invoice__r.BBF_New_Id__c,
+               Address_A__c, Address_A__r.BBF_New_Id__c,
+               Address_Z__c, Address_Z__r.BBF_New_Id__c
+           FROM Order
+           WHERE Status IN {ACTIVE_STATUSES}
+             AND (NOT Project_Group__c LIKE '%PA MARKET DECOM%')
+             AND Service_Order_Record_Type__c = 'Service Order Agreement'
+             AND Billing_Invoice__r.BBF_New_Id__c != null
+             AND Billing_Invoice__r.BBF_New_Id__c != ''
+             AND (BBF_New_Id__c = null OR BBF_New_Id__c = '')""",
+        service_transformers,
+        {'Billing_Account_Number__c': 'Billing_Invoice__r.BBF_New_Id__c',
+         'A_Location__c': 'Address_A__r.BBF_New_Id__c',
+         'Z_Location__c': 'Address_Z__r.BBF_New_Id__c'},
+        'Billing_Account_Number__c',
+        {'Service_Type__c': 'Service_Type__c', 'Bandwidth__c': 'Bandwidth__c'},
+    ),
+    MigrationStep(
+        'service_charge', 'OrderItem', 'Service_Charge__c',
+        f"""SELECT Id, Order.BBF_New_Id__c
+           FROM OrderItem
+           WHERE Order.BBF_New_Id__c != null
+             AND Order.BBF_New_Id__c != ''
+             AND Order.Status IN {ACTIVE_STATUSES}
+             AND (NOT Order.Project_Group__c LIKE '%PA MARKET DECOM%')
+             AND Order.Service_Order_Record_Type__c = 'Service Order Agreement'
+             AND (BBF_New_Id__c = null OR BBF_New_Id__c = '')""",
+        service_charge_transformers,
+        {'Service__c': 'Order.BBF_New_Id__c'},
+        'Service__c',
+        {'Amount__c': 'UnitPrice', 'Charge_Type__c': 'Charge_Type__c',
+         'Description__c': 'Description'},
+    ),
+    MigrationStep(
+        'offnet', 'Off_Net__c', 'Off_Net__c',
+        """SELECT Id, Name, SOF1__c, SOF1__r.BBF_New_Id__c,
+               Location_1__c, Location_1__r.BBF_New_Id__c,
+               Location_2__c, Location_2__r.BBF_New_Id__c
+           FROM Off_Net__c
+           WHERE SOF1__c != null
+             AND SOF1__r.BBF_New_Id__c != null
+             AND SOF1__r.BBF_New_Id__c != ''
+             AND (BBF_New_Id__c = null OR BBF_New_Id__c = '')""",
+        off_net_transformers,
+        {'Name': 'Name', 'Service__c': 'SOF1__r.BBF_New_Id__c',
+         'AA_Location__c': 'Location_1__r.BBF_New_Id__c',
+         'ZZ_Location__c': 'Location_2__r.BBF_New_Id__c'},
+        'Service__c',
+        {'Vendor__c': 'Vendor__c', 'Vendor_Circuit_ID__c': 'Vendor_Circuit_ID__c',
+         'Monthly_Cost__c': 'Monthly_Cost__c'},
+    ),
+]
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+class BenchmarkResult:
+    """Per-object and per-stage records, seconds and API calls."""
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.rows: List[Dict] = []  # {object, stage, records, seconds, api_calls}
+
+    def add(self, object_key: str, stage: str, records: int, seconds: float, api_calls: int):
+        self.rows.append({'object': object_key, 'stage': stage, 'records': records,
+                          'seconds': seconds, 'api_calls': api_calls})
+
+    def stages(self) -> Dict[str, Dict]:
+        """Totals per stage with records_per_sec and api_calls_per_1k."""
+        out = {}
+        for stage in STAGES:
+            rows = [r for r in self.rows if r['stage'] == stage]
+            records = sum(r['records'] for r in rows)
+            seconds = sum(r['seconds'] for r in rows)
+            api_calls = sum(r['api_calls'] for r in rows)
+            out[stage] = {
+                'records': records,
+                'seconds': round(seconds, 4),
+                'api_calls': api_calls,
+                'records_per_sec': round(records / seconds, 1) if seconds else 0.0,
+                'api_calls_per_1k': round(api_calls * 1000 / records, 2) if records else 0.0,
+            }
+        return out
+
+    def to_dict(self) -> Dict:
+        return {'config': self.config, 'stages': self.stages(), 'objects': self.rows}
+
+    def print_summary(self):
+        print("\n" + "=" * 80)
+        print("BENCHMARK RESULTS")
+        print("=" * 80)
+        print(f"{'Object':<16} {'Stage':<12} {'Records':>9} {'Seconds':>9} {'Rec/s':>10} {'API/1k':>8}")
+        for r in self.rows:
+            rate = r['records'] / r['seconds'] if r['seconds'] else 0.0
+            per_1k = r['api_calls'] * 1000 / r['records'] if r['records'] else 0.0
+            print(f"{r['object']:<16} {r['stage']:<12} {r['records']:>9,} {r['seconds']:>9.3f} "
+                  f"{rate:>10,.0f} {per_1k:>8.2f}")
+        print("-" * 80)
+        for stage, s in self.stages().items():
+            print(f"{'TOTAL':<16} {stage:<12} {s['records']:>9,} {s['seconds']:>9.3f} "
+                  f"{s['records_per_sec']:>10,.0f} {s['api_calls_per_1k']:>8.2f}")
+
+
+def compare_to_baseline(result: BenchmarkResult, baseline: Dict,
+                        tolerance: float = DEFAULT_TOLERANCE,
+                        api_tolerance: float = DEFAULT_API_TOLERANCE,
+                        min_seconds: float = DEFAULT_MIN_SECONDS) -> List[str]:
+    """
+    List stage regressions against a saved baseline.
+
+    Args:
+        result: This run
+        baseline: A previous BenchmarkResult.to_dict()
+        tolerance: Allowed fractional drop in records/sec
+        api_tolerance: Allowed fractional growth in API calls per 1k records
+        min_seconds: Stages shorter than this (in either run) skip the
+            records/sec check; timer noise dominates them
+
+    Returns:
+        One message per regression (empty when the run passes)
+    """
+    regressions = []
+    for stage, current in result.stages().items():
+        base = baseline.get('stages', {}).get(stage)
+        if not base or not base.get('records'):
+            continue
+        floor = base['records_per_sec'] * (1 - tolerance)
+        timed_long_enough = min(current['seconds'], base['seconds']) >= min_seconds
+        if timed_long_enough and current['records_per_sec'] < floor:
+            regressions.append(
+                f"{stage}: {current['records_per_sec']:,.0f} rec/s < "
+                f"{floor:,.0f} (baseline {base['records_per_sec']:,.0f} - {tolerance:.0%})")
+        ceiling = base['api_calls_per_1k'] * (1 + api_tolerance)
+        if current['api_calls_per_1k'] > ceiling:
+            regressions.append(
+                f"{stage}: {current['api_calls_per_1k']:.2f} API calls/1k > "
+                f"{ceiling:.2f} (baseline {base['api_calls_per_1k']:.2f} + {api_tolerance:.0%})")
+    return regressions
+
+
+# =============================================================================
+# RUN
+# =============================================================================
+
+def _connect(server: FakeOrgServer, org: str) -> Salesforce:
+    return Salesforce(instance_url=f"https://{org}.{HOST_SUFFIX}", session_id=f"benchmark!{org}",
+                      session=fake_session(server.url, org=org))
+
+
+def _api_calls(server: FakeOrgServer) -> int:
+    return sum(sum(calls.values()) for calls in server.api_calls().values())
+
+
+def _declare_fields(org, sobject: str, fields: List[str]):
+    """Declare the plain fields a query selects that the synthetic schema lacks (read as null)."""
+    obj = org.sobject(sobject)
+    org.define_object(sobject, [FieldDef(f) for f in fields if '.' not in f and obj.field(f) is None])
+
+
+def _enrich(es_sf, bbf_sf, step: MigrationStep, chunk_size: int, describe_dir: str) -> int:
+    """The enrichment_runner steps for one object, without fingerprints, ledger or report."""
+    obj = ENRICHMENT_OBJECTS[step.key]
+    limiter = RateLimiter(None)
+    es_records = limiter.call(
+        es_sf.query_all,
+        f"SELECT {', '.join(es_query_fields(step.enrichment, obj))} FROM {obj.es_object} "
+        f"WHERE BBF_New_Id__c != null")['records']
+    bbf_records = query_bbf_records(obj, bbf_sf, es_records,
+                                    bbf_query_fields(step.enrichment, obj), limiter, chunk_size)
+    field_metadata = describe_fields(bbf_sf, obj.bbf_object, cache_dir=describe_dir, refresh=True)
+    build = build_enrichment_updates(es_records, bbf_records, step.enrichment, {},
+                                     field_metadata=field_metadata, **obj.build_options)
+    if build.updates:
+        apply_updates(obj, build.updates, bbf_sf, limiter)
+    return len(es_records)
+
+
+def _run_chain(dataset: Dict[str, List[Dict]], steps: List[MigrationStep], load_batch_size: int,
+               write_back_batch_size: int, enrich_chunk_size: int,
+               latency_ms: float) -> BenchmarkResult:
+    """One timed pass of the migration chain on freshly seeded fake orgs."""
+    orgs = build_fake_orgs(dataset, faults=FaultConfig(latency_ms=latency_ms))
+    for step in steps:
+        obj = ENRICHMENT_OBJECTS[step.key]
+        _declare_fields(orgs['es'], step.es_object,
+                        step.transformer_fields() + es_query_fields(step.enrichment, obj))
+        _declare_fields(orgs['bbf'], step.bbf_object, bbf_query_fields(step.enrichment, obj))
+    server = FakeOrgServer(orgs).start()
+    result = BenchmarkResult({})
+    try:
+        es_sf = _connect(server, 'es')
+        bbf_sf = _connect(server, 'bbf')
+
+        def timed(step: MigrationStep, stage: str, fn: Callable[[], int]):
+            calls = _api_calls(server)
+            start = time.perf_counter()
+            out = fn()
+            records = out if isinstance(out, int) else len(out)
+            result.add(step.key, stage, records, time.perf_counter() - start,
+                       _api_calls(server) - calls)
+            return out
+
+        for step in steps:
+            print(f"\n📌 {step.key}: {step.es_object} -> {step.bbf_object}")
+            es_records = timed(step, 'extract', lambda: es_sf.query_all(step.extract_query())['records'])
+            payloads = timed(step, 'transform', lambda: step.transform(es_records))
+            results = timed(step, 'load', lambda: upsert_by_legacy_id(
+                getattr(bbf_sf.bulk, step.bbf_object), payloads, batch_size=load_batch_size))
+            links = [{'Id': p[LEGACY_ID_FIELD], 'BBF_New_Id__c': r.get('id')}
+                     for p, r in zip(payloads, results) if as_bool(r.get('success'))]
+            if links:
+                timed(step, 'write_back', lambda: getattr(es_sf.bulk, step.es_object).update(
+                    links, batch_size=write_back_batch_size))
+            print(f"   extracted {len(es_records):,}, loaded {len(links):,}/{len(payloads):,}")
+
+        with tempfile.TemporaryDirectory() as describe_dir:
+            for step in steps:
+                timed(step, 'enrichment', lambda: _enrich(es_sf, bbf_sf, step,
+                                                          enrich_chunk_size, describe_dir))
+    finally:
+        server.stop()
+    return result
+
+
+def run_benchmark(orders: int = SCALES['small'], seed: int = 0, profile_dir: str = None,
+                  load_batch_size: int = DEFAULT_LOAD_BATCH_SIZE,
+                  write_back_batch_size: int = DEFAULT_WRITE_BACK_BATCH_SIZE,
+                  enrich_chunk_size: int = DEFAULT_ENRICH_CHUNK_SIZE,
+                  latency_ms: float = 0, steps: List[MigrationStep] = None,
+                  repeat: int = DEFAULT_REPEAT) -> BenchmarkResult:
+    """
+    Generate a dataset, serve it and time the migration chain.
+
+    Args:
+        orders: Synthetic Order count (other objects scale with it)
+        seed: Dataset random seed
+        profile_dir: es_data_profiler.py output for picklist distributions
+        load_batch_size: Bulk batch size for BBF loads
+        write_back_batch_size: Bulk batch size for ES write-back
+        enrich_chunk_size: Ids per BBF "WHERE Id IN" query during enrichment
+        latency_ms: Simulated latency per API call
+        steps: Objects to run (defaults to MIGRATION_STEPS)
+        repeat: Chain runs; each stage reports its median time
+
+    Returns:
+        BenchmarkResult
+    """
+    steps = steps or MIGRATION_STEPS
+    repeat = max(1, repeat)
+    config = {
+        'orders': orders, 'seed': seed, 'load_batch_size': load_batch_size,
+        'write_back_batch_size': write_back_batch_size,
+        'enrich_chunk_size': enrich_chunk_size, 'latency_ms': latency_ms,
+        'repeat': repeat,
+    }
+    print(f"📌 Generating synthetic ES org ({orders:,} Orders, seed {seed})...")
+    dataset = generate_es_dataset(orders=orders, seed=seed, profile_dir=profile_dir)
+    for obj, records in dataset.items():
+        print(f"   {obj:<20} {len(records):>10,}")
+
+    runs = []
+    for run in range(1, repeat + 1):
+        print(f"\n{'=' * 80}\nRUN {run}/{repeat}\n{'=' * 80}")
+        runs.append(_run_chain(dataset, steps, load_batch_size, write_back_batch_size,
+                               enrich_chunk_size, latency_ms))
+
+    # Records and API calls are deterministic; only the timings vary between runs
+    result = BenchmarkResult(config)
+    for row in runs[0].rows:
+        seconds = [r['seconds'] for run in runs for r in run.rows
+                   if (r['object'], r['stage']) == (row['object'], row['stage'])]
+        result.add(row['object'], row['stage'], row['records'], statistics.median(seconds),
+                   row['api_calls'])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the migration chain on a fake org')
+    parser.add_argument('--orders', type=int, default=None, help='Order count (overrides --scale)')
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--profile-dir', help='es_data_profiler.py output directory')
+    parser.add_argument('--load-batch-size', type=int, default=DEFAULT_LOAD_BATCH_SIZE)
+    parser.add_argument('--write-back-batch-size', type=int, default=DEFAULT_WRITE_BACK_BATCH_SIZE)
+    parser.add_argument('--enrich-chunk-size', type=int, default=DEFAULT_ENRICH_CHUNK_SIZE)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Chain runs; stage times are the median (default: 3)')
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Write this run as the new baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed records/sec drop (default: 0.20)')
+    parser.add_argument('--api-tolerance', type=float, default=DEFAULT_API_TOLERANCE,
+                        help='Allowed API calls per 1k growth (default: 0.05)')
+    parser.add_argument('--min-seconds', type=float, default=DEFAULT_MIN_SECONDS,
+                        help='Skip the records/sec check for shorter stages (default: 0.1)')
+    parser.add_argument('--output', help='Write this run\'s results JSON here')
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        orders=args.orders or SCALES[args.scale],
+        seed=args.seed,
+        profile_dir=args.profile_dir,
+        load_batch_size=args.load_batch_size,
+        write_back_batch_size=args.write_back_batch_size,
+        enrich_chunk_size=args.enrich_chunk_size,
+        latency_ms=args.latency_ms,
+        repeat=args.repeat,
+    )
+    result.print_summary()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result.to_dict(), f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result.to_dict(), f, indent=2)
+        print(f"\n✅ Baseline saved: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️  No baseline at {args.baseline} - run with --save-baseline first")
+        return
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    base_config = baseline.get('config', {})
+    if base_config.get('orders') != result.config['orders'] or \
+            base_config.get('seed') != result.config['seed']:
+        print(f"\n⚠️  Baseline dataset differs (orders={base_config.get('orders')}, "
+              f"seed={base_config.get('seed')}); rates are not directly comparable")
+
+    regressions = compare_to_baseline(result, baseline, args.tolerance, args.api_tolerance,
+                                      args.min_seconds)
+    if regressions:
+        print("\n❌ REGRESSIONS:")
+        for message in regressions:
+            print(f"   - {message}")
+        sys.exit(1)
+    print("\n✅ No regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()
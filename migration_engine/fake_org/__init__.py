@@ -0,0 +1,25 @@
+"""
+In-memory fake Salesforce orgs for end-to-end migration runs without a sandbox.
+
+A FakeOrgServer hosts one FakeOrg per name (normally 'es' and 'bbf') and speaks
+the SOAP login, REST query / sObject and Bulk API 1.0 endpoints the notebooks
+use. Point the notebooks at it with SF_FAKE_ORG_URL; the connect cells pass
+fake_session_from_env("es") / ("bbf") to Salesforce(), which is None against
+the real orgs.
+
+Usage:
+    python -m migration_engine.fake_org --port 8765 --seed seed.json --lock-error-rate 0.02
+    SF_FAKE_ORG_URL=http://127.0.0.1:8765 jupyter nbconvert --execute ...
+
+Modules:
+    client: requests session that routes simple_salesforce traffic to the server
+    server: HTTP endpoints (login, REST, Bulk 1.0) over FakeOrgs
+    soql: SOQL subset parser and evaluator
+    store: Records, schema validation, relationship queries and fault injection
+"""
+
+from migration_engine.fake_org.soql import SOQLError
+from migration_engine.fake_org.store import FakeOrg, FaultConfig, FieldDef
+from migration_engine.fake_org.server import FakeOrgServer
+
+__all__ = ['FakeOrg', 'FakeOrgServer', 'FaultConfig', 'FieldDef', 'SOQLError']
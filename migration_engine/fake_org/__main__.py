@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Run a fake org server from the command line.
+
+Usage:
+    python -m migration_engine.fake_org --port 8765
+    python -m migration_engine.fake_org --seed seed.json --user es=me@everstream.net
+    python -m migration_engine.fake_org --latency-ms 150 --lock-error-rate 0.02
+    python -m migration_engine.fake_org --case-sensitive-ids
+
+seed.json is {org name: {sObject: [records]}}; records may carry their own Id.
+"""
+
+import argparse
+import json
+import sys
+
+from migration_engine.fake_org.server import FakeOrgServer
+from migration_engine.fake_org.store import FakeOrg, FaultConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve in-memory fake Salesforce orgs')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--orgs', default='es,bbf', help='Comma-separated org names (first is login default)')
+    parser.add_argument('--seed', help='JSON file of {org: {sObject: [records]}}')
+    parser.add_argument('--user', action='append', default=[], metavar='ORG=USERNAME',
+                        help='Map a login username to an org (repeatable)')
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--http-error-rate', type=float, default=0.0)
+    parser.add_argument('--lock-error-rate', type=float, default=0.0)
+    parser.add_argument('--row-error-rate', type=float, default=0.0)
+    parser.add_argument('--random-seed', type=int, default=None)
+    parser.add_argument('--case-sensitive-ids', action='store_true',
+                        help='Sort ORDER BY Id case-sensitively, as a real org does')
+    args = parser.parse_args()
+
+    orgs = {}
+    for name in [n.strip() for n in args.orgs.split(',') if n.strip()]:
+        faults = FaultConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            http_error_rate=args.http_error_rate,
+            lock_error_rate=args.lock_error_rate,
+            row_error_rate=args.row_error_rate,
+            seed=args.random_seed,
+        )
+        orgs[name] = FakeOrg(name, faults=faults, case_sensitive_ids=args.case_sensitive_ids)
+
+    if args.seed:
+        with open(args.seed, encoding='utf-8') as f:
+            seed = json.load(f)
+        for name, data in seed.items():
+            if name not in orgs:
+                print(f"❌ Seed org '{name}' is not in --orgs {args.orgs}")
+                sys.exit(1)
+            counts = orgs[name].seed(data)
+            for sobject, count in counts.items():
+                print(f"   {name}.{sobject}: {count:,} records")
+
+    users = {}
+    for mapping in args.user:
+        org, _, username = mapping.partition('=')
+        users[username] = org
+
+    server = FakeOrgServer(orgs, host=args.host, port=args.port, users=users)
+    print(f"✅ Fake orgs {', '.join(orgs)} serving at {server.url}")
+    print(f"   export SF_FAKE_ORG_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("\nAPI calls:")
+        for name, calls in server.api_calls().items():
+            print(f"   {name}: {calls}")
+
+
+if __name__ == '__main__':
+    main()
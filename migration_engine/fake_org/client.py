@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Fake Org Client Session
+=======================
+requests.Session that sends simple_salesforce traffic to a FakeOrgServer.
+
+simple_salesforce always builds https://<instance>/... URLs. The session's
+adapter rewrites every https request to the fake server's address and passes
+the original host in the X-Fake-Host header, which the server uses to pick the
+org. The org name given to the session is sent as X-Fake-Org so the login
+lands on the right org whatever the username. Nothing else in the notebooks
+changes.
+
+Set SF_FAKE_ORG_URL (e.g. http://127.0.0.1:8765) to point the notebooks at a
+running fake org server; leave it unset for the real orgs.
+
+Usage:
+    from migration_engine.fake_org.client import fake_session_from_env
+
+    es_sf = Salesforce(
+        username=ES_USERNAME,
+        password=ES_PASSWORD,
+        security_token=ES_TOKEN,
+        domain=ES_DOMAIN,
+        session=fake_session_from_env("es"),
+    )
+"""
+
+import os
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from migration_engine.fake_org.server import FAKE_HOST_HEADER, FAKE_ORG_HEADER
+
+FAKE_ORG_URL_ENV = 'SF_FAKE_ORG_URL'
+
+
+class FakeOrgAdapter(HTTPAdapter):
+    """Rewrite https://<host>/path to <server url>/path, keeping the host in a header."""
+
+    def __init__(self, server_url: str, org: str = None, **kwargs):
+        super().__init__(**kwargs)
+        self.server = urlsplit(server_url)
+        self.org = org
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        request.headers[FAKE_HOST_HEADER] = url.netloc
+        if self.org:
+            request.headers[FAKE_ORG_HEADER] = self.org
+        request.url = urlunsplit((self.server.scheme, self.server.netloc,
+                                  url.path, url.query, url.fragment))
+        return super().send(request, **kwargs)
+
+
+def fake_session(server_url: str, org: str = None) -> requests.Session:
+    """
+    Session routing all https traffic to the fake org server at server_url.
+
+    Args:
+        server_url: Fake org server address, e.g. http://127.0.0.1:8765
+        org: Org to log in to ('es' / 'bbf'); defaults to the server's username rules
+    """
+    session = requests.Session()
+    session.mount('https://', FakeOrgAdapter(server_url, org=org))
+    return session
+
+
+def fake_session_from_env(org: str = None) -> Optional[requests.Session]:
+    """fake_session(SF_FAKE_ORG_URL, org), or None (real orgs) when it is not set."""
+    server_url = os.environ.get(FAKE_ORG_URL_ENV)
+    return fake_session(server_url, org=org) if server_url else None
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+Fake Org HTTP Server
+====================
+Serves one or more FakeOrgs over the Salesforce endpoints simple_salesforce uses.
+
+Endpoints:
+    POST   /services/Soap/u/<v>                         SOAP login
+    GET    /services/data/v<v>/query?q=...              REST query (2000-row pages)
+    GET    /services/data/v<v>/queryAll?q=...
+    GET    /services/data/v<v>/query/<locator>          query_more
+    GET    /services/data/v<v>/sobjects                 describe global
+    GET    /services/data/v<v>/sobjects/<obj>/describe
+    POST   /services/data/v<v>/sobjects/<obj>           create
+    GET / PATCH / DELETE  .../sobjects/<obj>/<id>
+    PATCH  .../sobjects/<obj>/<external field>/<value>  upsert
+    /services/async/<v>/job...                          Bulk API 1.0 (JSON)
+
+Each org is addressed by host name: <org>.fake.salesforce.com. The login
+endpoint picks the org from the X-Fake-Org header (set by the client session),
+else from the username (explicit mapping, or the org name appearing as a word
+in the username), and returns that org's host as serverUrl, so
+simple_salesforce sends every later call to the right org.
+
+Bulk batches are processed synchronously when they are added, so the first
+status poll already reports Completed.
+
+Usage:
+    from migration_engine.fake_org import FakeOrg, FakeOrgServer
+
+    server = FakeOrgServer({'es': FakeOrg('es'), 'bbf': FakeOrg('bbf')}).start()
+    print(server.url)      # http://127.0.0.1:<port>
+    ...
+    server.stop()
+"""
+
+import itertools
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from migration_engine.fake_org import soql
+from migration_engine.fake_org.store import FakeOrg, to_18
+
+HOST_SUFFIX = 'fake.salesforce.com'
+FAKE_HOST_HEADER = 'X-Fake-Host'
+FAKE_ORG_HEADER = 'X-Fake-Org'
+
+_LOGIN_RE = re.compile(r'^/services/Soap/[uc]/([\d.]+)')
+_REST_RE = re.compile(r'^/services/data/v([\d.]+)/(.*)$')
+_BULK_RE = re.compile(r'^/services/async/([\d.]+)/(.*)$')
+_USERNAME_RE = re.compile(r'<(?:\w+:)?username>(.*?)</(?:\w+:)?username>', re.S)
+
+
+class FakeOrgServer:
+    """
+    Threaded HTTP server hosting fake orgs.
+
+    Args:
+        orgs: {org name: FakeOrg}; the first org is the login default
+        host: Bind address
+        port: Port (0 picks a free one)
+        users: {username: org name} login mapping
+    """
+
+    def __init__(self, orgs: Dict[str, FakeOrg], host: str = '127.0.0.1', port: int = 0,
+                 users: Dict[str, str] = None):
+        self.orgs = orgs
+        self.users = {k.lower(): v for k, v in (users or {}).items()}
+        self.cursors: Dict[str, tuple] = {}
+        self.jobs: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeOrgServer':
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def next_id(self, prefix: str) -> str:
+        with self.lock:
+            return to_18(f"{prefix}Fk{next(self._ids):010d}")
+
+    def org_for_host(self, host: str) -> Optional[FakeOrg]:
+        label = (host or '').split(':')[0].split('.')[0].lower()
+        return self.orgs.get(label)
+
+    def org_for_username(self, username: str) -> str:
+        name = self.users.get(username.lower())
+        if name:
+            return name
+        words = set(re.split(r'[^a-z0-9]+', username.lower()))
+        for name in self.orgs:
+            if name.lower() in words:
+                return name
+        return next(iter(self.orgs))
+
+    def api_calls(self) -> Dict[str, Dict[str, int]]:
+        """API calls served per org and endpoint kind."""
+        return {name: dict(org.api_calls) for name, org in self.orgs.items()}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    # -------------------------------------------------------------------------
+    # Plumbing
+    # -------------------------------------------------------------------------
+
+    @property
+    def fake(self) -> FakeOrgServer:
+        return self.server.fake
+
+    def _body(self) -> bytes:
+        return self._raw
+
+    def _json_body(self):
+        raw = self._body()
+        return json.loads(raw) if raw else None
+
+    def _send(self, status: int, payload=None, content_type: str = 'application/json'):
+        if payload is None:
+            data = b''
+        elif isinstance(payload, (bytes, str)):
+            data = payload.encode() if isinstance(payload, str) else payload
+        else:
+            data = json.dumps(payload).encode()
+        self.send_response(status)
+        if data:
+            self.send_header('Content-Type', f'{content_type}; charset=UTF-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, method: str):
+        # Read the body up front so error responses leave the keep-alive stream clean
+        length = int(self.headers.get('Content-Length') or 0)
+        self._raw = self.rfile.read(length) if length else b''
+        split = urlsplit(self.path)
+        path = split.path.rstrip('/')
+        params = {k: v[0] for k, v in parse_qs(split.query).items()}
+        host = self.headers.get(FAKE_HOST_HEADER) or self.headers.get('Host', '')
+        try:
+            login = _LOGIN_RE.match(path)
+            if login:
+                return self._login(login.group(1))
+            org = self.fake.org_for_host(host)
+            if org is None:
+                raise _HTTPError(404, 'NOT_FOUND', f"no fake org for host {host}")
+            org.faults.delay()
+            if org.faults.http_error():
+                org.count_call('error')
+                raise _HTTPError(503, 'SERVER_UNAVAILABLE', 'Server temporarily unavailable')
+            rest = _REST_RE.match(path)
+            if rest:
+                return self._rest(org, method, rest.group(1), rest.group(2), params)
+            bulk = _BULK_RE.match(path)
+            if bulk:
+                return self._bulk(org, method, bulk.group(1), bulk.group(2))
+            raise _HTTPError(404, 'NOT_FOUND', f"unknown endpoint {path}")
+        except _HTTPError as e:
+            self._send(e.status, [{'errorCode': e.code, 'message': e.message}])
+        except soql.SOQLError as e:
+            self._send(400, [{'errorCode': 'MALFORMED_QUERY', 'message': str(e)}])
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    # -------------------------------------------------------------------------
+    # SOAP login
+    # -------------------------------------------------------------------------
+
+    def _login(self, version: str):
+        body = self._body().decode('utf-8', 'replace')
+        match = _USERNAME_RE.search(body)
+        username = match.group(1) if match else ''
+        name = self.headers.get(FAKE_ORG_HEADER)
+        if name not in self.fake.orgs:
+            name = self.fake.org_for_username(username)
+        org = self.fake.orgs[name]
+        org.count_call('login')
+        session_id = self.fake.next_id('00D') + '!' + name
+        server_url = f"https://{name}.{HOST_SUFFIX}/services/Soap/u/{version}/00D000000000001"
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+            'xmlns="urn:partner.soap.sforce.com"><soapenv:Body><loginResponse><result>'
+            f'<metadataServerUrl>https://{name}.{HOST_SUFFIX}/services/Soap/m/{version}'
+            '</metadataServerUrl>'
+            '<passwordExpired>false</passwordExpired><sandbox>true</sandbox>'
+            f'<serverUrl>{server_url}</serverUrl>'
+            f'<sessionId>{session_id}</sessionId>'
+            f'<userId>{to_18("005000000000001")}</userId>'
+            '</result></loginResponse></soapenv:Body></soapenv:Envelope>'
+        )
+        self._send(200, xml, content_type='text/xml')
+
+    # -------------------------------------------------------------------------
+    # REST
+    # -------------------------------------------------------------------------
+
+    def _rest(self, org: FakeOrg, method: str, version: str, rest: str, params: Dict):
+        parts = [unquote(p) for p in rest.split('/') if p]
+        head = parts[0] if parts else ''
+
+        if head in ('query', 'queryAll') and method == 'GET':
+            if len(parts) == 2:
+                org.count_call('query_more')
+                return self._send(200, self._page(version, parts[1]))
+            org.count_call('query')
+            result = org.query(params.get('q', ''), version=version)
+            return self._send(200, self._first_page(org, version, result))
+
+        if head != 'sobjects':
+            raise _HTTPError(404, 'NOT_FOUND', f"unsupported resource {rest}")
+
+        if len(parts) == 1:
+            org.count_call('describe')
+            return self._send(200, {'encoding': 'UTF-8', 'maxBatchSize': 200, 'sobjects': [
+                {k: v for k, v in obj.describe().items() if k != 'fields'}
+                for obj in org.objects.values()
+            ]})
+
+        obj = org.sobject(parts[1], create=method != 'GET')
+        if obj is None:
+            raise _HTTPError(404, 'NOT_FOUND', 'The requested resource does not exist')
+
+        if len(parts) == 2:
+            if method == 'POST':
+                org.count_call('sobject')
+                return self._dml_response(org.insert(obj.name, self._json_body() or {}), 201)
+            if method == 'GET':
+                org.count_call('describe')
+                return self._send(200, {'objectDescribe': obj.describe(), 'recentItems': []})
+
+        if len(parts) == 3 and parts[2] == 'describe':
+            org.count_call('describe')
+            return self._send(200, obj.describe())
+
+        if len(parts) == 3:
+            org.count_call('sobject')
+            record_id = parts[2]
+            if method == 'GET':
+                record = org.get(record_id)
+                if record is None:
+                    raise _HTTPError(404, 'NOT_FOUND', 'The requested resource does not exist')
+                shaped = {'attributes': {'type': obj.name,
+                                         'url': f"/services/data/v{version}/sobjects/{obj.name}/{record_id}"}}
+                shaped.update(record)
+                return self._send(200, shaped)
+            if method == 'PATCH':
+                result = org.update(obj.name, self._json_body() or {}, record_id=record_id)
+                return self._dml_response(result, 204)
+            if method == 'DELETE':
+                return self._dml_response(org.delete(obj.name, record_id), 204)
+
+        if len(parts) == 4 and method == 'PATCH':
+            org.count_call('sobject')
+            values = dict(self._json_body() or {})
+            values[parts[2]] = parts[3]
+            result = org.upsert(obj.name, parts[2], values)
+            return self._dml_response(result, 201 if result['created'] else 204)
+
+        raise _HTTPError(405, 'METHOD_NOT_ALLOWED', f"{method} not allowed on {rest}")
+
+    def _dml_response(self, result: Dict, ok_status: int):
+        if result['success']:
+            if ok_status == 204:
+                return self._send(204)
+            return self._send(ok_status, {'id': result['id'], 'success': True, 'errors': []})
+        error = result['errors'][0]
+        status = 404 if error['statusCode'] in ('ENTITY_IS_DELETED', 'NOT_FOUND') else 400
+        self._send(status, [{'errorCode': error['statusCode'], 'message': error['message'],
+                             'fields': error.get('fields', [])}])
+
+    def _first_page(self, org: FakeOrg, version: str, result: Dict) -> Dict:
+        records = result['records']
+        if len(records) <= org.page_size:
+            return {'totalSize': result['totalSize'], 'done': True, 'records': records}
+        cursor = self.fake.next_id('01g')
+        with self.fake.lock:
+            self.fake.cursors[cursor] = (records, org.page_size)
+        return {
+            'totalSize': result['totalSize'],
+            'done': False,
+            'nextRecordsUrl': f"/services/data/v{version}/query/{cursor}-{org.page_size}",
+            'records': records[:org.page_size],
+        }
+
+    def _page(self, version: str, locator: str) -> Dict:
+        cursor, _, offset = locator.partition('-')
+        with self.fake.lock:
+            entry = self.fake.cursors.get(cursor)
+        if entry is None:
+            raise _HTTPError(400, 'INVALID_QUERY_LOCATOR', 'invalid query locator')
+        records, page_size = entry
+        start = int(offset or 0)
+        page = records[start:start + page_size]
+        done = start + page_size >= len(records)
+        out = {'totalSize': len(records), 'done': done, 'records': page}
+        if done:
+            with self.fake.lock:
+                self.fake.cursors.pop(cursor, None)
+        else:
+            out['nextRecordsUrl'] = f"/services/data/v{version}/query/{cursor}-{start + page_size}"
+        return out
+
+    # -------------------------------------------------------------------------
+    # Bulk API 1.0
+    # -------------------------------------------------------------------------
+
+    def _bulk(self, org: FakeOrg, method: str, version: str, rest: str):
+        parts = [p for p in rest.split('/') if p]
+        if not parts or parts[0] != 'job':
+            raise _HTTPError(404, 'NOT_FOUND', f"unsupported bulk resource {rest}")
+
+        if len(parts) == 1 and method == 'POST':
+            org.count_call('bulk_job')
+            spec = self._json_body() or {}
+            job_id = self.fake.next_id('750')
+            job = {
+                'id': job_id,
+                'operation': spec.get('operation', 'insert'),
+                'object': spec.get('object'),
+                'externalIdFieldName': spec.get('externalIdFieldName'),
+                'concurrencyMode': spec.get('concurrencyMode', 'Parallel'),
+                'contentType': spec.get('contentType', 'JSON'),
+                'state': 'Open',
+                'org': org,
+                'batches': {},
+            }
+            with self.fake.lock:
+                self.fake.jobs[job_id] = job
+            return self._send(201, self._job_info(job))
+
+        job = self.fake.jobs.get(parts[1])
+        if job is None:
+            raise _HTTPError(400, 'InvalidJob', f"invalid job id {parts[1]}")
+
+        if len(parts) == 2:
+            org.count_call('bulk_job')
+            if method == 'POST':
+                job['state'] = (self._json_body() or {}).get('state', job['state'])
+            return self._send(200, self._job_info(job))
+
+        if len(parts) == 3 and method == 'POST':
+            org.count_call('bulk_batch')
+            return self._send(201, self._add_batch(org, job, self._body()))
+
+        batch = job['batches'].get(parts[3]) if len(parts) > 3 else None
+        if batch is None:
+            raise _HTTPError(400, 'InvalidBatch', 'invalid batch id')
+
+        if len(parts) == 4:
+            org.count_call('bulk_status')
+            return self._send(200, self._batch_info(job, batch))
+
+        if len(parts) == 5 and parts[4] == 'result':
+            org.count_call('bulk_result')
+            if job['operation'] in ('query', 'queryAll'):
+                return self._send(200, list(batch['query_results']))
+            return self._send(200, batch['results'])
+
+        if len(parts) == 6 and parts[4] == 'result':
+            org.count_call('bulk_result')
+            records = batch['query_results'].get(parts[5])
+            if records is None:
+                raise _HTTPError(400, 'InvalidBatch', 'invalid result id')
+            return self._send(200, records)
+
+        raise _HTTPError(404, 'NOT_FOUND', f"unsupported bulk resource {rest}")
+
+    def _add_batch(self, org: FakeOrg, job: Dict, raw: bytes) -> Dict:
+        batch_id = self.fake.next_id('751')
+        batch = {'id': batch_id, 'state': 'Completed', 'results': [], 'query_results': {},
+                 'processed': 0, 'failed': 0}
+        operation = job['operation']
+        if operation in ('query', 'queryAll'):
+            text = raw.decode('utf-8')
+            try:
+                text = json.loads(text)
+            except ValueError:
+                pass
+            try:
+                records = org.query(text)['records']
+                batch['query_results'][self.fake.next_id('752')] = records
+                batch['processed'] = len(records)
+            except soql.SOQLError as e:
+                batch['state'] = 'Failed'
+                batch['stateMessage'] = f"MALFORMED_QUERY: {e}"
+        else:
+            rows: List[Dict] = json.loads(raw or b'[]')
+            for row in rows:
+                if operation == 'insert':
+                    result = org.insert(job['object'], row)
+                elif operation == 'update':
+                    result = org.update(job['object'], row)
+                elif operation == 'upsert':
+                    result = org.upsert(job['object'], job['externalIdFieldName'], row)
+                elif operation in ('delete', 'hardDelete'):
+                    result = org.delete(job['object'], row.get('Id'))
+                    result['created'] = False
+                else:
+                    raise _HTTPError(400, 'InvalidJob', f"unsupported operation {operation}")
+                batch['results'].append(result)
+                batch['processed'] += 1
+                batch['failed'] += 0 if result['success'] else 1
+        job['batches'][batch_id] = batch
+        return self._batch_info(job, batch)
+
+    @staticmethod
+    def _job_info(job: Dict) -> Dict:
+        batches = job['batches'].values()
+        return {
+            'id': job['id'],
+            'operation': job['operation'],
+            'object': job['object'],
+            'externalIdFieldName': job['externalIdFieldName'],
+            'concurrencyMode': job['concurrencyMode'],
+            'contentType': job['contentType'],
+            'state': job['state'],
+            'numberBatchesTotal': len(job['batches']),
+            'numberBatchesCompleted': sum(1 for b in batches if b['state'] == 'Completed'),
+            'numberBatchesFailed': sum(1 for b in batches if b['state'] == 'Failed'),
+            'numberRecordsProcessed': sum(b['processed'] for b in batches),
+            'numberRecordsFailed': sum(b['failed'] for b in batches),
+        }
+
+    @staticmethod
+    def _batch_info(job: Dict, batch: Dict) -> Dict:
+        info = {
+            'id': batch['id'],
+            'jobId': job['id'],
+            'state': batch['state'],
+            'numberRecordsProcessed': batch['processed'],
+            'numberRecordsFailed': batch['failed'],
+        }
+        if 'stateMessage' in batch:
+            info['stateMessage'] = batch['stateMessage']
+        return info
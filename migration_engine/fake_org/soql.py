@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+SOQL Subset
+===========
+Parser and evaluator for the SOQL the migration notebooks and tools send.
+
+Supported:
+- SELECT field, Parent__r.Field__c, Order.BBF_New_Id__c, COUNT(), COUNT(field) [alias]
+- FROM object
+- WHERE with AND / OR / NOT / parentheses and =, !=, <, <=, >, >=,
+  [NOT] IN (...), LIKE, field NOT LIKE / NOT field LIKE, null, true / false,
+  numbers, strings, date / datetime literals
+- GROUP BY field, ... (with COUNT aggregates)
+- ORDER BY field [ASC|DESC] [NULLS FIRST|LAST], ...
+- LIMIT n, OFFSET n
+
+Field names and string comparisons are case-insensitive, as in Salesforce.
+ORDER BY is case-insensitive too, except for the fields the caller sorts
+case-sensitively (Id fields, see FakeOrg case_sensitive_ids).
+Records are evaluated through a resolver callback so relationship paths are
+followed by the store, not by this module.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class SOQLError(ValueError):
+    """Malformed or unsupported query (returned as MALFORMED_QUERY)."""
+
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.)*')
+      | (?P<datetime>\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)?(?![\w.]))
+      | (?P<number>-?\d+(?:\.\d+)?(?![\w.]))
+      | (?P<op>!=|<>|<=|>=|=|<|>|\(|\)|,)
+      | (?P<ident>[A-Za-z_][\w.]*)
+    )""", re.VERBOSE)
+
+KEYWORDS = {
+    'SELECT', 'FROM', 'WHERE', 'AND', 'OR', 'NOT', 'IN', 'LIKE', 'NULL', 'TRUE',
+    'FALSE', 'GROUP', 'BY', 'ORDER', 'ASC', 'DESC', 'NULLS', 'FIRST', 'LAST',
+    'LIMIT', 'OFFSET', 'COUNT',
+}
+
+# Standard objects whose names are also SOQL keywords (FROM Order)
+KEYWORD_OBJECTS = {'ORDER': 'Order', 'GROUP': 'Group'}
+
+
+def tokenize(soql: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    pos = 0
+    text = soql.strip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise SOQLError(f"unexpected token at: {text[pos:pos + 20]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'string':
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == 'number':
+            value = float(value) if '.' in value else int(value)
+        elif kind == 'ident' and value.upper() in KEYWORDS:
+            kind, value = 'kw', value.upper()
+        tokens.append((kind, value))
+    return tokens
+
+
+# =============================================================================
+# AST
+# =============================================================================
+
+class Aggregate:
+    def __init__(self, func: str, field: Optional[str], alias: Optional[str]):
+        self.func = func
+        self.field = field
+        self.alias = alias
+
+
+class Query:
+    def __init__(self):
+        self.fields: List[str] = []
+        self.aggregates: List[Aggregate] = []
+        self.sobject = ''
+        self.where = None
+        self.group_by: List[str] = []
+        self.order_by: List[Tuple[str, bool, Optional[bool]]] = []  # (field, desc, nulls_last)
+        self.limit: Optional[int] = None
+        self.offset: int = 0
+
+    @property
+    def count_only(self) -> bool:
+        """SELECT COUNT() FROM ... - Salesforce returns only totalSize."""
+        return (not self.fields and len(self.aggregates) == 1
+                and self.aggregates[0].field is None and not self.group_by)
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def accept_kw(self, *words) -> bool:
+        kind, value = self.peek()
+        if kind == 'kw' and value in words:
+            self.pos += 1
+            return True
+        return False
+
+    def expect_kw(self, word):
+        if not self.accept_kw(word):
+            raise SOQLError(f"expected {word} near {self.peek()[1]!r}")
+
+    def accept_op(self, op) -> bool:
+        kind, value = self.peek()
+        if kind == 'op' and value == op:
+            self.pos += 1
+            return True
+        return False
+
+    def expect_op(self, op):
+        if not self.accept_op(op):
+            raise SOQLError(f"expected {op!r} near {self.peek()[1]!r}")
+
+    def ident(self) -> str:
+        kind, value = self.next()
+        if kind != 'ident':
+            raise SOQLError(f"expected field name, got {value!r}")
+        return value
+
+    def parse(self) -> Query:
+        q = Query()
+        self.expect_kw('SELECT')
+        while True:
+            if self.accept_kw('COUNT'):
+                self.expect_op('(')
+                field = None if self.accept_op(')') else self.ident()
+                if field is not None:
+                    self.expect_op(')')
+                alias = None
+                if self.peek()[0] == 'ident':
+                    alias = self.ident()
+                q.aggregates.append(Aggregate('COUNT', field, alias))
+            else:
+                q.fields.append(self.ident())
+            if not self.accept_op(','):
+                break
+        self.expect_kw('FROM')
+        kind, value = self.peek()
+        if kind == 'kw' and value in KEYWORD_OBJECTS:
+            self.pos += 1
+            q.sobject = KEYWORD_OBJECTS[value]
+        else:
+            q.sobject = self.ident()
+        if self.accept_kw('WHERE'):
+            q.where = self.or_expr()
+        if self.accept_kw('GROUP'):
+            self.expect_kw('BY')
+            q.group_by.append(self.ident())
+            while self.accept_op(','):
+                q.group_by.append(self.ident())
+        if self.accept_kw('ORDER'):
+            self.expect_kw('BY')
+            while True:
+                field = self.ident()
+                desc = False
+                if self.accept_kw('DESC'):
+                    desc = True
+                else:
+                    self.accept_kw('ASC')
+                nulls_last = None
+                if self.accept_kw('NULLS'):
+                    if self.accept_kw('LAST'):
+                        nulls_last = True
+                    else:
+                        self.expect_kw('FIRST')
+                        nulls_last = False
+                q.order_by.append((field, desc, nulls_last))
+                if not self.accept_op(','):
+                    break
+        if self.accept_kw('LIMIT'):
+            q.limit = int(self.next()[1])
+        if self.accept_kw('OFFSET'):
+            q.offset = int(self.next()[1])
+        if self.peek()[0] is not None:
+            raise SOQLError(f"unexpected {self.peek()[1]!r}")
+        for field in q.fields:
+            if q.group_by and field.lower() not in {g.lower() for g in q.group_by}:
+                raise SOQLError(f"field {field} must be grouped or aggregated")
+        return q
+
+    # Conditions are tuples: ('and'|'or', a, b), ('not', a), ('cmp', field, op, value),
+    # ('in', field, values, negated), ('like', field, pattern, negated)
+
+    def or_expr(self):
+        node = self.and_expr()
+        while self.accept_kw('OR'):
+            node = ('or', node, self.and_expr())
+        return node
+
+    def and_expr(self):
+        node = self.not_expr()
+        while self.accept_kw('AND'):
+            node = ('and', node, self.not_expr())
+        return node
+
+    def not_expr(self):
+        if self.accept_kw('NOT'):
+            return ('not', self.not_expr())
+        if self.accept_op('('):
+            node = self.or_expr()
+            self.expect_op(')')
+            return node
+        return self.comparison()
+
+    def literal(self):
+        kind, value = self.next()
+        if kind in ('string', 'number', 'datetime'):
+            return value
+        if kind == 'kw' and value == 'NULL':
+            return None
+        if kind == 'kw' and value in ('TRUE', 'FALSE'):
+            return value == 'TRUE'
+        raise SOQLError(f"expected a value, got {value!r}")
+
+    def comparison(self):
+        field = self.ident()
+        negated = self.accept_kw('NOT')
+        if self.accept_kw('IN'):
+            self.expect_op('(')
+            values = [self.literal()]
+            while self.accept_op(','):
+                values.append(self.literal())
+            self.expect_op(')')
+            return ('in', field, values, negated)
+        if self.accept_kw('LIKE'):
+            kind, pattern = self.next()
+            if kind != 'string':
+                raise SOQLError("LIKE needs a string pattern")
+            return ('like', field, _like_regex(pattern), negated)
+        if negated:
+            raise SOQLError("NOT must be followed by IN or LIKE")
+        kind, op = self.next()
+        if kind != 'op' or op not in ('=', '!=', '<>', '<', '<=', '>', '>='):
+            raise SOQLError(f"expected an operator after {field}, got {op!r}")
+        return ('cmp', field, '!=' if op == '<>' else op, self.literal())
+
+
+def _like_regex(pattern: str):
+    parts = []
+    for ch in pattern:
+        if ch == '%':
+            parts.append('.*')
+        elif ch == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(ch))
+    return re.compile('^' + ''.join(parts) + '$', re.IGNORECASE | re.DOTALL)
+
+
+def parse(soql: str) -> Query:
+    """Parse a SOQL string into a Query."""
+    return _Parser(tokenize(soql)).parse()
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+Resolver = Callable[[Dict, str], Any]
+
+
+def _norm(value):
+    if isinstance(value, str):
+        return value.lower()
+    return value
+
+
+def _compare(left, op: str, right) -> bool:
+    # Salesforce stores empty text as null, so '' and null compare the same
+    if left == '':
+        left = None
+    if right == '':
+        right = None
+    if op == '=':
+        if right is None:
+            return left is None
+        return left is not None and _norm(left) == _norm(right)
+    if op == '!=':
+        if right is None:
+            return left is not None
+        return left is None or _norm(left) != _norm(right)
+    if left is None or right is None:
+        return False
+    try:
+        left, right = _norm(left), _norm(right)
+        if isinstance(left, str) and not isinstance(right, str):
+            left = float(left)
+        return {'<': left < right, '<=': left <= right,
+                '>': left > right, '>=': left >= right}[op]
+    except (TypeError, ValueError):
+        return False
+
+
+def matches(node, record: Dict, resolve: Resolver) -> bool:
+    """Evaluate a WHERE tree against one record."""
+    if node is None:
+        return True
+    kind = node[0]
+    if kind == 'and':
+        return matches(node[1], record, resolve) and matches(node[2], record, resolve)
+    if kind == 'or':
+        return matches(node[1], record, resolve) or matches(node[2], record, resolve)
+    if kind == 'not':
+        return not matches(node[1], record, resolve)
+    value = resolve(record, node[1])
+    if kind == 'cmp':
+        return _compare(value, node[2], node[3])
+    if kind == 'in':
+        found = any(_compare(value, '=', v) for v in node[2])
+        return found != node[3]
+    if kind == 'like':
+        found = value is not None and bool(node[2].match(str(value)))
+        return found != node[3]
+    raise SOQLError(f"unknown condition {kind}")
+
+
+def sort_records(records: List[Dict], order_by, resolve: Resolver,
+                 case_sensitive: Iterable[str] = ()) -> List[Dict]:
+    """
+    Apply ORDER BY (stable, one pass per key from last to first).
+
+    Text sorts case-insensitively; fields named in case_sensitive (lower
+    case) sort by their raw value, as Salesforce sorts Id fields.
+    """
+    case_sensitive = {f.lower() for f in case_sensitive}
+    for field, desc, nulls_last in reversed(order_by):
+        if nulls_last is None:
+            nulls_last = desc  # Salesforce default: NULLS FIRST for ASC, LAST for DESC
+        norm = (lambda v: v) if field.lower() in case_sensitive else _norm
+        present = [r for r in records if resolve(r, field) is not None]
+        missing = [r for r in records if resolve(r, field) is None]
+        present.sort(key=lambda r: norm(resolve(r, field)), reverse=desc)
+        records = present + missing if nulls_last else missing + present
+    return records
+
+
+def aggregate(query: Query, records: List[Dict], resolve: Resolver) -> List[Dict]:
+    """Evaluate GROUP BY / COUNT into AggregateResult rows."""
+    groups: Dict[tuple, List[Dict]] = {}
+    for record in records:
+        key = tuple(_norm(resolve(record, f)) for f in query.group_by)
+        groups.setdefault(key, []).append(record)
+    if not query.group_by and not groups:
+        groups[()] = []
+
+    rows = []
+    for members in groups.values():
+        row = {'attributes': {'type': 'AggregateResult'}}
+        for field in query.group_by:
+            row[field.split('.')[-1]] = resolve(members[0], field) if members else None
+        for i, agg in enumerate(query.aggregates):
+            name = agg.alias or f"expr{i}"
+            if agg.field is None:
+                row[name] = len(members)
+            else:
+                row[name] = sum(1 for m in members if resolve(m, agg.field) is not None)
+        rows.append(row)
+    return rows
@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Fake Org Store
+==============
+In-memory records, schema, validation and fault injection for one fake org.
+
+Objects are created on first use; fields seen on write are added to the schema
+as strings unless they were declared up front (define_object / load_describe).
+Declared fields drive describe() output and row-level validation:
+- unique / external ID fields  -> DUPLICATE_VALUE
+- non-nillable fields          -> REQUIRED_FIELD_MISSING
+- restricted picklists         -> INVALID_OR_NULL_FOR_RESTRICTED_PICKLIST
+- string / textarea length     -> STRING_TOO_LONG
+- reference fields             -> relationship paths (Parent__r.Field__c, Order.X)
+"""
+
+import itertools
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from migration_engine.fake_org import soql
+
+# Standard object key prefixes; custom objects get a00, a01, ...
+STANDARD_PREFIXES = {
+    'Account': '001',
+    'Contact': '003',
+    'User': '005',
+    'Opportunity': '006',
+    'Product2': '01t',
+    'Order': '801',
+    'OrderItem': '802',
+}
+
+_BASE62 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+_SUFFIX_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ012345'
+
+
+def to_18(id15: str) -> str:
+    """Append the case-safe checksum suffix to a 15-character Id."""
+    suffix = ''
+    for chunk in range(3):
+        bits = 0
+        for i, ch in enumerate(id15[chunk * 5:chunk * 5 + 5]):
+            if 'A' <= ch <= 'Z':
+                bits |= 1 << i
+        suffix += _SUFFIX_CHARS[bits]
+    return id15 + suffix
+
+
+def _base62(n: int, width: int) -> str:
+    out = ''
+    while n:
+        n, r = divmod(n, 62)
+        out = _BASE62[r] + out
+    return out.rjust(width, '0')
+
+
+class FaultConfig:
+    """
+    Latency and failure injection.
+
+    Args:
+        latency_ms: Added to every HTTP request
+        jitter_ms: Random extra latency, 0..jitter_ms
+        http_error_rate: Fraction of requests answered with 503 SERVER_UNAVAILABLE
+        lock_error_rate: Fraction of DML rows failed with UNABLE_TO_LOCK_ROW
+        row_error_rate: Fraction of DML rows failed with UNKNOWN_EXCEPTION
+        seed: Random seed for reproducible runs
+    """
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0,
+                 http_error_rate: float = 0.0, lock_error_rate: float = 0.0,
+                 row_error_rate: float = 0.0, seed: int = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.http_error_rate = http_error_rate
+        self.lock_error_rate = lock_error_rate
+        self.row_error_rate = row_error_rate
+        self.random = random.Random(seed)
+
+    def delay(self):
+        seconds = (self.latency_ms + self.random.uniform(0, self.jitter_ms)) / 1000
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def http_error(self) -> bool:
+        return self.http_error_rate > 0 and self.random.random() < self.http_error_rate
+
+    def row_error(self) -> Optional[Dict]:
+        if self.lock_error_rate > 0 and self.random.random() < self.lock_error_rate:
+            return _error('UNABLE_TO_LOCK_ROW', 'unable to obtain exclusive access to this record')
+        if self.row_error_rate > 0 and self.random.random() < self.row_error_rate:
+            return _error('UNKNOWN_EXCEPTION', 'An unexpected error occurred')
+        return None
+
+
+def _error(code: str, message: str, fields: List[str] = None) -> Dict:
+    return {'statusCode': code, 'message': message, 'fields': fields or []}
+
+
+class FieldDef:
+    """One field's describe metadata."""
+
+    def __init__(self, name: str, type: str = 'string', length: int = None,
+                 reference_to: List[str] = None, relationship_name: str = None,
+                 nillable: bool = True, unique: bool = False, external_id: bool = False,
+                 picklist_values: List[str] = None, restricted: bool = False,
+                 label: str = None, scale: int = None):
+        self.name = name
+        self.type = type
+        self.length = length if length is not None else (255 if type in ('string', 'textarea', 'picklist') else 0)
+        self.reference_to = reference_to or []
+        if relationship_name is None and type == 'reference':
+            if name.endswith('__c'):
+                relationship_name = name[:-3] + '__r'
+            elif name.endswith('Id'):
+                relationship_name = name[:-2]
+        self.relationship_name = relationship_name
+        self.nillable = nillable
+        self.unique = unique
+        self.external_id = external_id
+        self.picklist_values = picklist_values or []
+        self.restricted = restricted
+        self.label = label or name
+        self.scale = scale
+
+    def describe(self) -> Dict:
+        return {
+            'name': self.name,
+            'label': self.label,
+            'type': self.type,
+            'length': self.length,
+            'scale': self.scale or 0,
+            'nillable': self.nillable,
+            'unique': self.unique,
+            'externalId': self.external_id,
+            'referenceTo': self.reference_to,
+            'relationshipName': self.relationship_name,
+            'restrictedPicklist': self.restricted,
+            'picklistValues': [
+                {'value': v, 'label': v, 'active': True, 'defaultValue': False}
+                for v in self.picklist_values
+            ],
+            'createable': self.name not in ('Id',),
+            'updateable': self.name not in ('Id',),
+        }
+
+
+class ObjectDef:
+    """One sObject's schema and records."""
+
+    def __init__(self, name: str, key_prefix: str):
+        self.name = name
+        self.key_prefix = key_prefix
+        self.fields: Dict[str, FieldDef] = {}
+        self.relationships: Dict[str, FieldDef] = {}
+        self.records: Dict[str, Dict] = {}
+        self.unique_index: Dict[str, Dict[str, str]] = {}
+        self.add_field(FieldDef('Id', type='id', length=18, nillable=False, unique=True))
+
+    def add_field(self, field: FieldDef):
+        self.fields[field.name.lower()] = field
+        if field.relationship_name:
+            self.relationships[field.relationship_name.lower()] = field
+        if field.unique or field.external_id:
+            index = self.unique_index.setdefault(field.name.lower(), {})
+            for record_id, record in self.records.items():
+                if record.get(field.name) is not None:
+                    index[str(record[field.name]).lower()] = record_id
+
+    def field(self, name: str, create: bool = False) -> Optional[FieldDef]:
+        found = self.fields.get(name.lower())
+        if found is None and create:
+            found = FieldDef(name)
+            self.add_field(found)
+        return found
+
+    def describe(self) -> Dict:
+        return {
+            'name': self.name,
+            'label': self.name,
+            'keyPrefix': self.key_prefix,
+            'custom': self.name.endswith('__c'),
+            'queryable': True,
+            'createable': True,
+            'updateable': True,
+            'fields': [f.describe() for f in self.fields.values()],
+        }
+
+
+class FakeOrg:
+    """
+    In-memory Salesforce org.
+
+    Args:
+        name: Org name (also the instance host label, e.g. es -> es.fake.salesforce.com)
+        faults: Latency / failure injection settings
+        page_size: Records per REST query page (query_more splits larger results)
+        case_sensitive_ids: ORDER BY Id / reference fields sorts case-sensitively
+            (digits, A-Z, a-z) like a real org; text fields stay case-insensitive
+    """
+
+    def __init__(self, name: str = 'org', faults: FaultConfig = None, page_size: int = 2000,
+                 case_sensitive_ids: bool = False):
+        self.name = name
+        self.faults = faults or FaultConfig()
+        self.page_size = page_size
+        self.case_sensitive_ids = case_sensitive_ids
+        self.objects: Dict[str, ObjectDef] = {}
+        self.id_index: Dict[str, str] = {}
+        self.api_calls: Dict[str, int] = {}
+        self.lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self._custom_prefixes = (f"a{_base62(i, 2)}" for i in itertools.count(0))
+
+    # -------------------------------------------------------------------------
+    # Schema
+    # -------------------------------------------------------------------------
+
+    def sobject(self, name: str, create: bool = True) -> Optional[ObjectDef]:
+        with self.lock:
+            found = self.objects.get(name.lower())
+            if found is None and create:
+                prefix = STANDARD_PREFIXES.get(name) or next(self._custom_prefixes)
+                found = ObjectDef(name, prefix)
+                self.objects[name.lower()] = found
+            return found
+
+    def define_object(self, name: str, fields: Iterable[FieldDef] = ()) -> ObjectDef:
+        """Declare an object and (some of) its fields."""
+        obj = self.sobject(name)
+        for field in fields:
+            obj.add_field(field)
+        return obj
+
+    def load_describe(self, describe: Dict) -> ObjectDef:
+        """Declare an object from a real describe() result (e.g. a cached JSON dump)."""
+        obj = self.sobject(describe['name'])
+        if describe.get('keyPrefix'):
+            obj.key_prefix = describe['keyPrefix']
+        for f in describe['fields']:
+            obj.add_field(FieldDef(
+                f['name'],
+                type=f.get('type', 'string'),
+                length=f.get('length'),
+                reference_to=f.get('referenceTo'),
+                relationship_name=f.get('relationshipName'),
+                nillable=f.get('nillable', True),
+                unique=f.get('unique', False),
+                external_id=f.get('externalId', False),
+                picklist_values=[p['value'] for p in f.get('picklistValues', []) if p.get('active', True)],
+                restricted=f.get('restrictedPicklist', False),
+                label=f.get('label'),
+                scale=f.get('scale'),
+            ))
+        return obj
+
+    def count_call(self, kind: str):
+        with self.lock:
+            self.api_calls[kind] = self.api_calls.get(kind, 0) + 1
+
+    # -------------------------------------------------------------------------
+    # DML
+    # -------------------------------------------------------------------------
+
+    def new_id(self, obj: ObjectDef) -> str:
+        return to_18(obj.key_prefix + 'Fk' + _base62(next(self._ids), 10))
+
+    def _clean(self, obj: ObjectDef, values: Dict) -> Dict:
+        out = {}
+        for key, value in values.items():
+            if key == 'attributes':
+                continue
+            field = obj.field(key, create=True)
+            out[field.name] = None if value == '' else value
+        return out
+
+    def _validate(self, obj: ObjectDef, values: Dict, record_id: Optional[str],
+                  existing: Optional[Dict]) -> Optional[Dict]:
+        for name, value in values.items():
+            field = obj.field(name)
+            if value is None:
+                continue
+            if field.type in ('string', 'textarea', 'picklist', 'email', 'phone', 'url') \
+                    and field.length and len(str(value)) > field.length:
+                return _error('STRING_TOO_LONG',
+                              f"{field.label}: data value too large: {str(value)[:40]} "
+                              f"(max length={field.length})", [field.name])
+            if field.type == 'picklist' and field.restricted and field.picklist_values \
+                    and value not in field.picklist_values:
+                return _error('INVALID_OR_NULL_FOR_RESTRICTED_PICKLIST',
+                              f"{field.label}: bad value for restricted picklist field: {value}",
+                              [field.name])
+            if field.type == 'reference' and value not in self.id_index:
+                return _error('INVALID_CROSS_REFERENCE_KEY',
+                              f"invalid cross reference id: {value}", [field.name])
+            index = obj.unique_index.get(field.name.lower())
+            if index is not None:
+                owner = index.get(str(value).lower())
+                if owner is not None and owner != record_id:
+                    return _error('DUPLICATE_VALUE',
+                                  f"duplicate value found: {field.name} duplicates value on "
+                                  f"record with id: {owner}", [field.name])
+        if existing is None:
+            for field in obj.fields.values():
+                if not field.nillable and field.name != 'Id' and field.type != 'boolean' \
+                        and values.get(field.name) is None:
+                    return _error('REQUIRED_FIELD_MISSING',
+                                  f"Required fields are missing: [{field.name}]", [field.name])
+        return None
+
+    def _store(self, obj: ObjectDef, record_id: str, values: Dict):
+        record = obj.records.setdefault(record_id, {'Id': record_id})
+        for name, value in values.items():
+            index = obj.unique_index.get(name.lower())
+            if index is not None:
+                old = record.get(name)
+                if old is not None:
+                    index.pop(str(old).lower(), None)
+                if value is not None:
+                    index[str(value).lower()] = record_id
+            record[name] = value
+        self.id_index[record_id] = obj.name.lower()
+
+    def insert(self, sobject: str, values: Dict, check_faults: bool = True) -> Dict:
+        """Create a record; returns a result dict {id, success, created, errors}."""
+        with self.lock:
+            obj = self.sobject(sobject)
+            values = self._clean(obj, values)
+            values.pop('Id', None)
+            error = (self.faults.row_error() if check_faults else None) \
+                or self._validate(obj, values, None, None)
+            if error:
+                return {'id': None, 'success': False, 'created': False, 'errors': [error]}
+            record_id = self.new_id(obj)
+            self._store(obj, record_id, values)
+            return {'id': record_id, 'success': True, 'created': True, 'errors': []}
+
+    def update(self, sobject: str, values: Dict, record_id: str = None) -> Dict:
+        """Update a record by Id (from the argument or values['Id'])."""
+        with self.lock:
+            obj = self.sobject(sobject)
+            values = self._clean(obj, values)
+            record_id = record_id or values.pop('Id', None)
+            values.pop('Id', None)
+            existing = obj.records.get(record_id) if record_id else None
+            if existing is None:
+                return {'id': record_id, 'success': False, 'created': False,
+                        'errors': [_error('ENTITY_IS_DELETED' if record_id in self.id_index
+                                          else 'INVALID_CROSS_REFERENCE_KEY',
+                                          f"invalid cross reference id: {record_id}")]}
+            error = self.faults.row_error() or self._validate(obj, values, record_id, existing)
+            if error:
+                return {'id': record_id, 'success': False, 'created': False, 'errors': [error]}
+            self._store(obj, record_id, values)
+            return {'id': record_id, 'success': True, 'created': False, 'errors': []}
+
+    def upsert(self, sobject: str, external_id_field: str, values: Dict) -> Dict:
+        """Insert or update matching on an external ID field."""
+        with self.lock:
+            obj = self.sobject(sobject)
+            field = obj.field(external_id_field, create=True)
+            if field.name.lower() not in obj.unique_index:
+                field.external_id = True
+                obj.add_field(field)
+            key = values.get(field.name) if field.name in values else values.get(external_id_field)
+            if key in (None, ''):
+                return {'id': None, 'success': False, 'created': False,
+                        'errors': [_error('MISSING_ARGUMENT',
+                                          f"{field.name} not specified", [field.name])]}
+            existing_id = obj.unique_index[field.name.lower()].get(str(key).lower())
+            if existing_id:
+                return self.update(sobject, values, record_id=existing_id)
+            return self.insert(sobject, values)
+
+    def delete(self, sobject: str, record_id: str) -> Dict:
+        with self.lock:
+            obj = self.sobject(sobject)
+            record = obj.records.pop(record_id, None)
+            if record is None:
+                return {'id': record_id, 'success': False,
+                        'errors': [_error('ENTITY_IS_DELETED', 'entity is deleted')]}
+            for name, index in obj.unique_index.items():
+                for key, owner in list(index.items()):
+                    if owner == record_id:
+                        del index[key]
+            return {'id': record_id, 'success': True, 'errors': []}
+
+    def get(self, record_id: str) -> Optional[Dict]:
+        """Look up any record by Id (15 or 18 characters)."""
+        with self.lock:
+            if len(record_id) == 15:
+                record_id = to_18(record_id)
+            object_key = self.id_index.get(record_id)
+            if object_key is None:
+                return None
+            return self.objects[object_key].records.get(record_id)
+
+    def object_of(self, record_id: str) -> Optional[ObjectDef]:
+        object_key = self.id_index.get(record_id)
+        return self.objects.get(object_key) if object_key else None
+
+    def seed(self, data: Dict[str, List[Dict]]) -> Dict[str, int]:
+        """
+        Load records without fault injection, keeping supplied Ids.
+
+        Args:
+            data: {sobject: [records]}; records may carry their own 'Id'
+
+        Returns:
+            Records loaded per object
+        """
+        counts = {}
+        with self.lock:
+            for sobject, records in data.items():
+                obj = self.sobject(sobject)
+                for values in records:
+                    values = self._clean(obj, values)
+                    record_id = values.pop('Id', None) or self.new_id(obj)
+                    if len(record_id) == 15:
+                        record_id = to_18(record_id)
+                    self._store(obj, record_id, values)
+                counts[sobject] = len(records)
+        return counts
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def resolve(self, obj: ObjectDef, record: Optional[Dict], path: str) -> Any:
+        """Read a (relationship) field path from a record."""
+        parts = path.split('.')
+        current_obj, current = obj, record
+        for part in parts[:-1]:
+            if current is None:
+                return None
+            rel = current_obj.relationships.get(part.lower())
+            if rel is None:
+                # Undeclared relationship: Parent__r -> Parent__c, Order -> OrderId
+                guess = part[:-3] + '__c' if part.lower().endswith('__r') else part + 'Id'
+                rel = current_obj.field(guess)
+                if rel is None:
+                    return None
+            parent_id = current.get(rel.name)
+            current = self.get(parent_id) if parent_id else None
+            current_obj = self.object_of(current['Id']) if current else None
+        if current is None:
+            return None
+        field = current_obj.field(parts[-1])
+        return current.get(field.name) if field else None
+
+    def _shape(self, obj: ObjectDef, record: Dict, fields: List[str], version: str) -> Dict:
+        out = {'attributes': {'type': obj.name,
+                              'url': f"/services/data/v{version}/sobjects/{obj.name}/{record['Id']}"}}
+        for path in fields:
+            parts = path.split('.')
+            target, current_obj, current = out, obj, record
+            for part in parts[:-1]:
+                rel = current_obj.relationships.get(part.lower())
+                if rel is None:
+                    guess = part[:-3] + '__c' if part.lower().endswith('__r') else part + 'Id'
+                    rel = current_obj.field(guess) or FieldDef(guess)
+                rel_name = rel.relationship_name or part
+                parent_id = current.get(rel.name) if current else None
+                parent = self.get(parent_id) if parent_id else None
+                if parent is None:
+                    target[rel_name] = None
+                    target = None
+                    break
+                parent_obj = self.object_of(parent['Id'])
+                if not isinstance(target.get(rel_name), dict):
+                    target[rel_name] = {'attributes': {
+                        'type': parent_obj.name,
+                        'url': f"/services/data/v{version}/sobjects/{parent_obj.name}/{parent['Id']}"}}
+                target, current_obj, current = target[rel_name], parent_obj, parent
+            if target is not None:
+                field = current_obj.field(parts[-1])
+                name = field.name if field else parts[-1]
+                target[name] = current.get(name) if current else None
+        return out
+
+    def _candidates(self, obj: ObjectDef, node) -> Optional[List[Dict]]:
+        """Records picked by an Id = / Id IN filter (None: scan everything)."""
+        if node is None:
+            return None
+        if node[0] == 'and':
+            found = self._candidates(obj, node[1])
+            return found if found is not None else self._candidates(obj, node[2])
+        ids = None
+        if node[0] == 'in' and node[1].lower() == 'id' and not node[3]:
+            ids = node[2]
+        elif node[0] == 'cmp' and node[1].lower() == 'id' and node[2] == '=':
+            ids = [node[3]]
+        if ids is None:
+            return None
+        records = (obj.records.get(to_18(i) if isinstance(i, str) and len(i) == 15 else i)
+                   for i in dict.fromkeys(ids))
+        return [r for r in records if r is not None]
+
+    def _id_sort_fields(self, obj: ObjectDef, order_by) -> List[str]:
+        """ORDER BY fields sorted case-sensitively (Id and reference fields)."""
+        if not self.case_sensitive_ids:
+            return []
+        fields = []
+        for path, _desc, _nulls in order_by:
+            field = obj.field(path) if '.' not in path else None
+            if field is not None and field.type in ('id', 'reference'):
+                fields.append(path)
+        return fields
+
+    def query(self, text: str, version: str = '59.0', include_deleted: bool = False) -> Dict:
+        """
+        Run a SOQL query.
+
+        Returns:
+            {'totalSize': n, 'records': [...]} with all matching rows (paging is
+            done by the server layer)
+
+        Raises:
+            soql.SOQLError: malformed or unsupported query
+        """
+        q = soql.parse(text)
+        with self.lock:
+            obj = self.sobject(q.sobject, create=False)
+            if obj is None:
+                raise soql.SOQLError(f"sObject type '{q.sobject}' is not supported.")
+            for path in q.fields + q.group_by + [o[0] for o in q.order_by]:
+                if '.' not in path and obj.field(path) is None:
+                    raise soql.SOQLError(f"No such column '{path}' on entity '{obj.name}'")
+
+            def resolve(record, path):
+                return self.resolve(obj, record, path)
+
+            candidates = self._candidates(obj, q.where)
+            if candidates is None:
+                candidates = obj.records.values()
+            rows = [r for r in candidates if soql.matches(q.where, r, resolve)]
+
+            if q.aggregates:
+                if q.count_only:
+                    total = len(rows)
+                    return {'totalSize': total, 'records': []}
+                result_rows = soql.aggregate(q, rows, resolve)
+                if q.order_by:
+                    result_rows = soql.sort_records(
+                        result_rows, q.order_by, lambda r, p: r.get(p.split('.')[-1]))
+                result_rows = result_rows[q.offset:]
+                if q.limit is not None:
+                    result_rows = result_rows[:q.limit]
+                return {'totalSize': len(result_rows), 'records': result_rows}
+
+            if q.order_by:
+                rows = soql.sort_records(rows, q.order_by, resolve, self._id_sort_fields(obj, q.order_by))
+            rows = rows[q.offset:]
+            if q.limit is not None:
+                rows = rows[:q.limit]
+            shaped = [self._shape(obj, r, q.fields, version) for r in rows]
+            return {'totalSize': len(shaped), 'records': shaped}
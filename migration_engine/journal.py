@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Run Journal
+===========
+Append-only JSON Lines log of per-record outcomes for a migration run.
+
+Each notebook run gets one file, journal/<object>/<run_id>.jsonl at the repo
+root (override the directory with MIGRATION_JOURNAL_DIR). Every line is one
+event:
+
+    {"ts": "...", "run_id": "20261019_101500", "object": "service",
+     "event": "retry", "es_id": "801...", "status": "success", ...}
+
+Lines are flushed as they are written, so a crashed or interrupted run still
+leaves a usable record of what happened.
+
+Usage:
+    from migration_engine.journal import RunJournal
+
+    journal = RunJournal("service", run_id=timestamp)
+    journal.record("retry", es_id=es_id, status="failed", error_class="validation")
+
+    for entry in RunJournal.read_all("service"):
+        ...
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOURNAL_DIR = os.environ.get('MIGRATION_JOURNAL_DIR', os.path.join(REPO_ROOT, 'journal'))
+
+
+class RunJournal:
+    """
+    Journal for one run of one migrated object.
+
+    Args:
+        object_name: Object key, e.g. 'service' (one sub-directory per object)
+        run_id: Run identifier; defaults to the current timestamp
+        directory: Journal root directory
+    """
+
+    def __init__(self, object_name: str, run_id: str = None, directory: str = None):
+        self.object_name = object_name
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.directory = os.path.join(directory or JOURNAL_DIR, object_name)
+        self.path = os.path.join(self.directory, f"{self.run_id}.jsonl")
+
+    def record(self, event: str, **fields: Any):
+        """Append one event."""
+        self.record_many(event, [fields])
+
+    def record_many(self, event: str, rows: List[Dict[str, Any]]):
+        """Append one event per row in a single write."""
+        if not rows:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        ts = datetime.now().isoformat(timespec='seconds')
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for row in rows:
+                entry = {'ts': ts, 'run_id': self.run_id, 'object': self.object_name,
+                         'event': event}
+                entry.update(row)
+                f.write(json.dumps(entry, default=str) + '\n')
+
+    def entries(self) -> Iterator[Dict]:
+        """Yield this run's events."""
+        return _read_file(self.path)
+
+    @staticmethod
+    def read_all(object_name: str, directory: str = None) -> Iterator[Dict]:
+        """Yield events from every run of an object, oldest run first."""
+        object_dir = os.path.join(directory or JOURNAL_DIR, object_name)
+        if not os.path.isdir(object_dir):
+            return
+        for name in sorted(os.listdir(object_dir)):
+            if name.endswith('.jsonl'):
+                yield from _read_file(os.path.join(object_dir, name))
+
+
+def _read_file(path: str) -> Iterator[Dict]:
+    if not os.path.exists(path):
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
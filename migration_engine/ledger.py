@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Run-Results Ledger
+==================
+Append-only, partitioned Parquet ledger of per-record migration outcomes.
+
+Every notebook run used to leave a one-off es_bbf_*_<timestamp>.xlsx behind,
+so comparing runs meant opening spreadsheets. The ledger keeps one row per
+record per run in a Hive-partitioned Parquet dataset:
+
+    ledger/object=service/run_id=20261019_101500/part-0000.parquet
+
+Columns: run_id, object, ts, es_id, bbf_id, status, error, batch_size,
+field_diffs (list of {field, old, new}). Files are only ever added, never
+rewritten. Set MIGRATION_LEDGER_DIR to move the dataset.
+
+Cross-run questions become columnar queries, and Excel reports are rendered
+from the ledger only when somebody asks for one.
+
+Usage:
+    from migration_engine.ledger import (
+        RunLedger, failed_in_any_run, render_report, success_rate_by,
+    )
+
+    ledger = RunLedger("service", run_id=timestamp, batch_size=LOAD_BATCH_SIZE)
+    ledger.record_results(bbf_services, results)
+    ledger.record_skipped(skipped_no_bbf_ban)
+
+    ledger = RunLedger("service_enrichment", run_id=timestamp)   # Day-2
+    ledger.record_updates(update_details, update_results=update_results)
+
+    failed_in_any_run("service")                 # ES Ids that failed in any run
+    success_rate_by("batch_size", "service")     # success rate per batch size
+    render_report("service", timestamp, "service_run.xlsx")
+
+Command line (from the repo root):
+    python -m migration_engine.ledger runs service
+    python -m migration_engine.ledger failed service
+    python -m migration_engine.ledger rate batch_size service
+    python -m migration_engine.ledger render service 20261019_101500 service_run.xlsx
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from migration_engine.loader import LEGACY_ID_FIELD, as_bool
+from migration_engine.report import STYLE_HEADER_FAILED, ReportWriter, bold
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEDGER_DIR = os.environ.get('MIGRATION_LEDGER_DIR', os.path.join(REPO_ROOT, 'ledger'))
+
+STATUS_SUCCESS = 'Success'
+STATUS_FAILED = 'Failed'
+STATUS_SKIPPED = 'Skipped'
+
+DIFF_TYPE = pa.struct([
+    ('field', pa.string()),
+    ('old', pa.string()),
+    ('new', pa.string()),
+])
+
+# Partition columns (object, run_id) live in the directory names
+FILE_SCHEMA = pa.schema([
+    ('ts', pa.string()),
+    ('es_id', pa.string()),
+    ('bbf_id', pa.string()),
+    ('status', pa.string()),
+    ('error', pa.string()),
+    ('batch_size', pa.int64()),
+    ('field_diffs', pa.list_(DIFF_TYPE)),
+])
+
+PARTITIONING = ds.partitioning(
+    pa.schema([('object', pa.string()), ('run_id', pa.string())]), flavor='hive'
+)
+
+
+def _error_text(errors) -> Optional[str]:
+    if not errors:
+        return None
+    if isinstance(errors, str):
+        return errors
+    return json.dumps(errors, default=str)
+
+
+class RunLedger:
+    """
+    Writer for one run of one object.
+
+    Args:
+        object_name: Object key, e.g. 'service'
+        run_id: Run identifier (the notebook timestamp)
+        batch_size: Load batch size used by this run (recorded on every row)
+        directory: Ledger root directory
+    """
+
+    def __init__(self, object_name: str, run_id: str = None, batch_size: int = None,
+                 directory: str = None):
+        self.object_name = object_name
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.batch_size = batch_size
+        self.partition_dir = os.path.join(
+            directory or LEDGER_DIR, f"object={object_name}", f"run_id={self.run_id}"
+        )
+        self.rows_written = 0
+
+    def _next_part(self) -> str:
+        os.makedirs(self.partition_dir, exist_ok=True)
+        existing = [n for n in os.listdir(self.partition_dir) if n.endswith('.parquet')]
+        return os.path.join(self.partition_dir, f"part-{len(existing):04d}.parquet")
+
+    def append(self, rows: Iterable[Dict]) -> int:
+        """
+        Write rows as a new Parquet part file.
+
+        Args:
+            rows: Dicts with es_id, bbf_id, status, error and optional
+                field_diffs ([{field, old, new}]) / batch_size
+
+        Returns:
+            Number of rows written
+        """
+        ts = datetime.now().isoformat(timespec='seconds')
+        table_rows = []
+        for row in rows:
+            diffs = row.get('field_diffs')
+            table_rows.append({
+                'ts': ts,
+                'es_id': row.get('es_id'),
+                'bbf_id': row.get('bbf_id'),
+                'status': row.get('status'),
+                'error': _error_text(row.get('error')),
+                'batch_size': row.get('batch_size', self.batch_size),
+                'field_diffs': [
+                    {'field': d['field'],
+                     'old': None if d.get('old') is None else str(d['old']),
+                     'new': None if d.get('new') is None else str(d['new'])}
+                    for d in diffs
+                ] if diffs else None,
+            })
+        if not table_rows:
+            return 0
+        pq.write_table(pa.Table.from_pylist(table_rows, schema=FILE_SCHEMA), self._next_part())
+        self.rows_written += len(table_rows)
+        return len(table_rows)
+
+    def record_results(self, records: List[Dict], results: List[Dict],
+                       key_field: str = LEGACY_ID_FIELD) -> int:
+        """Record bulk insert / upsert results (same order as records)."""
+        return self.append(
+            {
+                'es_id': record.get(key_field),
+                'bbf_id': result.get('id') if as_bool(result.get('success')) else None,
+                'status': STATUS_SUCCESS if as_bool(result.get('success')) else STATUS_FAILED,
+                'error': None if as_bool(result.get('success')) else result.get('errors'),
+            }
+            for record, result in zip(records, results)
+        )
+
+    def record_skipped(self, skipped: List[Dict], reason: str = None) -> int:
+        """Record skipped records ({'es_id', 'reason'} dicts)."""
+        return self.append(
+            {'es_id': item.get('es_id'), 'status': STATUS_SKIPPED,
+             'error': item.get('reason', reason)}
+            for item in skipped
+        )
+
+    def record_updates(self, update_details: List[Dict], failed_ids: Sequence[str] = (),
+                       update_results: List[Dict] = None) -> int:
+        """
+        Record Day-2 enrichment updates with their field diffs.
+
+        Args:
+            update_details: [{'bbf_id', 'es_id'?, 'fields': [{field, old, new}]}]
+                (EnrichmentBuild.update_details)
+            failed_ids: BBF Ids whose update failed
+            update_results: Bulk / REST update results ({'id', 'success'}); an
+                update without a successful result is recorded as failed
+        """
+        failed = set(failed_ids)
+        if update_results is not None:
+            succeeded = {r.get('id') for r in update_results if as_bool(r.get('success'))}
+            failed.update(d['bbf_id'] for d in update_details if d['bbf_id'] not in succeeded)
+        return self.append(
+            {
+                'es_id': detail.get('es_id'),
+                'bbf_id': detail['bbf_id'],
+                'status': STATUS_FAILED if detail['bbf_id'] in failed else STATUS_SUCCESS,
+                'field_diffs': detail['fields'],
+            }
+            for detail in update_details
+        )
+
+
+# =============================================================================
+# QUERY API
+# =============================================================================
+
+def _dataset(directory: str = None) -> Optional[ds.Dataset]:
+    root = directory or LEDGER_DIR
+    if not os.path.isdir(root):
+        return None
+    return ds.dataset(root, format='parquet', partitioning=PARTITIONING)
+
+
+def query_ledger(object_name: str = None, run_id: str = None, status: str = None,
+                 columns: List[str] = None, directory: str = None) -> pd.DataFrame:
+    """
+    Load ledger rows as a DataFrame, pushing filters down to the Parquet scan.
+
+    Args:
+        object_name: Only this object
+        run_id: Only this run
+        status: Only this status ('Success' / 'Failed' / 'Skipped')
+        columns: Columns to read (default all)
+        directory: Ledger root directory
+
+    Returns:
+        DataFrame (empty if the ledger does not exist yet)
+    """
+    dataset = _dataset(directory)
+    if dataset is None:
+        return pd.DataFrame(columns=columns or ['object', 'run_id'] + FILE_SCHEMA.names)
+
+    expr = None
+    for column, value in (('object', object_name), ('run_id', run_id), ('status', status)):
+        if value is not None:
+            clause = ds.field(column) == value
+            expr = clause if expr is None else expr & clause
+
+    return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+def list_runs(object_name: str = None, directory: str = None) -> pd.DataFrame:
+    """Per-run row counts by status."""
+    df = query_ledger(object_name, columns=['object', 'run_id', 'status'], directory=directory)
+    if df.empty:
+        return df
+    return (df.groupby(['object', 'run_id', 'status']).size()
+              .unstack(fill_value=0).reset_index())
+
+
+def failed_in_any_run(object_name: str, directory: str = None) -> pd.DataFrame:
+    """ES Ids that failed in at least one run, with failure count and last error."""
+    df = query_ledger(object_name, status=STATUS_FAILED,
+                      columns=['run_id', 'es_id', 'error'], directory=directory)
+    if df.empty:
+        return df
+    df = df.sort_values('run_id')
+    return (df.groupby('es_id')
+              .agg(failures=('run_id', 'size'), runs=('run_id', 'nunique'),
+                   last_run=('run_id', 'last'), last_error=('error', 'last'))
+              .reset_index())
+
+
+def success_rate_by(column: str, object_name: str = None, directory: str = None) -> pd.DataFrame:
+    """
+    Success rate grouped by a ledger column (e.g. 'batch_size', 'run_id').
+
+    Skipped rows were never sent to BBF, so they are counted in their own
+    column and left out of the success-rate denominator.
+    """
+    df = query_ledger(object_name, columns=[column, 'status'], directory=directory)
+    if df.empty:
+        return df
+    df['attempted'] = df['status'] != STATUS_SKIPPED
+    df['succeeded'] = df['status'] == STATUS_SUCCESS
+    df['skipped'] = ~df['attempted']
+    rates = (df.groupby(column)[['attempted', 'succeeded', 'skipped']]
+               .sum()
+               .reset_index())
+    rates['success_rate'] = rates['succeeded'] / rates['attempted'].where(rates['attempted'] > 0)
+    return rates
+
+
+# =============================================================================
+# LAZY REPORTS
+# =============================================================================
+
+def render_report(object_name: str, run_id: str, output_file: str,
+                  directory: str = None) -> str:
+    """
+    Render a run's Excel report from the ledger.
+
+    Sheets: Migration Results (status-coloured), Summary, Failed, and Field
+    Changes when the run recorded field diffs.
+
+    Returns:
+        Path of the written workbook
+    """
+    df = query_ledger(object_name, run_id=run_id, directory=directory)
+    report = ReportWriter(output_file)
+
+    report.add_table(
+        "Migration Results",
+        ["ES ID", "BBF ID", "Status", "Error"],
+        df[['es_id', 'bbf_id', 'status', 'error']].itertuples(index=False, name=None),
+        status_column=2,
+    )
+
+    counts = df['status'].value_counts().to_dict() if not df.empty else {}
+    total = len(df)
+    succeeded = counts.get(STATUS_SUCCESS, 0)
+    report.add_summary("Summary", f"{object_name} run {run_id}", [
+        [],
+        bold(["Metric", "Count"]),
+        ["Total Records", total],
+        ["Successful", succeeded],
+        ["Failed", counts.get(STATUS_FAILED, 0)],
+        ["Skipped", counts.get(STATUS_SKIPPED, 0)],
+        ["Success Rate", f"{succeeded / total * 100:.1f}%" if total else "0%"],
+    ])
+
+    failed = df[df['status'] != STATUS_SUCCESS]
+    report.add_table(
+        "Failed",
+        ["ES ID", "Status", "Error Details"],
+        failed[['es_id', 'status', 'error']].itertuples(index=False, name=None),
+        header_style=STYLE_HEADER_FAILED,
+        max_width=70,
+    )
+
+    with_diffs = df[df['field_diffs'].notna()]
+    if not with_diffs.empty:
+        report.add_table(
+            "Field Changes",
+            ["BBF ID", "ES ID", "Field", "Old Value", "New Value"],
+            (
+                [row.bbf_id, row.es_id, d['field'], d['old'] or '', d['new'] or '']
+                for row in with_diffs.itertuples(index=False)
+                for d in row.field_diffs
+            ),
+        )
+
+    return report.save()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the migration run ledger")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    runs = sub.add_parser('runs', help="Per-run status counts")
+    runs.add_argument('object', nargs='?', help="Object key, e.g. service")
+
+    failed = sub.add_parser('failed', help="ES Ids that failed in any run")
+    failed.add_argument('object')
+
+    rate = sub.add_parser('rate', help="Success rate grouped by a column")
+    rate.add_argument('column', help="e.g. batch_size or run_id")
+    rate.add_argument('object', nargs='?')
+
+    render = sub.add_parser('render', help="Render a run's Excel report")
+    render.add_argument('object')
+    render.add_argument('run_id')
+    render.add_argument('output_file')
+
+    args = parser.parse_args()
+    if args.command == 'runs':
+        print(list_runs(args.object).to_string(index=False))
+    elif args.command == 'failed':
+        print(failed_in_any_run(args.object).to_string(index=False))
+    elif args.command == 'rate':
+        print(success_rate_by(args.column, args.object).to_string(index=False))
+    elif args.command == 'render':
+        print(f"✅ Report saved to: {render_report(args.object, args.run_id, args.output_file)}")
+
+
+if __name__ == '__main__':
+    main()
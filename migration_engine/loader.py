@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Upsert Load Mode
+================
+Bulk upsert of Day 1 records into BBF keyed on ES_Legacy_ID__c.
+
+The insert load mode has to scan BBF for every record that already carries an
+ES_Legacy_ID__c ("DUPLICATE PREVENTION") before it can split new inserts from
+ES back-fill updates. Upserting on the external ID lets Salesforce do that
+match server-side: the bulk results say whether each row was created or
+updated, and both cases carry the BBF Id needed for the ES write-back.
+
+Requires ES_Legacy_ID__c to be an External ID field on the BBF object.
+
+Usage:
+    from migration_engine.loader import upsert_by_legacy_id, split_upsert_results
+
+    results = upsert_by_legacy_id(bbf_sf.bulk.Service__c, bbf_services)
+    split = split_upsert_results(bbf_services, results)
+
+    es_updates = [
+        {'Id': item['es_id'], 'BBF_New_Id__c': item['bbf_id']}
+        for item in split['created'] + split['updated']
+    ]
+"""
+
+from typing import Any, Dict, List
+
+# External ID field on every BBF target object
+LEGACY_ID_FIELD = 'ES_Legacy_ID__c'
+
+# Load modes understood by the Day 1 notebooks (LOAD_MODE config)
+LOAD_MODE_INSERT = 'insert'
+LOAD_MODE_UPSERT = 'upsert'
+LOAD_MODES = (LOAD_MODE_INSERT, LOAD_MODE_UPSERT)
+
+
+def as_bool(value: Any) -> bool:
+    """Bulk 1.0 returns JSON booleans, Bulk 2.0 returns 'true'/'false' strings."""
+    if isinstance(value, str):
+        return value.strip().lower() == 'true'
+    return bool(value)
+
+
+def upsert_by_legacy_id(bulk_object, records: List[Dict],
+                        external_id_field: str = LEGACY_ID_FIELD,
+                        batch_size: int = 10000,
+                        use_serial: bool = False) -> List[Dict]:
+    """
+    Bulk upsert records into BBF matching on the ES legacy ID.
+
+    Args:
+        bulk_object: simple_salesforce bulk handler (e.g. bbf_sf.bulk.Service__c)
+        records: Transformed BBF records; each must contain external_id_field
+        external_id_field: External ID field used as the upsert key
+        batch_size: Records per bulk batch
+        use_serial: Run bulk batches serially (use when parents are shared and
+            parallel batches hit UNABLE_TO_LOCK_ROW)
+
+    Returns:
+        Bulk result list, one dict per input record in input order, with keys
+        success, created, id, errors. Same shape as bulk insert results, so
+        existing success/failure loops keep working.
+    """
+    missing = [i for i, r in enumerate(records) if not r.get(external_id_field)]
+    if missing:
+        raise ValueError(
+            f"{len(missing)} records have no {external_id_field} "
+            f"(first index: {missing[0]}) - cannot upsert without the key"
+        )
+
+    if not records:
+        return []
+
+    return bulk_object.upsert(
+        records, external_id_field, batch_size=batch_size, use_serial=use_serial
+    )
+
+
+def split_upsert_results(records: List[Dict], results: List[Dict],
+                         external_id_field: str = LEGACY_ID_FIELD) -> Dict[str, List[Dict]]:
+    """
+    Split bulk upsert results into created, updated and failed rows.
+
+    Args:
+        records: The records passed to upsert_by_legacy_id (same order)
+        results: The bulk results returned for those records
+        external_id_field: External ID field used as the upsert key
+
+    Returns:
+        Dictionary with:
+        - created: [{es_id, bbf_id, record}] rows inserted by this run
+        - updated: [{es_id, bbf_id, record}] rows that already existed in BBF
+        - failed: [{es_id, errors, record}] rows Salesforce rejected
+    """
+    split = {'created': [], 'updated': [], 'failed': []}
+
+    for record, result in zip(records, results):
+        es_id = record.get(external_id_field)
+        if as_bool(result.get('success')):
+            bucket = 'created' if as_bool(result.get('created')) else 'updated'
+            split[bucket].append({
+                'es_id': es_id,
+                'bbf_id': result.get('id'),
+                'record': record,
+            })
+        else:
+            split['failed'].append({
+                'es_id': es_id,
+                'errors': result.get('errors'),
+                'record': record,
+            })
+
+    return split
+
+
+def print_upsert_summary(split: Dict[str, List[Dict]], object_name: str = 'records'):
+    """Print created / updated / failed counts for an upsert run."""
+    print(f"   Created in BBF: {len(split['created'])} {object_name}")
+    print(f"   Already in BBF (updated): {len(split['updated'])} {object_name}")
+    print(f"   Failed: {len(split['failed'])} {object_name}")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Derived Lookups
+===============
+Resolve lookups that BBF derives from a parent record at transform time, so
+they go into the initial insert payload instead of a post-insert update pass.
+
+Example: Service__c.Account__c is the Account of the Service's BAN. The
+Service notebook used to insert Services, re-query every Service__c with
+Account__c = null to read Billing_Account_Number__r.Account__c, then bulk
+update Account__c. With a BAN -> Account crosswalk the value is known before
+the insert:
+
+    from migration_engine.lookups import Crosswalk, DerivedLookup, apply_derived_lookups
+
+    ban_ids = {s['Billing_Account_Number__c'] for s in bbf_services}
+    ban_to_account = Crosswalk.from_query(bbf_sf, 'BAN__c', 'Account__c', ban_ids)
+
+    stats = apply_derived_lookups(bbf_services, [
+        DerivedLookup('Account__c', via_field='Billing_Account_Number__c',
+                      crosswalk=ban_to_account),
+    ])
+
+The crosswalk query only touches the parent rows referenced by the payload
+(BANs), which is far smaller than the child set (Services).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+# Records per "WHERE Id IN (...)" chunk - same limit the notebooks use
+ID_CHUNK_SIZE = 200
+
+
+def get_path(record: Optional[Dict], path: str) -> Any:
+    """
+    Read a dotted relationship path from a Salesforce record dict.
+
+    Args:
+        record: Record as returned by simple_salesforce (nested __r dicts)
+        path: Field path, e.g. 'Billing_Invoice__r.Account__r.BBF_New_Id__c'
+
+    Returns:
+        The value, or None if any relationship along the path is null
+    """
+    value = record
+    for part in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+class Crosswalk:
+    """Parent Id -> field value map used to resolve derived lookups."""
+
+    def __init__(self, name: str, mapping: Dict[str, Any]):
+        self.name = name
+        self.mapping = mapping
+
+    @classmethod
+    def from_records(cls, name: str, records: Iterable[Dict],
+                     value_field: str, key_field: str = 'Id') -> 'Crosswalk':
+        """
+        Build a crosswalk from already-queried records.
+
+        Args:
+            name: Label used in stats output (e.g. 'BAN__c -> Account__c')
+            records: Salesforce record dicts
+            value_field: Field (or dotted path) holding the derived value
+            key_field: Field (or dotted path) holding the parent Id
+
+        Returns:
+            Crosswalk with one entry per record that has both key and value
+        """
+        mapping = {}
+        for record in records:
+            key = get_path(record, key_field)
+            value = get_path(record, value_field)
+            if key and value:
+                mapping[key] = value
+        return cls(name, mapping)
+
+    @classmethod
+    def from_query(cls, sf, sobject: str, value_field: str, ids: Iterable[str],
+                   key_field: str = 'Id', chunk_size: int = ID_CHUNK_SIZE) -> 'Crosswalk':
+        """
+        Build a crosswalk by querying only the parent rows that are referenced.
+
+        Args:
+            sf: simple_salesforce connection (usually bbf_sf)
+            sobject: Parent object API name (e.g. 'BAN__c')
+            value_field: Field on the parent holding the derived value
+            ids: Parent Ids referenced by the payload
+            key_field: Field matched against ids (default 'Id')
+            chunk_size: Ids per SOQL IN clause
+
+        Returns:
+            Crosswalk keyed by parent Id
+        """
+        unique_ids = sorted({i for i in ids if i})
+        records = []
+        for i in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[i:i + chunk_size]
+            ids_str = "','".join(chunk)
+            query = (
+                f"SELECT {key_field}, {value_field} FROM {sobject} "
+                f"WHERE {key_field} IN ('{ids_str}')"
+            )
+            records.extend(sf.query_all(query)['records'])
+        return cls.from_records(f"{sobject}.{key_field} -> {value_field}",
+                                records, value_field, key_field)
+
+    def get(self, key: Optional[str], default: Any = None) -> Any:
+        if not key:
+            return default
+        return self.mapping.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.mapping
+
+    def __len__(self) -> int:
+        return len(self.mapping)
+
+
+class DerivedLookup:
+    """
+    A BBF field whose value comes from a crosswalk keyed by another payload field.
+
+    Args:
+        target_field: BBF field to populate (e.g. 'Account__c')
+        via_field: Payload field holding the parent Id (e.g. 'Billing_Account_Number__c')
+        crosswalk: Parent Id -> value map
+        overwrite: Replace a value already present in the payload
+    """
+
+    def __init__(self, target_field: str, via_field: str, crosswalk: Crosswalk,
+                 overwrite: bool = False):
+        self.target_field = target_field
+        self.via_field = via_field
+        self.crosswalk = crosswalk
+        self.overwrite = overwrite
+
+    def resolve(self, payload: Dict) -> Optional[str]:
+        """Return the derived value for one payload (None if unresolved)."""
+        return self.crosswalk.get(payload.get(self.via_field))
+
+
+def apply_derived_lookups(payloads: List[Dict], lookups: List[DerivedLookup]) -> Dict[str, Dict[str, int]]:
+    """
+    Populate derived lookup fields on BBF payloads in place.
+
+    Args:
+        payloads: Transformed BBF records about to be inserted
+        lookups: Derived lookups to resolve
+
+    Returns:
+        Stats per target field: {'resolved': n, 'already_set': n, 'unresolved': n}
+    """
+    stats = {lk.target_field: {'resolved': 0, 'already_set': 0, 'unresolved': 0}
+             for lk in lookups}
+
+    for payload in payloads:
+        for lookup in lookups:
+            field_stats = stats[lookup.target_field]
+            if payload.get(lookup.target_field) and not lookup.overwrite:
+                field_stats['already_set'] += 1
+                continue
+            value = lookup.resolve(payload)
+            if value:
+                payload[lookup.target_field] = value
+                field_stats['resolved'] += 1
+            else:
+                field_stats['unresolved'] += 1
+
+    return stats
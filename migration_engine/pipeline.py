@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Streaming Migration Pipeline
+============================
+Overlapped extract -> transform -> load -> write-back for Day 1 migrations.
+
+The notebooks run each phase to completion before the next one starts: the BBF
+insert waits for the last ES query_more page, and the ES write-back waits for
+the last BBF batch. Here every stage runs on its own thread, connected by
+bounded queues:
+
+    ES pages --> transform --> BBF bulk batches --> ES BBF_New_Id__c write-back
+
+A full queue blocks the stage feeding it (backpressure), so memory stays at a
+few pages / batches no matter how many records flow through, and total wall
+time approaches the slowest stage instead of the sum of all stages.
+
+Usage:
+    from migration_engine.pipeline import run_pipeline
+    from migration_engine.reconcile import stream_query
+
+    result = run_pipeline(
+        source=stream_query(es_sf, query),
+        transform=transform_orderitem,                  # ES record -> BBF payload or None
+        load=lambda batch: bbf_sf.bulk.Service_Charge__c.insert(batch),
+        write_back=lambda batch, results: es_sf.bulk.OrderItem.update([
+            {'Id': rec['ES_Legacy_ID__c'], 'BBF_New_Id__c': res['id']}
+            for rec, res in zip(batch, results) if res['success']
+        ]),
+        load_batch_size=2000,
+    )
+    result.print_summary()
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Records per chunk handed from the extract stage (one SOQL query_more page)
+EXTRACT_CHUNK_SIZE = 2000
+
+# Chunks / batches buffered between two stages before the producer blocks
+DEFAULT_QUEUE_SIZE = 4
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+class PipelineResult:
+    """Outputs and per-stage timings of one pipeline run."""
+
+    def __init__(self):
+        self.extracted = 0
+        self.skipped = 0
+        # Loaded BBF payloads and their bulk results, in load order
+        self.records: List[Dict] = []
+        self.results: List[Dict] = []
+        # Whatever write_back returned, one entry per load batch
+        self.write_back_results: List[Any] = []
+        self.stage_seconds = {'extract': 0.0, 'transform': 0.0, 'load': 0.0, 'write_back': 0.0}
+        self.wall_seconds = 0.0
+
+    def print_summary(self):
+        print(f"\nPipeline: {self.extracted} extracted, {self.skipped} skipped, "
+              f"{len(self.records)} loaded")
+        for stage, seconds in self.stage_seconds.items():
+            print(f"   {stage:<11} {seconds:>8.1f}s busy")
+        print(f"   {'wall':<11} {self.wall_seconds:>8.1f}s "
+              f"(sequential would be ~{sum(self.stage_seconds.values()):.1f}s)")
+
+
+class _Stage(threading.Thread):
+    """Worker thread that records the first exception and stops the pipeline."""
+
+    def __init__(self, name: str, target: Callable, stop: threading.Event):
+        super().__init__(name=f"pipeline-{name}", daemon=True)
+        self._target_fn = target
+        self._stop_event = stop
+        self.error: Optional[BaseException] = None
+
+    def run(self):
+        try:
+            self._target_fn()
+        except BaseException as e:
+            self.error = e
+            self._stop_event.set()
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Blocking put that gives up when the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> Any:
+    """Blocking get that returns _DONE when the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.2)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def run_pipeline(source: Iterable[Dict],
+                 transform: Callable[[Dict], Optional[Dict]],
+                 load: Callable[[List[Dict]], List[Dict]],
+                 write_back: Callable[[List[Dict], List[Dict]], Any] = None,
+                 load_batch_size: int = 2000,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 verbose: bool = True) -> PipelineResult:
+    """
+    Stream records through extract, transform, load and write-back concurrently.
+
+    Args:
+        source: ES records, ideally a lazy page-by-page iterator (stream_query)
+        transform: ES record -> BBF payload, or None to skip the record
+        load: BBF payload batch -> bulk results (same order as the batch)
+        write_back: Called with (batch, results) after each load; optional
+        load_batch_size: BBF payloads per load call
+        queue_size: Chunks / batches buffered between stages (backpressure)
+        verbose: Print a line per loaded batch
+
+    Returns:
+        PipelineResult with loaded records, bulk results and stage timings
+
+    Raises:
+        The first exception raised by any stage, after all stages have stopped
+    """
+    result = PipelineResult()
+    stop = threading.Event()
+    extract_q: queue.Queue = queue.Queue(maxsize=queue_size)
+    load_q: queue.Queue = queue.Queue(maxsize=queue_size)
+    write_back_q: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    def extract():
+        chunk = []
+        source_iter = iter(source)
+        while True:
+            started = time.perf_counter()
+            record = next(source_iter, _DONE)
+            result.stage_seconds['extract'] += time.perf_counter() - started
+            if record is _DONE:
+                break
+            result.extracted += 1
+            chunk.append(record)
+            if len(chunk) >= EXTRACT_CHUNK_SIZE:
+                if not _put(extract_q, chunk, stop):
+                    return
+                chunk = []
+        if chunk and not _put(extract_q, chunk, stop):
+            return
+        _put(extract_q, _DONE, stop)
+
+    def transform_stage():
+        batch = []
+        while True:
+            chunk = _get(extract_q, stop)
+            if chunk is _DONE:
+                break
+            started = time.perf_counter()
+            for record in chunk:
+                payload = transform(record)
+                if payload is None:
+                    result.skipped += 1
+                else:
+                    batch.append(payload)
+            result.stage_seconds['transform'] += time.perf_counter() - started
+            while len(batch) >= load_batch_size:
+                if not _put(load_q, batch[:load_batch_size], stop):
+                    return
+                batch = batch[load_batch_size:]
+        if stop.is_set():
+            return
+        if batch and not _put(load_q, batch, stop):
+            return
+        _put(load_q, _DONE, stop)
+
+    def load_stage():
+        batch_num = 0
+        while True:
+            batch = _get(load_q, stop)
+            if batch is _DONE:
+                break
+            batch_num += 1
+            started = time.perf_counter()
+            results = load(batch)
+            result.stage_seconds['load'] += time.perf_counter() - started
+            result.records.extend(batch)
+            result.results.extend(results)
+            if verbose:
+                ok = sum(1 for r in results if r.get('success') in (True, 'true'))
+                print(f"   Batch {batch_num}: {ok}/{len(batch)} loaded")
+            if write_back is not None and not _put(write_back_q, (batch, results), stop):
+                return
+        if write_back is not None and not stop.is_set():
+            _put(write_back_q, _DONE, stop)
+
+    def write_back_stage():
+        while True:
+            item = _get(write_back_q, stop)
+            if item is _DONE:
+                break
+            started = time.perf_counter()
+            result.write_back_results.append(write_back(*item))
+            result.stage_seconds['write_back'] += time.perf_counter() - started
+
+    stages = [
+        _Stage('extract', extract, stop),
+        _Stage('transform', transform_stage, stop),
+        _Stage('load', load_stage, stop),
+    ]
+    if write_back is not None:
+        stages.append(_Stage('write_back', write_back_stage, stop))
+
+    started = time.perf_counter()
+    for stage in stages:
+        stage.start()
+    for stage in stages:
+        stage.join()
+    result.wall_seconds = time.perf_counter() - started
+
+    for stage in stages:
+        if stage.error is not None:
+            raise stage.error
+
+    return result
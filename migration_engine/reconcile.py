@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+TRUE-UP Reconciliation
+======================
+Linear sorted-merge reconciliation of the ES <-> BBF Id links.
+
+Every migrated object carries the link twice:
+- BBF side: (Id, ES_Legacy_ID__c) on the BBF record
+- ES side:  (Id, BBF_New_Id__c) on the ES record
+
+Both sides are streamed ordered by the ES Id - page by page from the orgs
+with query/queryMore, or from local CSV snapshots - and merged in one pass.
+The BBF side comes back from ORDER BY ES_Legacy_ID__c, a text field, which
+SOQL sorts case-insensitively. ORDER BY Id on the ES side sorts Ids
+case-sensitively (digits, A-Z, a-z), so the ES stream is re-sorted into the
+same case-insensitive order first with an external merge sort (sorted runs
+spilled to temporary CSV files). Memory stays bounded apart from the
+findings themselves, and only the minimal fix set is written back.
+
+Findings:
+- missing:       ES record has no BBF_New_Id__c, BBF record points to it  -> fix
+- mismatched:    ES BBF_New_Id__c differs from the BBF record's Id        -> fix
+- orphaned_bbf:  BBF record's ES_Legacy_ID__c matches no ES record        -> report
+- orphaned_es:   ES BBF_New_Id__c set but no BBF record points back       -> report
+- duplicate_bbf: more than one BBF record with the same ES_Legacy_ID__c   -> report
+
+Usage:
+    from migration_engine.reconcile import reconcile_object, apply_link_fixes
+
+    result = reconcile_object(es_sf, bbf_sf, 'service')
+    result.print_summary()
+    apply_link_fixes(es_sf, 'Order', result.fixes(), bulk=False)
+"""
+
+import csv
+import heapq
+import itertools
+import os
+import tempfile
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# ES object -> BBF object for every Day 1 migration
+RECONCILE_OBJECTS = {
+    'location': ('Address__c', 'Location__c'),
+    'account': ('Account', 'Account'),
+    'contact': ('Contact', 'Contact'),
+    'ban': ('Billing_Invoice__c', 'BAN__c'),
+    'service': ('Order', 'Service__c'),
+    'service_charge': ('OrderItem', 'Service_Charge__c'),
+    'offnet': ('Off_Net__c', 'Off_Net__c'),
+}
+
+LEGACY_ID_FIELD = 'ES_Legacy_ID__c'
+NEW_ID_FIELD = 'BBF_New_Id__c'
+
+# Pairs held in memory per sorted run of sort_links()
+SORT_RUN_SIZE = 200000
+
+# A link pair: (record Id, linked Id in the other org or None)
+Pair = Tuple[str, Optional[str]]
+
+
+def id_sort_key(sf_id: str) -> str:
+    """
+    Ordering key for Salesforce Ids: the order of ORDER BY on a text field.
+
+    SOQL sorts text fields (ES_Legacy_ID__c) case-insensitively, and
+    18-character Ids are unique ignoring case, so upper-cased Ids give a total
+    order. ORDER BY Id does not sort this way (it is case-sensitive); streams
+    ordered by Id must go through sort_links() first.
+    """
+    return sf_id.upper()
+
+
+# =============================================================================
+# SOURCES
+# =============================================================================
+
+def stream_query(sf, query: str) -> Iterator[Dict]:
+    """
+    Yield records one page at a time using query / query_more.
+
+    Unlike query_all, only the current page (up to 2,000 rows) is held in memory.
+    """
+    result = sf.query(query)
+    while True:
+        for record in result['records']:
+            yield record
+        if result.get('done', True):
+            break
+        result = sf.query_more(result['nextRecordsUrl'], identifier_is_url=True)
+
+
+def stream_bbf_links(bbf_sf, bbf_object: str) -> Iterator[Pair]:
+    """Yield (ES_Legacy_ID__c, BBF Id) for every BBF record, ordered by ES Id."""
+    query = (
+        f"SELECT Id, {LEGACY_ID_FIELD} FROM {bbf_object} "
+        f"WHERE {LEGACY_ID_FIELD} != null ORDER BY {LEGACY_ID_FIELD}"
+    )
+    for record in stream_query(bbf_sf, query):
+        yield record[LEGACY_ID_FIELD], record['Id']
+
+
+def stream_es_links(es_sf, es_object: str, where: str = None) -> Iterator[Pair]:
+    """
+    Yield (ES Id, BBF_New_Id__c or None) for every ES record, in ORDER BY Id order.
+
+    That order is case-sensitive; sort_links() puts it in id_sort_key order.
+    """
+    query = f"SELECT Id, {NEW_ID_FIELD} FROM {es_object}"
+    if where:
+        query += f" WHERE {where}"
+    query += " ORDER BY Id"
+    for record in stream_query(es_sf, query):
+        yield record['Id'], record.get(NEW_ID_FIELD) or None
+
+
+def sort_links(pairs: Iterable[Pair], run_size: int = SORT_RUN_SIZE) -> Iterator[Pair]:
+    """
+    Yield pairs ordered by id_sort_key of their key (external merge sort).
+
+    Up to run_size pairs are sorted in memory at a time; larger inputs are
+    spilled as sorted runs to temporary CSV files and merged back.
+    """
+    def sort_key(pair):
+        return id_sort_key(pair[0])
+
+    pairs = iter(pairs)
+    run = sorted(itertools.islice(pairs, run_size), key=sort_key)
+    following = sorted(itertools.islice(pairs, run_size), key=sort_key)
+    if not following:
+        yield from run
+        return
+
+    with tempfile.TemporaryDirectory(prefix='reconcile_') as tmp_dir:
+        paths = []
+        while run:
+            path = os.path.join(tmp_dir, f"run_{len(paths)}.csv")
+            _write_pairs(path, run)
+            paths.append(path)
+            run, following = following, sorted(itertools.islice(pairs, run_size), key=sort_key)
+        yield from heapq.merge(*(read_snapshot(path) for path in paths), key=sort_key)
+
+
+def _write_pairs(path: str, pairs: Iterable[Pair]) -> int:
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['key', 'value'])
+        for key, value in pairs:
+            writer.writerow([key, value or ''])
+            count += 1
+    return count
+
+
+def write_snapshot(path: str, pairs: Iterable[Pair]) -> int:
+    """
+    Save link pairs to a CSV snapshot, sorted by key, for offline reconciliation.
+
+    Returns:
+        Number of pairs written
+    """
+    return _write_pairs(path, sort_links(pairs))
+
+
+def read_snapshot(path: str) -> Iterator[Pair]:
+    """Stream link pairs back from a CSV snapshot written by write_snapshot."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for key, value in reader:
+            yield key, value or None
+
+
+def _checked(pairs: Iterator[Pair], side: str) -> Iterator[Pair]:
+    """Pass pairs through, failing fast if the stream is not sorted by key."""
+    previous = None
+    for key, value in pairs:
+        sort_key = id_sort_key(key)
+        if previous is not None and sort_key < previous:
+            raise ValueError(
+                f"{side} stream is not sorted by Id ({key} after {previous}); "
+                f"reconcile from a snapshot written by write_snapshot() instead"
+            )
+        previous = sort_key
+        yield key, value
+
+
+# =============================================================================
+# MERGE
+# =============================================================================
+
+class ReconcileResult:
+    """Findings from one reconciliation pass."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.matched = 0
+        self.missing: List[Dict] = []
+        self.mismatched: List[Dict] = []
+        self.orphaned_bbf: List[Dict] = []
+        self.orphaned_es: List[Dict] = []
+        self.duplicate_bbf: List[Dict] = []
+
+    def fixes(self) -> List[Dict]:
+        """ES updates needed to repair missing and mismatched links."""
+        return [
+            {'Id': item['es_id'], NEW_ID_FIELD: item['bbf_id']}
+            for item in self.missing + self.mismatched
+        ]
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            'matched': self.matched,
+            'missing': len(self.missing),
+            'mismatched': len(self.mismatched),
+            'orphaned_bbf': len(self.orphaned_bbf),
+            'orphaned_es': len(self.orphaned_es),
+            'duplicate_bbf': len(self.duplicate_bbf),
+        }
+
+    def print_summary(self):
+        print(f"\nReconciliation: {self.name}")
+        for label, count in self.counts().items():
+            print(f"   {label:<15} {count:>8}")
+        print(f"   Fixes to apply: {len(self.missing) + len(self.mismatched)}")
+
+
+def _grouped(pairs: Iterator[Pair]) -> Iterator[Tuple[str, List[Pair]]]:
+    """Group consecutive pairs sharing a key (BBF duplicates)."""
+    group_key = None
+    group: List[Pair] = []
+    for pair in pairs:
+        sort_key = id_sort_key(pair[0])
+        if group and sort_key != group_key:
+            yield group_key, group
+            group = []
+        group_key = sort_key
+        group.append(pair)
+    if group:
+        yield group_key, group
+
+
+def reconcile_links(bbf_links: Iterator[Pair], es_links: Iterator[Pair],
+                    name: str = '') -> ReconcileResult:
+    """
+    Merge two key-ordered link streams and classify every link.
+
+    Args:
+        bbf_links: (ES_Legacy_ID__c, BBF Id) pairs ordered by id_sort_key
+        es_links: (ES Id, BBF_New_Id__c) pairs ordered by id_sort_key (pass
+            ORDER BY Id streams through sort_links())
+        name: Label for the result
+
+    Returns:
+        ReconcileResult with the minimal fix set and report-only findings
+    """
+    result = ReconcileResult(name)
+    bbf_iter = _grouped(_checked(bbf_links, 'BBF'))
+    es_iter = _checked(es_links, 'ES')
+
+    bbf_group = next(bbf_iter, None)
+    es_pair = next(es_iter, None)
+
+    while bbf_group is not None or es_pair is not None:
+        es_key = id_sort_key(es_pair[0]) if es_pair is not None else None
+
+        if es_pair is None or (bbf_group is not None and bbf_group[0] < es_key):
+            # BBF record points at an ES record that does not exist
+            for legacy_id, bbf_id in bbf_group[1]:
+                result.orphaned_bbf.append({'bbf_id': bbf_id, 'es_id': legacy_id})
+            bbf_group = next(bbf_iter, None)
+            continue
+
+        es_id, bbf_new_id = es_pair
+
+        if bbf_group is None or es_key < bbf_group[0]:
+            # ES record not referenced by any BBF record
+            if bbf_new_id:
+                result.orphaned_es.append({'es_id': es_id, 'bbf_new_id': bbf_new_id})
+            es_pair = next(es_iter, None)
+            continue
+
+        # Same key on both sides
+        bbf_ids = [bbf_id for _, bbf_id in bbf_group[1]]
+        if len(bbf_ids) > 1:
+            result.duplicate_bbf.append({'es_id': es_id, 'bbf_ids': bbf_ids})
+
+        if bbf_new_id in bbf_ids:
+            result.matched += 1
+        elif not bbf_new_id:
+            result.missing.append({'es_id': es_id, 'bbf_id': bbf_ids[0]})
+        else:
+            result.mismatched.append({
+                'es_id': es_id, 'bbf_id': bbf_ids[0], 'current': bbf_new_id
+            })
+
+        bbf_group = next(bbf_iter, None)
+        es_pair = next(es_iter, None)
+
+    return result
+
+
+def reconcile_object(es_sf, bbf_sf, object_key: str, es_where: str = None) -> ReconcileResult:
+    """
+    Reconcile one migrated object straight from both orgs.
+
+    Args:
+        es_sf: ES connection
+        bbf_sf: BBF connection
+        object_key: Key of RECONCILE_OBJECTS (e.g. 'service')
+        es_where: Optional extra filter on the ES side
+
+    Returns:
+        ReconcileResult
+    """
+    es_object, bbf_object = RECONCILE_OBJECTS[object_key]
+    return reconcile_links(
+        stream_bbf_links(bbf_sf, bbf_object),
+        sort_links(stream_es_links(es_sf, es_object, es_where)),
+        name=f"{es_object} <-> {bbf_object}",
+    )
+
+
+# =============================================================================
+# APPLY FIXES
+# =============================================================================
+
+def apply_link_fixes(es_sf, es_object: str, fixes: List[Dict], batch_size: int = 200,
+                     delay_seconds: float = 2, bulk: bool = True) -> Dict[str, int]:
+    """
+    Write the fix set back to ES BBF_New_Id__c.
+
+    Args:
+        es_sf: ES connection
+        es_object: ES object API name
+        fixes: Output of ReconcileResult.fixes()
+        batch_size: Records per batch
+        delay_seconds: Pause between batches
+        bulk: Use the bulk API; False sends individual REST updates (needed for
+            objects whose triggers make @future calls, e.g. Order)
+
+    Returns:
+        {'success': n, 'failed': n}
+    """
+    counts = {'success': 0, 'failed': 0}
+    num_batches = (len(fixes) + batch_size - 1) // batch_size
+
+    for batch_num in range(num_batches):
+        batch = fixes[batch_num * batch_size:(batch_num + 1) * batch_size]
+
+        if bulk:
+            try:
+                results = getattr(es_sf.bulk, es_object).update(batch)
+                for r in results:
+                    counts['success' if r['success'] else 'failed'] += 1
+            except Exception as e:
+                print(f"   Batch {batch_num + 1} failed: {e}")
+                counts['failed'] += len(batch)
+        else:
+            handler = getattr(es_sf, es_object)
+            for fix in batch:
+                try:
+                    handler.update(fix['Id'], {NEW_ID_FIELD: fix[NEW_ID_FIELD]})
+                    counts['success'] += 1
+                except Exception as e:
+                    print(f"   {fix['Id']}: {e}")
+                    counts['failed'] += 1
+
+        if batch_num < num_batches - 1:
+            time.sleep(delay_seconds)
+
+    return counts
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Streaming Excel Reports
+=======================
+Constant-memory results workbooks for the migration and enrichment notebooks.
+
+The notebooks used to build reports in normal openpyxl mode: append every row,
+then style cells one at a time and measure every cell for column widths. The
+whole workbook sits in memory and saving a 100k-row result sheet takes minutes.
+
+ReportWriter uses a write-only workbook instead:
+- rows are streamed to disk as they are appended (any iterable, consumed lazily)
+- styles are registered once as named styles and referenced by name
+- column widths come from the headers and the first WIDTH_SAMPLE_ROWS rows
+
+Sheet shapes:
+    add_table()    "Migration Results" / "ID Mapping" / "Failed Inserts" /
+                   "Update Details" (optional status colouring) and
+                   "Mapping Reference" (with a heading above the table)
+    add_summary()  key / value summary sheets
+
+Usage:
+    from migration_engine.report import ReportWriter, bold, update_detail_rows
+
+    report = ReportWriter(output_file)
+    report.add_summary("Summary", "Service Enrichment Summary", [
+        ["Records Updated:", len(updates)],
+        [],
+        bold(["Field", "Enriched"]),
+    ])
+    report.add_table("Update Details", headers, update_detail_rows(update_details))
+    report.add_table("Mapping Reference", ["BBF Field", "ES Field"],
+                     ENRICHMENT_MAPPING.items(), heading="Field Mappings Used (from Excel)")
+    report.save()
+"""
+
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+# Rows measured for column widths before streaming the rest
+WIDTH_SAMPLE_ROWS = 500
+
+STYLE_HEADER = 'Report Header'
+STYLE_HEADER_FAILED = 'Report Header Failed'
+STYLE_TITLE = 'Report Title'
+STYLE_BOLD = 'Report Bold'
+STYLE_HEADING = 'Report Heading'
+
+# Status column value -> row fill (same colours the notebooks used)
+STATUS_COLORS = {
+    'Success': 'C6EFCE',
+    'Failed': 'FFC7CE',
+    'Skipped': 'FFEB9C',
+}
+
+_THIN = Side(style='thin')
+_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+
+
+def _named_styles() -> List[NamedStyle]:
+    styles = [
+        NamedStyle(
+            name=STYLE_HEADER,
+            font=Font(bold=True, size=12, color='FFFFFF'),
+            fill=PatternFill('solid', start_color='4472C4', end_color='4472C4'),
+            alignment=Alignment(horizontal='center', vertical='center'),
+            border=_BORDER,
+        ),
+        NamedStyle(
+            name=STYLE_HEADER_FAILED,
+            font=Font(bold=True, size=12, color='FFFFFF'),
+            fill=PatternFill('solid', start_color='FF4444', end_color='FF4444'),
+            alignment=Alignment(horizontal='center', vertical='center'),
+        ),
+        NamedStyle(name=STYLE_TITLE, font=Font(bold=True, size=14)),
+        NamedStyle(name=STYLE_HEADING, font=Font(bold=True, size=12)),
+        NamedStyle(name=STYLE_BOLD, font=Font(bold=True)),
+    ]
+    for status, color in STATUS_COLORS.items():
+        styles.append(NamedStyle(
+            name=f'Report {status}',
+            fill=PatternFill('solid', fgColor=color),
+            border=_BORDER,
+        ))
+    return styles
+
+
+class _BoldRow(list):
+    """Summary row rendered in bold."""
+
+
+def bold(values: Sequence) -> _BoldRow:
+    """Mark a summary row as bold (e.g. the "Metric / Count" header)."""
+    return _BoldRow(values)
+
+
+class ReportWriter:
+    """
+    Write-only results workbook.
+
+    Args:
+        path: Output .xlsx path
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.wb = Workbook(write_only=True)
+        for style in _named_styles():
+            self.wb.add_named_style(style)
+        self.row_counts: Dict[str, int] = {}
+
+    def _styled(self, ws, values: Sequence, style: str) -> List[WriteOnlyCell]:
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            cells.append(cell)
+        return cells
+
+    def add_table(self, title: str, headers: Sequence[str], rows: Iterable[Sequence],
+                  status_column: Optional[int] = None,
+                  header_style: str = STYLE_HEADER,
+                  heading: str = None,
+                  max_width: int = 60) -> int:
+        """
+        Stream a header + rows table into a new sheet.
+
+        Args:
+            title: Sheet name
+            headers: Column headers
+            rows: Row value sequences; consumed lazily
+            status_column: Index of a Success / Failed / Skipped column used to
+                colour the whole row (Migration Results shape)
+            header_style: Named style for the header row
+            heading: Bold line written above the table (Mapping Reference shape);
+                panes are frozen under the header only when there is no heading
+            max_width: Column width cap
+
+        Returns:
+            Number of data rows written
+        """
+        ws = self.wb.create_sheet(title)
+        rows = iter(rows)
+        sample = list(islice(rows, WIDTH_SAMPLE_ROWS))
+
+        widths = [len(str(h)) for h in headers]
+        for row in sample:
+            for i, value in enumerate(row[:len(widths)]):
+                widths[i] = max(widths[i], len(str(value if value is not None else '')))
+        for i, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(i)].width = min(width + 2, max_width)
+
+        if heading is None:
+            ws.freeze_panes = 'A2'
+        else:
+            ws.append(self._styled(ws, [heading], STYLE_HEADING))
+            ws.append([])
+
+        ws.append(self._styled(ws, headers, header_style))
+
+        count = 0
+        for batch in (sample, rows):
+            for row in batch:
+                if status_column is not None and row[status_column] in STATUS_COLORS:
+                    ws.append(self._styled(ws, row, f'Report {row[status_column]}'))
+                else:
+                    ws.append(list(row))
+                count += 1
+
+        self.row_counts[title] = count
+        return count
+
+    def add_summary(self, title: str, heading: str, rows: Iterable[Sequence]) -> int:
+        """
+        Write a key / value summary sheet.
+
+        Args:
+            title: Sheet name
+            heading: Title line in row 1
+            rows: Rows below the heading; [] for a blank line, bold([...]) for bold
+
+        Returns:
+            Number of rows written below the heading
+        """
+        ws = self.wb.create_sheet(title)
+        ws.append(self._styled(ws, [heading], STYLE_TITLE))
+        count = 0
+        for row in rows:
+            if isinstance(row, _BoldRow):
+                ws.append(self._styled(ws, row, STYLE_BOLD))
+            else:
+                ws.append(list(row))
+            count += 1
+        self.row_counts[title] = count
+        return count
+
+    def save(self) -> str:
+        """Write the workbook to disk and return its path."""
+        self.wb.save(self.path)
+        return self.path
+
+
+def update_detail_rows(update_details: Iterable[Dict]) -> Iterable[List]:
+    """
+    Flatten enrichment update_details into "Update Details" rows.
+
+    Each detail is {'bbf_id', 'name', 'fields': [{'field', 'old', 'new', 'source'}]}.
+    Yields [BBF Id, Name, Field, Old Value, New Value, ES Source].
+    """
+    for detail in update_details:
+        for f in detail['fields']:
+            yield [
+                detail['bbf_id'],
+                detail['name'],
+                f['field'],
+                str(f['old']) if f['old'] else '',
+                str(f['new']),
+                str(f['source']),
+            ]
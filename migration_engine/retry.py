@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Failed-Record Retry Queue
+=========================
+Re-drive retryable bulk row failures after a Day 1 load.
+
+Bulk loads of children that share parents (Services under one BAN, Service
+Charges under one Service) regularly fail rows with UNABLE_TO_LOCK_ROW when
+parallel batches touch the same parent, and the occasional row fails on a
+transient server error. Those rows used to go straight to the "Failed Inserts"
+sheet and needed a second notebook run.
+
+Row errors are classified as:
+- lock:       UNABLE_TO_LOCK_ROW                             -> retried
+- transient:  limits, timeouts, server errors                -> retried
+- duplicate:  DUPLICATE_VALUE / DUPLICATES_DETECTED / ...    -> reported
+- validation: anything else (required fields, picklists...)  -> reported
+- unconfirmed: a retry batch whose call raised in insert mode -> reported
+
+Retryable rows are re-submitted serially in progressively smaller batches with
+exponential backoff. When a retry call itself raises (timeout, dropped
+connection) the batch may still have committed on the server; in insert mode
+re-submitting it could create duplicate BBF records, so those rows are marked
+BATCH_OUTCOME_UNKNOWN and not retried. Upserts on ES_Legacy_ID__c are
+idempotent and are retried. The final outcome of every row that entered the
+queue is written to the run journal.
+
+Usage:
+    from migration_engine.retry import retry_failed_rows
+
+    results = bbf_sf.bulk.Service__c.insert(bbf_services)
+    results = retry_failed_rows(bbf_sf.bulk.Service__c, bbf_services, results,
+                                LOAD_MODE, journal=run_journal)
+"""
+
+import time
+from typing import Callable, Dict, List, Sequence
+
+from migration_engine.loader import (
+    LEGACY_ID_FIELD,
+    LOAD_MODE_UPSERT,
+    as_bool,
+    upsert_by_legacy_id,
+)
+
+ERROR_LOCK = 'lock'
+ERROR_TRANSIENT = 'transient'
+ERROR_DUPLICATE = 'duplicate'
+ERROR_VALIDATION = 'validation'
+ERROR_UNCONFIRMED = 'unconfirmed'
+RETRYABLE = (ERROR_LOCK, ERROR_TRANSIENT)
+
+LOCK_CODES = ('UNABLE_TO_LOCK_ROW',)
+UNCONFIRMED_CODE = 'BATCH_OUTCOME_UNKNOWN'
+DUPLICATE_CODES = ('DUPLICATE_VALUE', 'DUPLICATES_DETECTED', 'DUPLICATE_EXTERNAL_ID')
+TRANSIENT_CODES = (
+    'REQUEST_LIMIT_EXCEEDED',
+    'SERVER_UNAVAILABLE',
+    'UNKNOWN_EXCEPTION',
+    'QUERY_TIMEOUT',
+    'TOO_MANY_APEX_REQUESTS',
+    'API_TEMPORARILY_UNAVAILABLE',
+    'Max CPU time',
+    'timed out',
+    'Connection aborted',
+)
+
+# Batch size per retry round; one round per entry
+DEFAULT_RETRY_BATCH_SIZES = (200, 50, 10)
+DEFAULT_BACKOFF_SECONDS = 5
+
+
+def classify_error(errors) -> str:
+    """
+    Classify a bulk row error.
+
+    Args:
+        errors: The row's 'errors' value - a list of {statusCode, message}
+            dicts (Bulk 1.0), an 'sf__Error' string (Bulk 2.0) or an exception
+
+    Returns:
+        One of 'lock', 'transient', 'duplicate', 'validation', 'unconfirmed'
+    """
+    text = str(errors)
+    if UNCONFIRMED_CODE in text:
+        return ERROR_UNCONFIRMED
+    if any(code in text for code in LOCK_CODES):
+        return ERROR_LOCK
+    if any(code in text for code in DUPLICATE_CODES):
+        return ERROR_DUPLICATE
+    if any(code in text for code in TRANSIENT_CODES):
+        return ERROR_TRANSIENT
+    return ERROR_VALIDATION
+
+
+def bulk_submitter(bulk_object, load_mode: str) -> Callable[[List[Dict]], List[Dict]]:
+    """Build a serial bulk submit function for the notebook's LOAD_MODE."""
+    def submit(batch: List[Dict]) -> List[Dict]:
+        if load_mode == LOAD_MODE_UPSERT:
+            return upsert_by_legacy_id(bulk_object, batch, batch_size=len(batch),
+                                       use_serial=True)
+        return bulk_object.insert(batch, batch_size=len(batch), use_serial=True)
+    return submit
+
+
+def retry_failed_rows(bulk_object, records: List[Dict], results: List[Dict],
+                      load_mode: str = 'insert',
+                      batch_sizes: Sequence[int] = DEFAULT_RETRY_BATCH_SIZES,
+                      backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+                      journal=None,
+                      key_field: str = LEGACY_ID_FIELD,
+                      submit: Callable[[List[Dict]], List[Dict]] = None) -> List[Dict]:
+    """
+    Re-submit lock / transient failures and return the merged results.
+
+    Args:
+        bulk_object: simple_salesforce bulk handler the rows were loaded with
+        records: Records passed to the original load (same order as results)
+        results: Bulk results of the original load
+        load_mode: 'insert' or 'upsert' (LOAD_MODE)
+        batch_sizes: Batch size for each retry round
+        backoff_seconds: Wait before the first round; doubles every round
+        journal: Optional RunJournal for final outcomes
+        key_field: Record field identifying the ES record in the journal
+        submit: Override the submit function (defaults to bulk_submitter)
+
+    Returns:
+        Results in input order, with retried rows replaced by their last attempt
+    """
+    submit = submit or bulk_submitter(bulk_object, load_mode)
+    final = list(results)
+    initial_class = {}
+    for i, result in enumerate(results):
+        if not as_bool(result.get('success')):
+            initial_class[i] = classify_error(result.get('errors'))
+
+    attempts = {i: 0 for i in initial_class}
+    pending = [i for i, cls in initial_class.items() if cls in RETRYABLE]
+
+    if initial_class:
+        not_retried = len(initial_class) - len(pending)
+        print(f"\n🔁 Retry queue: {len(pending)} retryable failures "
+              f"({not_retried} validation/duplicate not retried)")
+
+    for round_num, batch_size in enumerate(batch_sizes, 1):
+        if not pending:
+            break
+        wait = backoff_seconds * 2 ** (round_num - 1)
+        print(f"   Round {round_num}: {len(pending)} rows in batches of {batch_size} "
+              f"after {wait:.0f}s backoff...", end=" ")
+        time.sleep(wait)
+
+        still_pending = []
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            try:
+                chunk_results = submit([records[i] for i in chunk])
+            except Exception as e:
+                # No row outcome: an insert batch may have committed anyway, so
+                # only idempotent upserts are re-submitted
+                error = str(e) if load_mode == LOAD_MODE_UPSERT else \
+                    f"{UNCONFIRMED_CODE}: insert batch not retried, rows may exist in BBF: {e}"
+                chunk_results = [{'success': False, 'created': False, 'id': None,
+                                  'errors': error} for _ in chunk]
+            for i, result in zip(chunk, chunk_results):
+                attempts[i] += 1
+                final[i] = result
+                if not as_bool(result.get('success')) and \
+                        classify_error(result.get('errors')) in RETRYABLE:
+                    still_pending.append(i)
+
+        recovered = sum(1 for i in pending if as_bool(final[i].get('success')))
+        unconfirmed = sum(1 for i in pending
+                          if classify_error(final[i].get('errors')) == ERROR_UNCONFIRMED)
+        print(f"✅ {recovered} recovered" + (f", ⚠️ {unconfirmed} unconfirmed (not retried)"
+                                              if unconfirmed else ""))
+        pending = still_pending
+
+    if journal is not None and initial_class:
+        journal.record_many('retry', [
+            {
+                'es_id': records[i].get(key_field),
+                'status': 'success' if as_bool(final[i].get('success')) else 'failed',
+                'bbf_id': final[i].get('id'),
+                'initial_error_class': initial_class[i],
+                'final_error_class': (None if as_bool(final[i].get('success'))
+                                      else classify_error(final[i].get('errors'))),
+                'attempts': attempts[i],
+                'errors': None if as_bool(final[i].get('success')) else final[i].get('errors'),
+            }
+            for i in sorted(initial_class)
+        ])
+
+    if initial_class:
+        recovered_total = sum(1 for i in initial_class if as_bool(final[i].get('success')))
+        print(f"   Retry complete: {recovered_total}/{len(initial_class)} failures recovered")
+
+    return final
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Synthetic ES Org Generator
+==========================
+Realistic, reproducible ES datasets for benchmarks and fake-org runs.
+
+Generates the ES objects the migration reads, wired together the way the
+Day 1 queries expect:
+
+    Account <- Billing_Invoice__c (Account__c, BBF_Ban__c)
+    Address__c
+    Order (Billing_Invoice__c, Address_A__c, Address_Z__c, Status, ...)
+    OrderItem (OrderId)
+    Off_Net__c (SOF1__c -> Order, Location_1__c / Location_2__c -> Address__c)
+
+Picklist values are drawn from PICKLIST_DEFAULTS, overlaid with the actual
+usage counts from es_data_profiler.py output (<Object>_picklist_distributions_
+<timestamp>.csv, latest file per object) when a profile directory is given.
+
+Scale is driven by the Order count; the other objects follow SCALE_RATIOS.
+
+Usage:
+    from migration_engine.synth import generate_es_dataset, build_fake_orgs
+
+    dataset = generate_es_dataset(orders=10000, seed=7,
+                                  profile_dir="day-two/data-profiles")
+    orgs = build_fake_orgs(dataset)      # {'es': FakeOrg, 'bbf': FakeOrg}
+
+    # Seed file for python -m migration_engine.fake_org --seed
+    python -m migration_engine.synth --orders 10000 --output seed.json
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import random
+from itertools import accumulate
+from typing import Dict, List
+
+from migration_engine.fake_org.store import FakeOrg, FaultConfig, FieldDef, to_18
+
+# Records per Order for every generated object
+SCALE_RATIOS = {
+    'Account': 0.10,
+    'Billing_Invoice__c': 0.12,
+    'Address__c': 0.80,
+    'Order': 1.0,
+    'OrderItem': 3.0,
+    'Off_Net__c': 0.10,
+}
+
+SCALES = {
+    'small': 1_000,
+    'medium': 10_000,
+    'large': 100_000,
+}
+
+# ES key prefixes for generated Ids
+ES_PREFIXES = {
+    'Account': '001',
+    'Address__c': 'a0A',
+    'Billing_Invoice__c': 'a0B',
+    'Order': '801',
+    'OrderItem': '802',
+    'Off_Net__c': 'a0C',
+}
+
+# {object: {field: {value: weight}}}; None is an unpopulated field
+PICKLIST_DEFAULTS: Dict[str, Dict[str, Dict]] = {
+    'Account': {
+        'Type': {'Customer': 70, 'Carrier': 15, 'Prospect': 10, 'Partner': 5},
+        'Industry': {'Telecommunications': 25, 'Healthcare': 15, 'Education': 15,
+                     'Government': 10, 'Finance': 10, None: 25},
+    },
+    'Address__c': {
+        'State__c': {'OH': 35, 'MI': 30, 'IN': 15, 'IL': 10, 'PA': 10},
+        'Building_Status__c': {'On-Net': 45, 'Off-Net': 30, 'Near-Net': 15, None: 10},
+        'Building_Type__c': {'Commercial': 50, 'Multi-Tenant': 15, 'Tower': 15,
+                             'Data Center': 10, 'Residential': 5, None: 5},
+        'Address_Type__c': {'Service': 80, 'Billing': 15, None: 5},
+    },
+    'Billing_Invoice__c': {
+        'Payment_Terms__c': {'Net 30': 80, 'Net 45': 10, 'Net 60': 5, 'Due on Receipt': 5},
+        'Invoice_Delivery_Preference__c': {'Email': 75, 'Mail': 15, 'Email and Mail': 10},
+        'BBF_Ban__c': {True: 80, False: 20},
+    },
+    'Order': {
+        'Status': {'Activated': 70, 'Draft': 10, 'Disconnected': 10,
+                   'Suspended (Late Payment)': 5, 'Disconnect in Progress': 5},
+        'Service_Order_Record_Type__c': {'Service Order Agreement': 85, 'Change Order': 15},
+        'Project_Group__c': {None: 90, 'PA MARKET DECOM': 5, 'MI MARKET BUILD': 5},
+        'Service_Type__c': {'Dedicated Internet': 40, 'Ethernet': 30, 'Dark Fiber': 10,
+                            'Wavelength': 10, 'Colocation': 10},
+        'Bandwidth__c': {'100 Mbps': 30, '1 Gbps': 40, '10 Gbps': 15, '500 Mbps': 10,
+                         '100 Gbps': 5},
+    },
+    'OrderItem': {
+        'Charge_Type__c': {'MRC': 70, 'NRC': 25, 'Usage': 5},
+    },
+    'Off_Net__c': {
+        'Vendor__c': {'AT&T': 35, 'Frontier': 20, 'Spectrum': 20, 'Lumen': 15, 'Zayo': 10},
+        'Status__c': {'Active': 80, 'Pending': 10, 'Disconnected': 10},
+    },
+}
+
+CITIES = ['Columbus', 'Cleveland', 'Detroit', 'Grand Rapids', 'Indianapolis',
+          'Chicago', 'Pittsburgh', 'Toledo', 'Lansing', 'Fort Wayne']
+STREETS = ['Main St', 'High St', 'Broad St', 'Market St', 'Oak Ave', 'Michigan Ave',
+           'Washington Blvd', 'Industrial Pkwy', 'Commerce Dr', 'Park Pl']
+COMPANY_WORDS = ['Acme', 'Summit', 'Lakeshore', 'Keystone', 'Buckeye', 'Great Lakes',
+                 'Riverside', 'Pioneer', 'Heartland', 'Midwest']
+COMPANY_SUFFIXES = ['Health', 'Schools', 'Logistics', 'Bank', 'Manufacturing', 'Networks']
+
+
+# =============================================================================
+# PICKLIST DISTRIBUTIONS
+# =============================================================================
+
+def load_profile_distributions(profile_dir: str) -> Dict[str, Dict[str, Dict]]:
+    """
+    Read picklist usage from es_data_profiler.py output.
+
+    Args:
+        profile_dir: Directory holding <Object>_picklist_distributions_<ts>.csv
+
+    Returns:
+        {object: {field: {value: count}}} from the latest file per object
+        (USED rows only)
+    """
+    latest: Dict[str, str] = {}
+    for path in sorted(glob.glob(os.path.join(profile_dir, '*_picklist_distributions_*.csv'))):
+        object_name = os.path.basename(path).split('_picklist_distributions_')[0]
+        latest[object_name] = path  # sorted by timestamp suffix, last wins
+
+    distributions: Dict[str, Dict[str, Dict]] = {}
+    for object_name, path in latest.items():
+        fields: Dict[str, Dict] = {}
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row.get('Status') != 'USED':
+                    continue
+                try:
+                    count = float(row['Count'])
+                except (TypeError, ValueError):
+                    continue
+                fields.setdefault(row['Field Name'], {})[row['Picklist Value']] = count
+        distributions[object_name] = fields
+    return distributions
+
+
+def merge_distributions(profiled: Dict[str, Dict[str, Dict]] = None) -> Dict[str, Dict[str, Dict]]:
+    """PICKLIST_DEFAULTS with profiled fields replacing the defaults they cover."""
+    merged = {obj: dict(fields) for obj, fields in PICKLIST_DEFAULTS.items()}
+    for obj, fields in (profiled or {}).items():
+        merged.setdefault(obj, {}).update(fields)
+    return merged
+
+
+class _Sampler:
+    """Weighted picklist draws with one cumulative table per field."""
+
+    def __init__(self, rng: random.Random, distributions: Dict[str, Dict[str, Dict]]):
+        self.rng = rng
+        self.tables = {}
+        self.fields: Dict[str, List[str]] = {}
+        for obj, fields in distributions.items():
+            for field, weights in fields.items():
+                self.tables[(obj, field)] = (list(weights), list(accumulate(weights.values())))
+                self.fields.setdefault(obj, []).append(field)
+
+    def pick(self, obj: str, field: str):
+        values, cum_weights = self.tables[(obj, field)]
+        return self.rng.choices(values, cum_weights=cum_weights)[0]
+
+    def fill(self, obj: str, record: Dict) -> Dict:
+        for field in self.fields.get(obj, ()):
+            if field not in record:
+                record[field] = self.pick(obj, field)
+        return record
+
+
+# =============================================================================
+# GENERATOR
+# =============================================================================
+
+def _counts(orders: int) -> Dict[str, int]:
+    return {obj: max(1, int(orders * ratio)) for obj, ratio in SCALE_RATIOS.items()}
+
+
+def generate_es_dataset(orders: int = 1000, seed: int = 0, profile_dir: str = None,
+                        distributions: Dict[str, Dict[str, Dict]] = None) -> Dict[str, List[Dict]]:
+    """
+    Generate a linked ES dataset.
+
+    Args:
+        orders: Number of Orders; other objects scale by SCALE_RATIOS
+        seed: Random seed (same seed and inputs -> identical dataset)
+        profile_dir: Optional es_data_profiler.py output directory
+        distributions: Explicit {object: {field: {value: weight}}} overlay
+
+    Returns:
+        {sObject: [records]} with 18-character Ids, ready for FakeOrg.seed()
+    """
+    rng = random.Random(seed)
+    profiled = load_profile_distributions(profile_dir) if profile_dir else {}
+    if distributions:
+        for obj, fields in distributions.items():
+            profiled.setdefault(obj, {}).update(fields)
+    sampler = _Sampler(rng, merge_distributions(profiled))
+    counts = _counts(orders)
+
+    def ids(obj: str) -> List[str]:
+        prefix = ES_PREFIXES[obj]
+        return [to_18(f"{prefix}Sy{n:010d}") for n in range(1, counts[obj] + 1)]
+
+    account_ids = ids('Account')
+    accounts = []
+    for i, record_id in enumerate(account_ids):
+        name = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)} {i + 1}"
+        accounts.append(sampler.fill('Account', {
+            'Id': record_id,
+            'Name': name,
+            'BillingStreet': f"{rng.randint(1, 9999)} {rng.choice(STREETS)}",
+            'BillingCity': rng.choice(CITIES),
+            'BillingState': sampler.pick('Address__c', 'State__c'),
+            'BillingPostalCode': f"{rng.randint(43000, 49999)}",
+            'Phone': f"({rng.randint(200, 989)}) 555-{rng.randint(0, 9999):04d}",
+            'Website': f"www.{name.split()[0].lower()}{i + 1}.com",
+        }))
+
+    ban_ids = ids('Billing_Invoice__c')
+    bans = []
+    for i, record_id in enumerate(ban_ids):
+        account = accounts[i % len(accounts)]
+        bans.append(sampler.fill('Billing_Invoice__c', {
+            'Id': record_id,
+            'Name': f"BAN-{i + 1:07d}",
+            'Account__c': account['Id'],
+            'Account_Name__c': account['Name'],
+            'Account_Number__c': f"{rng.randint(10**7, 10**8 - 1)}",
+            'Billing_Address_1__c': account['BillingStreet'],
+            'Billing_City__c': account['BillingCity'],
+            'Billing_State__c': account['BillingState'],
+            'Billing_ZIP__c': account['BillingPostalCode'],
+            'Billing_E_mail__c': f"ap{i + 1}@example.com",
+            'Description__c': rng.choice([None, None, 'Legacy BAN', 'Consolidated billing']),
+        }))
+
+    address_ids = ids('Address__c')
+    addresses = []
+    for i, record_id in enumerate(address_ids):
+        street = f"{rng.randint(1, 9999)} {rng.choice(STREETS)}"
+        city = rng.choice(CITIES)
+        record = sampler.fill('Address__c', {
+            'Id': record_id,
+            'Name': f"{street}, {city}",
+            'Address__c': street,
+            'Clean_Street__c': street.upper(),
+            'City__c': city,
+            'Zip__c': f"{rng.randint(43000, 49999)}",
+            'County__c': rng.choice(['Franklin', 'Cuyahoga', 'Wayne', 'Kent', 'Marion', 'Cook']),
+            'CLLI__c': f"{city[:4].upper()}{rng.choice(['OH', 'MI', 'IN'])}{rng.randint(10, 99)}"
+                       if rng.random() < 0.6 else None,
+            'Geocode_Lat_Long__Latitude__s': round(rng.uniform(38.0, 46.0), 6),
+            'Geocode_Lat_Long__Longitude__s': round(rng.uniform(-88.0, -80.0), 6),
+        })
+        record['Complete_Address__c'] = f"{street}, {city}, {record['State__c']} {record['Zip__c']}"
+        addresses.append(record)
+
+    order_ids = ids('Order')
+    orders_out = []
+    for i, record_id in enumerate(order_ids):
+        ban = bans[rng.randrange(len(bans))]
+        orders_out.append(sampler.fill('Order', {
+            'Id': record_id,
+            'OrderNumber': f"{i + 1:08d}",
+            'AccountId': ban['Account__c'],
+            'Billing_Invoice__c': ban['Id'],
+            'Address_A__c': address_ids[rng.randrange(len(address_ids))],
+            'Address_Z__c': (address_ids[rng.randrange(len(address_ids))]
+                             if rng.random() < 0.5 else None),
+            'EffectiveDate': f"20{rng.randint(15, 25)}-{rng.randint(1, 12):02d}-01",
+        }))
+
+    orderitems = []
+    for i, record_id in enumerate(ids('OrderItem')):
+        order = orders_out[i % len(orders_out)]
+        orderitems.append(sampler.fill('OrderItem', {
+            'Id': record_id,
+            'OrderId': order['Id'],
+            'Quantity': rng.choice([1, 1, 1, 2, 4]),
+            'UnitPrice': round(rng.choice([150, 495, 950, 1800, 4500]) * rng.uniform(0.8, 1.2), 2),
+            'Description': f"{order['Service_Type__c']} {order['Bandwidth__c']}",
+        }))
+
+    offnets = []
+    for i, record_id in enumerate(ids('Off_Net__c')):
+        order = orders_out[rng.randrange(len(orders_out))]
+        offnets.append(sampler.fill('Off_Net__c', {
+            'Id': record_id,
+            'Name': f"OFFNET-{i + 1:06d}",
+            'SOF1__c': order['Id'],
+            'Location_1__c': order['Address_A__c'],
+            'Location_2__c': order['Address_Z__c'],
+            'Vendor_Circuit_ID__c': f"{rng.randint(10, 99)}.KXFN.{rng.randint(100000, 999999)}",
+            'Monthly_Cost__c': round(rng.uniform(200, 3500), 2),
+        }))
+
+    return {
+        'Account': accounts,
+        'Billing_Invoice__c': bans,
+        'Address__c': addresses,
+        'Order': orders_out,
+        'OrderItem': orderitems,
+        'Off_Net__c': offnets,
+    }
+
+
+# =============================================================================
+# FAKE ORG WIRING
+# =============================================================================
+
+def _ref(name: str, target: str) -> FieldDef:
+    return FieldDef(name, type='reference', reference_to=[target])
+
+
+ES_SCHEMA = {
+    'Account': [FieldDef('Name', nillable=False), FieldDef('BBF_New_Id__c', length=18)],
+    'Address__c': [FieldDef('Name', nillable=False), FieldDef('BBF_New_Id__c', length=18)],
+    'Billing_Invoice__c': [FieldDef('Name', nillable=False), _ref('Account__c', 'Account'),
+                           FieldDef('BBF_Ban__c', type='boolean'),
+                           FieldDef('BBF_New_Id__c', length=18)],
+    'Order': [_ref('AccountId', 'Account'), _ref('Billing_Invoice__c', 'Billing_Invoice__c'),
+              _ref('Address_A__c', 'Address__c'), _ref('Address_Z__c', 'Address__c'),
+              FieldDef('BBF_New_Id__c', length=18)],
+    'OrderItem': [_ref('OrderId', 'Order'), FieldDef('BBF_New_Id__c', length=18)],
+    'Off_Net__c': [_ref('SOF1__c', 'Order'), _ref('Location_1__c', 'Address__c'),
+                   _ref('Location_2__c', 'Address__c'), FieldDef('BBF_New_Id__c', length=18)],
+}
+
+BBF_SCHEMA = {
+    'Location__c': [FieldDef('Name', length=80, nillable=False)],
+    'Account': [FieldDef('Name', nillable=False)],
+    'BAN__c': [_ref('Account__c', 'Account')],
+    'Service__c': [_ref('Billing_Account_Number__c', 'BAN__c')],
+    'Service_Charge__c': [_ref('Service__c', 'Service__c')],
+    'Off_Net__c': [_ref('Service__c', 'Service__c')],
+}
+
+
+def build_fake_orgs(dataset: Dict[str, List[Dict]], faults: FaultConfig = None,
+                    bbf_faults: FaultConfig = None, case_sensitive_ids: bool = False) -> Dict[str, FakeOrg]:
+    """
+    Seed an ES fake org with a dataset and declare an empty BBF org.
+
+    Args:
+        dataset: generate_es_dataset() output
+        faults: Fault injection for the ES org
+        bbf_faults: Fault injection for the BBF org (defaults to faults' settings)
+        case_sensitive_ids: Sort ORDER BY Id case-sensitively in both orgs, as real orgs do
+
+    Returns:
+        {'es': FakeOrg, 'bbf': FakeOrg}
+    """
+    es = FakeOrg('es', faults=faults, case_sensitive_ids=case_sensitive_ids)
+    for obj, fields in ES_SCHEMA.items():
+        es.define_object(obj, fields).key_prefix = ES_PREFIXES[obj]
+    es.seed(dataset)
+
+    bbf = FakeOrg('bbf', faults=bbf_faults or faults, case_sensitive_ids=case_sensitive_ids)
+    for obj, fields in BBF_SCHEMA.items():
+        bbf.define_object(obj, fields + [FieldDef('ES_Legacy_ID__c', length=18,
+                                                  external_id=True, unique=True)])
+    return {'es': es, 'bbf': bbf}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic ES dataset')
+    parser.add_argument('--orders', type=int, default=None, help='Order count (overrides --scale)')
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--profile-dir', help='es_data_profiler.py output directory')
+    parser.add_argument('--output', default='seed.json', help='fake_org seed file to write')
+    args = parser.parse_args()
+
+    orders = args.orders or SCALES[args.scale]
+    dataset = generate_es_dataset(orders=orders, seed=args.seed, profile_dir=args.profile_dir)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'es': dataset}, f)
+
+    print(f"✅ Wrote {args.output}")
+    for obj, records in dataset.items():
+        print(f"   {obj:<20} {len(records):>10,}")
+
+
+if __name__ == '__main__':
+    main()